@@ -1,4 +1,5 @@
 # app/clients/person_auth.py
+import asyncio
 from typing import Optional
 
 import httpx
@@ -9,21 +10,41 @@ from app.core.config import settings
 class PersonAuthService:
     def __init__(self):
         self._token: Optional[str] = None
+        self._login_task: Optional[asyncio.Future] = None
 
     @property
     def token(self) -> Optional[str]:
         return self._token
 
-    async def login(self) -> str:
-        """Hace login en el MS de personas y guarda el token."""
+    async def login(self, client: Optional[httpx.AsyncClient] = None) -> str:
+        """
+        Hace login en el MS de personas y guarda el token.
+
+        Los logins simultáneos comparten una sola petición. Con `client` se
+        reutiliza el cliente HTTP compartido en lugar de abrir uno nuevo.
+        """
+        task = self._login_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._login(client))
+            self._login_task = task
+        return await asyncio.shield(task)
+
+    async def _login(self, client: Optional[httpx.AsyncClient]) -> str:
         payload = {
             "email": settings.PERSON_MS_ADMIN_EMAIL,
             "password": settings.PERSON_MS_ADMIN_PASSWORD,
         }
-        async with httpx.AsyncClient(base_url=settings.PERSON_MS_BASE_URL) as client:
-            resp = await client.post("/api/person/login", json=payload)
-            resp.raise_for_status()
-            body = resp.json()
-            token = body["data"]["token"]  # viene con el prefijo 'Bearer ...'
-            self._token = token
-            return token
+        if client is None:
+            async with httpx.AsyncClient(
+                base_url=settings.PERSON_MS_BASE_URL
+            ) as own_client:
+                return await self._request_token(own_client, payload)
+        return await self._request_token(client, payload)
+
+    async def _request_token(self, client: httpx.AsyncClient, payload: dict) -> str:
+        resp = await client.post("/api/person/login", json=payload)
+        resp.raise_for_status()
+        body = resp.json()
+        token = body["data"]["token"]  # viene con el prefijo 'Bearer ...'
+        self._token = token
+        return token
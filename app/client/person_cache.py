@@ -0,0 +1,211 @@
+"""Caché cache-aside de las consultas al MS de personas por identificación."""
+
+import asyncio
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """LRU con TTL en memoria del proceso."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Backend compartido entre workers sobre un cliente `redis.asyncio`."""
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "person:"):
+        self.prefix = prefix
+        self._client = client
+        self._url = url
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis.asyncio as redis  # dependencia opcional
+
+            self._client = redis.from_url(self._url)
+        return self._client
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f"{self.prefix}*"):
+            await self.client.delete(key)
+
+
+class PersonCache:
+    """
+    Cache-aside con TTL y deduplicación de fallos concurrentes (single-flight).
+
+    Las consultas simultáneas por la misma identificación que no están en
+    caché esperan a una sola llamada al MS. Un error del backend nunca
+    impide consultar el MS.
+    """
+
+    def __init__(self, backend=None, ttl: float = 300):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl > 0
+
+    async def get_or_load(
+        self, identification: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Devuelve la respuesta en caché o la obtiene con `loader` una sola vez."""
+        if not self.enabled:
+            return await loader()
+
+        key = self._key(identification)
+        cached = await self._backend_call("get", key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # marcado como recuperado si nadie esperaba
+            raise
+        else:
+            future.set_result(value)
+            # Si se invalidó mientras se consultaba, no guardar el dato viejo
+            if value and self._inflight.get(key) is future:
+                await self._backend_call("set", key, value, self.ttl)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def peek(self, identification: str) -> Optional[Any]:
+        """Valor en caché, sin consultar el MS (None si no está)."""
+        if not self.enabled:
+            return None
+        value = await self._backend_call("get", self._key(identification))
+        if value is not None:
+            self.hits += 1
+        return value
+
+    async def put(self, identification: str, value: Any) -> None:
+        """Guarda una respuesta obtenida por otra vía (p. ej. un listado completo)."""
+        if self.enabled and value:
+            await self._backend_call("set", self._key(identification), value, self.ttl)
+
+    async def invalidate(self, identification: Optional[str]) -> None:
+        """Descarta la entrada de una identificación tras modificar la persona."""
+        if not self.enabled or not identification:
+            return
+        key = self._key(identification)
+        self.invalidations += 1
+        self._inflight.pop(key, None)
+        await self._backend_call("delete", key)
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self._backend_call("clear")
+        self.hits = self.misses = self.coalesced = self.invalidations = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    @staticmethod
+    def _key(identification: str) -> str:
+        return str(identification).strip()
+
+    async def _backend_call(self, method: str, *args) -> Any:
+        try:
+            return await getattr(self.backend, method)(*args)
+        except Exception as e:
+            logger.warning(f"Person cache backend error on {method}: {e}")
+            return None
+
+
+def build_person_cache() -> PersonCache:
+    """Crea la caché según PERSON_CACHE_BACKEND (memory, redis o none)."""
+    backend_name = settings.PERSON_CACHE_BACKEND.lower()
+    if backend_name == "redis" and settings.REDIS_URL:
+        backend = RedisBackend(url=settings.REDIS_URL)
+    elif backend_name == "memory":
+        backend = MemoryBackend(settings.PERSON_CACHE_MAX_ENTRIES)
+    else:
+        backend = None
+    return PersonCache(backend, ttl=settings.PERSON_CACHE_TTL_SECONDS)
+
+
+# Instancia por proceso; con Redis el contenido se comparte entre workers
+person_cache = build_person_cache()
@@ -1,9 +1,9 @@
-import asyncio
 from typing import Any, ClassVar, Dict, List, Optional
 
 import httpx
 
 from app.client.person_auth import PersonAuthService
+from app.client.resilience import AdaptiveLimiter, CircuitBreaker, CircuitOpenError
 from app.core.config import settings
 from app.utils.exceptions import ExternalServiceException, ValidationException
 
@@ -16,16 +16,44 @@ HTTP_LIMITS = httpx.Limits(
     keepalive_expiry=30,  # Segundos antes de cerrar conexión idle
 )
 
-# Semáforo global para limitar concurrencia al microservicio
-_ms_semaphore: Optional[asyncio.Semaphore] = None
+UNAVAILABLE_MSG = (
+    "El servicio de usuarios no está disponible. "
+    "Por favor, intente nuevamente más tarde."
+)
+NETWORK_ERRORS = (httpx.ConnectError, httpx.TimeoutException)
+
+# Circuito y límite de concurrencia compartidos por todas las instancias
+_ms_breaker: Optional[CircuitBreaker] = None
+_ms_limiter: Optional[AdaptiveLimiter] = None
+
+
+def get_ms_breaker() -> CircuitBreaker:
+    """Obtiene o crea el circuito del MS de personas."""
+    global _ms_breaker
+    if _ms_breaker is None:
+        _ms_breaker = CircuitBreaker(
+            failure_threshold=settings.PERSON_MS_BREAKER_FAILURES,
+            reset_timeout=settings.PERSON_MS_BREAKER_RESET_SECONDS,
+        )
+    return _ms_breaker
 
 
-def get_ms_semaphore(max_concurrent: int = 20) -> asyncio.Semaphore:
-    """Obtiene o crea el semáforo para limitar concurrencia."""
-    global _ms_semaphore
-    if _ms_semaphore is None:
-        _ms_semaphore = asyncio.Semaphore(max_concurrent)
-    return _ms_semaphore
+def get_ms_limiter() -> AdaptiveLimiter:
+    """Obtiene o crea el límite adaptativo de concurrencia al MS."""
+    global _ms_limiter
+    if _ms_limiter is None:
+        _ms_limiter = AdaptiveLimiter(
+            initial=settings.PERSON_MS_CONCURRENCY_INITIAL,
+            max_limit=settings.PERSON_MS_CONCURRENCY_MAX,
+        )
+    return _ms_limiter
+
+
+def reset_ms_resilience() -> None:
+    """Descarta circuito y límite (se recrean con la configuración actual)."""
+    global _ms_breaker, _ms_limiter
+    _ms_breaker = None
+    _ms_limiter = None
 
 
 class PersonClient:
@@ -51,89 +79,98 @@ class PersonClient:
         """
         Realiza una petición autenticada al MS de usuarios.
         Maneja errores de conexión y autenticación.
-        Usa un semáforo para limitar concurrencia y un cliente HTTP compartido.
-        """
-        semaphore = get_ms_semaphore()
-
-        async with semaphore:  # Limitar concurrencia
-            try:
-                token = auth_service.token or await auth_service.login()
-            except (
-                httpx.ConnectError,
-                httpx.TimeoutException,
-                httpx.ConnectTimeout,
-            ) as e:
-                raise ExternalServiceException(
-                    "El servicio de usuarios no está disponible. "
-                    "Por favor, intente nuevamente más tarde."
-                ) from e
 
+        Con el circuito abierto falla de inmediato sin llamar al MS. La
+        concurrencia la limita `get_ms_limiter`, que se reduce ante timeouts,
+        errores 5xx o 429 y crece mientras el MS responde bien.
+        """
+        breaker = get_ms_breaker()
+        limiter = get_ms_limiter()
+        try:
+            breaker.before_call()
+        except CircuitOpenError as e:
+            raise ExternalServiceException(UNAVAILABLE_MSG) from e
+
+        await limiter.acquire()
+        failed = overloaded = True
+        try:
+            resp = await self._send(method, url, **kwargs)
+            failed = resp.status_code >= 500
+            overloaded = failed or resp.status_code == 429
+        finally:
+            limiter.release(overloaded=overloaded)
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return self._parse_response(resp)
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Envía la petición con el token, renovándolo una vez si expiró."""
+        client = self.get_shared_client(self.base_url, self.timeout)
+        try:
+            token = auth_service.token or await auth_service.login(client)
             headers = kwargs.pop("headers", {})
             headers["Authorization"] = token
-
-            try:
-                # Usar cliente compartido para reutilizar conexiones
-                client = self.get_shared_client(self.base_url, self.timeout)
+            resp = await client.request(method, url, headers=headers, **kwargs)
+
+            if resp.status_code == 401:
+                # Otra petición pudo haber renovado el token mientras tanto
+                fresh = auth_service.token
+                if not fresh or fresh == token:
+                    fresh = await auth_service.login(client)
+                headers["Authorization"] = fresh
                 resp = await client.request(method, url, headers=headers, **kwargs)
-
-                if resp.status_code == 401:
-                    token = await auth_service.login()
-                    headers["Authorization"] = token
-                    resp = await client.request(method, url, headers=headers, **kwargs)
-
-                if resp.status_code >= 400:
-                    try:
-                        error_data = resp.json()
-                        if isinstance(error_data, dict):
-                            error_message = (
-                                error_data.get("message")
-                                or error_data.get("detail")
-                                or error_data.get("error")
-                                or "Error desconocido"
-                            )
-                        elif isinstance(error_data, list) and error_data:
-                            # FastAPI/Pydantic suele devolver una lista de errores.
-                            first = error_data[0]
-                            if isinstance(first, dict):
-                                error_message = (
-                                    first.get("message")
-                                    or first.get("detail")
-                                    or first.get("msg")
-                                    or "Error desconocido"
-                                )
-                            else:
-                                error_message = str(first)
-                        else:
-                            error_message = "Error desconocido"
-                    except Exception:
-                        error_message = resp.text or f"Error {resp.status_code}"
-
-                    # Si el MS devuelve un error genérico, añadir contexto
-                    generic_errors = [
-                        "error de validacion de datos",
-                        "validation error",
-                        "error desconocido",
-                    ]
-                    if error_message.lower().strip(".") in generic_errors:
+        except NETWORK_ERRORS as e:
+            raise ExternalServiceException(UNAVAILABLE_MSG) from e
+        return resp
+
+    @staticmethod
+    def _parse_response(resp: httpx.Response) -> Any:
+        """Devuelve el JSON de la respuesta o lanza el error del MS."""
+        if resp.status_code >= 400:
+            try:
+                error_data = resp.json()
+                if isinstance(error_data, dict):
+                    error_message = (
+                        error_data.get("message")
+                        or error_data.get("detail")
+                        or error_data.get("error")
+                        or "Error desconocido"
+                    )
+                elif isinstance(error_data, list) and error_data:
+                    # FastAPI/Pydantic suele devolver una lista de errores.
+                    first = error_data[0]
+                    if isinstance(first, dict):
                         error_message = (
-                            "El sistema de usuarios institucional rechazó los datos. "
-                            "Esto puede deberse a que el número de identificación "
-                            "no es válido según sus reglas de validación."
+                            first.get("message")
+                            or first.get("detail")
+                            or first.get("msg")
+                            or "Error desconocido"
                         )
-
-                    raise ValidationException(error_message)
-
-                return resp.json()
-
-            except (
-                httpx.ConnectError,
-                httpx.TimeoutException,
-                httpx.ConnectTimeout,
-            ) as e:
-                raise ExternalServiceException(
-                    "El servicio de usuarios no está disponible. "
-                    "Por favor, intente nuevamente más tarde."
-                ) from e
+                    else:
+                        error_message = str(first)
+                else:
+                    error_message = "Error desconocido"
+            except Exception:
+                error_message = resp.text or f"Error {resp.status_code}"
+
+            # Si el MS devuelve un error genérico, añadir contexto
+            generic_errors = [
+                "error de validacion de datos",
+                "validation error",
+                "error desconocido",
+            ]
+            if error_message.lower().strip(".") in generic_errors:
+                error_message = (
+                    "El sistema de usuarios institucional rechazó los datos. "
+                    "Esto puede deberse a que el número de identificación "
+                    "no es válido según sus reglas de validación."
+                )
+
+            raise ValidationException(error_message)
+
+        return resp.json()
 
     async def create_person(self, data: Dict[str, Any]) -> Dict[str, Any]:
         return await self._authorized_request("POST", "/api/person/save", json=data)
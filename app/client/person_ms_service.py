@@ -1,16 +1,22 @@
 """Servicio para gestionar operaciones con el MS de personas/usuarios."""
 
+import asyncio
 import logging
 import secrets
 import unicodedata
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set
 
+from app.client.person_cache import PersonCache, person_cache
 from app.client.person_client import PersonClient
+from app.core.config import settings
 from app.schemas.user_schema import CreatePersonInMSRequest
 from app.utils.exceptions import ExternalServiceException, ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Consultas que siguen en segundo plano tras vencer la espera de un listado
+_background_lookups: Set[asyncio.Task] = set()
+
 # Constante para mensaje de servicio no disponible
 SERVICE_UNAVAILABLE_MSG = (
     "El servicio de usuarios no está disponible. "
@@ -21,8 +27,13 @@ SERVICE_UNAVAILABLE_MSG = (
 class PersonMSService:
     """Servicio que encapsula toda la lógica de interacción con el MS de usuarios."""
 
-    def __init__(self, person_client: Optional[PersonClient] = None):
+    def __init__(
+        self,
+        person_client: Optional[PersonClient] = None,
+        cache: Optional[PersonCache] = None,
+    ):
         self.person_client = person_client or PersonClient()
+        self.cache = cache or person_cache
 
     async def create_or_get_person(self, data: CreatePersonInMSRequest) -> str:
         """
@@ -34,6 +45,7 @@ class PersonMSService:
 
         # DEBUG: Log del payload enviado al MS
         logger.info(f"[DEBUG] Sending to MS: {person_payload}")
+        await self.cache.invalidate(data.dni)
         try:
             save_resp = await self.person_client.create_person_with_account(
                 person_payload
@@ -90,6 +102,7 @@ class PersonMSService:
 
         try:
             update_resp = await self.person_client.update_person(person_payload)
+            await self.cache.invalidate(dni)
             external = self._extract_external(update_resp)
 
             if external:
@@ -119,10 +132,13 @@ class PersonMSService:
     async def get_user_by_identification(self, identification: str) -> dict:
         """
         Obtiene un usuario por su identificación desde el MS de usuarios.
+        Las respuestas se guardan en la caché de personas (ver `person_cache`).
         """
         try:
-            user_resp = await self.person_client.get_by_identification(identification)
-            return user_resp
+            return await self.cache.get_or_load(
+                identification,
+                lambda: self.person_client.get_by_identification(identification),
+            )
         except ExternalServiceException:
             raise
         except Exception as e:
@@ -131,8 +147,74 @@ class PersonMSService:
             )
             raise ExternalServiceException(SERVICE_UNAVAILABLE_MSG) from e
 
+    async def get_many_by_identification(
+        self, identifications: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Obtiene varias personas a la vez para enriquecer listados.
+
+        Lo que está en caché no se consulta; el resto se pide en paralelo
+        (limitado por `get_ms_limiter` y con el cliente HTTP compartido).
+        Con muchas ausencias se usa un único `get_all_filter`. Las consultas
+        que no responden dentro de `timeout` quedan en None y siguen en
+        segundo plano para llenar la caché.
+
+        Returns:
+            Respuesta del MS por identificación (None si no se obtuvo)
+        """
+        ids = list(dict.fromkeys(str(i).strip() for i in identifications if i))
+        cached = await asyncio.gather(*(self.cache.peek(i) for i in ids))
+        results = dict(zip(ids, cached, strict=True))
+        missing = [i for i in ids if results[i] is None]
+        if not missing:
+            return results
+
+        if len(missing) >= settings.PERSON_MS_SNAPSHOT_THRESHOLD:
+            snapshot = await self._get_snapshot_by_identification()
+            if snapshot is not None:
+                for identification in missing:
+                    results[identification] = snapshot.get(identification)
+                    await self.cache.put(identification, results[identification])
+                return results
+
+        tasks = {
+            i: asyncio.ensure_future(self.get_user_by_identification(i))
+            for i in missing
+        }
+        done, pending = await asyncio.wait(
+            tasks.values(),
+            timeout=timeout or settings.PERSON_MS_BATCH_TIMEOUT_SECONDS,
+        )
+        for identification, task in tasks.items():
+            if task in done and task.exception() is None:
+                results[identification] = task.result()
+            elif task in done:
+                logger.warning(
+                    f"No se pudo obtener la persona {identification} del MS: "
+                    f"{task.exception()}"
+                )
+        for task in pending:
+            _background_lookups.add(task)
+            task.add_done_callback(_discard_background_lookup)
+        if pending:
+            logger.warning(f"{len(pending)} consultas al MS superaron la espera")
+        return results
+
     # Metodos privados
 
+    async def _get_snapshot_by_identification(self) -> Optional[Dict[str, dict]]:
+        """Listado completo del MS indexado por identificación (None si falla)."""
+        try:
+            people = await self.get_all_users()
+        except ExternalServiceException as e:
+            logger.warning(f"Listado completo del MS no disponible: {e}")
+            return None
+        return {
+            str(person["identification"]).strip(): {"status": "success", "data": person}
+            for person in people
+            if isinstance(person, dict) and person.get("identification")
+        }
+
     def _build_person_payload(self, data: CreatePersonInMSRequest) -> dict:
         """Construye el payload para crear persona en el MS."""
         # Convertir Enum a string si es necesario
@@ -371,3 +453,9 @@ class PersonMSService:
         """Detecta si una excepción indica duplicación."""
         message = getattr(exc, "message", "") or str(exc)
         return PersonMSService._is_duplicate_message(message)
+
+
+def _discard_background_lookup(task: asyncio.Task) -> None:
+    _background_lookups.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Consulta al MS en segundo plano falló: {task.exception()}")
@@ -0,0 +1,149 @@
+"""Protección de las llamadas a servicios externos.
+
+`CircuitBreaker` corta las llamadas a un servicio caído (cerrado, abierto,
+semiabierto) y `AdaptiveLimiter` ajusta la concurrencia permitida con AIMD:
+suma de a poco mientras el servicio responde y reduce a la mitad ante
+timeouts o errores del servidor.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """El circuito está abierto: la llamada no se intenta."""
+
+
+class CircuitBreaker:
+    """
+    Circuito por servicio.
+
+    Tras `failure_threshold` fallos seguidos se abre y rechaza llamadas
+    durante `reset_timeout` segundos. Luego deja pasar `half_open_max_calls`
+    llamadas de prueba: si salen bien se cierra, si fallan se vuelve a abrir.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        elapsed = self._clock() - self._opened_at
+        if self._state == OPEN and elapsed >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """Reserva el paso de una llamada o lanza CircuitOpenError."""
+        state = self.state
+        if state == OPEN or (
+            state == HALF_OPEN and self._trial_calls >= self.half_open_max_calls
+        ):
+            self.rejected += 1
+            raise CircuitOpenError("circuito abierto")
+        if state == HALF_OPEN:
+            self._trial_calls += 1
+
+    def record_success(self) -> None:
+        self._state = CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = OPEN
+            self._opened_at = self._clock()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self.rejected,
+        }
+
+
+class AdaptiveLimiter:
+    """
+    Límite de llamadas concurrentes con incremento aditivo y reducción
+    multiplicativa (AIMD).
+
+    Cada éxito suma `1 / limit` (un lugar más por ventana completa) y cada
+    señal de sobrecarga multiplica el límite por `decrease_factor`.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    self._wake()  # ceder el lugar que se le había dado
+                raise
+        self.in_flight += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        """Libera un lugar ajustando el límite según el resultado."""
+        self.in_flight -= 1
+        if overloaded:
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+        }
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -13,19 +16,16 @@ from app.schemas.account_schema import (
 )
 from app.utils.email_client import send_reset_email
 from app.utils.exceptions import UnauthorizedException
+from app.utils.password_service import password_service
+from app.utils.principal_cache import principal_cache
 from app.utils.security import (
     create_access_token,
     create_refresh_token,
     create_reset_token,
-    hash_password,
     validate_refresh_token,
     validate_reset_token,
-    verify_password,
 )
 
-# Hash ficticio para mitigar ataques de timing en login cuando el email no existe
-DUMMY_PASSWORD_HASH = hash_password("DummyPass123!")
-
 
 class AccountController:
     """Controlador de cuentas de usuario."""
@@ -33,19 +33,40 @@ class AccountController:
     def __init__(self) -> None:
         self.account_dao = AccountDAO()
 
-    def login(self, db: Session, payload: LoginRequest) -> LoginResponse:
-        """Iniciar sesión y obtener un token de acceso."""
+    async def login(self, db: AsyncSession, payload: LoginRequest) -> LoginResponse:
+        """Iniciar sesión y obtener un token de acceso.
+
+        bcrypt corre en `password_service`; si el hash guardado usa otro
+        costo que `BCRYPT_ROUNDS` se reemplaza por uno nuevo.
+        """
         email = payload.email.strip().lower()
-        account = self.account_dao.get_by_email(db, email, only_active=True)
+        account = await db.run_sync(
+            self.account_dao.get_by_email, email, only_active=True
+        )
 
         if not account:
             # Verificamos contra un hash ficticio para igualar tiempos de respuesta
-            verify_password(payload.password, DUMMY_PASSWORD_HASH)
+            await password_service.verify(
+                payload.password, await password_service.dummy_hash()
+            )
             raise UnauthorizedException("Credenciales inválidas")
 
-        if not verify_password(payload.password, account.password_hash):
+        valid, new_hash = await password_service.verify_and_update(
+            payload.password, account.password_hash
+        )
+        if not valid:
             raise UnauthorizedException("Credenciales inválidas")
 
+        return await db.run_sync(self._issue_tokens, account, new_hash)
+
+    def _issue_tokens(
+        self, db: Session, account: Account, new_hash: Optional[str] = None
+    ) -> LoginResponse:
+        """Genera los tokens de la cuenta, guardando antes el hash rehasheado."""
+        if new_hash:
+            account.password_hash = new_hash
+            db.commit()
+
         access_token = self.generate_jwt(account)
         refresh_token = create_refresh_token(subject=account.id)
 
@@ -103,36 +124,40 @@ class AccountController:
             to_email=account.email, full_name=email, reset_token=reset_token
         )
 
-    def change_password(
-        self, db: Session, user_id: int, payload: ChangePasswordRequest
+    async def change_password(
+        self, db: AsyncSession, user_id: int, payload: ChangePasswordRequest
     ) -> None:
         """Cambia la contraseña de un usuario autenticado.
 
         Args:
-            db: Sesión de base de datos.
+            db: Sesión asíncrona de base de datos.
             user_id: ID del usuario autenticado.
             payload: Datos de cambio de contraseña.
 
         Raises:
             UnauthorizedException: Si la contraseña actual es incorrecta.
         """
-        account = self.account_dao.get_by_id(db, user_id, only_active=True)
+        account = await db.run_sync(
+            self.account_dao.get_by_id, user_id, only_active=True
+        )
         if not account:
             raise UnauthorizedException("Cuenta no encontrada")
 
-        if not verify_password(payload.current_password, account.password_hash):
+        if not await password_service.verify(
+            payload.current_password, account.password_hash
+        ):
             raise UnauthorizedException("Contraseña actual incorrecta")
 
-        account.password_hash = hash_password(payload.new_password)
-        db.commit()
+        new_hash = await password_service.hash(payload.new_password)
+        await db.run_sync(self.set_password_hash, account, new_hash)
 
-    def confirm_password_reset(
-        self, db: Session, payload: PasswordResetConfirm
+    async def confirm_password_reset(
+        self, db: AsyncSession, payload: PasswordResetConfirm
     ) -> None:  # noqa: E501
         """Valida el token de reset y actualiza la contraseña.
 
         Args:
-            db: Sesión de base de datos.
+            db: Sesión asíncrona de base de datos.
             payload: Token de reset y la nueva contraseña.
 
         Raises:
@@ -142,12 +167,21 @@ class AccountController:
         data = validate_reset_token(payload.token)
         account_id = int(data["sub"])
 
-        account = self.account_dao.get_by_id(db, account_id, only_active=True)
+        account = await db.run_sync(
+            self.account_dao.get_by_id, account_id, only_active=True
+        )
         if not account:
             raise UnauthorizedException("Cuenta no encontrada o inactiva")
 
-        account.password_hash = hash_password(payload.new_password)
+        new_hash = await password_service.hash(payload.new_password)
+        await db.run_sync(self.set_password_hash, account, new_hash)
+
+    def set_password_hash(self, db: Session, account: Account, new_hash: str) -> None:
+        """Guarda el nuevo hash y descarta los principales en caché de la cuenta."""
+        account_id = account.id
+        account.password_hash = new_hash
         db.commit()
+        principal_cache.invalidate(account_id)
 
     def refresh_token(self, db: Session, payload: RefreshTokenRequest) -> LoginResponse:
         """Genera un nuevo access token usando un refresh token válido.
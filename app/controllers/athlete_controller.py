@@ -1,5 +1,6 @@
 import logging
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.client.person_ms_service import PersonMSService
@@ -32,7 +33,11 @@ logger = logging.getLogger(__name__)
 
 
 class AthleteController:
-    """Controlador de atletas del club."""
+    """Controlador de atletas del club.
+
+    Los métodos que esperan al MS de personas reciben una `AsyncSession` y
+    ejecutan los DAO con `run_sync`, sin bloquear el event loop.
+    """
 
     def __init__(self) -> None:
         self.athlete_dao = AthleteDAO()
@@ -42,7 +47,7 @@ class AthleteController:
         self.person_ms_service = PersonMSService()
 
     async def register_athlete_unl(
-        self, db: Session, data: AthleteInscriptionDTO
+        self, db: AsyncSession, data: AthleteInscriptionDTO
     ) -> AthleteInscriptionResponseDTO:
         """
         Registra un atleta de la UNL.
@@ -59,7 +64,7 @@ class AthleteController:
         dni = data.dni
 
         # Validar unicidad en todas las entidades locales ANTES del MS externo
-        validate_dni_not_exists_locally(db, dni)
+        await db.run_sync(validate_dni_not_exists_locally, dni)
 
         # Crear o recuperar persona en MS de usuarios
         external_person_id = await self.person_ms_service.create_or_get_person(
@@ -96,11 +101,10 @@ class AthleteController:
             sex=sex,
         )
 
-        athlete = self.athlete_dao.create(db, athlete_payload.model_dump())
-
-        # Crear estadísticas iniciales
-        statistic_payload = StatisticCreateDB(athlete_id=athlete.id)
-        statistic = self.statistic_dao.create(db, statistic_payload.model_dump())
+        # Crear atleta y estadísticas iniciales
+        athlete, statistic = await db.run_sync(
+            self._create_athlete_with_statistic, athlete_payload.model_dump()
+        )
 
         return AthleteInscriptionResponseDTO(
             athlete_id=athlete.id,
@@ -110,7 +114,7 @@ class AthleteController:
         )
 
     async def register_minor_athlete(
-        self, db: Session, data: MinorAthleteInscriptionDTO
+        self, db: AsyncSession, data: MinorAthleteInscriptionDTO
     ) -> MinorAthleteInscriptionResponseDTO:
         """
         Registra un deportista menor de edad junto con su representante.
@@ -134,11 +138,11 @@ class AthleteController:
             )
 
         # Validar que el DNI del atleta no exista en ninguna entidad
-        validate_dni_not_exists_locally(db, athlete_data.dni)
+        await db.run_sync(validate_dni_not_exists_locally, athlete_data.dni)
 
         # 1. Buscar representante existente por DNI
-        existing_rep = self.representative_dao.get_by_field(
-            db, "dni", rep_data.dni, only_active=True
+        existing_rep = await db.run_sync(
+            self.representative_dao.get_by_field, "dni", rep_data.dni, only_active=True
         )
 
         representative_is_new = False
@@ -158,8 +162,8 @@ class AthleteController:
             representative_is_new = True
 
             # Validar que el DNI del representante no exista como usuario o atleta
-            validate_dni_not_exists_locally(
-                db,
+            await db.run_sync(
+                validate_dni_not_exists_locally,
                 rep_data.dni,
                 check_users=True,
                 check_athletes=False,  # Permitir que un representante sea deportista
@@ -213,8 +217,8 @@ class AthleteController:
                 relationship_type=relationship,  # Pasar enum, no el value
             )
 
-            new_representative = self.representative_dao.create(
-                db, rep_payload.model_dump(mode="python")
+            new_representative = await db.run_sync(
+                self.representative_dao.create, rep_payload.model_dump(mode="python")
             )
             representative_id = new_representative.id
             representative_full_name = new_representative.full_name
@@ -271,11 +275,10 @@ class AthleteController:
         athlete_dict = athlete_payload.model_dump()
         athlete_dict["representative_id"] = representative_id
 
-        athlete = self.athlete_dao.create(db, athlete_dict)
-
-        # 4. Crear estadísticas iniciales
-        statistic_payload = StatisticCreateDB(athlete_id=athlete.id)
-        statistic = self.statistic_dao.create(db, statistic_payload.model_dump())
+        # 4. Crear atleta y estadísticas iniciales
+        athlete, statistic = await db.run_sync(
+            self._create_athlete_with_statistic, athlete_dict
+        )
 
         logger.info(
             f"Atleta menor registrado: {athlete_full_name} "
@@ -293,6 +296,13 @@ class AthleteController:
             statistic_id=statistic.id,
         )
 
+    def _create_athlete_with_statistic(self, db: Session, athlete_data: dict) -> tuple:
+        """Crea el atleta y sus estadísticas iniciales."""
+        athlete = self.athlete_dao.create(db, athlete_data)
+        statistic_payload = StatisticCreateDB(athlete_id=athlete.id)
+        statistic = self.statistic_dao.create(db, statistic_payload.model_dump())
+        return athlete, statistic
+
     def get_all_athletes(
         self, db: Session, filters: AthleteFilter
     ) -> PaginatedResponse:
@@ -300,16 +310,9 @@ class AthleteController:
         Obtiene atletas aplicando los filtros recibidos.
         Retorna un PaginatedResponse con lista de AthleteResponse.
         """
-        items, total = self.athlete_dao.get_all_with_filters(db, filters=filters)
-
-        # Obtener DNIs de todos los atletas para verificar cuentas
-        athlete_dnis = [athlete.dni for athlete in items]
-
-        # Verificar cuáles tienen cuenta en el sistema
-        existing_users = {}
-        for dni in athlete_dnis:
-            user = self.user_dao.get_by_field(db, "dni", dni, only_active=False)
-            existing_users[dni] = user is not None
+        rows, total, next_cursor = self.athlete_dao.get_all_with_account_flag(
+            db, filters=filters
+        )
 
         athlete_responses = [
             AthleteResponse(
@@ -319,7 +322,7 @@ class AthleteController:
                 type_athlete=athlete.type_athlete,
                 sex=getattr(athlete.sex, "value", str(athlete.sex)),
                 is_active=athlete.is_active,
-                has_account=existing_users.get(athlete.dni, False),
+                has_account=has_account,
                 height=athlete.height,
                 weight=athlete.weight,
                 created_at=(
@@ -329,7 +332,7 @@ class AthleteController:
                     athlete.updated_at.isoformat() if athlete.updated_at else None
                 ),
             )
-            for athlete in items
+            for athlete, has_account in rows
         ]
 
         return PaginatedResponse(
@@ -337,8 +340,26 @@ class AthleteController:
             total=total,
             page=filters.page,
             limit=filters.limit,
+            next_cursor=next_cursor,
         )
 
+    async def enrich_with_person_data(
+        self, page: PaginatedResponse
+    ) -> PaginatedResponse:
+        """
+        Completa teléfono y dirección de cada atleta del listado con los datos
+        del MS de personas (una consulta por lote, no por atleta).
+        """
+        people = await self.person_ms_service.get_many_by_identification(
+            item["dni"] for item in page.items
+        )
+        for item in page.items:
+            ms_data = (people.get(item["dni"]) or {}).get("data")
+            if isinstance(ms_data, dict):
+                item["phone"] = ms_data.get("phono")
+                item["direction"] = ms_data.get("direction")
+        return page
+
     def get_athlete_by_id(self, db: Session, athlete_id: int):
         """
         Obtiene un atleta por su ID.
@@ -349,13 +370,15 @@ class AthleteController:
         return athlete
 
     async def update_athlete(
-        self, db: Session, athlete_id: int, update_data: dict
+        self, db: AsyncSession, athlete_id: int, update_data: dict
     ) -> AthleteUpdateResponse:
         """
         Actualiza los datos básicos de un atleta y sincroniza con MS de personas.
         Similar a admin_update_user: simple y directo.
         """
-        athlete = self.athlete_dao.get_by_id(db=db, id=athlete_id, only_active=False)
+        athlete = await db.run_sync(
+            self.athlete_dao.get_by_id, athlete_id, only_active=False
+        )
         if not athlete:
             raise ValidationException("Atleta no encontrado")
 
@@ -425,7 +448,9 @@ class AthleteController:
                 update_data["sex"] = sex_mapping[sex_value]
 
         # Actualizar datos locales del atleta
-        updated_athlete = self.athlete_dao.update(db, athlete_id, update_data)
+        updated_athlete = await db.run_sync(
+            self.athlete_dao.update, athlete_id, update_data
+        )
         if not updated_athlete:
             raise ValidationException("Error al actualizar el atleta")
 
@@ -463,13 +488,13 @@ class AthleteController:
         self.athlete_dao.update(db, athlete_id, {"is_active": True})
 
     async def get_athlete_with_ms_info(
-        self, db: Session, athlete_id: int
+        self, db: AsyncSession, athlete_id: int
     ) -> AthleteDetailResponse:
         """
         Obtiene un atleta con toda la información local y del MS de usuarios.
         Retorna AthleteDetailResponse con datos unificados (sin duplicados).
         """
-        athlete = self.get_athlete_by_id(db=db, athlete_id=athlete_id)
+        athlete = await db.run_sync(self.get_athlete_by_id, athlete_id)
 
         # Datos base del atleta local
         first_name: str | None = None
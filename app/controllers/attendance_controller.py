@@ -2,7 +2,7 @@
 
 import logging
 from datetime import date, datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -37,11 +37,10 @@ class AttendanceController:
         Raises:
             NotFoundException: Si algún atleta no existe
         """
-        missing_ids = []
-        for athlete_id in athlete_ids:
-            athlete = self.athlete_dao.get_by_id(db, athlete_id)
-            if not athlete:
-                missing_ids.append(athlete_id)
+        existing_ids = self.athlete_dao.get_existing_ids(db, athlete_ids)
+        missing_ids = [
+            athlete_id for athlete_id in athlete_ids if athlete_id not in existing_ids
+        ]
         return missing_ids
 
     def create_bulk_attendance(
@@ -120,7 +119,7 @@ class AttendanceController:
         self,
         db: Session,
         filters: AttendanceFilter,
-    ) -> Tuple[list, int]:
+    ) -> Tuple[list, Optional[int], Optional[str]]:
         """
         Obtener asistencias por fecha con filtros.
 
@@ -129,16 +128,19 @@ class AttendanceController:
             filters: Filtros de búsqueda
 
         Returns:
-            Tupla con lista de asistencias formateadas y total
+            Tupla con lista de asistencias formateadas, total y `next_cursor`
         """
         try:
-            attendances, total = self.attendance_dao.get_by_date(
+            attendances, total, next_cursor = self.attendance_dao.get_by_date(
                 db=db,
                 target_date=filters.attendance_date,
                 type_athlete=filters.type_athlete,
                 search=filters.search,
                 skip=filters.skip,
                 limit=filters.limit,
+                keyset=filters.use_cursor,
+                cursor=filters.cursor,
+                count=filters.count,
             )
 
             # Formatear respuesta
@@ -165,7 +167,7 @@ class AttendanceController:
                     }
                 )
 
-            return formatted, total
+            return formatted, total, next_cursor
 
         except AppException:
             raise
@@ -7,6 +7,7 @@ from app.controllers.statistic_controller import statistic_controller
 from app.dao.athlete_dao import AthleteDAO
 from app.dao.endurance_test_dao import EnduranceTestDAO
 from app.dao.evaluation_dao import EvaluationDAO
+from app.dao.statistic_dao import contribution_of
 from app.dao.test_dao import TestDAO
 from app.models.athlete import Athlete
 from app.models.endurance_test import EnduranceTest
@@ -33,6 +34,7 @@ class EnduranceTestController:
         min_duration: int,
         total_distance_m: float,
         observations: str | None = None,
+        sync_stats: bool = False,
     ) -> Test:
         """Crear EnduranceTest para una evaluación y atleta dados."""
         if not self.evaluation_dao.get_by_id(db, evaluation_id):
@@ -51,11 +53,15 @@ class EnduranceTestController:
         )
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, athlete_id)
+        statistic_controller.record_test_change(
+            db, after=contribution_of(test), sync=sync_stats
+        )
 
         return test
 
-    def update_test(self, db: Session, test_id: int, **fields) -> Test | None:
+    def update_test(
+        self, db: Session, test_id: int, sync_stats: bool = False, **fields
+    ) -> Test | None:
         """Actualizar un EnduranceTest existente."""
         if "evaluation_id" in fields and fields["evaluation_id"] is not None:
             if not self.evaluation_dao.get_by_id(db, fields["evaluation_id"]):
@@ -74,24 +80,30 @@ class EnduranceTestController:
         if not fields:
             return existing
 
-        return self.endurance_test_dao.update(db, test_id, fields)
+        before = contribution_of(existing)
+        test = self.endurance_test_dao.update(db, test_id, fields)
+        statistic_controller.record_test_change(
+            db, before=before, after=contribution_of(test), sync=sync_stats
+        )
+        return test
 
-    def delete_test(self, db: Session, test_id: int) -> bool:
+    def delete_test(self, db: Session, test_id: int, sync_stats: bool = False) -> bool:
         """Eliminar un EnduranceTest existente."""
         existing = self.endurance_test_dao.get_by_id(db, test_id, only_active=True)
         if not existing:
             return False
 
+        before = contribution_of(existing)
         self.endurance_test_dao.delete(db, test_id)
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, existing.athlete_id)
+        statistic_controller.record_test_change(db, before=before, sync=sync_stats)
         return True
 
     def list_tests(
         self, db: Session, filters: EnduranceTestFilter
-    ) -> tuple[list[Test], int]:
-        """Listar EnduranceTests con paginación y filtros."""
+    ) -> tuple[list[Test], int | None, str | None]:
+        """Listar EnduranceTests con paginación (offset o cursor) y filtros."""
         query = db.query(Test).join(EnduranceTest).filter(Test.is_active)
 
         if filters.evaluation_id is not None:
@@ -103,6 +115,17 @@ class EnduranceTestController:
                 Athlete.full_name.ilike(f"%{filters.search}%")
             )
 
+        if filters.use_cursor:
+            return self.test_dao.paginate_keyset(
+                db,
+                query,
+                Test.date,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+
         total = query.with_entities(func.count(Test.id)).scalar()
 
         items = (
@@ -112,4 +135,4 @@ class EnduranceTestController:
             .all()
         )
 
-        return items, total
+        return items, total, None
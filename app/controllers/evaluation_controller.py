@@ -71,8 +71,8 @@ class EvaluationController:
 
     def list_evaluations_paginated(
         self, db: Session, filters: EvaluationFilter
-    ) -> tuple[list[Evaluation], int]:
-        """Listar evaluaciones con paginación y filtros básicos."""
+    ) -> tuple[list[Evaluation], int | None, str | None]:
+        """Listar evaluaciones con paginación (offset o cursor) y filtros básicos."""
         query = db.query(Evaluation).filter(Evaluation.is_active)
 
         if filters.user_id:
@@ -90,6 +90,17 @@ class EvaluationController:
             like = f"%{filters.location.strip()}%"
             query = query.filter(Evaluation.location.ilike(like))
 
+        if filters.use_cursor:
+            return self.evaluation_dao.paginate_keyset(
+                db,
+                query,
+                Evaluation.date,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+
         total = query.with_entities(func.count()).scalar() or 0
 
         items = (
@@ -99,7 +110,7 @@ class EvaluationController:
             .all()
         )
 
-        return items, total
+        return items, total, None
 
     def list_evaluations_by_user(
         self, db: Session, user_id: int, skip: int = 0, limit: int = 100
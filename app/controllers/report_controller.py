@@ -1,13 +1,17 @@
 """Controlador de reportes deportivos - Refactorizado."""
 
 import logging
+from functools import cached_property
 from io import BytesIO
+from typing import Iterator, Optional
 
 from sqlalchemy.orm import Session
 
+from app.dao.report_dao import ReportDAO
 from app.schemas.report_schema import ReportFilter, ReportType
-from app.services.report_service import ReportService
-from app.utils.exceptions import ValidationException
+from app.services.report_cache import report_cache
+from app.services.report_jobs import ReportJob
+from app.utils.exceptions import AppException, ValidationException
 
 logger = logging.getLogger(__name__)
 
@@ -16,24 +20,59 @@ class ReportController:
     """Controlador de reportes que delega a ReportService."""
 
     def __init__(self):
-        self.report_service = ReportService()
+        self.report_dao = ReportDAO()
+        self.report_cache = report_cache
+
+    @cached_property
+    def report_service(self):
+        """ReportService creado en el primer uso (importa pandas y matplotlib)."""
+        from app.services.report_service import ReportService
+
+        return ReportService()
+
+    def report_cache_key(
+        self, db: Session, filters: ReportFilter, user_name: str
+    ) -> Optional[str]:
+        """
+        Clave de caché (y ETag) del reporte: hash del tipo, formato, filtros
+        normalizados, usuario (aparece en el documento) y versión de datos.
+
+        Returns:
+            La clave, o None si el reporte no se cachea (modo raw o caché
+            deshabilitada)
+        """
+        if not self.report_cache.enabled or not filters.report_type:
+            return None
+        if filters.mode == "raw":
+            return None
+        version = self.report_dao.data_version(db, filters.report_type.value)
+        normalized = filters.model_dump(mode="json", exclude={"background"})
+        return self.report_cache.key(normalized, user_name, version)
 
     def generate_report(
         self,
         db: Session,
         filters: ReportFilter,
         user_name: str,
-    ) -> BytesIO:
+        cache_key: Optional[str] = None,
+    ) -> BytesIO | Iterator[bytes] | ReportJob:
         """
         Genera un reporte según el tipo especificado.
 
+        Con `filters.mode == "raw"` devuelve un iterador de bytes con los
+        registros individuales (exportación en streaming). Los PDF grandes o
+        pedidos en segundo plano devuelven el ReportJob que los genera.
+        Los reportes ya generados con los mismos datos se sirven desde la
+        caché en disco.
+
         Args:
             db: Sesión de BD
             filters: Filtros del reporte
             user_name: Usuario que genera el reporte
+            cache_key: Clave ya calculada con `report_cache_key` (opcional)
 
         Returns:
-            BytesIO con el reporte generado
+            BytesIO con el reporte, iterador de bytes (modo raw) o ReportJob
 
         Raises:
             ValidationException: Si el tipo de reporte no es válido
@@ -45,26 +84,50 @@ class ReportController:
                     "Debe especificar un tipo de reporte (attendance, tests, statistics"
                 )
 
-            # Delegar a ReportService según tipo
-            if filters.report_type == ReportType.ATTENDANCE:
-                return self.report_service.generate_attendance_report(
-                    db=db, filters=filters, user_name=user_name
-                )
-            elif filters.report_type == ReportType.TESTS:
-                return self.report_service.generate_tests_report(
-                    db=db, filters=filters, user_name=user_name
-                )
-            elif filters.report_type == ReportType.STATISTICS:
-                return self.report_service.generate_statistics_report(
-                    db=db, filters=filters, user_name=user_name
-                )
-            else:
-                raise ValidationException(
-                    f"Tipo de reporte no válido: {filters.report_type}"
-                )
+            if filters.mode == "raw":
+                return self.report_service.stream_raw_report(db=db, filters=filters)
+
+            key = cache_key or self.report_cache_key(db, filters, user_name)
+            if key and (cached := self.report_cache.get(key)) is not None:
+                return BytesIO(cached)
+
+            result = self._build_report(db, filters, user_name)
+            if key:
+                self._store(key, result)
+            return result
 
-        except ValidationException:
+        except AppException:
             raise
         except Exception as e:
             logger.error(f"Error generando reporte: {str(e)}")
             raise ValidationException(f"Error al generar reporte: {str(e)}") from e
+
+    def _build_report(
+        self, db: Session, filters: ReportFilter, user_name: str
+    ) -> BytesIO | ReportJob:
+        """Delega a ReportService según el tipo de reporte."""
+        if filters.report_type == ReportType.ATTENDANCE:
+            return self.report_service.generate_attendance_report(
+                db=db, filters=filters, user_name=user_name
+            )
+        elif filters.report_type == ReportType.TESTS:
+            return self.report_service.generate_tests_report(
+                db=db, filters=filters, user_name=user_name
+            )
+        elif filters.report_type == ReportType.STATISTICS:
+            return self.report_service.generate_statistics_report(
+                db=db, filters=filters, user_name=user_name
+            )
+        raise ValidationException(f"Tipo de reporte no válido: {filters.report_type}")
+
+    def _store(self, key: str, result: BytesIO | ReportJob) -> None:
+        """Guarda el reporte en caché (los trabajos, al terminar)."""
+        if isinstance(result, BytesIO):
+            self.report_cache.put(key, result.getvalue())
+        elif isinstance(result, ReportJob):
+
+            def on_done(future):
+                if not future.cancelled() and future.exception() is None:
+                    self.report_cache.put(key, future.result())
+
+            result.future.add_done_callback(on_done)
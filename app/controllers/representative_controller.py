@@ -3,6 +3,7 @@
 import logging
 from typing import Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.client.person_ms_service import PersonMSService
@@ -28,14 +29,18 @@ logger = logging.getLogger(__name__)
 
 
 class RepresentativeController:
-    """Controlador de representantes."""
+    """Controlador de representantes.
+
+    Los métodos que esperan al MS de personas reciben una `AsyncSession` y
+    ejecutan los DAO con `run_sync`, sin bloquear el event loop.
+    """
 
     def __init__(self):
         self.representative_dao = RepresentativeDAO()
         self.person_ms_service = PersonMSService()
 
     async def create_representative(
-        self, db: Session, data: RepresentativeInscriptionDTO
+        self, db: AsyncSession, data: RepresentativeInscriptionDTO
     ) -> RepresentativeInscriptionResponseDTO:
         """
         Registra un representante.
@@ -50,7 +55,7 @@ class RepresentativeController:
         dni = data.dni
 
         # Validar unicidad en todas las entidades locales ANTES del MS externo
-        validate_dni_not_exists_locally(db, dni)
+        await db.run_sync(validate_dni_not_exists_locally, dni)
 
         # Crear o recuperar persona en MS de usuarios
         external_person_id = await self.person_ms_service.create_or_get_person(
@@ -86,8 +91,8 @@ class RepresentativeController:
             relationship_type=relationship.value,
         )
 
-        representative = self.representative_dao.create(
-            db, representative_payload.model_dump()
+        representative = await db.run_sync(
+            self.representative_dao.create, representative_payload.model_dump()
         )
 
         return RepresentativeInscriptionResponseDTO(
@@ -150,13 +155,13 @@ class RepresentativeController:
         )
 
     async def get_representative_by_id(
-        self, db: Session, representative_id: int
+        self, db: AsyncSession, representative_id: int
     ) -> RepresentativeDetailResponse:
         """
         Obtiene un representante con toda la información local y del MS.
         """
-        representative = self.representative_dao.get_by_id(
-            db=db, id=representative_id, only_active=True
+        representative = await db.run_sync(
+            self.representative_dao.get_by_id, representative_id, only_active=True
         )
         if not representative:
             raise ValidationException("Representante no encontrado")
@@ -214,15 +219,15 @@ class RepresentativeController:
         )
 
     async def get_representative_by_dni(
-        self, db: Session, dni: str
+        self, db: AsyncSession, dni: str
     ) -> Optional[RepresentativeResponse]:
         """
         Busca un representante por DNI.
         Retorna None si no existe (útil para verificar existencia desde frontend).
         Incluye datos adicionales (nombres, dirección) obtenidos del MS de personas.
         """
-        representative = self.representative_dao.get_by_field(
-            db, "dni", dni, only_active=True
+        representative = await db.run_sync(
+            self.representative_dao.get_by_field, "dni", dni, only_active=True
         )
         if not representative:
             return None
@@ -271,14 +276,14 @@ class RepresentativeController:
         )
 
     async def update_representative(
-        self, db: Session, representative_id: int, data: RepresentativeUpdateDTO
+        self, db: AsyncSession, representative_id: int, data: RepresentativeUpdateDTO
     ) -> RepresentativeDetailResponse:
         """
         Actualiza los datos de un representante.
         Similar a admin_update_user: simple y directo.
         """
-        representative = self.representative_dao.get_by_id(
-            db=db, id=representative_id, only_active=False
+        representative = await db.run_sync(
+            self.representative_dao.get_by_id, representative_id, only_active=False
         )
         if not representative:
             raise ValidationException("Representante no encontrado")
@@ -332,7 +337,9 @@ class RepresentativeController:
             )
 
         # Actualizar localmente
-        updated_rep = self.representative_dao.update(db, representative_id, update_data)
+        updated_rep = await db.run_sync(
+            self.representative_dao.update, representative_id, update_data
+        )
         if not updated_rep:
             raise ValidationException("Error al actualizar el representante")
 
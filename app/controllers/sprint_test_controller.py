@@ -5,6 +5,7 @@ from app.controllers.statistic_controller import statistic_controller
 from app.dao.athlete_dao import AthleteDAO
 from app.dao.evaluation_dao import EvaluationDAO
 from app.dao.sprint_test_dao import SprintTestDAO
+from app.dao.statistic_dao import contribution_of
 from app.dao.test_dao import TestDAO
 from app.models.athlete import Athlete
 from app.models.sprint_test import SprintTest
@@ -30,6 +31,7 @@ class SprintTestController:
         self,
         db: Session,
         payload: CreateSprintTestSchema,
+        sync_stats: bool = False,
     ) -> Test:
         """Crear SprintTest para una evaluación y atleta dados."""
         if not self.evaluation_dao.get_by_id(db, payload.evaluation_id):
@@ -49,12 +51,9 @@ class SprintTestController:
         )
 
         # Actualizar estadísticas del atleta
-        print(
-            "[DEBUG] SprintTest creado. Llamando update_stats para atleta "
-            f"{payload.athlete_id}"
+        statistic_controller.record_test_change(
+            db, after=contribution_of(test), sync=sync_stats
         )
-        result = statistic_controller.update_athlete_stats(db, payload.athlete_id)
-        print(f"[DEBUG] Resultado de update_athlete_stats: {result}")
 
         return test
 
@@ -63,6 +62,7 @@ class SprintTestController:
         db: Session,
         test_id: int,
         payload: UpdateSprintTestSchema,
+        sync_stats: bool = False,
     ) -> Test | None:
         """Actualizar un SprintTest existente."""
         fields = payload.model_dump(exclude_none=True)
@@ -84,24 +84,30 @@ class SprintTestController:
         if not fields:
             return existing
 
-        return self.sprint_test_dao.update(db, test_id, fields)
+        before = contribution_of(existing)
+        test = self.sprint_test_dao.update(db, test_id, fields)
+        statistic_controller.record_test_change(
+            db, before=before, after=contribution_of(test), sync=sync_stats
+        )
+        return test
 
-    def delete_test(self, db: Session, test_id: int) -> bool:
+    def delete_test(self, db: Session, test_id: int, sync_stats: bool = False) -> bool:
         """Eliminar un SprintTest existente."""
         existing = self.sprint_test_dao.get_by_id(db, test_id, only_active=True)
         if not existing:
             return False
 
+        before = contribution_of(existing)
         self.sprint_test_dao.delete(db, test_id)
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, existing.athlete_id)
+        statistic_controller.record_test_change(db, before=before, sync=sync_stats)
         return True
 
     def list_tests(
         self, db: Session, filters: SprintTestFilter
-    ) -> tuple[list[SprintTest], int]:
-        """Listar Sprint Tests con paginación y filtros básicos."""
+    ) -> tuple[list[SprintTest], int | None, str | None]:
+        """Listar Sprint Tests con paginación (offset o cursor) y filtros básicos."""
         query = db.query(SprintTest).filter(SprintTest.is_active)
 
         if filters.evaluation_id:
@@ -113,6 +119,17 @@ class SprintTestController:
                 Athlete.full_name.ilike(f"%{filters.search}%")
             )
 
+        if filters.use_cursor:
+            return self.sprint_test_dao.paginate_keyset(
+                db,
+                query,
+                SprintTest.date,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+
         total = query.with_entities(func.count()).scalar() or 0
 
         items = (
@@ -122,4 +139,4 @@ class SprintTestController:
             .all()
         )
 
-        return items, total
+        return items, total, None
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.dao.statistic_dao import StatisticDAO
 from app.schemas.statistic_schema import UpdateSportsStatsRequest
+from app.services.statistic_refresher import statistic_refresher
 from app.utils.exceptions import AppException
 
 logger = logging.getLogger(__name__)
@@ -146,10 +147,14 @@ class StatisticController:
 
     def update_athlete_stats(self, db: Session, athlete_id: int) -> dict | None:
         """
-        Recalcula y actualiza las estadísticas físicas de un atleta
-        basándose en sus tests completados.
+        Recalcula desde cero las estadísticas físicas de un atleta
+        basándose en sus tests activos.
 
-        Lógica de negocio:
+        Las altas, ediciones y bajas de tests usan `record_test_change`, que
+        actualiza los acumulados en O(1); este método queda para forzar un
+        recálculo completo (concilia los acumulados del atleta).
+
+        Lógica de negocio (ver `physical_stats_from_totals`):
         - speed: Basado en tiempo promedio de SprintTests (4s=100, 8s=0)
         - stamina: Combinación de YoyoTests y EnduranceTests
         - agility: Basado en cantidad de TechnicalAssessments
@@ -162,61 +167,18 @@ class StatisticController:
             Dict con estadísticas actualizadas o None si no existe
         """
         try:
-            # Obtener el registro Statistic del atleta
             statistic = self.statistic_dao.get_athlete_statistic(db, athlete_id)
-            print(f"[DEBUG] Statistic encontrado: {statistic}")
             if not statistic:
                 logger.warning(f"Statistic no encontrado para atleta {athlete_id}")
                 return None
 
-            updates = {}
-
-            # VELOCIDAD (SprintTest)
-            sprint_avg = self.statistic_dao.get_sprint_avg_time(db, athlete_id)
-            print(f"[DEBUG] Sprint avg time: {sprint_avg}")
-            if sprint_avg is not None:
-                # Fórmula: 4 segundos = 100 (excelente), 8 segundos = 0 (malo)
-                speed_score = max(0, min(100, 100 - ((sprint_avg - 4) * 25)))
-                updates["speed"] = round(speed_score, 1)
-                print(f"[DEBUG] Speed score calculado: {speed_score}")
-            else:
-                updates["speed"] = None
-
-            # RESISTENCIA (YoyoTest + EnduranceTest)
-            yoyo_avg = self.statistic_dao.get_yoyo_avg_shuttles(db, athlete_id)
-            endurance_avg = self.statistic_dao.get_endurance_avg_distance(
-                db, athlete_id
-            )
-            stamina_scores = []
-
-            if yoyo_avg is not None:
-                # Shuttle count: 20 = 30 puntos, 80 = 100 puntos
-                yoyo_score = min(100, max(0, 30 + (yoyo_avg - 20) * 1.17))
-                stamina_scores.append(yoyo_score)
-
-            if endurance_avg is not None:
-                # Distancia: 1000m = 30 puntos, 3000m = 100 puntos
-                endurance_score = min(100, max(0, 30 + (endurance_avg - 1000) * 0.035))
-                stamina_scores.append(endurance_score)
-
-            if stamina_scores:
-                updates["stamina"] = round(sum(stamina_scores) / len(stamina_scores), 1)
-            else:
-                updates["stamina"] = None
-
-            # AGILIDAD (TechnicalAssessment)
-            tech_count = self.statistic_dao.get_technical_count(db, athlete_id)
-            if tech_count > 0:
-                # Cada evaluación técnica suma 10 puntos (máximo 100)
-                updates["agility"] = min(100, tech_count * 10)
-            else:
-                updates["agility"] = None
-
-            # Actualizar en la base de datos
-            if updates:
-                self.statistic_dao.update_statistic_fields(db, statistic, updates)
-                logger.info(f"Stats actualizadas para atleta {athlete_id}: {updates}")
-
+            self.statistic_dao.reconcile_test_totals(db, athlete_ids=[athlete_id])
+            updates = {
+                "speed": statistic.speed,
+                "stamina": statistic.stamina,
+                "agility": statistic.agility,
+            }
+            logger.info(f"Stats actualizadas para atleta {athlete_id}: {updates}")
             return updates
 
         except Exception as e:
@@ -225,6 +187,98 @@ class StatisticController:
                 f"Error al actualizar estadísticas del atleta: {str(e)}"
             ) from e
 
+    def record_test_change(
+        self,
+        db: Session,
+        before: tuple | None = None,
+        after: tuple | None = None,
+        sync: bool = False,
+    ) -> dict:
+        """
+        Registra el alta, edición o baja de un test en las estadísticas.
+
+        Con el refresco diferido activo, los atletas afectados se encolan y
+        se recalculan por lotes en segundo plano. Con `sync=True` (o sin
+        refresco activo) las estadísticas se actualizan antes de responder.
+
+        Args:
+            db: Sesión de base de datos
+            before: Aporte del test antes del cambio (`contribution_of`)
+            after: Aporte del test después del cambio
+            sync: Forzar la actualización inmediata
+
+        Returns:
+            Dict athlete_id -> estadísticas físicas actualizadas (vacío si
+            el cambio quedó encolado)
+        """
+        if statistic_refresher.running:
+            athlete_ids = [c[0] for c in (before, after) if c]
+            return self.refresh_athlete_stats(db, athlete_ids, sync=sync)
+
+        try:
+            return self.statistic_dao.apply_test_change(db, before=before, after=after)
+        except Exception as e:
+            logger.error(f"Error recording test change: {str(e)}")
+            raise AppException(
+                f"Error al actualizar estadísticas del atleta: {str(e)}"
+            ) from e
+
+    def refresh_athlete_stats(
+        self, db: Session, athlete_ids: list[int], sync: bool = False
+    ) -> dict:
+        """
+        Recalcula las estadísticas físicas de varios atletas.
+
+        Con el refresco diferido activo y sin `sync`, solo se encolan; si no,
+        se recalculan en línea con una única consulta agrupada.
+
+        Returns:
+            Dict athlete_id -> estadísticas físicas actualizadas (vacío si
+            quedaron encoladas)
+        """
+        athlete_ids = list(dict.fromkeys(athlete_ids))
+        if not sync and statistic_refresher.enqueue(athlete_ids):
+            return {}
+
+        try:
+            # Los cambios ya encolados de estos atletas quedan incluidos
+            statistic_refresher.discard(athlete_ids)
+            self.statistic_dao.refresh_test_totals(db, athlete_ids)
+            return self._physical_stats(db, athlete_ids)
+        except Exception as e:
+            logger.error(f"Error refreshing athlete stats: {str(e)}")
+            raise AppException(
+                f"Error al actualizar estadísticas del atleta: {str(e)}"
+            ) from e
+
+    def refresh_pending_stats(self, db: Session) -> dict:
+        """
+        Recalcula en línea las estadísticas encoladas por el refresco diferido.
+
+        Returns:
+            Dict con la cantidad de atletas recalculados
+        """
+        try:
+            return {"refreshed_athletes": statistic_refresher.flush(db)}
+        except Exception as e:
+            logger.error(f"Error refreshing pending stats: {str(e)}")
+            raise AppException(
+                f"Error al actualizar estadísticas pendientes: {str(e)}"
+            ) from e
+
+    def _physical_stats(self, db: Session, athlete_ids: list[int]) -> dict:
+        """Estadísticas físicas almacenadas de los atletas indicados."""
+        result = {}
+        for athlete_id in athlete_ids:
+            statistic = self.statistic_dao.get_athlete_statistic(db, athlete_id)
+            if statistic:
+                result[athlete_id] = {
+                    "speed": statistic.speed,
+                    "stamina": statistic.stamina,
+                    "agility": statistic.agility,
+                }
+        return result
+
     def update_sports_stats(
         self, db: Session, athlete_id: int, payload: UpdateSportsStatsRequest
     ) -> dict | None:
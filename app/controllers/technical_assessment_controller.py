@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.controllers.statistic_controller import statistic_controller
 from app.dao.athlete_dao import AthleteDAO
 from app.dao.evaluation_dao import EvaluationDAO
+from app.dao.statistic_dao import contribution_of
 from app.dao.technical_assessment_dao import TechnicalAssessmentDAO
 from app.dao.test_dao import TestDAO
 from app.models.athlete import Athlete
@@ -30,6 +31,7 @@ class TechnicalAssessmentController:
         self,
         db: Session,
         payload: CreateTechnicalAssessmentSchema,
+        sync_stats: bool = False,
     ) -> Test:
         """Crear TechnicalAssessment para una evaluación y atleta dados."""
         if not self.evaluation_dao.get_by_id(db, payload.evaluation_id):
@@ -37,7 +39,7 @@ class TechnicalAssessmentController:
         if not self.athlete_dao.get_by_id(db, payload.athlete_id):
             raise DatabaseException(f"Atleta {payload.athlete_id} no existe")
 
-        return self.test_dao.create_technical_assessment(
+        test = self.test_dao.create_technical_assessment(
             db=db,
             date=payload.date,
             athlete_id=payload.athlete_id,
@@ -50,11 +52,19 @@ class TechnicalAssessmentController:
             observations=payload.observations,
         )
 
+        # Actualizar estadísticas del atleta
+        statistic_controller.record_test_change(
+            db, after=contribution_of(test), sync=sync_stats
+        )
+
+        return test
+
     def update_test(
         self,
         db: Session,
         test_id: int,
         payload: UpdateTechnicalAssessmentSchema,
+        sync_stats: bool = False,
     ) -> Test | None:
         """Actualizar un TechnicalAssessment existente."""
         fields = payload.model_dump(exclude_none=True)
@@ -78,9 +88,14 @@ class TechnicalAssessmentController:
         if not fields:
             return existing
 
-        return self.technical_assessment_dao.update(db, test_id, fields)
+        before = contribution_of(existing)
+        test = self.technical_assessment_dao.update(db, test_id, fields)
+        statistic_controller.record_test_change(
+            db, before=before, after=contribution_of(test), sync=sync_stats
+        )
+        return test
 
-    def delete_test(self, db: Session, test_id: int) -> bool:
+    def delete_test(self, db: Session, test_id: int, sync_stats: bool = False) -> bool:
         """Eliminar (desactivar) un TechnicalAssessment existente."""
         existing = self.technical_assessment_dao.get_by_id(
             db, test_id, only_active=True
@@ -88,17 +103,18 @@ class TechnicalAssessmentController:
         if not existing:
             return False
 
+        before = contribution_of(existing)
         self.technical_assessment_dao.delete(db, test_id)
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, existing.athlete_id)
+        statistic_controller.record_test_change(db, before=before, sync=sync_stats)
 
         return True
 
     def list_tests(
         self, db: Session, filters: TechnicalAssessmentFilter
-    ) -> tuple[list[TechnicalAssessment], int]:
-        """Listar Technical Assessments con paginación y filtros básicos."""
+    ) -> tuple[list[TechnicalAssessment], int | None, str | None]:
+        """Listar Technical Assessments paginando por offset o cursor."""
         query = db.query(TechnicalAssessment).filter(TechnicalAssessment.is_active)
 
         if filters.evaluation_id:
@@ -112,6 +128,17 @@ class TechnicalAssessmentController:
                 Athlete.full_name.ilike(f"%{filters.search}%")
             )
 
+        if filters.use_cursor:
+            return self.technical_assessment_dao.paginate_keyset(
+                db,
+                query,
+                TechnicalAssessment.date,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+
         total = query.with_entities(func.count()).scalar() or 0
 
         items = (
@@ -121,4 +148,4 @@ class TechnicalAssessmentController:
             .all()
         )
 
-        return items, total
+        return items, total, None
@@ -1,11 +1,32 @@
 from typing import List
 
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from app.controllers.statistic_controller import statistic_controller
+from app.core.exception_handlers import _build_error_map
+from app.dao.athlete_dao import AthleteDAO
 from app.dao.evaluation_dao import EvaluationDAO
 from app.dao.test_dao import TestDAO
 from app.models.test import Test
-from app.utils.exceptions import DatabaseException
+from app.schemas.endurance_test_schema import CreateEnduranceTestSchema
+from app.schemas.sprint_test_schema import CreateSprintTestSchema
+from app.schemas.technical_assessment_schema import CreateTechnicalAssessmentSchema
+from app.schemas.test_base_schema import BulkCreateTestsSchema
+from app.schemas.yoyo_test_schema import CreateYoyoTestSchema
+from app.utils.exceptions import (
+    DatabaseException,
+    NotFoundException,
+    ValidationException,
+)
+
+# Schema de alta por tipo de test (campo `test_type` de la carga en lote)
+CREATE_SCHEMAS = {
+    "sprint_test": CreateSprintTestSchema,
+    "yoyo_test": CreateYoyoTestSchema,
+    "endurance_test": CreateEnduranceTestSchema,
+    "technical_assessment": CreateTechnicalAssessmentSchema,
+}
 
 
 class TestController:
@@ -16,6 +37,7 @@ class TestController:
     def __init__(self):
         self.test_dao = TestDAO()
         self.evaluation_dao = EvaluationDAO()
+        self.athlete_dao = AthleteDAO()
 
     def list_tests_by_evaluation(self, db: Session, evaluation_id: int) -> List[Test]:
         if not self.evaluation_dao.get_by_id(db, evaluation_id):
@@ -24,3 +46,91 @@ class TestController:
 
     def delete_test(self, db: Session, test_id: int) -> bool:
         return self.test_dao.delete(db, test_id)
+
+    def bulk_create_tests(
+        self,
+        db: Session,
+        evaluation_id: int,
+        payload: BulkCreateTestsSchema,
+        sync_stats: bool = False,
+    ) -> dict:
+        """
+        Registrar en lote los resultados de una evaluación.
+
+        Todas las filas se validan antes de escribir (una consulta para la
+        evaluación y otra para todos los atletas); si alguna falla no se
+        registra ninguna. Las válidas se insertan en una sola transacción.
+
+        Args:
+            db: Sesión de base de datos
+            evaluation_id: ID de la evaluación
+            payload: Resultados con su `test_type`
+            sync_stats: Actualizar las estadísticas antes de responder
+
+        Returns:
+            Dict con `created`, `by_type` y `test_ids` (en el orden recibido)
+
+        Raises:
+            NotFoundException: Si la evaluación no existe
+            ValidationException: Con `errors` por fila (`tests.<i>.<campo>`)
+        """
+        if not self.evaluation_dao.get_by_id(db, evaluation_id):
+            raise NotFoundException(f"Evaluación {evaluation_id} no existe")
+
+        errors: dict[str, list[str]] = {}
+        validated = []
+        for index, row in enumerate(payload.tests):
+            schema = CREATE_SCHEMAS.get(row.get("test_type"))
+            if schema is None:
+                errors[f"tests.{index}.test_type"] = [
+                    f"Tipo de test inválido. Use: {', '.join(CREATE_SCHEMAS)}"
+                ]
+                continue
+            try:
+                test = schema.model_validate({**row, "evaluation_id": evaluation_id})
+            except ValidationError as exc:
+                row_errors, _ = _build_error_map(exc)
+                for field, messages in row_errors.items():
+                    key = f"tests.{index}"
+                    errors[key if field == "__root__" else f"{key}.{field}"] = messages
+                continue
+            validated.append((index, row["test_type"], test))
+
+        existing = self.athlete_dao.get_existing_ids(
+            db, [test.athlete_id for _, _, test in validated]
+        )
+        for index, _, test in validated:
+            if test.athlete_id not in existing:
+                errors[f"tests.{index}.athlete_id"] = [
+                    f"El atleta con ID {test.athlete_id} no existe"
+                ]
+
+        if errors:
+            failed = len({key.split(".")[1] for key in errors})
+            raise ValidationException(
+                f"{failed} de {len(payload.tests)} tests tienen errores; "
+                "no se registró ninguno",
+                errors=errors,
+            )
+
+        tests_by_type: dict[str, list[dict]] = {}
+        positions: dict[str, list[int]] = {}
+        for index, test_type, test in validated:
+            tests_by_type.setdefault(test_type, []).append(test.model_dump())
+            positions.setdefault(test_type, []).append(index)
+
+        created = self.test_dao.create_many(db, tests_by_type)
+
+        test_ids = [0] * len(validated)
+        for test_type, ids in created.items():
+            for index, test_id in zip(positions[test_type], ids, strict=True):
+                test_ids[index] = test_id
+
+        statistic_controller.refresh_athlete_stats(
+            db, [test.athlete_id for _, _, test in validated], sync=sync_stats
+        )
+        return {
+            "created": len(test_ids),
+            "by_type": {t: len(ids) for t, ids in created.items()},
+            "test_ids": test_ids,
+        }
@@ -2,6 +2,7 @@
 
 import logging
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.client.person_ms_service import PersonMSService
@@ -28,6 +29,8 @@ from app.utils.exceptions import (
     NotFoundException,
     ValidationException,
 )
+from app.utils.password_service import password_service
+from app.utils.principal_cache import principal_cache
 from app.utils.security import hash_password, validate_ec_dni
 
 logger = logging.getLogger(__name__)
@@ -36,6 +39,9 @@ logger = logging.getLogger(__name__)
 class UserController:
     """
     Controlador de usuarios del sistema (club).
+
+    Los métodos que esperan al MS de personas reciben una `AsyncSession` y
+    ejecutan los DAO con `run_sync`, sin bloquear el event loop.
     """
 
     def __init__(self) -> None:
@@ -46,7 +52,7 @@ class UserController:
 
     async def admin_create_user(
         self,
-        db: Session,
+        db: AsyncSession,
         payload: AdminCreateUserRequest,
         requester_account_id: int | None = None,
     ) -> AdminCreateUserResponse:
@@ -71,7 +77,7 @@ class UserController:
             dni = payload.dni
 
         # Validar unicidad en el club
-        self._validate_user_uniqueness(db, dni=dni, email=email)
+        await db.run_sync(self._validate_user_uniqueness, dni=dni, email=email)
 
         # Crear o recuperar persona en MS de usuarios
         external = await self.person_ms_service.create_or_get_person(
@@ -88,13 +94,14 @@ class UserController:
 
         # Crear usuario y cuenta localmente
         full_name = f"{first_name} {last_name}"
-        user, account = self._create_local_user_and_account(
-            db=db,
+        password_hash = await password_service.hash(payload.password)
+        user, account = await db.run_sync(
+            self._create_local_user_and_account,
             external=external,
             full_name=full_name,
             dni=dni,
             email=email,
-            password=payload.password,
+            password_hash=password_hash,
             role=payload.role,
         )
 
@@ -109,7 +116,7 @@ class UserController:
 
     async def admin_update_user(
         self,
-        db: Session,
+        db: AsyncSession,
         payload: AdminUpdateUserRequest,
         user_id: int,
     ) -> AdminUpdateUserResponse:
@@ -122,7 +129,7 @@ class UserController:
         3. Actualizar localmente (incluyendo external si cambió)
         """
         # Verificar que el usuario existe
-        user = self.user_dao.get_by_id(db=db, id=user_id, only_active=False)
+        user = await db.run_sync(self.user_dao.get_by_id, user_id, only_active=False)
         if not user:
             raise ValidationException("El usuario a actualizar no existe")
 
@@ -144,9 +151,17 @@ class UserController:
             "external": new_external,
         }
 
-        updated_user = self.user_dao.update(db, user.id, update_data)
+        return await db.run_sync(self._update_local_user, user.id, update_data)
+
+    def _update_local_user(
+        self, db: Session, user_id: int, update_data: dict
+    ) -> AdminUpdateUserResponse:
+        """Actualiza el usuario local y arma la respuesta con su cuenta."""
+        updated_user = self.user_dao.update(db, user_id, update_data)
         if not updated_user:
             raise ValidationException("Error al actualizar el usuario")
+        if updated_user.account is not None:
+            principal_cache.invalidate(updated_user.account.id)
 
         return AdminUpdateUserResponse(
             id=updated_user.id,
@@ -178,7 +193,7 @@ class UserController:
         full_name: str,
         dni: str,
         email: str,
-        password: str,
+        password_hash: str,
         role,
     ):
         """
@@ -197,7 +212,7 @@ class UserController:
             db,
             {
                 "email": email,
-                "password_hash": hash_password(password),
+                "password_hash": password_hash,
                 "role": role,
                 "user_id": new_user.id,
             },
@@ -212,12 +227,12 @@ class UserController:
         return self.user_dao.get_all_with_filters(db, filters=filters)
 
     async def get_user_by_id(
-        self, db: Session, user_id: int
+        self, db: AsyncSession, user_id: int
     ) -> UserDetailResponse | None:
         """
         Obtiene la informacion personal de un uusario
         """
-        user = self.user_dao.get_by_id(db=db, id=user_id)
+        user = await db.run_sync(self._get_user_with_account, user_id)
         if not user:
             return None
 
@@ -251,6 +266,18 @@ class UserController:
             updated_at=user.updated_at,
         )
 
+    def _get_user_with_account(self, db: Session, user_id: int):
+        """
+        Usuario activo con su cuenta cargada.
+
+        La relación se carga aquí: fuera de `run_sync` la sesión asíncrona no
+        admite carga perezosa.
+        """
+        user = self.user_dao.get_by_id(db=db, id=user_id)
+        if user is not None:
+            _ = user.account
+        return user
+
     def desactivate_user(self, db: Session, user_id: int) -> None:
         """
         Desactiva un usuario (soft delete).
@@ -260,6 +287,8 @@ class UserController:
             raise ValidationException("El usuario a desactivar no existe")
 
         self.user_dao.update(db, user_id, {"is_active": False})
+        if user.account is not None:
+            principal_cache.invalidate(user.account.id)
 
     def activate_user(self, db: Session, user_id: int) -> None:
         """
@@ -271,6 +300,8 @@ class UserController:
             raise ValidationException("El usuario a activar no existe")
 
         self.user_dao.update(db, user_id, {"is_active": True})
+        if user.account is not None:
+            principal_cache.invalidate(user.account.id)
 
     # ==========================================
     # MÉTODOS DE PASANTES (INTERNS)
@@ -378,6 +409,7 @@ class UserController:
             raise ValidationException("El usuario no es un pasante")
 
         self.user_dao.update(db, account.user_id, {"is_active": False})
+        principal_cache.invalidate(account.id)
 
     def activate_intern(self, db: Session, account_id: int) -> None:
         """
@@ -391,3 +423,4 @@ class UserController:
             raise ValidationException("El usuario no es un pasante")
 
         self.user_dao.update(db, account.user_id, {"is_active": True})
+        principal_cache.invalidate(account.id)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.controllers.statistic_controller import statistic_controller
 from app.dao.athlete_dao import AthleteDAO
 from app.dao.evaluation_dao import EvaluationDAO
+from app.dao.statistic_dao import contribution_of
 from app.dao.test_dao import TestDAO
 from app.dao.yoyo_test_dao import YoyoTestDAO
 from app.models.athlete import Athlete
@@ -30,6 +31,7 @@ class YoyoTestController:
         self,
         db: Session,
         payload: CreateYoyoTestSchema,
+        sync_stats: bool = False,
     ) -> Test:
         """Crear YoyoTest para una evaluación y atleta dados."""
         if not self.evaluation_dao.get_by_id(db, payload.evaluation_id):
@@ -49,7 +51,9 @@ class YoyoTestController:
         )
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, payload.athlete_id)
+        statistic_controller.record_test_change(
+            db, after=contribution_of(test), sync=sync_stats
+        )
 
         return test
 
@@ -58,6 +62,7 @@ class YoyoTestController:
         db: Session,
         test_id: int,
         payload: UpdateYoyoTestSchema,
+        sync_stats: bool = False,
     ) -> Test | None:
         """Actualizar un YoyoTest existente."""
         fields = payload.model_dump(exclude_none=True)
@@ -79,25 +84,31 @@ class YoyoTestController:
         if not fields:
             return existing
 
-        return self.yoyo_test_dao.update(db, test_id, fields)
+        before = contribution_of(existing)
+        test = self.yoyo_test_dao.update(db, test_id, fields)
+        statistic_controller.record_test_change(
+            db, before=before, after=contribution_of(test), sync=sync_stats
+        )
+        return test
 
-    def delete_test(self, db: Session, test_id: int) -> bool:
+    def delete_test(self, db: Session, test_id: int, sync_stats: bool = False) -> bool:
         """Eliminar un YoyoTest existente."""
         existing = self.yoyo_test_dao.get_by_id(db, test_id, only_active=True)
         if not existing:
             return False
 
+        before = contribution_of(existing)
         self.yoyo_test_dao.delete(db, test_id)
 
         # Actualizar estadísticas del atleta
-        statistic_controller.update_athlete_stats(db, existing.athlete_id)
+        statistic_controller.record_test_change(db, before=before, sync=sync_stats)
 
         return True
 
     def list_tests(
         self, db: Session, filters: YoyoTestFilter
-    ) -> tuple[list[YoyoTest], int]:
-        """Listar Yoyo Tests con paginación y filtros básicos."""
+    ) -> tuple[list[YoyoTest], int | None, str | None]:
+        """Listar Yoyo Tests con paginación (offset o cursor) y filtros básicos."""
         query = db.query(YoyoTest).filter(YoyoTest.is_active)
 
         if filters.evaluation_id:
@@ -109,6 +120,17 @@ class YoyoTestController:
                 Athlete.full_name.ilike(f"%{filters.search}%")
             )
 
+        if filters.use_cursor:
+            return self.yoyo_test_dao.paginate_keyset(
+                db,
+                query,
+                YoyoTest.date,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+
         total = query.with_entities(func.count()).scalar() or 0
 
         items = (
@@ -118,4 +140,4 @@ class YoyoTestController:
             .all()
         )
 
-        return items, total
+        return items, total, None
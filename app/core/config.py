@@ -11,6 +11,32 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
+    # Réplica de lectura para estadísticas, reportes y listados (None = primario)
+    DATABASE_READ_URL: Optional[str] = None
+    # Segundos que un cliente lee del primario tras una escritura
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # ================= DATABASE POOL =================
+    # Conexiones al primario de todo el host (workers y motores)
+    DB_MAX_CONNECTIONS: int = 100
+    # Parte de ese presupuesto para el motor asíncrono (login, contraseñas y
+    # rutas que esperan al MS de personas)
+    DB_ASYNC_POOL_RATIO: float = 0.2
+    # Parte del presupuesto de cada worker reservada como overflow
+    DB_POOL_OVERFLOW_RATIO: float = 0.3
+    DB_POOL_TIMEOUT: float = 30
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    # Sentencias más lentas que esto se registran con su EXPLAIN (0 = nunca)
+    SQL_SLOW_QUERY_MS: int = 500
+    # Directorio compartido por los workers para sumar las métricas de
+    # /metrics (None = solo las del proceso que responde)
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_FLUSH_SECONDS: float = 5
+    # Workers del servidor: es la variable que `uvicorn` y `gunicorn` usan por
+    # defecto para --workers/-w, así el pool se dimensiona con los procesos
+    # reales. Sin ella se usa UVICORN_WORKERS (nombre anterior, 4 por defecto)
+    WEB_CONCURRENCY: Optional[int] = None
+    UVICORN_WORKERS: int = 4
 
     # ================= APP =================
     APP_NAME: str = "Backend Futbol API"
@@ -24,6 +50,15 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     TOKEN_EXPIRES: int = 3600  # Access token: 1 hora
     REFRESH_TOKEN_EXPIRES: int = 604800  # Refresh token: 7 días
+    # Caché por worker de la cuenta autenticada (0 = deshabilitada). Tras
+    # desactivar una cuenta o cambiar su rol, los demás workers pueden
+    # seguir aceptándola con los datos anteriores hasta este TTL
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 4096
+    # Costo de bcrypt; al cambiarlo cada contraseña se rehashea en su login
+    BCRYPT_ROUNDS: int = 10
+    # Hilos dedicados a hashear/verificar contraseñas (por worker)
+    PASSWORD_HASH_WORKERS: int = 4
 
     # ================= CORS =================
     ALLOWED_ORIGINS: List[str] = ["*"]
@@ -41,10 +76,47 @@ class Settings(BaseSettings):
     # Restricciones de correo institucional
     INSTITUTIONAL_EMAIL_DOMAINS: List[str] = ["@unl.edu.ec"]
 
+    # ================= STATISTICS =================
+    # Refresco diferido de estadísticas tras registrar tests
+    STATS_REFRESH_DEFERRED: bool = True
+    STATS_REFRESH_INTERVAL_SECONDS: float = 0.5
+    STATS_REFRESH_BATCH_SIZE: int = 200
+
+    # ================= REPORTS =================
+    # Pool de procesos para PDF (0 = renderizar en el hilo de la petición)
+    REPORT_PDF_WORKERS: int = 2
+    # Precargar plantillas (y WeasyPrint sin pool) al arrancar; con False el
+    # stack de reportes se importa con el primer reporte
+    REPORT_WARM_UP: bool = True
+    # Reportes con más filas de tabla se generan como trabajo asíncrono
+    REPORT_PDF_SYNC_MAX_ROWS: int = 200
+    REPORT_JOB_MAX_PENDING: int = 20
+    REPORT_JOB_TTL_SECONDS: float = 600
+    # Caché en disco de reportes generados (0 MB = deshabilitada)
+    REPORT_CACHE_DIR: Optional[str] = None  # None = directorio temporal
+    REPORT_CACHE_MAX_MB: int = 256
+    # Formato de los gráficos: svg (vectorial) o png
+    REPORT_CHART_FORMAT: str = "svg"
+
     # ================= MICROSERVICE =================
     PERSON_MS_BASE_URL: str = "http://localhost:8096"
     PERSON_MS_ADMIN_EMAIL: str = "admin@admin.com"
     PERSON_MS_ADMIN_PASSWORD: str = "12345678"
+    # Caché de consultas por identificación: memory, redis o none
+    PERSON_CACHE_BACKEND: str = "memory"
+    PERSON_CACHE_TTL_SECONDS: float = 300
+    PERSON_CACHE_MAX_ENTRIES: int = 2048
+    REDIS_URL: Optional[str] = None  # requerido con PERSON_CACHE_BACKEND=redis
+    # Listados enriquecidos: desde cuántas personas fuera de caché se usa un
+    # único listado completo del MS, y espera máxima por página
+    PERSON_MS_SNAPSHOT_THRESHOLD: int = 50
+    PERSON_MS_BATCH_TIMEOUT_SECONDS: float = 3
+    # Circuito: fallos seguidos para abrirlo y segundos hasta probar de nuevo
+    PERSON_MS_BREAKER_FAILURES: int = 5
+    PERSON_MS_BREAKER_RESET_SECONDS: float = 30
+    # Concurrencia adaptativa (AIMD) hacia el MS: límite inicial y máximo
+    PERSON_MS_CONCURRENCY_INITIAL: int = 10
+    PERSON_MS_CONCURRENCY_MAX: int = 50
 
     # ================= DEFAULT ADMIN =================
     DEFAULT_ADMIN_EMAIL: str = "admin@unl.edu.ec"
@@ -60,6 +132,20 @@ class Settings(BaseSettings):
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    @property
+    def WEB_WORKERS(self) -> int:
+        # reload (DEBUG) no soporta varios workers
+        if self.DEBUG:
+            return 1
+        return max(1, self.WEB_CONCURRENCY or self.UVICORN_WORKERS)
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
+
     # ================= PYDANTIC V2 CONFIG =================
     model_config = ConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
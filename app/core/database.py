@@ -1,42 +1,113 @@
-from sqlalchemy import create_engine, event
+import time
+from typing import Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import QueuePool
 
+from app.core import query_stats
 from app.core.config import settings
-
-# ================= DATABASE ENGINE =================
-# Configuración optimizada para ALTA CONCURRENCIA
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    poolclass=QueuePool,
-    pool_size=50,
-    max_overflow=100,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-    pool_timeout=60,
-    connect_args={
-        "client_encoding": "utf8",
-        "connect_timeout": 10,
-    },
+from app.core.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_metrics,
 )
 
+# Lectura del primario tras escribir ("read your writes")
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+
+
+def pool_limits(share: float = 1.0, workers: Optional[int] = None) -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) de cada worker para un motor.
+
+    DB_MAX_CONNECTIONS es el presupuesto del host; el motor se queda con
+    `share` de él, cada worker recibe su parte y reserva
+    DB_POOL_OVERFLOW_RATIO de ella como overflow.
+    """
+    workers = max(1, workers or settings.WEB_WORKERS)
+    budget = max(1, int(settings.DB_MAX_CONNECTIONS * share) // workers)
+    pool_size = max(1, budget - int(budget * settings.DB_POOL_OVERFLOW_RATIO))
+    return pool_size, budget - pool_size
+
+
+def pool_share(name: str) -> float:
+    """
+    Parte del presupuesto de conexiones de cada motor.
+
+    Los motores síncrono y asíncrono del primario se reparten su
+    presupuesto; la réplica es otro servidor y tiene el suyo.
+    """
+    if name == "primary_async":
+        return settings.DB_ASYNC_POOL_RATIO
+    if name == "primary":
+        return 1 - settings.DB_ASYNC_POOL_RATIO
+    return 1.0
+
 
-# Optimización: configurar conexiones al crearlas
-@event.listens_for(engine, "connect")
-def set_connection_params(dbapi_conn, connection_record):
-    """Configurar parámetros de conexión para mejor rendimiento."""
-    cursor = dbapi_conn.cursor()
-    cursor.execute("SET statement_timeout = '30s'")
-    cursor.close()
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
 
 
+def _create_sync_engine(url: str, name: str):
+    """Motor síncrono con pool instrumentado; SQLite sirve como réplica local."""
+    if _is_sqlite(url):
+        new_engine = create_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        pool_size, max_overflow = pool_limits(pool_share(name))
+        new_engine = create_engine(
+            url,
+            echo=False,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            connect_args={
+                "client_encoding": "utf8",
+                "connect_timeout": 10,
+                # En el arranque de la sesión, sin una consulta extra por conexión
+                "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}",
+            },
+        )
+    pool_metrics.track(name, new_engine)
+    query_stats.instrument(new_engine)
+    return new_engine
+
+
+# ================= DATABASE ENGINE =================
+engine = _create_sync_engine(settings.DATABASE_URL, "primary")
+
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
     autocommit=False,
 )
 
+# Réplica de lectura opcional; sin DATABASE_READ_URL se lee del primario
+if settings.DATABASE_READ_URL:
+    read_engine = _create_sync_engine(settings.DATABASE_READ_URL, "replica")
+    ReadSessionLocal = sessionmaker(
+        bind=read_engine,
+        autoflush=False,
+        autocommit=False,
+    )
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
 Base = declarative_base()
 
 
@@ -46,3 +117,109 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def wants_primary(request: Request) -> bool:
+    """El cliente pidió consistencia fuerte o escribió hace poco."""
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+    try:
+        return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def mark_read_your_writes(request: Request, response) -> None:
+    """Tras una escritura, las lecturas del cliente van al primario un rato."""
+    if (
+        ReadSessionLocal is SessionLocal
+        or request.method in ("GET", "HEAD", "OPTIONS")
+        or getattr(request.state, "read_only", False)
+        or response.status_code >= 400
+    ):
+        return
+    seconds = settings.READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        READ_PRIMARY_COOKIE,
+        str(time.time() + seconds),
+        max_age=seconds,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def get_read_db(request: Request):
+    """Sesión de solo lectura: réplica, salvo lectura tras escritura."""
+    request.state.read_only = True
+    factory = SessionLocal if wants_primary(request) else ReadSessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ================= ASYNC DATABASE ENGINE =================
+# Motor asíncrono para las rutas que esperan I/O externo: login y contraseñas
+# (bcrypt corre en su propio pool) y las altas, consultas y ediciones que
+# llaman al MS de personas. Los DAOs síncronos se ejecutan con `run_sync`.
+# Se crea al primer uso (o en el lifespan)
+# para que importar este módulo no requiera el driver asíncrono.
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+_async_engine: Optional[AsyncEngine] = None
+
+
+def _create_async_engine(url: str, name: str) -> AsyncEngine:
+    """Motor asíncrono con su parte del presupuesto de conexiones."""
+    if _is_sqlite(url):
+        new_engine = create_async_engine(url, poolclass=InstrumentedAsyncQueuePool)
+    else:
+        pool_size, max_overflow = pool_limits(pool_share(name))
+        new_engine = create_async_engine(
+            url,
+            echo=False,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            connect_args={
+                "timeout": 10,
+                "server_settings": {
+                    "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+                },
+            },
+        )
+    pool_metrics.track(name, new_engine)
+    query_stats.instrument(new_engine)
+    return new_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Motor asíncrono compartido del primario."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _create_async_engine(
+            settings.ASYNC_DATABASE_URL, "primary_async"
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Cierra las conexiones del motor asíncrono si llegó a crearse."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
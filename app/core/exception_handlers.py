@@ -120,7 +120,9 @@ def validation_exception_handler(
 
 def app_exception_handler(_request: Request, exc: AppException) -> JSONResponse:
     """Manejador para excepciones de aplicación (AppException y subclases)."""
-    errors = {"__root__": [exc.message]} if exc.status_code == 422 else None
+    errors = getattr(exc, "errors", None)
+    if errors is None and exc.status_code == 422:
+        errors = {"__root__": [exc.message]}
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -0,0 +1,244 @@
+"""Métricas HTTP por ruta en formato de texto de Prometheus.
+
+El middleware registra, por método y plantilla de ruta (`/athletes/{id}`,
+no la URL real), peticiones por código de estado, latencia, tamaño de
+respuesta y peticiones en curso. Con `METRICS_MULTIPROC_DIR` cada worker
+de uvicorn vuelca sus contadores a un archivo propio en ese directorio y
+`/metrics` suma los de todos los procesos.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.routing import Match
+
+from app.core.config import settings
+from app.core.pool_metrics import Histogram
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+UNMATCHED_ROUTE = "<unmatched>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+RouteKey = Tuple[str, str]
+
+
+class RouteMetrics:
+    """Contadores por ruta del proceso, con volcado opcional a disco."""
+
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 5):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self.requests: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self.in_flight: Dict[RouteKey, int] = defaultdict(int)
+        self.latency: Dict[RouteKey, Histogram] = {}
+        self.size: Dict[RouteKey, Histogram] = {}
+        self._routes: "OrderedDict[RouteKey, str]" = OrderedDict()
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> int:
+        # Se consulta cada vez: el módulo puede importarse antes del fork
+        return os.getpid()
+
+    # ---------- registro ----------
+
+    def route_for(self, app, scope) -> str:
+        """Plantilla de la ruta que atenderá la petición (con caché LRU)."""
+        key = (scope["method"], scope["path"])
+        with self._lock:
+            route = self._routes.get(key)
+            if route is not None:
+                self._routes.move_to_end(key)
+                return route
+        route = UNMATCHED_ROUTE
+        for candidate in app.router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate.path
+                break
+            if match == Match.PARTIAL and route == UNMATCHED_ROUTE:
+                route = candidate.path  # existe con otro método (405)
+        with self._lock:
+            self._routes[key] = route
+            if len(self._routes) > 2048:
+                self._routes.popitem(last=False)
+        return route
+
+    def start(self, method: str, route: str) -> None:
+        with self._lock:
+            self.in_flight[(method, route)] += 1
+
+    def finish(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        size: Optional[int] = None,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            self.in_flight[key] -= 1
+            self.requests[(method, route, str(status))] += 1
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            if size is not None:
+                self.size.setdefault(key, Histogram(SIZE_BUCKETS)).observe(size)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due and self.directory is not None:
+            self.flush()
+
+    # ---------- agregación entre procesos ----------
+
+    def snapshot(self) -> dict:
+        """Contadores del proceso en un formato serializable."""
+        with self._lock:
+            return {
+                "pid": self.pid,
+                "requests": [[*k, v] for k, v in self.requests.items()],
+                "in_flight": [[*k, v] for k, v in self.in_flight.items()],
+                "latency": [[*k, h.counts, h.sum] for k, h in self.latency.items()],
+                "size": [[*k, h.counts, h.sum] for k, h in self.size.items()],
+            }
+
+    def flush(self) -> None:
+        """Escribe el snapshot del proceso en su archivo (de forma atómica)."""
+        if self.directory is None:
+            return
+        self._last_flush = time.monotonic()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"http-{self.pid}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+
+    def collect(self) -> List[dict]:
+        """Snapshots de este proceso y de los demás workers."""
+        snapshots = [self.snapshot()]
+        if self.directory is None or not self.directory.is_dir():
+            return snapshots
+        for path in self.directory.glob("http-*.json"):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if snapshot.get("pid") == self.pid:
+                continue
+            if not _pid_alive(snapshot.get("pid")):
+                # Los contadores de un worker terminado se conservan;
+                # sus peticiones en curso ya no existen
+                snapshot["in_flight"] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+    def render(self) -> str:
+        """Métricas de todos los procesos en formato de texto de Prometheus."""
+        requests: Dict[tuple, int] = defaultdict(int)
+        in_flight: Dict[tuple, int] = defaultdict(int)
+        latency: Dict[tuple, list] = {}
+        size: Dict[tuple, list] = {}
+        for snapshot in self.collect():
+            for method, route, status, value in snapshot["requests"]:
+                requests[(method, route, status)] += value
+            for method, route, value in snapshot["in_flight"]:
+                in_flight[(method, route)] += value
+            _merge_histograms(latency, snapshot["latency"])
+            _merge_histograms(size, snapshot["size"])
+
+        lines: List[str] = []
+        _samples(
+            lines,
+            "http_requests_total",
+            "Peticiones HTTP atendidas por ruta y código de estado.",
+            "counter",
+            (
+                ({"method": m, "route": r, "status": s}, v)
+                for (m, r, s), v in requests.items()
+            ),
+        )
+        _samples(
+            lines,
+            "http_requests_in_progress",
+            "Peticiones HTTP en curso por ruta.",
+            "gauge",
+            (({"method": m, "route": r}, v) for (m, r), v in in_flight.items()),
+        )
+        _histogram(
+            lines,
+            "http_request_duration_seconds",
+            "Latencia de las peticiones HTTP por ruta.",
+            LATENCY_BUCKETS,
+            latency,
+        )
+        _histogram(
+            lines,
+            "http_response_size_bytes",
+            "Tamaño de las respuestas HTTP por ruta.",
+            SIZE_BUCKETS,
+            size,
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _pid_alive(pid) -> bool:
+    if not isinstance(pid, int):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _merge_histograms(target: Dict[tuple, list], rows) -> None:
+    for method, route, counts, total in rows:
+        merged = target.setdefault((method, route), [[0] * len(counts), 0.0])
+        merged[0] = [a + b for a, b in zip(merged[0], counts, strict=True)]
+        merged[1] += total
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _samples(
+    lines: List[str], name: str, help_text: str, kind: str, samples: Iterable
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {value}")
+
+
+def _histogram(
+    lines: List[str], name: str, help_text: str, buckets, data: Dict[tuple, list]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for (method, route), (counts, total) in data.items():
+        labels = {"method": method, "route": route}
+        cumulative = 0
+        for bound, count in zip((*buckets, "+Inf"), counts, strict=True):
+            cumulative += count
+            lines.append(
+                f"{name}_bucket{_labels({**labels, 'le': bound})} {cumulative}"
+            )
+        lines.append(f"{name}_sum{_labels(labels)} {total}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+
+
+route_metrics = RouteMetrics(
+    settings.METRICS_MULTIPROC_DIR, settings.METRICS_FLUSH_SECONDS
+)
@@ -0,0 +1,81 @@
+"""Ajustes de esquema y backfills que `create_all` no cubre.
+
+`Base.metadata.create_all` crea las tablas que faltan pero nunca altera
+las existentes. Estas funciones se ejecutan al arrancar (lifespan), tras
+`create_all`: son idempotentes y, si no hay nada que hacer, cuestan una
+inspección del esquema.
+"""
+
+import logging
+
+from sqlalchemy import Integer, inspect, text
+from sqlalchemy.orm import Session
+
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO
+from app.dao.statistic_dao import ACCUMULATOR_FIELDS, StatisticDAO
+from app.models.statistic import Statistic
+from app.utils.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_statistic_accumulators(db: Session) -> list[str]:
+    """
+    Agrega a `statistics` las columnas de acumulados que falten y las
+    rellena desde los tests activos.
+
+    En PostgreSQL columnas y backfill se confirman en la misma transacción:
+    si el backfill falla, las columnas no quedan creadas en cero y el
+    siguiente arranque lo reintenta.
+
+    Returns:
+        Columnas agregadas
+    """
+    existing = {col["name"] for col in inspect(db.get_bind()).get_columns("statistics")}
+    missing = [field for field in ACCUMULATOR_FIELDS if field not in existing]
+    if not missing:
+        return []
+
+    # Con varios workers otro proceso puede agregarlas a la vez
+    if_not_exists = (
+        "IF NOT EXISTS " if db.get_bind().dialect.name == "postgresql" else ""
+    )
+    for field in missing:
+        column = Statistic.__table__.c[field]
+        sql_type = "INTEGER" if isinstance(column.type, Integer) else "FLOAT"
+        db.execute(
+            text(
+                f"ALTER TABLE statistics ADD COLUMN {if_not_exists}{field} "
+                f"{sql_type} NOT NULL DEFAULT 0"
+            )
+        )
+    StatisticDAO().reconcile_test_totals(db, repair=True)
+    logger.info(f"Added statistics columns: {', '.join(missing)}")
+    return missing
+
+
+def ensure_attendance_rollup(db: Session) -> int:
+    """
+    Puebla `attendance_daily_rollup` si está vacía y hay asistencias.
+
+    Un fallo no impide arrancar: mientras la tabla esté vacía las lecturas
+    se calculan sobre `attendances` y la primera escritura la reconstruye.
+
+    Returns:
+        Días reconstruidos
+    """
+    try:
+        days = AttendanceRollupDAO().backfill_if_empty(db)
+    except DatabaseException:
+        # Con varios workers otro proceso puede estar reconstruyéndola
+        logger.warning("Attendance rollup backfill failed; reading attendances")
+        return 0
+    if days:
+        logger.info(f"Attendance rollup backfilled: {days} days")
+    return days
+
+
+def upgrade_schema(db: Session) -> None:
+    """Aplica los ajustes de esquema pendientes."""
+    ensure_statistic_accumulators(db)
+    ensure_attendance_rollup(db)
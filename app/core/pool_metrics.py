@@ -0,0 +1,141 @@
+"""Métricas de los pools de conexiones a partir de sus eventos.
+
+Cada motor registrado expone conexiones en uso, overflow y tiempos de
+espera por una conexión como histogramas acumulados, para dimensionar
+los pools con datos.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Segundos esperando una conexión libre
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Conexiones en uso / en overflow al entregar una conexión
+SIZE_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class Histogram:
+    """Histograma con límites fijos (conteos acumulados al exportar)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_dict(self) -> dict:
+        cumulative, buckets = 0, []
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            cumulative += count
+            buckets.append({"le": bound, "count": cumulative})
+        return {"buckets": buckets, "sum": self.sum, "count": self.count}
+
+
+class PoolStats:
+    """Contadores e histogramas de un pool, alimentados por sus eventos."""
+
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checked_out = Histogram(SIZE_BUCKETS)
+        self.overflow = Histogram(SIZE_BUCKETS)
+        self.wait_seconds = Histogram(WAIT_BUCKETS)
+        self._lock = threading.Lock()
+
+    def on_checkout(self, dbapi_conn, connection_record, connection_proxy) -> None:
+        pool = self.engine.pool
+        in_use = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        overflow = max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out.observe(in_use)
+            self.overflow.observe(overflow)
+
+    def observe_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds.observe(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Estado actual del pool y sus histogramas."""
+        pool = self.engine.pool
+        with self._lock:
+            return {
+                "pool_size": pool.size() if hasattr(pool, "size") else None,
+                "checked_out": (
+                    pool.checkedout() if hasattr(pool, "checkedout") else None
+                ),
+                "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "checked_out_histogram": self.checked_out.to_dict(),
+                "overflow_histogram": self.overflow.to_dict(),
+                "wait_seconds_histogram": self.wait_seconds.to_dict(),
+            }
+
+
+class PoolMetrics:
+    """Registro de los motores cuyos pools se exponen en /metrics/db-pool."""
+
+    def __init__(self):
+        self._pools: Dict[str, PoolStats] = {}
+
+    def track(self, name: str, engine) -> PoolStats:
+        """Escucha los eventos del pool de `engine` (síncrono o asíncrono)."""
+        engine = getattr(engine, "sync_engine", engine)
+        stats = PoolStats(name, engine)
+        event.listen(engine, "checkout", stats.on_checkout)
+        engine.pool.stats = stats
+        self._pools[name] = stats
+        return stats
+
+    def get(self, name: str) -> Optional[PoolStats]:
+        return self._pools.get(name)
+
+    def snapshot(self) -> dict:
+        return {name: stats.snapshot() for name, stats in self._pools.items()}
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool que mide cuánto espera cada checkout por una conexión."""
+
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.stats is not None:
+                self.stats.observe_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.stats is not None:
+            self.stats.observe_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # dispose() recrea el pool: conservar las métricas
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Variante para motores asíncronos (asyncpg, aiosqlite)."""
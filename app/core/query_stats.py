@@ -0,0 +1,125 @@
+"""Métricas de SQL por petición a partir de los eventos del motor.
+
+Cada petición HTTP abre un `RequestQueryStats` en una ContextVar; los
+eventos `before/after_cursor_execute` de los motores registrados suman
+consultas y tiempo en BD. Las sentencias más lentas que
+`SQL_SLOW_QUERY_MS` se registran junto con su plan (EXPLAIN).
+"""
+
+import logging
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.sql")
+
+_STATEMENT_LOG_CHARS = 2000
+
+
+class RequestQueryStats:
+    """Consultas, tiempo total en BD y sentencia más lenta de una petición."""
+
+    __slots__ = ("count", "total_seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """Valor de la cabecera `Server-Timing`."""
+        return (
+            f'db;dur={self.total_seconds * 1000:.1f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.1f}"
+        )
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def start_request() -> Token:
+    """Empieza a contar las consultas de la petición actual."""
+    return _current.set(RequestQueryStats())
+
+
+def end_request(token: Token) -> Optional[RequestQueryStats]:
+    """Termina la cuenta y devuelve las métricas de la petición."""
+    stats = _current.get()
+    _current.reset(token)
+    return stats
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    threshold = settings.SQL_SLOW_QUERY_MS
+    if threshold and elapsed * 1000 >= threshold:
+        _log_slow_query(conn, statement, parameters, elapsed, many)
+
+
+def _handle_error(exception_context) -> None:
+    # La sentencia falló: descartar su marca de inicio
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def _log_slow_query(conn, statement, parameters, elapsed, many) -> None:
+    plan = None
+    if not many and statement.lstrip()[:6].upper() in ("SELECT", "WITH "):
+        plan = _explain(conn, statement, parameters)
+    logger.warning(
+        f"slow_query ms={elapsed * 1000:.1f} "
+        f"statement={statement[:_STATEMENT_LOG_CHARS]!r}"
+        + (f"\n{plan}" if plan else "")
+    )
+
+
+def _explain(conn, statement, parameters) -> Optional[str]:
+    """Plan de la sentencia, con un cursor DBAPI que no dispara eventos."""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return "\n".join(" ".join(str(col) for col in row) for row in cursor)
+        finally:
+            cursor.close()
+    except Exception as e:
+        logger.debug(f"EXPLAIN failed: {e}")
+        return None
+
+
+def instrument(engine) -> None:
+    """Registra los eventos de conteo en un motor (síncrono o asíncrono)."""
+    engine = getattr(engine, "sync_engine", engine)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
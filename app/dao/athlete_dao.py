@@ -1,11 +1,12 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from sqlalchemy import or_
+from sqlalchemy import exists, or_
 from sqlalchemy.orm import Session
 
 from app.dao.base import BaseDAO
 from app.models.athlete import Athlete
 from app.models.enums.sex import Sex
+from app.models.user import User
 
 
 class AthleteDAO(BaseDAO[Athlete]):
@@ -20,8 +21,64 @@ class AthleteDAO(BaseDAO[Athlete]):
         """
         Obtiene atletas con filtros y paginación.
         """
-        query = db.query(self.model)
+        query = self._apply_filters(db.query(self.model), filters)
 
+        total = query.count()
+
+        # Paginación
+        # Paginación con tolerancia si no existen propiedades
+        skip = getattr(filters, "skip", 0)
+        limit = getattr(filters, "limit", 10)
+        items = query.order_by(self.model.id.desc()).offset(skip).limit(limit).all()
+
+        return items, total
+
+    def get_all_with_account_flag(
+        self, db: Session, filters
+    ) -> Tuple[List[Tuple[Athlete, bool]], Optional[int], Optional[str]]:
+        """
+        Igual que `get_all_with_filters`, pero cada item es una tupla
+        (atleta, has_account). El indicador de cuenta se resuelve con un
+        EXISTS correlacionado sobre `users.dni`, de modo que una página cuesta
+        exactamente dos consultas (conteo y filas) sin importar su tamaño.
+
+        Si `filters.use_cursor` está activo pagina por cursor sobre el ID
+        (ver `BaseDAO.paginate_keyset`); el tercer elemento es `next_cursor`.
+        """
+        query = self._apply_filters(db.query(self.model), filters)
+
+        has_account = (
+            exists().where(User.dni == self.model.dni).correlate(self.model)
+        ).label("has_account")
+
+        if getattr(filters, "use_cursor", False):
+            rows, total, next_cursor = self.paginate_keyset(
+                db,
+                query.add_columns(has_account),
+                self.model.id,
+                filters.limit,
+                cursor=filters.cursor,
+                descending=True,
+                count=filters.count,
+            )
+            return [(a, bool(flag)) for a, flag in rows], total, next_cursor
+
+        total = query.count()
+
+        skip = getattr(filters, "skip", 0)
+        limit = getattr(filters, "limit", 10)
+        rows = (
+            query.add_columns(has_account)
+            .order_by(self.model.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+        return [(row[0], bool(row[1])) for row in rows], total, None
+
+    def _apply_filters(self, query, filters):
+        """Aplica búsqueda, tipo, sexo y estado activo a una consulta de atletas."""
         # Filtro por búsqueda (nombre o DNI)
         if filters.search:
             search_norm = filters.search.strip()
@@ -59,12 +116,4 @@ class AthleteDAO(BaseDAO[Athlete]):
         if is_active is not None:
             query = query.filter(self.model.is_active == is_active)
 
-        total = query.count()
-
-        # Paginación
-        # Paginación con tolerancia si no existen propiedades
-        skip = getattr(filters, "skip", 0)
-        limit = getattr(filters, "limit", 10)
-        items = query.order_by(self.model.id.desc()).offset(skip).limit(limit).all()
-
-        return items, total
+        return query
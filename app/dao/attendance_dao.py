@@ -4,13 +4,14 @@ import logging
 from datetime import date, datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func, insert
 from sqlalchemy.orm import Session, joinedload
 
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO
 from app.dao.base import BaseDAO
 from app.models.athlete import Athlete
 from app.models.attendance import Attendance
-from app.utils.exceptions import DatabaseException
+from app.utils.exceptions import DatabaseException, ValidationException
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class AttendanceDAO(BaseDAO[Attendance]):
 
     def __init__(self):
         super().__init__(Attendance)
+        self.rollup_dao = AttendanceRollupDAO()
 
     def get_by_date(
         self,
@@ -29,7 +31,10 @@ class AttendanceDAO(BaseDAO[Attendance]):
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> Tuple[List[Attendance], int]:
+        keyset: bool = False,
+        cursor: Optional[str] = None,
+        count: str = "exact",
+    ) -> Tuple[List[Attendance], Optional[int], Optional[str]]:
         """
         Obtener asistencias por fecha con filtros opcionales.
 
@@ -40,9 +45,12 @@ class AttendanceDAO(BaseDAO[Attendance]):
             search: Búsqueda por nombre o DNI (opcional)
             skip: Offset para paginación
             limit: Límite de resultados
+            keyset: Paginar por cursor en lugar de offset
+            cursor: Cursor de la página anterior (ver `BaseDAO.paginate_keyset`)
+            count: Modo de conteo en paginación por cursor
 
         Returns:
-            Tupla con lista de asistencias y total
+            Tupla con lista de asistencias, total y cursor de la siguiente página
         """
         try:
             # Convertir date a datetime para comparar (inicio y fin del día)
@@ -74,6 +82,11 @@ class AttendanceDAO(BaseDAO[Attendance]):
                     | (Athlete.dni.ilike(search_term))
                 )
 
+            if keyset or cursor:
+                return self.paginate_keyset(
+                    db, query, Athlete.full_name, limit, cursor=cursor, count=count
+                )
+
             # Contar total antes de paginar
             total = query.count()
 
@@ -82,8 +95,10 @@ class AttendanceDAO(BaseDAO[Attendance]):
                 query.order_by(Athlete.full_name.asc()).offset(skip).limit(limit).all()
             )
 
-            return items, total
+            return items, total, None
 
+        except ValidationException:
+            raise
         except Exception as e:
             logger.error(f"Error getting attendances by date: {str(e)}")
             raise DatabaseException("Error al obtener asistencias por fecha") from e
@@ -168,7 +183,24 @@ class AttendanceDAO(BaseDAO[Attendance]):
                 )
             ).delete(synchronize_session=False)
 
-            # 2. UPSERT de los registros que SI vienen
+            # 2. UPSERT de los registros que SI vienen: una sola consulta trae
+            # los existentes del día, los updates se agrupan al hacer flush y
+            # los inserts se envían en un único INSERT de varias filas
+            existing_by_athlete = {
+                attendance.athlete_id: attendance
+                for attendance in db.query(Attendance)
+                .filter(
+                    and_(
+                        Attendance.date >= start_of_day,
+                        Attendance.date <= end_of_day,
+                        Attendance.is_active.is_(True),
+                        Attendance.athlete_id.in_(payload_athlete_ids),
+                    )
+                )
+                .all()
+            }
+            new_rows = {}
+
             for record in records:
                 athlete_id = record["athlete_id"]
                 is_present = record.get("is_present", True)
@@ -178,8 +210,7 @@ class AttendanceDAO(BaseDAO[Attendance]):
                 if is_present:
                     justification = None
 
-                # Verificar si ya existe
-                existing = self.get_by_athlete_and_date(db, athlete_id, target_date)
+                existing = existing_by_athlete.get(athlete_id)
 
                 if existing:
                     # Actualizar existente
@@ -188,19 +219,31 @@ class AttendanceDAO(BaseDAO[Attendance]):
                     existing.justification = justification
                     existing.user_dni = user_dni
                     updated += 1
+                elif athlete_id in new_rows:
+                    # Atleta repetido en el payload: prevalece el último
+                    new_rows[athlete_id].update(
+                        is_present=is_present, justification=justification
+                    )
+                    updated += 1
                 else:
                     # Crear nuevo
-                    new_attendance = Attendance(
-                        date=attendance_datetime,
-                        time=time_str,
-                        is_present=is_present,
-                        justification=justification,
-                        user_dni=user_dni,
-                        athlete_id=athlete_id,
-                    )
-                    db.add(new_attendance)
+                    new_rows[athlete_id] = {
+                        "date": attendance_datetime,
+                        "time": time_str,
+                        "is_present": is_present,
+                        "justification": justification,
+                        "user_dni": user_dni,
+                        "athlete_id": athlete_id,
+                    }
                     created += 1
 
+            if new_rows:
+                db.execute(insert(Attendance), list(new_rows.values()))
+
+            # 3. Mantener el resumen diario en la misma transacción
+            db.flush()
+            self.rollup_dao.refresh_day(db, target_date)
+
             db.commit()
             return created, updated
 
@@ -213,48 +256,47 @@ class AttendanceDAO(BaseDAO[Attendance]):
         """
         Obtener resumen de asistencia por fecha.
 
+        Se lee de `attendance_daily_rollup`, por lo que el costo no depende
+        del tamaño de la tabla de asistencias. Mientras el resumen no esté
+        poblado se calcula sobre `attendances`.
+
         Returns:
             Dict con total, presentes y ausentes
         """
         try:
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            end_of_day = datetime.combine(target_date, datetime.max.time())
-
-            total = (
-                db.query(func.count(Attendance.id))
-                .filter(
-                    and_(
-                        Attendance.date >= start_of_day,
-                        Attendance.date <= end_of_day,
-                        Attendance.is_active,
-                    )
-                )
-                .scalar()
+            if not self.rollup_dao.is_populated(db):
+                return self._get_summary_from_records(db, target_date)
+            return self.rollup_dao.get_totals(
+                db, start_date=target_date, end_date=target_date
             )
 
-            present = (
-                db.query(func.count(Attendance.id))
-                .filter(
-                    and_(
-                        Attendance.date >= start_of_day,
-                        Attendance.date <= end_of_day,
-                        Attendance.is_present,
-                        Attendance.is_active,
-                    )
-                )
-                .scalar()
-            )
-
-            return {
-                "total": total or 0,
-                "present": present or 0,
-                "absent": (total or 0) - (present or 0),
-            }
-
         except Exception as e:
             logger.error(f"Error getting attendance summary: {str(e)}")
             return {"total": 0, "present": 0, "absent": 0}
 
+    def _get_summary_from_records(self, db: Session, target_date: date) -> dict:
+        """Resumen de un día calculado sobre `attendances`."""
+        start_of_day = datetime.combine(target_date, datetime.min.time())
+        end_of_day = datetime.combine(target_date, datetime.max.time())
+
+        total, present = (
+            db.query(
+                func.count(Attendance.id),
+                func.sum(case((Attendance.is_present.is_(True), 1), else_=0)),
+            )
+            .filter(
+                and_(
+                    Attendance.date >= start_of_day,
+                    Attendance.date <= end_of_day,
+                    Attendance.is_active.is_(True),
+                )
+            )
+            .one()
+        )
+        total = int(total or 0)
+        present = int(present or 0)
+        return {"total": total, "present": present, "absent": total - present}
+
     def get_existing_dates(self, db: Session) -> List[date]:
         """
         Obtener lista de fechas que tienen registros de asistencia.
@@ -263,14 +305,21 @@ class AttendanceDAO(BaseDAO[Attendance]):
             Lista de fechas ordenadas descendente
         """
         try:
-            dates = (
-                db.query(Attendance.date)
-                .filter(Attendance.is_active.is_(True))
-                .distinct()
-                .order_by(Attendance.date.desc())
-                .all()
-            )
-            return [d[0].date() for d in dates]
+            if not self.rollup_dao.is_populated(db):
+                return self._get_dates_from_records(db)
+            return self.rollup_dao.get_dates(db)
         except Exception as e:
             logger.error(f"Error getting existing dates: {str(e)}")
             raise DatabaseException("Error al obtener fechas de asistencia") from e
+
+    def _get_dates_from_records(self, db: Session) -> List[date]:
+        """Fechas con asistencia calculadas sobre `attendances`."""
+        dates = (
+            db.query(Attendance.date)
+            .filter(Attendance.is_active.is_(True))
+            .distinct()
+            .order_by(Attendance.date.desc())
+            .all()
+        )
+        # Varias horas el mismo día se reportan una sola vez
+        return list(dict.fromkeys(d[0].date() for d in dates))
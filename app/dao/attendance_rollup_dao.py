@@ -0,0 +1,301 @@
+"""DAO para la tabla derivada de asistencia diaria (`attendance_daily_rollup`)."""
+
+import logging
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.dao.base import BaseDAO
+from app.models.athlete import Athlete
+from app.models.attendance import Attendance
+from app.models.attendance_daily_rollup import AttendanceDailyRollup
+from app.utils.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceRollupDAO(BaseDAO[AttendanceDailyRollup]):
+    """DAO del resumen diario de asistencia.
+
+    La tabla guarda un registro por (día, tipo de atleta, sexo) con los
+    conteos de total, presentes y ausentes. Se mantiene desde
+    `AttendanceDAO.create_or_update_bulk` dentro de la misma transacción, y
+    se puede reconstruir por completo con `rebuild` (ver
+    `scripts/rebuild_attendance_rollup.py`), por ejemplo tras cambiar el tipo
+    o sexo de atletas con historial.
+
+    La tabla nunca queda a medias: vacía con asistencias activas significa
+    que aún no se pobló (ver `is_populated`), y en ese caso las lecturas
+    usan `attendances`.
+    """
+
+    def __init__(self):
+        super().__init__(AttendanceDailyRollup)
+
+    # ================================================================
+    # Mantenimiento
+    # ================================================================
+
+    def refresh_day(self, db: Session, target_date: date) -> None:
+        """
+        Recalcula los conteos de un día a partir de `attendances`.
+
+        No hace commit: está pensado para ejecutarse dentro de la
+        transacción que modifica las asistencias del día. El costo depende
+        solo de los registros de ese día, no del tamaño del historial.
+
+        Si la tabla está vacía se reconstruye completa, para no dejar un
+        resumen con un solo día que oculte el resto del historial.
+
+        Los conteos se escriben con un upsert sobre (día, tipo, sexo), de modo
+        que dos registros en lote concurrentes del mismo día no chocan en la
+        clave única: el último en confirmar deja sus conteos.
+        """
+        if not self._has_rows(db):
+            self._rebuild_rows(db)
+            return
+
+        start_of_day = datetime.combine(target_date, datetime.min.time())
+        end_of_day = datetime.combine(target_date, datetime.max.time())
+
+        rows = (
+            db.query(
+                Athlete.type_athlete,
+                Athlete.sex,
+                func.count(Attendance.id).label("total"),
+                func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
+                    "present"
+                ),
+            )
+            .join(Athlete, Attendance.athlete_id == Athlete.id)
+            .filter(
+                and_(
+                    Attendance.date >= start_of_day,
+                    Attendance.date <= end_of_day,
+                    Attendance.is_active.is_(True),
+                )
+            )
+            .group_by(Athlete.type_athlete, Athlete.sex)
+            .all()
+        )
+
+        self._upsert(
+            db,
+            [
+                self._build_rollup(target_date, row.type_athlete, row.sex, row)
+                for row in rows
+            ],
+        )
+
+        # Grupos que ya no tienen asistencias ese día
+        current = {(row.type_athlete, row.sex) for row in rows}
+        stale_ids = [
+            rollup_id
+            for rollup_id, type_athlete, sex in db.query(
+                AttendanceDailyRollup.id,
+                AttendanceDailyRollup.type_athlete,
+                AttendanceDailyRollup.sex,
+            ).filter(AttendanceDailyRollup.day == target_date)
+            if (type_athlete, sex) not in current
+        ]
+        if stale_ids:
+            db.query(AttendanceDailyRollup).filter(
+                AttendanceDailyRollup.id.in_(stale_ids)
+            ).delete(synchronize_session=False)
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Reconstruye la tabla completa desde `attendances` (backfill).
+
+        Returns:
+            Número de días con asistencia tras la reconstrucción
+        """
+        try:
+            days = self._rebuild_rows(db)
+            db.commit()
+            return days
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error rebuilding attendance rollup: {str(e)}")
+            raise DatabaseException("Error al reconstruir resumen de asistencia") from e
+
+    def backfill_if_empty(self, db: Session) -> int:
+        """
+        Reconstruye la tabla solo si todavía no se pobló.
+
+        Returns:
+            Número de días reconstruidos (0 si no hizo falta)
+        """
+        if self.is_populated(db):
+            return 0
+        return self.rebuild(db)
+
+    def _rebuild_rows(self, db: Session) -> int:
+        """Reemplaza el contenido de la tabla sin hacer commit."""
+        db.query(AttendanceDailyRollup).delete(synchronize_session=False)
+
+        att_day = func.date(Attendance.date)
+        rows = (
+            db.query(
+                att_day.label("att_date"),
+                Athlete.type_athlete,
+                Athlete.sex,
+                func.count(Attendance.id).label("total"),
+                func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
+                    "present"
+                ),
+            )
+            .join(Athlete, Attendance.athlete_id == Athlete.id)
+            .filter(Attendance.is_active.is_(True))
+            .group_by(att_day, Athlete.type_athlete, Athlete.sex)
+            .all()
+        )
+
+        rollups = []
+        for row in rows:
+            day = row.att_date
+            # SQLite devuelve func.date() como texto 'YYYY-MM-DD'
+            if isinstance(day, str):
+                day = date.fromisoformat(day)
+            rollups.append(self._build_rollup(day, row.type_athlete, row.sex, row))
+
+        self._upsert(db, rollups)
+        return len({r["day"] for r in rollups})
+
+    @staticmethod
+    def _build_rollup(day: date, type_athlete, sex, row) -> dict:
+        """Valores de un registro de resumen a partir de una fila agregada."""
+        total = int(row.total or 0)
+        present = int(row.present or 0)
+        return {
+            "day": day,
+            "type_athlete": type_athlete,
+            "sex": sex,
+            "total": total,
+            "present": present,
+            "absent": total - present,
+            "is_active": True,
+        }
+
+    @staticmethod
+    def _upsert(db: Session, rollups: List[dict]) -> None:
+        """
+        INSERT ... ON CONFLICT (day, type_athlete, sex) DO UPDATE.
+
+        Si otra transacción ya insertó la misma clave, PostgreSQL espera a
+        que confirme y actualiza la fila en vez de fallar.
+        """
+        if not rollups:
+            return
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = postgresql.insert(AttendanceDailyRollup)
+        else:
+            stmt = sqlite.insert(AttendanceDailyRollup)
+        stmt = stmt.values(rollups)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    AttendanceDailyRollup.day,
+                    AttendanceDailyRollup.type_athlete,
+                    AttendanceDailyRollup.sex,
+                ],
+                set_={
+                    "total": stmt.excluded.total,
+                    "present": stmt.excluded.present,
+                    "absent": stmt.excluded.absent,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    # ================================================================
+    # Consultas
+    # ================================================================
+
+    def is_populated(self, db: Session) -> bool:
+        """
+        Indica si la tabla refleja las asistencias registradas.
+
+        Solo es falso cuando hay asistencias activas y la tabla nunca se
+        reconstruyó; con la tabla poblada cuesta una consulta.
+        """
+        if self._has_rows(db):
+            return True
+        return (
+            db.query(Attendance.id).filter(Attendance.is_active.is_(True)).first()
+            is None
+        )
+
+    def _has_rows(self, db: Session) -> bool:
+        return db.query(AttendanceDailyRollup.id).first() is not None
+
+    def get_dates(self, db: Session) -> List[date]:
+        """Fechas con registros de asistencia, ordenadas descendente."""
+        rows = (
+            db.query(AttendanceDailyRollup.day)
+            .distinct()
+            .order_by(AttendanceDailyRollup.day.desc())
+            .all()
+        )
+        return [row[0] for row in rows]
+
+    def get_totals(
+        self,
+        db: Session,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        type_athlete: Optional[str] = None,
+        sex: Optional[str] = None,
+    ) -> dict:
+        """
+        Totales de asistencia para un rango de fechas y filtros de atleta.
+
+        Returns:
+            Dict con total, presentes y ausentes
+        """
+        query = db.query(
+            func.sum(AttendanceDailyRollup.total).label("total"),
+            func.sum(AttendanceDailyRollup.present).label("present"),
+        )
+        if start_date:
+            query = query.filter(AttendanceDailyRollup.day >= start_date)
+        if end_date:
+            query = query.filter(AttendanceDailyRollup.day <= end_date)
+        if type_athlete:
+            query = query.filter(AttendanceDailyRollup.type_athlete == type_athlete)
+        if sex:
+            query = query.filter(AttendanceDailyRollup.sex == sex)
+
+        row = query.first()
+        total = int(row.total or 0) if row else 0
+        present = int(row.present or 0) if row else 0
+        return {"total": total, "present": present, "absent": total - present}
+
+    def get_by_period(self, db: Session, limit: int = 30) -> list:
+        """Totales por día (más recientes primero) para gráficos de tendencia."""
+        return (
+            db.query(
+                AttendanceDailyRollup.day.label("att_date"),
+                func.sum(AttendanceDailyRollup.total).label("total"),
+                func.sum(AttendanceDailyRollup.present).label("present"),
+            )
+            .group_by(AttendanceDailyRollup.day)
+            .order_by(AttendanceDailyRollup.day.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_type(self, db: Session) -> list:
+        """Totales históricos agrupados por tipo de atleta."""
+        return (
+            db.query(
+                AttendanceDailyRollup.type_athlete,
+                func.sum(AttendanceDailyRollup.total).label("total"),
+                func.sum(AttendanceDailyRollup.present).label("present"),
+            )
+            .group_by(AttendanceDailyRollup.type_athlete)
+            .all()
+        )
@@ -1,17 +1,47 @@
+import base64
+import json
 import logging
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from datetime import date, datetime
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar
 
-from sqlalchemy import asc, desc, func
+from sqlalchemy import and_, asc, desc, func, or_
 from sqlalchemy.orm import Session
 
 from app.models.base import BaseModel
-from app.utils.exceptions import DatabaseException
+from app.utils.exceptions import DatabaseException, ValidationException
 
 logger = logging.getLogger(__name__)
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+def _encode_cursor(sort_key: str, sort_value: Any, row_id: int) -> str:
+    """Codifica (clave de orden, valor, id) como cursor opaco url-safe."""
+    if isinstance(sort_value, datetime):
+        sort_value = {"dt": sort_value.isoformat()}
+    elif isinstance(sort_value, date):
+        sort_value = {"d": sort_value.isoformat()}
+    raw = json.dumps({"k": sort_key, "v": sort_value, "id": row_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, int]:
+    """Decodifica un cursor generado por `_encode_cursor` para `sort_key`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["v"]
+        if isinstance(value, dict) and "dt" in value:
+            value = datetime.fromisoformat(value["dt"])
+        elif isinstance(value, dict) and "d" in value:
+            value = date.fromisoformat(value["d"])
+        if payload["k"] != sort_key:
+            raise ValueError("cursor de otro listado")
+        return value, int(payload["id"])
+    except Exception as e:
+        raise ValidationException("Cursor de paginación inválido") from e
+
+
 class BaseDAO(Generic[ModelType]):
     """DAO generico con CRUD, soft delete y utilidades de busqueda ordenada.
 
@@ -171,6 +201,21 @@ class BaseDAO(Generic[ModelType]):
             logger.error(f"Error checking existence in {self.model.__name__}: {str(e)}")
             return False
 
+    def get_existing_ids(
+        self, db: Session, ids: List[int], only_active: bool = True
+    ) -> Set[int]:
+        """Obtener, en una sola consulta, cuáles de los IDs dados existen"""
+        try:
+            if not ids:
+                return set()
+            query = db.query(self.model.id).filter(self.model.id.in_(set(ids)))
+            if only_active:
+                query = query.filter(self.model.is_active)
+            return {row[0] for row in query.all()}
+        except Exception as e:
+            logger.error(f"Error checking ids in {self.model.__name__}: {str(e)}")
+            raise DatabaseException("Error al verificar registros") from e
+
     def count(self, db: Session, only_active: bool = True) -> int:
         """Contar registros"""
         try:
@@ -194,17 +239,7 @@ class BaseDAO(Generic[ModelType]):
     ) -> List[ModelType]:
         """Búsqueda avanzada con filtros dinámicos y ordenamiento"""
         try:
-            query = db.query(self.model)
-
-            # Aplicar filtro de activos
-            if only_active:
-                query = query.filter(self.model.is_active)
-
-            # Aplicar filtros dinámicos
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field) and value is not None:
-                        query = query.filter(getattr(self.model, field) == value)
+            query = self._search_query(db, filters, only_active)
 
             # Aplicar ordenamiento
             if hasattr(self.model, order_by):
@@ -221,6 +256,159 @@ class BaseDAO(Generic[ModelType]):
             logger.error(f"Error searching {self.model.__name__}: {str(e)}")
             raise DatabaseException("Error al buscar registros") from e
 
+    def search_page(
+        self,
+        db: Session,
+        filters: Dict[str, Any] = None,
+        order_by: str = "id",
+        order_dir: str = "asc",
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        count: str = "exact",
+        only_active: bool = True,
+    ) -> Tuple[List[ModelType], Optional[int], Optional[str]]:
+        """Igual que `search`, pero paginando por cursor (ver `paginate_keyset`)"""
+        query = self._search_query(db, filters, only_active)
+        sort_column = getattr(self.model, order_by, self.model.id)
+        return self.paginate_keyset(
+            db,
+            query,
+            sort_column,
+            limit,
+            cursor=cursor,
+            descending=order_dir.lower() == "desc",
+            count=count,
+        )
+
+    def _search_query(
+        self, db: Session, filters: Optional[Dict[str, Any]], only_active: bool
+    ):
+        """Consulta base de `search`: activos y filtros dinámicos por igualdad."""
+        query = db.query(self.model)
+
+        # Aplicar filtro de activos
+        if only_active:
+            query = query.filter(self.model.is_active)
+
+        # Aplicar filtros dinámicos
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field) and value is not None:
+                    query = query.filter(getattr(self.model, field) == value)
+        return query
+
+    # PAGINACION POR CURSOR (KEYSET)
+
+    def paginate_keyset(
+        self,
+        db: Session,
+        query,
+        sort_column,
+        limit: int,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+        count: str = "exact",
+        tiebreaker=None,
+    ) -> Tuple[list, Optional[int], Optional[str]]:
+        """
+        Paginar una consulta por cursor sobre (`sort_column`, id).
+
+        En lugar de OFFSET, cada página filtra las filas posteriores a la
+        última vista, por lo que una página profunda cuesta lo mismo que la
+        primera. `sort_column` no debe admitir NULL; `tiebreaker` (por
+        defecto `self.model.id`) desempata filas con el mismo valor.
+
+        Args:
+            query: Consulta ya filtrada y sin ORDER BY/LIMIT
+            cursor: Valor de `next_cursor` de la página anterior (None = inicio)
+            count: "exact", "estimate" (solo PostgreSQL) o "none"
+
+        Returns:
+            Tupla (items, total, next_cursor). `total` es None si
+            count="none" y `next_cursor` es None en la última página.
+        """
+        tiebreaker = tiebreaker if tiebreaker is not None else self.model.id
+        sort_key = sort_column.key
+        try:
+            total = self.count_query(db, query, count)
+
+            if cursor:
+                last_value, last_id = _decode_cursor(cursor, sort_key)
+                if descending:
+                    after = or_(
+                        sort_column < last_value,
+                        and_(sort_column == last_value, tiebreaker < last_id),
+                    )
+                else:
+                    after = or_(
+                        sort_column > last_value,
+                        and_(sort_column == last_value, tiebreaker > last_id),
+                    )
+                query = query.filter(after)
+
+            direction = desc if descending else asc
+            width = len(query.column_descriptions)
+            rows = (
+                query.add_columns(
+                    sort_column.label("keyset_sort"), tiebreaker.label("keyset_id")
+                )
+                .order_by(None)
+                .order_by(direction(sort_column), direction(tiebreaker))
+                .limit(limit + 1)
+                .all()
+            )
+
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                next_cursor = _encode_cursor(sort_key, last[width], last[width + 1])
+
+            items = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+            return items, total, next_cursor
+        except ValidationException:
+            raise
+        except Exception as e:
+            logger.error(f"Error paginating {self.model.__name__}: {str(e)}")
+            raise DatabaseException("Error al paginar registros") from e
+
+    def count_query(self, db: Session, query, mode: str = "exact") -> Optional[int]:
+        """
+        Total de filas de una consulta según `mode`.
+
+        "none" omite el conteo; "estimate" usa las filas estimadas por el
+        planificador de PostgreSQL (EXPLAIN, sin recorrer la tabla) y en
+        otros motores, o si falla, recurre al conteo exacto.
+        """
+        if mode == "none":
+            return None
+        if mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+            estimate = self._estimate_count(db, query)
+            if estimate is not None:
+                return estimate
+        return query.order_by(None).count()
+
+    @staticmethod
+    def _estimate_count(db: Session, query) -> Optional[int]:
+        """Filas estimadas por el planificador de PostgreSQL para la consulta."""
+        try:
+            sql = query.order_by(None).statement.compile(
+                dialect=db.get_bind().dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            plan = (
+                db.connection()
+                .execution_options(no_parameters=True)
+                .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+                .scalar()
+            )
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.warning(f"Row estimate unavailable, using exact count: {str(e)}")
+            return None
+
     def bulk_create(
         self, db: Session, objects_data: List[Dict[str, Any]]
     ) -> List[ModelType]:
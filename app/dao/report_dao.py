@@ -1,9 +1,9 @@
 """DAO para generación de reportes deportivos."""
 
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional, Tuple, Union
 
-from sqlalchemy import and_, func
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.orm import Session
 
 from app.models.athlete import Athlete
@@ -11,9 +11,41 @@ from app.models.attendance import Attendance
 from app.models.endurance_test import EnduranceTest
 from app.models.evaluation import Evaluation
 from app.models.sprint_test import SprintTest
+from app.models.statistic import Statistic
 from app.models.technical_assessment import TechnicalAssessment
+from app.models.test import Test
 from app.models.yoyo_test import YoyoTest
 
+# Modelos y columnas propias exportables en modo "raw"
+EXPORT_MODELS = {
+    "attendance": Attendance,
+    "sprint_test": SprintTest,
+    "yoyo_test": YoyoTest,
+    "endurance_test": EnduranceTest,
+    "technical_assessment": TechnicalAssessment,
+}
+EXPORT_COLUMNS = {
+    "attendance": ("time", "is_present", "justification", "user_dni"),
+    "sprint_test": ("distance_meters", "time_0_10_s", "time_0_30_s", "observations"),
+    "yoyo_test": ("shuttle_count", "final_level", "failures", "observations"),
+    "endurance_test": ("min_duration", "total_distance_m", "observations"),
+    "technical_assessment": (
+        "ball_control",
+        "short_pass",
+        "long_pass",
+        "shooting",
+        "dribbling",
+        "observations",
+    ),
+}
+
+# Tablas de las que depende cada tipo de reporte (versión de datos)
+VERSION_MODELS = {
+    "attendance": (Attendance, Athlete),
+    "tests": (Test, Evaluation, Athlete),
+    "statistics": (Statistic, Test, Attendance, Evaluation, Athlete),
+}
+
 
 class ReportDAO:
     """DAO para consultas de reportes."""
@@ -64,15 +96,9 @@ class ReportDAO:
         Returns:
             Lista de registros de asistencia
         """
-        query = db.query(Attendance).filter(Attendance.athlete_id.in_(athlete_ids))
-
-        if start_date:
-            query = query.filter(Attendance.date >= start_date)
-
-        if end_date:
-            query = query.filter(Attendance.date <= end_date)
-
-        return query.order_by(Attendance.athlete_id, Attendance.date.desc()).all()
+        return self._records_query(
+            db, Attendance, athlete_ids, start_date, end_date
+        ).all()
 
     def get_evaluations(
         self,
@@ -129,15 +155,9 @@ class ReportDAO:
         Returns:
             Lista de pruebas de sprint
         """
-        query = db.query(SprintTest).filter(SprintTest.athlete_id.in_(athlete_ids))
-
-        if start_date:
-            query = query.filter(SprintTest.created_at >= start_date)
-
-        if end_date:
-            query = query.filter(SprintTest.created_at <= end_date)
-
-        return query.order_by(SprintTest.athlete_id, SprintTest.created_at.desc()).all()
+        return self._records_query(
+            db, SprintTest, athlete_ids, start_date, end_date
+        ).all()
 
     def get_endurance_tests(
         self,
@@ -158,18 +178,8 @@ class ReportDAO:
         Returns:
             Lista de pruebas de resistencia
         """
-        query = db.query(EnduranceTest).filter(
-            EnduranceTest.athlete_id.in_(athlete_ids)
-        )
-
-        if start_date:
-            query = query.filter(EnduranceTest.created_at >= start_date)
-
-        if end_date:
-            query = query.filter(EnduranceTest.created_at <= end_date)
-
-        return query.order_by(
-            EnduranceTest.athlete_id, EnduranceTest.created_at.desc()
+        return self._records_query(
+            db, EnduranceTest, athlete_ids, start_date, end_date
         ).all()
 
     def get_yoyo_tests(
@@ -191,15 +201,9 @@ class ReportDAO:
         Returns:
             Lista de pruebas Yo-Yo
         """
-        query = db.query(YoyoTest).filter(YoyoTest.athlete_id.in_(athlete_ids))
-
-        if start_date:
-            query = query.filter(YoyoTest.created_at >= start_date)
-
-        if end_date:
-            query = query.filter(YoyoTest.created_at <= end_date)
-
-        return query.order_by(YoyoTest.athlete_id, YoyoTest.created_at.desc()).all()
+        return self._records_query(
+            db, YoyoTest, athlete_ids, start_date, end_date
+        ).all()
 
     def get_technical_assessments(
         self,
@@ -220,19 +224,129 @@ class ReportDAO:
         Returns:
             Lista de evaluaciones técnicas
         """
-        query = db.query(TechnicalAssessment).filter(
-            TechnicalAssessment.athlete_id.in_(athlete_ids)
+        return self._records_query(
+            db, TechnicalAssessment, athlete_ids, start_date, end_date
+        ).all()
+
+    # ==================== EXPORTACIÓN DE REGISTROS ====================
+
+    def data_version(self, db: Session, report_type: str) -> str:
+        """
+        Sello de versión de los datos de un tipo de reporte.
+
+        Combina conteo, ID máximo y último `updated_at` de cada tabla en una
+        sola consulta: cambia con altas, bajas (lógicas o físicas) y ediciones.
+        """
+        columns = []
+        for model in VERSION_MODELS[report_type]:
+            columns += [
+                select(func.count(model.id)).scalar_subquery(),
+                select(func.max(model.id)).scalar_subquery(),
+                select(func.max(model.updated_at)).scalar_subquery(),
+            ]
+        return "|".join(str(value) for value in db.execute(select(*columns)).one())
+
+    def data_as_of(self, db: Session, report_type: str) -> Optional[datetime]:
+        """
+        Fecha del último alta o edición en los datos de un tipo de reporte.
+
+        Igual que `data_version`, solo cambia con los datos: un reporte
+        servido desde la caché sigue mostrando una fecha correcta, cosa que
+        no pasa con la hora de generación.
+        """
+        columns = []
+        for model in VERSION_MODELS[report_type]:
+            columns += [
+                select(func.max(model.created_at)).scalar_subquery(),
+                select(func.max(model.updated_at)).scalar_subquery(),
+            ]
+        stamps = [value for value in db.execute(select(*columns)).one() if value]
+        return max(stamps, default=None)
+
+    def athlete_scope(
+        self,
+        athlete_id: Optional[int] = None,
+        athlete_type: Optional[str] = None,
+        sex: Optional[str] = None,
+    ) -> Select:
+        """
+        Subconsulta con los IDs de atletas activos que cumplen los filtros.
+
+        Se puede pasar como `athlete_ids` a los getters para filtrar en la
+        propia consulta en lugar de cargar los IDs en memoria.
+        """
+        scope = select(Athlete.id).where(Athlete.is_active)
+        if athlete_id:
+            scope = scope.where(Athlete.id == athlete_id)
+        if athlete_type:
+            scope = scope.where(Athlete.type_athlete == athlete_type)
+        if sex:
+            scope = scope.where(Athlete.sex == sex)
+        return scope
+
+    def stream_records(
+        self,
+        db: Session,
+        record_type: str,
+        athlete_ids: Union[List[int], Select],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Registros crudos de asistencia o de un tipo de test, por lotes.
+
+        Usa las mismas consultas que los getters, pero selecciona solo las
+        columnas exportables y las lee con `yield_per` (cursor del lado del
+        servidor en PostgreSQL), de modo que la memoria no crece con el
+        volumen exportado.
+
+        Args:
+            record_type: "attendance" o el tipo de test (sprint_test, ...)
+            batch_size: Filas leídas por lote
+
+        Returns:
+            Tupla (nombres de columnas, iterador de filas)
+        """
+        model = EXPORT_MODELS[record_type]
+        columns = [
+            ("date", model.date),
+            ("athlete_name", Athlete.full_name),
+            ("athlete_dni", Athlete.dni),
+            *[(name, getattr(model, name)) for name in EXPORT_COLUMNS[record_type]],
+        ]
+        query = self._records_query(db, model, athlete_ids, start_date, end_date).join(
+            Athlete, Athlete.id == model.athlete_id
+        )
+        if record_type != "attendance":
+            query = query.join(Evaluation, Evaluation.id == model.evaluation_id)
+            columns.insert(3, ("evaluation", Evaluation.name))
+        query = query.with_entities(*[column for _, column in columns])
+
+        names = [name for name, _ in columns]
+        return names, (tuple(row) for row in query.yield_per(batch_size))
+
+    @staticmethod
+    def _records_query(
+        db: Session,
+        model,
+        athlete_ids: Union[List[int], Select],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """Consulta de asistencias o tests de los atletas en el período."""
+        query = db.query(model).filter(
+            model.athlete_id.in_(athlete_ids), model.is_active
         )
 
         if start_date:
-            query = query.filter(TechnicalAssessment.created_at >= start_date)
+            query = query.filter(model.date >= start_date)
 
         if end_date:
-            query = query.filter(TechnicalAssessment.created_at <= end_date)
+            # Fin inclusivo: `date` guarda fecha y hora
+            query = query.filter(model.date < end_date + timedelta(days=1))
 
-        return query.order_by(
-            TechnicalAssessment.athlete_id, TechnicalAssessment.created_at.desc()
-        ).all()
+        return query.order_by(model.athlete_id, model.date.desc(), model.id)
 
     def get_report_statistics(
         self,
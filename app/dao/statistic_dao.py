@@ -4,9 +4,10 @@ import logging
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import case, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, select, true
+from sqlalchemy.orm import Session, with_polymorphic
 
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO
 from app.dao.base import BaseDAO
 from app.models.athlete import Athlete
 from app.models.attendance import Attendance
@@ -30,32 +31,124 @@ SCALE_VALUES = {
     Scale.EXCELLENT: 100,
 }
 
+# Tipos de test del historial (discriminador -> etiqueta y unidad), en el
+# orden en que se listan a igual fecha y en `summary_by_type`
+HISTORY_TEST_LABELS = {
+    "sprint_test": ("Sprint Test", "segundos"),
+    "yoyo_test": ("YoYo Test", "shuttles"),
+    "endurance_test": ("Endurance Test", "metros"),
+    "technical_assessment": ("Technical Assessment", "puntos"),
+}
+HISTORY_TEST_TYPES = tuple(HISTORY_TEST_LABELS)
+
+TECHNICAL_FIELDS = ("ball_control", "short_pass", "long_pass", "shooting", "dribbling")
+
+# Acumulados de `statistics` por tipo de test:
+# discriminador -> (campo suma, campo cantidad, atributo con la métrica)
+TEST_ACCUMULATORS = {
+    "sprint_test": ("sprint_time_sum", "sprint_count", "time_0_30_s"),
+    "yoyo_test": ("yoyo_shuttles_sum", "yoyo_count", "shuttle_count"),
+    "endurance_test": (
+        "endurance_distance_sum",
+        "endurance_count",
+        "total_distance_m",
+    ),
+    "technical_assessment": (None, "technical_count", None),
+}
+ACCUMULATOR_FIELDS = tuple(
+    field for spec in TEST_ACCUMULATORS.values() for field in spec[:2] if field
+)
+
+
+def contribution_of(test) -> tuple | None:
+    """Aporte de un test a los acumulados: (athlete_id, tipo, valor).
+
+    Devuelve None si el test está inactivo o su tipo no acumula. Tomar el
+    aporte antes de modificar un test permite descontarlo después.
+    """
+    if test is None or not getattr(test, "is_active", False):
+        return None
+    spec = TEST_ACCUMULATORS.get(getattr(test, "type", None))
+    if spec is None:
+        return None
+    value = float(getattr(test, spec[2]) or 0) if spec[2] else 0.0
+    return test.athlete_id, test.type, value
+
+
+def physical_stats_from_totals(statistic: Statistic) -> dict:
+    """Calcula speed, stamina y agility a partir de los acumulados.
+
+    - speed: puntaje del tiempo promedio 0-30m de sprint
+    - stamina: promedio de los puntajes de YoYo y resistencia disponibles
+    - agility: 10 puntos por evaluación técnica (máximo 100)
+    """
+    stats = {"speed": None, "stamina": None, "agility": None}
+
+    if statistic.sprint_count:
+        sprint_avg = statistic.sprint_time_sum / statistic.sprint_count
+        stats["speed"] = round(_sprint_time_to_score(sprint_avg), 1)
+
+    stamina_scores = []
+    if statistic.yoyo_count:
+        yoyo_avg = statistic.yoyo_shuttles_sum / statistic.yoyo_count
+        stamina_scores.append(_yoyo_shuttles_to_score(yoyo_avg))
+    if statistic.endurance_count:
+        endurance_avg = statistic.endurance_distance_sum / statistic.endurance_count
+        stamina_scores.append(_endurance_distance_to_score(endurance_avg))
+    if stamina_scores:
+        stats["stamina"] = round(sum(stamina_scores) / len(stamina_scores), 1)
+
+    if statistic.technical_count:
+        stats["agility"] = min(100, statistic.technical_count * 10)
+
+    return stats
 
-def _sprint_time_to_score(time_seconds: float) -> float:
+
+# Fórmulas de puntaje 0-100. Aceptan un número o una columna de pandas
+# (`Series`), para usarlas igual en el cálculo fila a fila y en el vectorizado.
+
+
+def _bounded_score(value, formula):
+    """Aplica `formula` limitada a 0-100; sin medición (nula o <= 0) vale 0."""
+    if hasattr(value, "where"):
+        return formula(value).clip(0, 100).where(value > 0, 0)
+    if not value or value <= 0:
+        return 0
+    return max(0, min(100, formula(value)))
+
+
+def _sprint_time_to_score(time_seconds):
     """Convierte tiempo de sprint (segundos) a puntaje 0-100.
     Formula: 4s = 100, 8s = 0
     """
-    if not time_seconds or time_seconds <= 0:
-        return 0
-    return max(0, min(100, 100 - ((time_seconds - 4) * 25)))
+    return _bounded_score(time_seconds, lambda t: 100 - ((t - 4) * 25))
 
 
-def _yoyo_shuttles_to_score(shuttle_count: float) -> float:
+def _yoyo_shuttles_to_score(shuttle_count):
     """Convierte shuttles de YoYo a puntaje 0-100.
     Formula: 20 shuttles = 30 pts, escala proporcional
     """
-    if not shuttle_count or shuttle_count <= 0:
-        return 0
-    return min(100, max(0, 30 + (shuttle_count - 20) * 1.17))
+    return _bounded_score(shuttle_count, lambda n: 30 + (n - 20) * 1.17)
 
 
-def _endurance_distance_to_score(distance_m: float) -> float:
+def _endurance_distance_to_score(distance_m):
     """Convierte distancia de resistencia (metros) a puntaje 0-100.
     Formula: 1000m = 30 pts, escala proporcional
     """
-    if not distance_m or distance_m <= 0:
-        return 0
-    return min(100, max(0, 30 + (distance_m - 1000) * 0.035))
+    return _bounded_score(distance_m, lambda d: 30 + (d - 1000) * 0.035)
+
+
+def _technical_scales_to_score(scales):
+    """Promedia las escalas técnicas evaluadas a puntaje 0-100.
+
+    Recibe una secuencia de `Scale` o un `DataFrame` con una columna por
+    aspecto; los aspectos sin evaluar no cuentan y sin ninguno vale 0.
+    """
+    if hasattr(scales, "columns"):
+        values = scales.apply(lambda col: col.map(SCALE_VALUES)).astype(float)
+        return values.mean(axis=1).fillna(0)
+    values = [SCALE_VALUES[scale] for scale in scales if scale in SCALE_VALUES]
+    return sum(values) / len(values) if values else 0
 
 
 class StatisticDAO(BaseDAO[Statistic]):
@@ -63,96 +156,216 @@ class StatisticDAO(BaseDAO[Statistic]):
 
     def __init__(self):
         super().__init__(Statistic)
+        self.attendance_rollup_dao = AttendanceRollupDAO()
 
     def get_club_overview(
         self,
         db: Session,
         type_athlete: Optional[str] = None,
         sex: Optional[str] = None,
+        single_pass: bool = True,
     ) -> dict:
         """
         Obtener métricas generales del club.
 
+        Args:
+            db: Sesión de base de datos
+            type_athlete: Filtro por tipo de atleta
+            sex: Filtro por sexo
+            single_pass: Si es True, resuelve todas las métricas en una sola
+                consulta agregada; si es False, usa una consulta por métrica.
+
         Returns:
             Dict con totales y distribuciones
         """
         try:
-            # Base query for athletes
-            query = db.query(Athlete)
+            if single_pass:
+                return self._get_club_overview_single_pass(db, type_athlete, sex)
+            return self._get_club_overview_multi_query(db, type_athlete, sex)
 
-            if type_athlete:
-                query = query.filter(Athlete.type_athlete == type_athlete)
-            if sex:
-                query = query.filter(Athlete.sex == sex)
+        except Exception as e:
+            logger.error(f"Error getting club overview: {str(e)}")
+            raise DatabaseException("Error al obtener resumen del club") from e
 
-            # Total athletes
-            total = query.count()
-            active = query.filter(Athlete.is_active.is_(True)).count()
-            inactive = total - active
+    def _athlete_overview_filters(
+        self, type_athlete: Optional[str], sex: Optional[str]
+    ) -> list:
+        """Construye los criterios de filtro de atletas para el resumen."""
+        criteria = []
+        if type_athlete:
+            criteria.append(Athlete.type_athlete == type_athlete)
+        if sex:
+            criteria.append(Athlete.sex == sex)
+        return criteria
+
+    def _get_club_overview_single_pass(
+        self,
+        db: Session,
+        type_athlete: Optional[str],
+        sex: Optional[str],
+    ) -> dict:
+        """
+        Resumen del club en un único round trip.
 
-            # Distribution by type
-            type_distribution = (
-                db.query(
-                    Athlete.type_athlete,
-                    func.count(Athlete.id).label("count"),
-                )
-                .filter(Athlete.is_active.is_(True))
-                .group_by(Athlete.type_athlete)
-                .all()
+        Agrupa atletas por (tipo, sexo) con agregados condicionales y adjunta
+        los totales de evaluaciones y tests como subconsultas escalares. El
+        LEFT JOIN desde la fila de totales garantiza al menos una fila aunque
+        ningún atleta cumpla los filtros. Portable entre PostgreSQL y SQLite.
+        """
+        totals = select(
+            select(func.count(Evaluation.id))
+            .scalar_subquery()
+            .label("total_evaluations"),
+            select(func.count(Test.id)).scalar_subquery().label("total_tests"),
+        ).subquery()
+
+        rows = (
+            db.query(
+                Athlete.type_athlete,
+                Athlete.sex,
+                func.count(Athlete.id).label("total"),
+                func.sum(case((Athlete.is_active.is_(True), 1), else_=0)).label(
+                    "active"
+                ),
+                totals.c.total_evaluations,
+                totals.c.total_tests,
             )
-
-            athletes_by_type = []
-            for row in type_distribution:
-                pct = (row.count / active * 100) if active > 0 else 0
-                athletes_by_type.append(
-                    {
-                        "type_athlete": row.type_athlete or "Sin tipo",
-                        "count": row.count,
-                        "percentage": round(pct, 1),
-                    }
+            .select_from(totals)
+            .outerjoin(
+                Athlete,
+                and_(true(), *self._athlete_overview_filters(type_athlete, sex)),
+            )
+            .group_by(
+                Athlete.type_athlete,
+                Athlete.sex,
+                totals.c.total_evaluations,
+                totals.c.total_tests,
+            )
+            .order_by(Athlete.type_athlete, Athlete.sex)
+            .all()
+        )
+
+        total = 0
+        active = 0
+        eval_count = 0
+        total_tests = 0
+        active_by_type: dict = {}
+        active_by_sex: dict = {}
+        for row in rows:
+            eval_count = row.total_evaluations or 0
+            total_tests = row.total_tests or 0
+            total += row.total or 0
+            row_active = row.active or 0
+            active += row_active
+            if row_active:
+                active_by_type[row.type_athlete] = (
+                    active_by_type.get(row.type_athlete, 0) + row_active
                 )
+                active_by_sex[row.sex] = active_by_sex.get(row.sex, 0) + row_active
 
-            # Distribution by gender
-            gender_distribution = (
-                db.query(
-                    Athlete.sex,
-                    func.count(Athlete.id).label("count"),
-                )
-                .filter(Athlete.is_active.is_(True))
-                .group_by(Athlete.sex)
-                .all()
+        athletes_by_type = [
+            {
+                "type_athlete": type_name or "Sin tipo",
+                "count": count,
+                "percentage": round(count / active * 100, 1),
+            }
+            for type_name, count in active_by_type.items()
+        ]
+        athletes_by_gender = [
+            {
+                "sex": sex_value or "No especificado",
+                "count": count,
+                "percentage": round(count / active * 100, 1),
+            }
+            for sex_value, count in active_by_sex.items()
+        ]
+
+        return {
+            "total_athletes": total,
+            "active_athletes": active,
+            "inactive_athletes": total - active,
+            "athletes_by_type": athletes_by_type,
+            "athletes_by_gender": athletes_by_gender,
+            "total_evaluations": eval_count,
+            "total_tests": total_tests,
+        }
+
+    def _get_club_overview_multi_query(
+        self,
+        db: Session,
+        type_athlete: Optional[str],
+        sex: Optional[str],
+    ) -> dict:
+        """Resumen del club con una consulta independiente por métrica."""
+        criteria = self._athlete_overview_filters(type_athlete, sex)
+
+        # Base query for athletes
+        query = db.query(Athlete).filter(*criteria)
+
+        # Total athletes
+        total = query.count()
+        active = query.filter(Athlete.is_active.is_(True)).count()
+        inactive = total - active
+
+        # Distribution by type
+        type_distribution = (
+            db.query(
+                Athlete.type_athlete,
+                func.count(Athlete.id).label("count"),
+            )
+            .filter(Athlete.is_active.is_(True), *criteria)
+            .group_by(Athlete.type_athlete)
+            .all()
+        )
+
+        athletes_by_type = []
+        for row in type_distribution:
+            pct = (row.count / active * 100) if active > 0 else 0
+            athletes_by_type.append(
+                {
+                    "type_athlete": row.type_athlete or "Sin tipo",
+                    "count": row.count,
+                    "percentage": round(pct, 1),
+                }
             )
 
-            athletes_by_gender = []
-            for row in gender_distribution:
-                pct = (row.count / active * 100) if active > 0 else 0
-                athletes_by_gender.append(
-                    {
-                        "sex": row.sex or "No especificado",
-                        "count": row.count,
-                        "percentage": round(pct, 1),
-                    }
-                )
-
-            # Total evaluations
-            eval_count = db.query(func.count(Evaluation.id)).scalar() or 0
+        # Distribution by gender
+        gender_distribution = (
+            db.query(
+                Athlete.sex,
+                func.count(Athlete.id).label("count"),
+            )
+            .filter(Athlete.is_active.is_(True), *criteria)
+            .group_by(Athlete.sex)
+            .all()
+        )
+
+        athletes_by_gender = []
+        for row in gender_distribution:
+            pct = (row.count / active * 100) if active > 0 else 0
+            athletes_by_gender.append(
+                {
+                    "sex": row.sex or "No especificado",
+                    "count": row.count,
+                    "percentage": round(pct, 1),
+                }
+            )
 
-            # Total tests (sum of all test types)
-            total_tests = db.query(func.count(Test.id)).scalar() or 0
+        # Total evaluations
+        eval_count = db.query(func.count(Evaluation.id)).scalar() or 0
 
-            return {
-                "total_athletes": total,
-                "active_athletes": active,
-                "inactive_athletes": inactive,
-                "athletes_by_type": athletes_by_type,
-                "athletes_by_gender": athletes_by_gender,
-                "total_evaluations": eval_count,
-                "total_tests": total_tests,
-            }
+        # Total tests (sum of all test types)
+        total_tests = db.query(func.count(Test.id)).scalar() or 0
 
-        except Exception as e:
-            logger.error(f"Error getting club overview: {str(e)}")
-            raise DatabaseException("Error al obtener resumen del club") from e
+        return {
+            "total_athletes": total,
+            "active_athletes": active,
+            "inactive_athletes": inactive,
+            "athletes_by_type": athletes_by_type,
+            "athletes_by_gender": athletes_by_gender,
+            "total_evaluations": eval_count,
+            "total_tests": total_tests,
+        }
 
     def get_attendance_stats(
         self,
@@ -162,10 +375,16 @@ class StatisticDAO(BaseDAO[Statistic]):
         type_athlete: Optional[str] = None,
         sex: Optional[str] = None,
         athlete_id: Optional[int] = None,
+        use_rollup: bool = True,
     ) -> dict:
         """
         Obtener estadísticas de asistencia con filtros.
 
+        Por defecto se lee de `attendance_daily_rollup`, cuyo tamaño crece
+        por día y no por registro. El filtro por atleta no está disponible
+        en el resumen, así que con `athlete_id` se consulta `attendances`,
+        igual que mientras el resumen no esté poblado.
+
         Returns:
             Dict con tasas y tendencias de asistencia
         """
@@ -177,103 +396,160 @@ class StatisticDAO(BaseDAO[Statistic]):
                     f"a la fecha de fin ({end_date})"
                 )
 
-            # Base query
-            query = db.query(Attendance).filter(Attendance.is_active.is_(True))
-
-            # Date filters
-            if start_date:
-                start_dt = datetime.combine(start_date, datetime.min.time())
-                query = query.filter(Attendance.date >= start_dt)
-            if end_date:
-                end_dt = datetime.combine(end_date, datetime.max.time())
-                query = query.filter(Attendance.date <= end_dt)
-
-            # Join with athlete for type/sex/id filters
-            if type_athlete or sex or athlete_id:
-                query = query.join(Athlete, Attendance.athlete_id == Athlete.id)
-                if type_athlete:
-                    query = query.filter(Athlete.type_athlete == type_athlete)
-                if sex:
-                    query = query.filter(Athlete.sex == sex)
-                if athlete_id:
-                    query = query.filter(Athlete.id == athlete_id)
-
-            # Total records
-            total = query.count()
-            present = query.filter(Attendance.is_present.is_(True)).count()
-            absent = total - present
-            rate = (present / total * 100) if total > 0 else 0
-
-            # Attendance by date (for trend chart)
-            date_stats = (
-                db.query(
-                    func.date(Attendance.date).label("att_date"),
-                    func.count(Attendance.id).label("total"),
-                    func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
-                        "present"
-                    ),
+            if (
+                use_rollup
+                and not athlete_id
+                and self.attendance_rollup_dao.is_populated(db)
+            ):
+                return self._get_attendance_stats_from_rollup(
+                    db, start_date, end_date, type_athlete, sex
                 )
-                .filter(Attendance.is_active.is_(True))
-                .group_by(func.date(Attendance.date))
-                .order_by(func.date(Attendance.date).desc())
-                .limit(30)
-                .all()
+            return self._get_attendance_stats_from_records(
+                db, start_date, end_date, type_athlete, sex, athlete_id
             )
 
-            attendance_by_period = []
-            for row in date_stats:
-                att_rate = (row.present / row.total * 100) if row.total > 0 else 0
-                attendance_by_period.append(
-                    {
-                        "date": row.att_date.isoformat() if row.att_date else "",
-                        "present_count": row.present or 0,
-                        "absent_count": row.total - (row.present or 0),
-                        "attendance_rate": round(att_rate, 1),
-                    }
-                )
-
-            # Attendance by athlete type
-            type_stats = (
-                db.query(
-                    Athlete.type_athlete,
-                    func.count(Attendance.id).label("total"),
-                    func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
-                        "present"
-                    ),
-                )
-                .join(Athlete, Attendance.athlete_id == Athlete.id)
-                .filter(Attendance.is_active.is_(True))
-                .group_by(Athlete.type_athlete)
-                .all()
-            )
-
-            attendance_by_type = []
-            for row in type_stats:
-                att_rate = (row.present / row.total * 100) if row.total > 0 else 0
-                attendance_by_type.append(
-                    {
-                        "type_athlete": row.type_athlete or "Sin tipo",
-                        "total": row.total,
-                        "present": row.present or 0,
-                        "attendance_rate": round(att_rate, 1),
-                    }
-                )
-
-            return {
-                "total_records": total,
-                "total_present": present,
-                "total_absent": absent,
-                "overall_attendance_rate": round(rate, 1),
-                "attendance_by_period": attendance_by_period,
-                "attendance_by_type": attendance_by_type,
-            }
-
         except Exception as e:
             logger.error(f"Error getting attendance stats: {str(e)}")
             raise DatabaseException(
                 "Error al obtener estadísticas de asistencia"
             ) from e
 
+    def _get_attendance_stats_from_rollup(
+        self,
+        db: Session,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        type_athlete: Optional[str],
+        sex: Optional[str],
+    ) -> dict:
+        """Estadísticas de asistencia leídas del resumen diario."""
+        totals = self.attendance_rollup_dao.get_totals(
+            db,
+            start_date=start_date,
+            end_date=end_date,
+            type_athlete=type_athlete,
+            sex=sex,
+        )
+        return self._format_attendance_stats(
+            totals["total"],
+            totals["present"],
+            self.attendance_rollup_dao.get_by_period(db, limit=30),
+            self.attendance_rollup_dao.get_by_type(db),
+        )
+
+    def _get_attendance_stats_from_records(
+        self,
+        db: Session,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        type_athlete: Optional[str],
+        sex: Optional[str],
+        athlete_id: Optional[int],
+    ) -> dict:
+        """Estadísticas de asistencia calculadas sobre `attendances`."""
+        # Base query
+        query = db.query(Attendance).filter(Attendance.is_active.is_(True))
+
+        # Date filters
+        if start_date:
+            start_dt = datetime.combine(start_date, datetime.min.time())
+            query = query.filter(Attendance.date >= start_dt)
+        if end_date:
+            end_dt = datetime.combine(end_date, datetime.max.time())
+            query = query.filter(Attendance.date <= end_dt)
+
+        # Join with athlete for type/sex/id filters
+        if type_athlete or sex or athlete_id:
+            query = query.join(Athlete, Attendance.athlete_id == Athlete.id)
+            if type_athlete:
+                query = query.filter(Athlete.type_athlete == type_athlete)
+            if sex:
+                query = query.filter(Athlete.sex == sex)
+            if athlete_id:
+                query = query.filter(Athlete.id == athlete_id)
+
+        # Total records
+        total = query.count()
+        present = query.filter(Attendance.is_present.is_(True)).count()
+
+        # Attendance by date (for trend chart)
+        date_stats = (
+            db.query(
+                func.date(Attendance.date).label("att_date"),
+                func.count(Attendance.id).label("total"),
+                func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
+                    "present"
+                ),
+            )
+            .filter(Attendance.is_active.is_(True))
+            .group_by(func.date(Attendance.date))
+            .order_by(func.date(Attendance.date).desc())
+            .limit(30)
+            .all()
+        )
+
+        # Attendance by athlete type
+        type_stats = (
+            db.query(
+                Athlete.type_athlete,
+                func.count(Attendance.id).label("total"),
+                func.sum(case((Attendance.is_present.is_(True), 1), else_=0)).label(
+                    "present"
+                ),
+            )
+            .join(Athlete, Attendance.athlete_id == Athlete.id)
+            .filter(Attendance.is_active.is_(True))
+            .group_by(Athlete.type_athlete)
+            .all()
+        )
+
+        return self._format_attendance_stats(total, present, date_stats, type_stats)
+
+    def _format_attendance_stats(
+        self, total: int, present: int, date_stats: list, type_stats: list
+    ) -> dict:
+        """Arma la respuesta de asistencia a partir de totales y agrupaciones."""
+        absent = total - present
+        rate = (present / total * 100) if total > 0 else 0
+
+        attendance_by_period = []
+        for row in date_stats:
+            row_present = int(row.present or 0)
+            att_rate = (row_present / row.total * 100) if row.total > 0 else 0
+            att_date = row.att_date
+            if att_date and not isinstance(att_date, str):
+                att_date = att_date.isoformat()
+            attendance_by_period.append(
+                {
+                    "date": att_date or "",
+                    "present_count": row_present,
+                    "absent_count": int(row.total) - row_present,
+                    "attendance_rate": round(att_rate, 1),
+                }
+            )
+
+        attendance_by_type = []
+        for row in type_stats:
+            row_present = int(row.present or 0)
+            att_rate = (row_present / row.total * 100) if row.total > 0 else 0
+            attendance_by_type.append(
+                {
+                    "type_athlete": row.type_athlete or "Sin tipo",
+                    "total": int(row.total),
+                    "present": row_present,
+                    "attendance_rate": round(att_rate, 1),
+                }
+            )
+
+        return {
+            "total_records": total,
+            "total_present": present,
+            "total_absent": absent,
+            "overall_attendance_rate": round(rate, 1),
+            "attendance_by_period": attendance_by_period,
+            "attendance_by_type": attendance_by_type,
+        }
+
     def get_test_performance_stats(
         self,
         db: Session,
@@ -746,162 +1022,200 @@ class StatisticDAO(BaseDAO[Statistic]):
             db.rollback()
             raise DatabaseException("Error al actualizar estadísticas") from e
 
-    def get_athlete_tests_history(self, db: Session, athlete_id: int) -> dict | None:
+    # ================================================================
+    # Acumulados incrementales de tests
+    # ================================================================
+
+    def apply_test_change(
+        self,
+        db: Session,
+        before: tuple | None = None,
+        after: tuple | None = None,
+    ) -> dict:
         """
-        Obtener historial completo de tests de un atleta con fechas y scores.
+        Aplica en O(1) el cambio de aporte de un test a `statistics`.
 
-        Retorna datos ordenados cronológicamente para gráficos de progreso.
+        `before` y `after` son aportes (`contribution_of`) del test antes y
+        después de la operación: alta (None, aporte), edición (aporte
+        previo, aporte nuevo) o baja (aporte previo, None). Solo se leen y
+        actualizan las filas de los atletas involucrados, sin agregar su
+        historial. Las derivas se corrigen con `reconcile_test_totals`.
 
         Returns:
-            Dict con historial de tests o None si atleta no existe
+            Dict athlete_id -> {speed, stamina, agility} actualizados
         """
+        deltas: dict[int, dict[str, float]] = {}
+        for contribution, sign in ((before, -1), (after, 1)):
+            if contribution is None:
+                continue
+            athlete_id, test_type, value = contribution
+            sum_field, count_field, _ = TEST_ACCUMULATORS[test_type]
+            fields = deltas.setdefault(athlete_id, {})
+            fields[count_field] = fields.get(count_field, 0) + sign
+            if sum_field:
+                fields[sum_field] = fields.get(sum_field, 0.0) + sign * value
+
+        if not deltas:
+            return {}
+
         try:
-            # Verificar que el atleta existe
-            athlete = db.query(Athlete).filter(Athlete.id == athlete_id).first()
-            if not athlete:
-                return None
+            updated = {}
+            for athlete_id, fields in deltas.items():
+                statistic = (
+                    db.query(Statistic)
+                    .filter(Statistic.athlete_id == athlete_id)
+                    .with_for_update()
+                    .first()
+                )
+                if not statistic:
+                    logger.warning(f"Statistic no encontrado para atleta {athlete_id}")
+                    continue
+                for field, delta in fields.items():
+                    setattr(statistic, field, (getattr(statistic, field) or 0) + delta)
+                stats = physical_stats_from_totals(statistic)
+                for field, value in stats.items():
+                    setattr(statistic, field, value)
+                updated[athlete_id] = stats
+            db.commit()
+            return updated
+        except Exception as e:
+            logger.error(f"Error applying test change to statistics: {e}")
+            db.rollback()
+            raise DatabaseException("Error al actualizar estadísticas") from e
 
-            tests_history = []
-            summary_by_type = {}
+    def reconcile_test_totals(
+        self,
+        db: Session,
+        athlete_ids: Optional[list[int]] = None,
+        repair: bool = True,
+    ) -> list[dict]:
+        """
+        Verifica los acumulados contra los tests activos y corrige derivas.
 
-            # Sprint Tests
-            sprint_tests = (
-                db.query(SprintTest)
-                .filter(SprintTest.athlete_id == athlete_id)
-                .filter(SprintTest.is_active.is_(True))
-                .order_by(SprintTest.date.asc())
-                .all()
-            )
-            if sprint_tests:
-                scores = []
-                for test in sprint_tests:
-                    score = _sprint_time_to_score(test.time_0_30_s)
-                    scores.append(score)
-                    tests_history.append(
-                        {
-                            "id": test.id,
-                            "test_type": "Sprint Test",
-                            "date": test.date.isoformat() if test.date else None,
-                            "raw_value": test.time_0_30_s,
-                            "raw_unit": "segundos",
-                            "score": round(score, 1),
-                        }
-                    )
-                summary_by_type["Sprint Test"] = {
-                    "count": len(scores),
-                    "avg_score": round(sum(scores) / len(scores), 1),
-                    "best_score": round(max(scores), 1),
-                    "last_score": round(scores[-1], 1),
-                    "trend": self._calculate_trend(scores),
-                }
+        Los totales reales se obtienen con una única consulta agrupada por
+        atleta y tipo de test. Con `repair=True` se reescriben los
+        acumulados y las métricas derivadas de las filas con diferencias.
 
-            # YoYo Tests
-            yoyo_tests = (
-                db.query(YoyoTest)
-                .filter(YoyoTest.athlete_id == athlete_id)
-                .filter(YoyoTest.is_active.is_(True))
-                .order_by(YoyoTest.date.asc())
-                .all()
-            )
-            if yoyo_tests:
-                scores = []
-                for test in yoyo_tests:
-                    score = _yoyo_shuttles_to_score(test.shuttle_count or 0)
-                    scores.append(score)
-                    tests_history.append(
-                        {
-                            "id": test.id,
-                            "test_type": "YoYo Test",
-                            "date": test.date.isoformat() if test.date else None,
-                            "raw_value": test.shuttle_count,
-                            "raw_unit": "shuttles",
-                            "score": round(score, 1),
-                        }
-                    )
-                summary_by_type["YoYo Test"] = {
-                    "count": len(scores),
-                    "avg_score": round(sum(scores) / len(scores), 1),
-                    "best_score": round(max(scores), 1),
-                    "last_score": round(scores[-1], 1),
-                    "trend": self._calculate_trend(scores),
-                }
+        Args:
+            athlete_ids: Atletas a revisar (None = todos)
+            repair: Corregir las filas con diferencias
 
-            # Endurance Tests
-            endurance_tests = (
-                db.query(EnduranceTest)
-                .filter(EnduranceTest.athlete_id == athlete_id)
-                .filter(EnduranceTest.is_active.is_(True))
-                .order_by(EnduranceTest.date.asc())
-                .all()
-            )
-            if endurance_tests:
-                scores = []
-                for test in endurance_tests:
-                    score = _endurance_distance_to_score(test.total_distance_m or 0)
-                    scores.append(score)
-                    tests_history.append(
-                        {
-                            "id": test.id,
-                            "test_type": "Endurance Test",
-                            "date": test.date.isoformat() if test.date else None,
-                            "raw_value": test.total_distance_m,
-                            "raw_unit": "metros",
-                            "score": round(score, 1),
-                        }
-                    )
-                summary_by_type["Endurance Test"] = {
-                    "count": len(scores),
-                    "avg_score": round(sum(scores) / len(scores), 1),
-                    "best_score": round(max(scores), 1),
-                    "last_score": round(scores[-1], 1),
-                    "trend": self._calculate_trend(scores),
-                }
+        Returns:
+            Lista de derivas: {athlete_id, field, stored, actual}
+        """
+        try:
+            drift = self._recompute_test_totals(db, athlete_ids, repair)
+            for athlete_id in dict.fromkeys(item["athlete_id"] for item in drift):
+                logger.warning(f"Statistic drift for athlete {athlete_id}")
+            return drift
+        except Exception as e:
+            logger.error(f"Error reconciling statistics: {e}")
+            db.rollback()
+            raise DatabaseException("Error al conciliar estadísticas") from e
 
-            # Technical Assessments
-            tech_tests = (
-                db.query(TechnicalAssessment)
-                .filter(TechnicalAssessment.athlete_id == athlete_id)
-                .filter(TechnicalAssessment.is_active.is_(True))
-                .order_by(TechnicalAssessment.date.asc())
-                .all()
+    def refresh_test_totals(self, db: Session, athlete_ids: list[int]) -> int:
+        """
+        Recalcula los acumulados de un lote de atletas con una consulta agrupada.
+
+        Lo usa el refresco diferido de estadísticas: las diferencias son
+        esperadas (tests aún no aplicados), por lo que no se reportan.
+
+        Returns:
+            Cantidad de estadísticas con cambios
+        """
+        try:
+            drift = self._recompute_test_totals(db, athlete_ids, repair=True)
+            return len({item["athlete_id"] for item in drift})
+        except Exception as e:
+            logger.error(f"Error refreshing statistics: {e}")
+            db.rollback()
+            raise DatabaseException("Error al actualizar estadísticas") from e
+
+    def _recompute_test_totals(
+        self, db: Session, athlete_ids: Optional[list[int]], repair: bool
+    ) -> list[dict]:
+        """Compara (y con `repair` reescribe) los acumulados con los tests."""
+        # Bloquear las filas antes de agregar: un cambio concurrente queda
+        # incluido en la agregación o espera a que se confirme la reescritura
+        statistics = db.query(Statistic).order_by(Statistic.athlete_id)
+        if athlete_ids is not None:
+            statistics = statistics.filter(Statistic.athlete_id.in_(athlete_ids))
+        if repair:
+            statistics = statistics.with_for_update()
+        statistics = statistics.all()
+
+        tests = with_polymorphic(Test, [SprintTest, YoyoTest, EnduranceTest])
+        metric = case(
+            (tests.type == "sprint_test", tests.SprintTest.time_0_30_s),
+            (tests.type == "yoyo_test", tests.YoyoTest.shuttle_count),
+            (tests.type == "endurance_test", tests.EnduranceTest.total_distance_m),
+            else_=0,
+        )
+        query = (
+            db.query(
+                tests.athlete_id,
+                tests.type,
+                func.count(tests.id).label("count"),
+                func.coalesce(func.sum(metric), 0).label("total"),
             )
-            if tech_tests:
-                scores = []
-                for test in tech_tests:
-                    # Promediar todos los campos de escala disponibles
-                    scale_values = []
-                    for field in [
-                        test.ball_control,
-                        test.short_pass,
-                        test.long_pass,
-                        test.shooting,
-                        test.dribbling,
-                    ]:
-                        if field and field in SCALE_VALUES:
-                            scale_values.append(SCALE_VALUES[field])
-                    score = sum(scale_values) / len(scale_values) if scale_values else 0
-                    scores.append(score)
-                    tests_history.append(
+            .filter(tests.is_active.is_(True))
+            .filter(tests.type.in_(TEST_ACCUMULATORS))
+            .group_by(tests.athlete_id, tests.type)
+        )
+        if athlete_ids is not None:
+            query = query.filter(tests.athlete_id.in_(athlete_ids))
+
+        actual: dict[int, dict[str, float]] = {}
+        for row in query.all():
+            sum_field, count_field, _ = TEST_ACCUMULATORS[row.type]
+            fields = actual.setdefault(row.athlete_id, {})
+            fields[count_field] = int(row.count)
+            if sum_field:
+                fields[sum_field] = float(row.total)
+
+        drift = []
+        for statistic in statistics:
+            totals = actual.get(statistic.athlete_id, {})
+            for field in ACCUMULATOR_FIELDS:
+                stored = getattr(statistic, field) or 0
+                real = totals.get(field, 0)
+                if abs(stored - real) > 1e-6 * max(1.0, abs(real)):
+                    drift.append(
                         {
-                            "id": test.id,
-                            "test_type": "Technical Assessment",
-                            "date": test.date.isoformat() if test.date else None,
-                            "raw_value": score,
-                            "raw_unit": "puntos",
-                            "score": round(score, 1),
+                            "athlete_id": statistic.athlete_id,
+                            "field": field,
+                            "stored": stored,
+                            "actual": real,
                         }
                     )
-                if scores:
-                    summary_by_type["Technical Assessment"] = {
-                        "count": len(scores),
-                        "avg_score": round(sum(scores) / len(scores), 1),
-                        "best_score": round(max(scores), 1),
-                        "last_score": round(scores[-1], 1),
-                        "trend": self._calculate_trend(scores),
-                    }
+                if repair:
+                    setattr(statistic, field, real)
+            if repair:
+                for field, value in physical_stats_from_totals(statistic).items():
+                    setattr(statistic, field, value)
+
+        if repair:
+            db.commit()
+        return drift
+
+    def get_athlete_tests_history(self, db: Session, athlete_id: int) -> dict | None:
+        """
+        Obtener historial completo de tests de un atleta con fechas y scores.
+
+        Retorna datos ordenados cronológicamente para gráficos de progreso.
+        Los tests se leen en una sola consulta polimórfica y los scores y
+        resúmenes se calculan con pandas.
+
+        Returns:
+            Dict con historial de tests o None si atleta no existe
+        """
+        try:
+            # Verificar que el atleta existe
+            athlete = db.query(Athlete).filter(Athlete.id == athlete_id).first()
+            if not athlete:
+                return None
 
-            # Ordenar todo el historial por fecha
-            tests_history.sort(key=lambda x: x["date"] or "")
+            tests_history, summary_by_type = self._tests_history(db, athlete_id)
 
             return {
                 "athlete_id": athlete.id,
@@ -916,6 +1230,107 @@ class StatisticDAO(BaseDAO[Statistic]):
                 "Error al obtener historial de tests del atleta"
             ) from e
 
+    def _tests_history(self, db: Session, athlete_id: int) -> tuple[list, dict]:
+        """Historial y resumen por tipo con una consulta y cálculo vectorizado."""
+        import numpy as np
+        import pandas as pd
+
+        tests = with_polymorphic(
+            Test, [SprintTest, YoyoTest, EnduranceTest, TechnicalAssessment]
+        )
+        rows = (
+            db.query(
+                tests.id,
+                tests.type,
+                tests.date,
+                tests.SprintTest.time_0_30_s,
+                tests.YoyoTest.shuttle_count,
+                tests.EnduranceTest.total_distance_m,
+                *(getattr(tests.TechnicalAssessment, f) for f in TECHNICAL_FIELDS),
+            )
+            .filter(tests.athlete_id == athlete_id)
+            .filter(tests.is_active.is_(True))
+            .filter(tests.type.in_(HISTORY_TEST_TYPES))
+            .all()
+        )
+        if not rows:
+            return [], {}
+
+        df = pd.DataFrame(
+            [tuple(row) for row in rows],
+            columns=[
+                "id",
+                "type",
+                "date",
+                "sprint_time",
+                "yoyo_shuttles",
+                "endurance_distance",
+                *TECHNICAL_FIELDS,
+            ],
+        )
+        df["rank"] = df["type"].map({t: i for i, t in enumerate(HISTORY_TEST_TYPES)})
+
+        df["score"] = np.select(
+            [
+                df["type"] == "sprint_test",
+                df["type"] == "yoyo_test",
+                df["type"] == "endurance_test",
+            ],
+            [
+                _sprint_time_to_score(df["sprint_time"].astype(float)),
+                _yoyo_shuttles_to_score(df["yoyo_shuttles"].astype(float)),
+                _endurance_distance_to_score(df["endurance_distance"].astype(float)),
+            ],
+            default=_technical_scales_to_score(df[list(TECHNICAL_FIELDS)]),
+        )
+
+        # Resumen por tipo: cada grupo en orden cronológico
+        by_type = df.sort_values(["rank", "date", "id"], kind="stable")
+        grouped = by_type.groupby("rank", sort=True)["score"]
+        summary = pd.DataFrame(
+            {
+                "count": grouped.size(),
+                "avg": grouped.mean(),
+                "best": grouped.max(),
+                "last": grouped.last(),
+                "trend": grouped.agg(
+                    lambda scores: self._calculate_trend(list(scores))
+                ),
+            }
+        )
+
+        summary_by_type = {
+            HISTORY_TEST_LABELS[HISTORY_TEST_TYPES[rank]][0]: {
+                "count": int(item["count"]),
+                "avg_score": round(float(item["avg"]), 1),
+                "best_score": round(float(item["best"]), 1),
+                "last_score": round(float(item["last"]), 1),
+                "trend": str(item["trend"]),
+            }
+            for rank, item in summary.iterrows()
+        }
+
+        # Historial global: por fecha y, a igual fecha, en el orden de tipos
+        ordered = df.sort_values(["date", "rank", "id"], kind="stable")
+        raw_index = {"sprint_test": 3, "yoyo_test": 4, "endurance_test": 5}
+        tests_history = []
+        for position, score in ordered["score"].items():
+            row = rows[position]
+            label, unit = HISTORY_TEST_LABELS[row.type]
+            raw_value = row[raw_index[row.type]] if row.type in raw_index else score
+            tests_history.append(
+                {
+                    "id": row.id,
+                    "test_type": label,
+                    "date": row.date.isoformat() if row.date else None,
+                    "raw_value": raw_value,
+                    "raw_unit": unit,
+                    "score": round(float(score), 1),
+                }
+            )
+
+        return tests_history, summary_by_type
+
     def _calculate_trend(self, scores: list) -> str:
         """Calcula la tendencia de una serie de scores."""
         if len(scores) < 2:
@@ -1,8 +1,9 @@
 """DAO para gestión de Tests (pruebas)."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.dao.base import BaseDAO
@@ -13,6 +14,13 @@ from app.models.test import Test
 from app.models.yoyo_test import YoyoTest
 from app.utils.exceptions import DatabaseException
 
+TEST_MODELS = {
+    "sprint_test": SprintTest,
+    "yoyo_test": YoyoTest,
+    "endurance_test": EnduranceTest,
+    "technical_assessment": TechnicalAssessment,
+}
+
 
 class TestDAO(BaseDAO[Test]):
     """DAO para operaciones CRUD en Tests (pruebas polimórficas)."""
@@ -233,6 +241,37 @@ class TestDAO(BaseDAO[Test]):
                 f"Error al crear TechnicalAssessment: {str(e)}"
             ) from e
 
+    def create_many(
+        self, db: Session, tests_by_type: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[int]]:
+        """Insertar tests de varios tipos en una sola transacción.
+
+        Por cada tipo se emite un INSERT multi-fila sobre `tests` (con
+        RETURNING de los IDs, en el orden recibido) y otro sobre la tabla
+        del subtipo; al final hay un único commit. Los datos deben venir
+        validados.
+
+        Args:
+            db: Sesión de base de datos
+            tests_by_type: Tipo de test -> lista de columnas por fila
+
+        Returns:
+            Tipo de test -> IDs creados, en el mismo orden de las filas
+        """
+        try:
+            created = {}
+            for test_type, rows in tests_by_type.items():
+                if not rows:
+                    continue
+                model = TEST_MODELS[test_type]
+                stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+                created[test_type] = list(db.scalars(stmt, rows).all())
+            db.commit()
+            return created
+        except Exception as e:
+            db.rollback()
+            raise DatabaseException(f"Error al crear tests en lote: {str(e)}") from e
+
     # ==================== QUERY METHODS ====================
 
     def get_by_id(
@@ -2,6 +2,7 @@
 from app.models.account import Account
 from app.models.athlete import Athlete
 from app.models.attendance import Attendance
+from app.models.attendance_daily_rollup import AttendanceDailyRollup
 from app.models.base import BaseModel
 from app.models.endurance_test import EnduranceTest
 from app.models.evaluation import Evaluation
@@ -20,6 +21,7 @@ __all__ = [
     "Evaluation",
     "Test",
     "Attendance",
+    "AttendanceDailyRollup",
     "Statistic",
     "SprintTest",
     "EnduranceTest",
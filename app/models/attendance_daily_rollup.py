@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Date, Integer, String, UniqueConstraint
+from sqlalchemy import Enum as SQLEnum
+
+from app.models.base import BaseModel
+from app.models.enums.sex import Sex
+
+
+class AttendanceDailyRollup(BaseModel):
+    """Conteos diarios de asistencia por tipo de atleta y sexo (tabla derivada)."""
+
+    __tablename__ = "attendance_daily_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "day", "type_athlete", "sex", name="uq_attendance_rollup_day_type_sex"
+        ),
+    )
+
+    day = Column(Date, nullable=False, index=True)
+    type_athlete = Column(String(50), nullable=False, index=True)
+    sex = Column(SQLEnum(Sex, name="sex_enum"), nullable=False)
+
+    total = Column(Integer, nullable=False, default=0)
+    present = Column(Integer, nullable=False, default=0)
+    absent = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<AttendanceDailyRollup day={self.day} type={self.type_athlete} "
+            f"sex={self.sex} total={self.total} present={self.present} "
+            f"absent={self.absent}>"
+        )
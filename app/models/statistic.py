@@ -20,6 +20,16 @@ class Statistic(BaseModel):
     yellow_cards = Column(Integer, nullable=False, default=0)
     red_cards = Column(Integer, nullable=False, default=0)
 
+    # Acumulados de tests activos (suma de la métrica y cantidad por familia);
+    # speed, stamina y agility se derivan de ellos. Ver StatisticDAO.
+    sprint_time_sum = Column(Float, nullable=False, default=0)
+    sprint_count = Column(Integer, nullable=False, default=0)
+    yoyo_shuttles_sum = Column(Float, nullable=False, default=0)
+    yoyo_count = Column(Integer, nullable=False, default=0)
+    endurance_distance_sum = Column(Float, nullable=False, default=0)
+    endurance_count = Column(Integer, nullable=False, default=0)
+    technical_count = Column(Integer, nullable=False, default=0)
+
     athlete_id = Column(
         Integer, ForeignKey("athletes.id"), nullable=False, unique=True, index=True
     )
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, event
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.models.base import BaseModel
 
@@ -34,3 +35,13 @@ class Test(BaseModel):
             f"<Test id={self.id} type={self.type} athlete_id={self.athlete_id} "
             f"evaluation_id={self.evaluation_id}>"
         )
+
+
+@event.listens_for(Test, "before_update", propagate=True)
+def _touch_updated_at(mapper, connection, target):
+    """Marca `updated_at` también cuando solo cambia la tabla del subtipo.
+
+    Con herencia por tablas unidas, editar p. ej. `time_0_30_s` solo
+    actualiza `sprint_tests` y el `onupdate` de `tests` no se dispararía.
+    """
+    target.updated_at = func.now()
@@ -9,7 +9,7 @@ from typing import Any, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.models.enums.sex import Sex
-from app.schemas.base_schema import BaseSchema
+from app.schemas.base_schema import BaseSchema, CursorPaginationParams
 from app.schemas.constants import DATE_FORMAT_DESCRIPTION
 from app.schemas.user_schema import PersonBase, TypeStament
 from app.utils.exceptions import ValidationException
@@ -125,7 +125,7 @@ class AthleteUpdateDTO(BaseModel):
     weight: Optional[float] = Field(default=None, ge=0)
 
 
-class AthleteFilter(BaseModel):
+class AthleteFilter(CursorPaginationParams):
     """Filtros para busqueda/paginación de atletas."""
 
     page: int = Field(1, ge=1)
@@ -138,6 +138,9 @@ class AthleteFilter(BaseModel):
     )
     start_date: Optional[date] = None
     end_date: Optional[date] = None
+    include_person: bool = Field(
+        False, description="Incluir teléfono y dirección del MS de personas"
+    )
 
     @model_validator(mode="after")
     def _validate_date_range(self) -> "AthleteFilter":
@@ -195,6 +198,9 @@ class AthleteResponse(BaseSchema):
     weight: Optional[float] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    # Solo con include_person=true
+    phone: Optional[str] = None
+    direction: Optional[str] = None
 
 
 class AthleteDetailResponse(BaseSchema):
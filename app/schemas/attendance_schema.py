@@ -4,7 +4,7 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from app.schemas.base_schema import BaseSchema
+from app.schemas.base_schema import BaseSchema, CursorPaginationParams
 from app.schemas.constants import (
     DATE_FORMAT,
     DATE_FORMAT_DESCRIPTION,
@@ -136,7 +136,7 @@ class AttendanceResponse(BaseSchema):
     is_active: bool
 
 
-class AttendanceFilter(BaseModel):
+class AttendanceFilter(CursorPaginationParams):
     """Filtros para consultar asistencias."""
 
     attendance_date: date = Field(
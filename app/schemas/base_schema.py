@@ -1,9 +1,9 @@
 """Esquemas base compartidos para respuestas y mapeo ORM."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseSchema(BaseModel):
@@ -19,3 +19,25 @@ class BaseResponseSchema(BaseSchema):
     created_at: datetime
     updated_at: Optional[datetime] = None
     is_active: bool
+
+
+class CursorPaginationParams(BaseModel):
+    """Parámetros opcionales de paginación por cursor (keyset) para listados.
+
+    Por defecto los listados siguen paginando por `page`/`limit`. Con
+    `pagination=cursor` (o enviando `cursor`) se recorre con `next_cursor`.
+    """
+
+    pagination: Literal["offset", "cursor"] = Field(
+        "offset", description="Modo de paginación: offset (page) o cursor"
+    )
+    cursor: Optional[str] = Field(
+        None, description="Cursor `next_cursor` de la página anterior"
+    )
+    count: Literal["exact", "estimate", "none"] = Field(
+        "exact", description="Total en modo cursor: exact, estimate o none"
+    )
+
+    @property
+    def use_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
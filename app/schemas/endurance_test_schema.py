@@ -5,7 +5,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from app.schemas.base_schema import BaseResponseSchema
+from app.schemas.base_schema import BaseResponseSchema, CursorPaginationParams
 from app.schemas.test_base_schema import CreateTestBaseSchema
 
 
@@ -76,7 +76,7 @@ class UpdateEnduranceTestSchema(BaseModel):
     )
 
 
-class EnduranceTestFilter(BaseModel):
+class EnduranceTestFilter(CursorPaginationParams):
     """Filtros y paginación para Endurance Tests."""
 
     page: int = Field(1, ge=1)
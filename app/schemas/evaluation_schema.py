@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
-from app.schemas.base_schema import BaseResponseSchema
+from app.schemas.base_schema import BaseResponseSchema, CursorPaginationParams
 from app.schemas.constants import (
     DATE_FORMAT_DESCRIPTION,
     TIME_FORMAT_DESCRIPTION,
@@ -122,7 +122,7 @@ class EvaluationResponseSchema(BaseResponseSchema):
     user_id: int
 
 
-class EvaluationFilter(BaseModel):
+class EvaluationFilter(CursorPaginationParams):
     """Filtros y paginación para listar evaluaciones."""
 
     page: int = Field(1, ge=1, description="Número de página")
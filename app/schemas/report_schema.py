@@ -33,6 +33,21 @@ class ReportFilter(BaseModel):
         default="pdf",
         description="Formato de exportación",
     )
+    mode: Literal["summary", "raw"] = Field(
+        default="summary",
+        description=(
+            "summary: resumen agregado; raw: registros individuales de "
+            "asistencia o tests (solo xlsx y csv)"
+        ),
+    )
+
+    background: bool = Field(
+        default=False,
+        description=(
+            "Generar el PDF como trabajo asíncrono (los reportes grandes lo "
+            "hacen siempre); se consulta en /reports/jobs/{job_id}"
+        ),
+    )
 
     # Filtros temporales
     start_date: Optional[date] = Field(
@@ -56,6 +71,8 @@ class ReportFilter(BaseModel):
             raise ValueError(
                 "La fecha de inicio debe ser menor o igual a la fecha de fin"
             )
+        if self.mode == "raw" and self.format == "pdf":
+            raise ValueError("La exportación de registros solo admite xlsx o csv")
         return self
 
 
@@ -66,8 +83,9 @@ class ReportMetadata(BaseModel):
     system_name: str = Field(
         default="Sistema Kallpa UNL", description="Nombre del sistema"
     )
-    generated_at: datetime = Field(
-        default_factory=datetime.now, description="Fecha y hora de generación"
+    # Sin hora de generación: los reportes se cachean por versión de datos
+    data_as_of: Optional[datetime] = Field(
+        None, description="Fecha del último cambio en los datos del reporte"
     )
     generated_by: str = Field(..., description="Usuario que generó el reporte")
     filters_applied: dict = Field(
@@ -18,6 +18,7 @@ class ResponseSchema(BaseModel, Generic[T]):
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
@@ -5,7 +5,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from app.schemas.base_schema import BaseResponseSchema
+from app.schemas.base_schema import BaseResponseSchema, CursorPaginationParams
 from app.schemas.test_base_schema import CreateTestBaseSchema
 
 
@@ -62,7 +62,7 @@ class UpdateSprintTestSchema(BaseModel):
     time_0_30_s: Optional[float] = Field(None, gt=0, description="Tiempo 0-30 metros")
 
 
-class SprintTestFilter(BaseModel):
+class SprintTestFilter(CursorPaginationParams):
     """Filtros y paginación para Sprint Tests."""
 
     page: int = Field(1, ge=1)
@@ -6,7 +6,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, model_validator
 
 from app.models.enums.scale import Scale
-from app.schemas.base_schema import BaseResponseSchema
+from app.schemas.base_schema import BaseResponseSchema, CursorPaginationParams
 from app.schemas.test_base_schema import CreateTestBaseSchema
 
 
@@ -67,7 +67,7 @@ class UpdateTechnicalAssessmentSchema(BaseModel):
     dribbling: Optional[Scale] = None
 
 
-class TechnicalAssessmentFilter(BaseModel):
+class TechnicalAssessmentFilter(CursorPaginationParams):
     """Filtros y paginación para Technical Assessments."""
 
     page: int = Field(1, ge=1)
@@ -1,7 +1,7 @@
 """Schema base para todos los tipos de tests."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -32,3 +32,26 @@ class CreateTestBaseSchema(BaseModel):
                 f"Fecha ingresada: {v.strftime('%Y-%m-%d %H:%M')}"
             )
         return v
+
+
+class BulkCreateTestsSchema(BaseModel):
+    """Resultados de varios tests, de cualquier tipo, de una misma evaluación."""
+
+    tests: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description=(
+            "Cada resultado incluye `test_type` (sprint_test, yoyo_test, "
+            "endurance_test o technical_assessment) y los campos del test; "
+            "la evaluación se toma de la ruta."
+        ),
+    )
+
+
+class BulkCreateTestsResponseSchema(BaseModel):
+    """Resultado del registro en lote de tests."""
+
+    created: int
+    by_type: Dict[str, int]
+    test_ids: List[int]
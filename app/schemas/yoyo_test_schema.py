@@ -5,7 +5,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
-from app.schemas.base_schema import BaseResponseSchema
+from app.schemas.base_schema import BaseResponseSchema, CursorPaginationParams
 from app.schemas.test_base_schema import CreateTestBaseSchema
 
 
@@ -67,7 +67,7 @@ class UpdateYoyoTestSchema(BaseModel):
     failures: Optional[int] = Field(None, ge=0, description="Número de fallos")
 
 
-class YoyoTestFilter(BaseModel):
+class YoyoTestFilter(CursorPaginationParams):
     """Filtros y paginación para Yoyo Tests."""
 
     page: int = Field(1, ge=1)
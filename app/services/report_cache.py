@@ -0,0 +1,114 @@
+"""Caché en disco de reportes generados, direccionada por contenido."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ReportCache:
+    """
+    Archivos de reportes ya generados, indexados por el hash de sus entradas.
+
+    La clave combina tipo, formato, filtros normalizados y el sello de
+    versión de los datos, por lo que una entrada nunca queda obsoleta:
+    cualquier cambio en los datos produce otra clave. Por eso los reportes
+    no incluyen la hora de generación, sino la fecha de corte de los datos
+    (`ReportDAO.data_as_of`). El tamaño total se
+    acota expulsando primero los archivos usados hace más tiempo (LRU por
+    fecha de modificación, que se actualiza en cada lectura).
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: Optional[int] = None
+    ):
+        self.directory = Path(
+            directory
+            or settings.REPORT_CACHE_DIR
+            or Path(tempfile.gettempdir()) / "backend-futbol-reports"
+        )
+        self.max_bytes = (
+            settings.REPORT_CACHE_MAX_MB * 1024 * 1024
+            if max_bytes is None
+            else max_bytes
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Clave estable (sha256) para las partes dadas, serializadas en JSON."""
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Contenido guardado para la clave, o None si no está."""
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)  # marcar como usado recientemente
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Report cache read failed: {e}")
+            return None
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Guarda el contenido (escritura atómica) y aplica el límite de tamaño."""
+        if not self.enabled or len(content) > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                file.write(content)
+            os.replace(file.name, self._path(key))
+            with self._lock:
+                self._evict()
+        except OSError as e:
+            logger.warning(f"Report cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    # ========== INTERNOS ==========
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+# Singleton compartido por el controlador de reportes
+report_cache = ReportCache()
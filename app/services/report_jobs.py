@@ -0,0 +1,335 @@
+"""Renderizado de reportes PDF en un pool de procesos con trabajos asíncronos."""
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Union
+
+from app.core.config import settings
+from app.services.report_cache import report_cache
+from app.utils.exceptions import AppException, NotFoundException
+
+logger = logging.getLogger(__name__)
+
+
+def render_pdf_bytes(html_string: str) -> bytes:
+    """Convierte HTML a PDF con WeasyPrint (se ejecuta en el proceso worker)."""
+    from app.services.report_renderer import report_renderer
+
+    return report_renderer.write_pdf(html_string)
+
+
+class _JobView:
+    """Consulta común a los trabajos locales y a los leídos del disco."""
+
+    id: str
+    file_name: str
+    created_at: datetime
+    status: str
+    error: Optional[str]
+
+    def content(self) -> bytes:
+        """
+        PDF generado por el trabajo.
+
+        Raises:
+            AppException: 409 si aún no termina o 500 si falló
+        """
+        if self.status == "failed":
+            raise AppException(f"Error al generar reporte: {self.error}", 500)
+        if self.status != "done":
+            raise AppException("El reporte aún se está generando", status_code=409)
+        return self._result()
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "file_name": self.file_name,
+            "created_at": self.created_at.isoformat(),
+            "error": self.error,
+        }
+
+    def _result(self) -> bytes:
+        raise NotImplementedError
+
+
+@dataclass
+class ReportJob(_JobView):
+    """Trabajo de renderizado de un reporte PDF."""
+
+    id: str
+    future: Future
+    file_name: str = "reporte.pdf"
+    owner_id: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        """pending, running, done o failed."""
+        if not self.future.done():
+            return "running" if self.future.running() else "pending"
+        return "failed" if self.error else "done"
+
+    @property
+    def error(self) -> Optional[str]:
+        if not self.future.done():
+            return None
+        if self.future.cancelled():
+            return "Trabajo cancelado"
+        exc = self.future.exception()
+        return str(exc) if exc else None
+
+    def _result(self) -> bytes:
+        return self.future.result()
+
+
+@dataclass
+class StoredReportJob(_JobView):
+    """Trabajo creado por otro worker, leído del directorio compartido."""
+
+    id: str
+    status: str
+    path: Path
+    file_name: str = "reporte.pdf"
+    owner_id: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    error: Optional[str] = None
+
+    def _result(self) -> bytes:
+        try:
+            return self.path.read_bytes()
+        except OSError as e:
+            raise NotFoundException(
+                "Trabajo de reporte no encontrado o expirado"
+            ) from e
+
+
+class ReportJobManager:
+    """
+    Pool acotado de procesos para convertir reportes HTML a PDF.
+
+    WeasyPrint es intensivo en CPU y bloquea el worker de uvicorn; en un
+    proceso aparte no compite por el GIL. Los reportes pequeños esperan el
+    resultado y se devuelven en la misma petición; los grandes (o los
+    pedidos en segundo plano) quedan como trabajo consultable por ID. Si el
+    pool no está iniciado (tests, scripts) se renderiza en línea.
+
+    El estado y el PDF de cada trabajo se guardan además en `directory`
+    (por defecto `jobs/` dentro de la caché de reportes), para que
+    cualquier worker de uvicorn responda su consulta y descarga. Los
+    trabajos se descartan tras `ttl` segundos de terminados.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        sync_max_rows: Optional[int] = None,
+        ttl: Optional[float] = None,
+        directory: Optional[str] = None,
+    ):
+        self.max_workers = max_workers or settings.REPORT_PDF_WORKERS
+        self.max_pending = max_pending or settings.REPORT_JOB_MAX_PENDING
+        self.sync_max_rows = (
+            settings.REPORT_PDF_SYNC_MAX_ROWS
+            if sync_max_rows is None
+            else sync_max_rows
+        )
+        self.ttl = settings.REPORT_JOB_TTL_SECONDS if ttl is None else ttl
+        self.directory = Path(directory or report_cache.directory / "jobs")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: dict[str, ReportJob] = {}
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Crea el pool de procesos (idempotente)."""
+        if self.running:
+            return
+        # Importado aquí para no cargar Jinja al importar este módulo
+        from app.services.report_renderer import warm_up_worker
+
+        # Cada worker carga plantillas, CSS y fuentes al arrancar. "spawn":
+        # hacer fork de un proceso con hilos (refresco de estadísticas,
+        # pools de BD) puede heredar locks tomados
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=warm_up_worker,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Report PDF pool started ({self.max_workers} workers)")
+
+    def stop(self) -> None:
+        """Cierra el pool; los trabajos en curso se cancelan."""
+        if not self.running:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        with self._lock:
+            self._jobs.clear()
+        logger.info("Report PDF pool stopped")
+
+    def render(
+        self, html_string: str, rows: int = 0, background: bool = False
+    ) -> Union[BytesIO, ReportJob]:
+        """
+        Renderiza un PDF en el pool.
+
+        Args:
+            html_string: HTML ya renderizado del reporte
+            rows: Filas de tablas del reporte (estimación de su tamaño)
+            background: Forzar un trabajo asíncrono aunque sea pequeño
+
+        Returns:
+            BytesIO con el PDF (camino síncrono) o el ReportJob creado
+
+        Raises:
+            AppException: 503 si la cola de trabajos está llena
+        """
+        if not self.running:
+            return BytesIO(render_pdf_bytes(html_string))
+
+        if not background and rows <= self.sync_max_rows:
+            return BytesIO(
+                self._executor.submit(render_pdf_bytes, html_string).result()
+            )
+
+        with self._lock:
+            self._purge()
+            pending = sum(1 for job in self._jobs.values() if not job.future.done())
+            if pending >= self.max_pending:
+                raise AppException(
+                    "Hay demasiados reportes en proceso, intente nuevamente más tarde",
+                    status_code=503,
+                )
+            job = ReportJob(
+                id=uuid.uuid4().hex,
+                future=self._executor.submit(render_pdf_bytes, html_string),
+            )
+            self._jobs[job.id] = job
+        self._save(job)
+        job.future.add_done_callback(lambda _: self._finish(job))
+        return job
+
+    def assign(self, job: ReportJob, owner_id: int, file_name: str) -> None:
+        """Registra el dueño y el nombre de archivo del trabajo."""
+        job.owner_id = owner_id
+        job.file_name = file_name
+        self._save(job)
+
+    def get(
+        self, job_id: str, owner_id: Optional[int] = None
+    ) -> ReportJob | StoredReportJob:
+        """
+        Obtiene un trabajo; solo su creador puede consultarlo.
+
+        Busca primero en este proceso y luego en el directorio compartido
+        (trabajos creados por otro worker).
+
+        Raises:
+            NotFoundException: Si no existe, expiró o pertenece a otro usuario
+        """
+        with self._lock:
+            self._purge()
+            job = self._jobs.get(job_id)
+        if job is None:
+            job = self._load(job_id)
+        if job is None or (owner_id is not None and job.owner_id != owner_id):
+            raise NotFoundException("Trabajo de reporte no encontrado o expirado")
+        return job
+
+    # ========== INTERNOS ==========
+
+    def _finish(self, job: ReportJob) -> None:
+        if job.error:
+            logger.error(f"Report job {job.id} failed: {job.error}")
+        self._save(job)
+        job.finished_at = time.monotonic()
+
+    def _paths(self, job_id: str) -> tuple[Path, Path]:
+        # El ID viene de la URL: solo se aceptan IDs hexadecimales propios
+        if not job_id.isalnum():
+            raise NotFoundException("Trabajo de reporte no encontrado o expirado")
+        return self.directory / f"{job_id}.json", self.directory / f"{job_id}.pdf"
+
+    def _save(self, job: ReportJob) -> None:
+        """Escribe estado (y PDF, si terminó) en el directorio compartido."""
+        meta_path, pdf_path = self._paths(job.id)
+        # Serializado: el estado se toma dentro del lock, así la última
+        # escritura nunca es un estado anterior (assign y _finish compiten)
+        with self._store_lock:
+            meta = {**job.to_dict(), "owner_id": job.owner_id}
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                if meta["status"] == "done" and not pdf_path.exists():
+                    _write_atomic(pdf_path, job.future.result())
+                _write_atomic(meta_path, json.dumps(meta).encode())
+            except OSError as e:
+                logger.warning(f"Report job {job.id} could not be stored: {e}")
+
+    def _load(self, job_id: str) -> Optional[StoredReportJob]:
+        meta_path, pdf_path = self._paths(job_id)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return StoredReportJob(
+            id=job_id,
+            status=meta["status"],
+            path=pdf_path,
+            file_name=meta["file_name"],
+            owner_id=meta["owner_id"],
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            error=meta["error"],
+        )
+
+    def _purge(self) -> None:
+        limit = time.monotonic() - self.ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < limit
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._purge_stored()
+
+    def _purge_stored(self) -> None:
+        """Borra del directorio los trabajos sin cambios hace más de `ttl`."""
+        limit = time.time() - self.ttl
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                if meta_path.stat().st_mtime >= limit:
+                    continue
+                meta_path.unlink()
+            except OSError:
+                continue
+            meta_path.with_suffix(".pdf").unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        file.write(content)
+    os.replace(file.name, path)
+
+
+# Singleton compartido por el servicio y el router de reportes
+report_jobs = ReportJobManager()
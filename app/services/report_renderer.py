@@ -0,0 +1,103 @@
+"""Renderizador de reportes compartido por proceso (plantillas, CSS y fuentes)."""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+BASE_TEMPLATE = "report_base.html"
+BASE_STYLESHEET = "report_base.css"
+
+
+class ReportRenderer:
+    """
+    Plantillas Jinja y recursos de WeasyPrint reutilizados entre reportes.
+
+    El entorno Jinja (con sus plantillas compiladas), la hoja de estilos ya
+    parseada como `CSS` y la `FontConfiguration` se crean una sola vez por
+    proceso; `warm_up` los prepara por adelantado para que el primer
+    reporte no pague ese costo.
+    """
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR):
+        self.templates_dir = Path(templates_dir)
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+        )
+        self._font_config = None
+        self._stylesheet = None
+        self._lock = threading.Lock()
+
+    def render_html(self, template_name: str, **context) -> str:
+        """Renderiza una plantilla (compilada una vez por proceso)."""
+        return self.env.get_template(template_name).render(**context)
+
+    def write_pdf(self, html_string: str) -> bytes:
+        """Convierte HTML a PDF con la hoja de estilos y fuentes compartidas."""
+        from weasyprint import HTML
+
+        stylesheet, font_config = self._resources()
+        return HTML(string=html_string, base_url=str(self.templates_dir)).write_pdf(
+            stylesheets=[stylesheet], font_config=font_config
+        )
+
+    def warm_up(self, pdf: bool = True) -> float:
+        """
+        Compila las plantillas y, con `pdf`, carga CSS y fuentes y genera un
+        documento mínimo.
+
+        Returns:
+            Segundos empleados
+        """
+        from app.schemas.report_schema import ReportMetadata
+
+        start = time.perf_counter()
+        html_string = self.render_html(
+            BASE_TEMPLATE,
+            title="Warm-up",
+            metadata=ReportMetadata(title="Warm-up", generated_by="Sistema"),
+            kpi_cards=[],
+            main_chart=None,
+            tables=[],
+            athlete_info=None,
+        )
+        if pdf:
+            self.write_pdf(html_string)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Report renderer warmed up in {elapsed * 1000:.0f}ms")
+        return elapsed
+
+    def _resources(self) -> tuple:
+        if self._stylesheet is None:
+            with self._lock:
+                if self._stylesheet is None:
+                    from weasyprint import CSS
+                    from weasyprint.text.fonts import FontConfiguration
+
+                    font_config = FontConfiguration()
+                    self._stylesheet = CSS(
+                        filename=str(self.templates_dir / BASE_STYLESHEET),
+                        font_config=font_config,
+                    )
+                    self._font_config = font_config
+        return self._stylesheet, self._font_config
+
+
+# Instancia por proceso (servidor y cada worker del pool de PDF)
+report_renderer = ReportRenderer()
+
+
+def warm_up_worker(pdf: bool = True) -> Optional[float]:
+    """Inicializador de procesos: calienta el renderizador sin propagar errores."""
+    try:
+        return report_renderer.warm_up(pdf=pdf)
+    except Exception as e:  # el primer reporte lo reintentará y reportará
+        logger.warning(f"Report renderer warm-up failed: {e}")
+        return None
@@ -1,20 +1,40 @@
+import csv
+import enum
 import logging
-from io import BytesIO
+import tempfile
+from datetime import datetime
+from io import BytesIO, StringIO
+from typing import Iterable, Iterator, Optional
 
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from sqlalchemy.orm import Session
-from weasyprint import HTML
 
 # Importaciones de tu proyecto (Manteniendo las originales)
 from app.controllers.statistic_controller import StatisticController
+from app.dao.report_dao import ReportDAO
 from app.schemas.report_schema import ReportFilter, ReportMetadata, ReportType
+from app.services.report_jobs import ReportJob, report_jobs
+from app.services.report_renderer import report_renderer
 
 # Importar el generador de gráficos creado en el paso 1
 from app.utils.chart_generator import ChartGenerator
+from app.utils.exceptions import ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Registros exportables en modo "raw": tipo de registro -> hoja XLSX
+RAW_EXPORT_SOURCES = {
+    ReportType.ATTENDANCE: {"attendance": "Asistencia"},
+    ReportType.TESTS: {
+        "sprint_test": "Sprint",
+        "yoyo_test": "Yoyo",
+        "endurance_test": "Resistencia",
+        "technical_assessment": "Técnica",
+    },
+}
+# Tamaño de los fragmentos enviados al cliente
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 
 class ReportService:
     """
@@ -24,17 +44,16 @@ class ReportService:
 
     def __init__(self):
         self.statistic_controller = StatisticController()
-        # Configuración de Jinja2 para cargar templates HTML
-        self.env = Environment(
-            loader=FileSystemLoader("app/templates"),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.report_dao = ReportDAO()
+        # Plantillas compiladas compartidas por todo el proceso
+        self.renderer = report_renderer
+        self.env = report_renderer.env
 
     # ========== MÉTODOS PÚBLICOS ==========
 
     def generate_attendance_report(
         self, db: Session, filters: ReportFilter, user_name: str
-    ) -> BytesIO:
+    ) -> BytesIO | ReportJob:
         """Genera reporte de asistencia."""
         # 1. Obtener Datos
         stats_data = self.statistic_controller.get_attendance_statistics(
@@ -161,11 +180,12 @@ class ReportService:
             main_chart=chart,
             tables=tables,
             athlete_info=athlete_info,
+            background=filters.background,
         )
 
     def generate_tests_report(
         self, db: Session, filters: ReportFilter, user_name: str
-    ) -> BytesIO:
+    ) -> BytesIO | ReportJob:
         """Genera reporte de evaluaciones y tests."""
         stats_data = self.statistic_controller.get_test_performance(
             db=db,
@@ -300,11 +320,12 @@ class ReportService:
             main_chart=chart,
             tables=tables,
             athlete_info=athlete_info,
+            background=filters.background,
         )
 
     def generate_statistics_report(
         self, db: Session, filters: ReportFilter, user_name: str
-    ) -> BytesIO:
+    ) -> BytesIO | ReportJob:
         """Genera reporte de estadísticas."""
 
         athlete_info = None
@@ -519,8 +540,41 @@ class ReportService:
             main_chart=chart,
             tables=tables,
             athlete_info=athlete_info,
+            background=filters.background,
+        )
+
+    def stream_raw_report(self, db: Session, filters: ReportFilter) -> Iterator[bytes]:
+        """
+        Exporta registros individuales (sin agregar) de asistencia o tests.
+
+        Las filas se leen por lotes desde la BD y se escriben a medida que
+        llegan: CSV fragmento a fragmento y XLSX con el modo write-only de
+        openpyxl (en archivo temporal), sin acumular el volumen en memoria.
+        """
+        sources = RAW_EXPORT_SOURCES.get(filters.report_type)
+        if sources is None:
+            raise ValidationException(
+                "La exportación de registros solo está disponible para "
+                "asistencia y tests"
+            )
+
+        scope = self.report_dao.athlete_scope(
+            athlete_id=filters.athlete_id,
+            athlete_type=filters.athlete_type.value if filters.athlete_type else None,
+            sex=filters.sex.value if filters.sex else None,
         )
 
+        def sheets():
+            for record_type, sheet_name in sources.items():
+                columns, rows = self.report_dao.stream_records(
+                    db, record_type, scope, filters.start_date, filters.end_date
+                )
+                yield sheet_name, columns, rows
+
+        if filters.format == "xlsx":
+            return self._stream_xlsx(sheets())
+        return self._stream_csv(sheets())
+
     # ========== MÉTODOS PRIVADOS (Helpers) ==========
 
     def _render_pdf(
@@ -531,11 +585,16 @@ class ReportService:
         main_chart: str,
         tables: list,
         athlete_info: dict = None,
-    ) -> BytesIO:
-        """Renderiza HTML y lo convierte a PDF usando WeasyPrint."""
-        template = self.env.get_template(template_name)
-
-        html_string = template.render(
+        background: bool = False,
+    ) -> BytesIO | ReportJob:
+        """
+        Renderiza HTML y lo convierte a PDF usando WeasyPrint.
+
+        La conversión se delega al pool de procesos de reportes: los reportes
+        grandes (o con `background`) devuelven un ReportJob en lugar del PDF.
+        """
+        html_string = self.renderer.render_html(
+            template_name,
             title=metadata.title,
             metadata=metadata,
             kpi_cards=kpi_cards,
@@ -544,11 +603,8 @@ class ReportService:
             athlete_info=athlete_info,
         )
 
-        buffer = BytesIO()
-        # Generar PDF
-        HTML(string=html_string).write_pdf(buffer)
-        buffer.seek(0)
-        return buffer
+        rows = sum(len(table["rows"]) for table in tables)
+        return report_jobs.render(html_string, rows=rows, background=background)
 
     def _generate_tabular_report(
         self,
@@ -570,7 +626,7 @@ class ReportService:
                 info_rows = [
                     ["Reporte", metadata.title],
                     ["Generado Por", metadata.generated_by],
-                    ["Fecha", metadata.generated_at.strftime("%d/%m/%Y %H:%M")],
+                    ["Datos al", _format_data_as_of(metadata.data_as_of)],
                     ["Período", metadata.period or "Todo el histórico"],
                 ]
                 # Añadir filtros aplicados
@@ -750,6 +806,48 @@ class ReportService:
         buffer.seek(0)
         return buffer
 
+    @staticmethod
+    def _stream_csv(sheets: Iterable[tuple]) -> Iterator[bytes]:
+        """CSV por fragmentos: columna "Tipo" y la unión de columnas."""
+        sheets = list(sheets)  # solo nombres y consultas sin ejecutar
+        header = list(dict.fromkeys(col for _, columns, _ in sheets for col in columns))
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Tipo"] + [col.replace("_", " ").title() for col in header])
+        yield "\ufeff".encode()  # BOM, como el CSV de pandas (utf-8-sig)
+
+        for sheet_name, columns, rows in sheets:
+            positions = [header.index(col) for col in columns]
+            for row in rows:
+                line = [None] * len(header)
+                for position, value in zip(positions, row, strict=True):
+                    line[position] = _export_value(value)
+                writer.writerow([sheet_name, *line])
+                if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+
+        yield buffer.getvalue().encode()
+
+    @staticmethod
+    def _stream_xlsx(sheets: Iterable[tuple]) -> Iterator[bytes]:
+        """XLSX con una hoja por tipo de registro (openpyxl write-only)."""
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        for sheet_name, columns, rows in sheets:
+            sheet = workbook.create_sheet(sheet_name)
+            sheet.append([col.replace("_", " ").title() for col in columns])
+            for row in rows:
+                sheet.append([_export_value(value) for value in row])
+
+        with tempfile.TemporaryFile() as file:
+            workbook.save(file)
+            file.seek(0)
+            while chunk := file.read(EXPORT_CHUNK_SIZE):
+                yield chunk
+
     def _build_metadata(
         self,
         db: Session,
@@ -793,6 +891,17 @@ class ReportService:
         return ReportMetadata(
             title=title,
             generated_by=user_name,
+            data_as_of=self.report_dao.data_as_of(db, report_type.value),
             filters_applied=filters_dict,
             period=period,
         )
+
+
+def _format_data_as_of(value: Optional[datetime]) -> str:
+    """Fecha de corte de los datos para mostrar en el reporte."""
+    return value.strftime("%d/%m/%Y %H:%M") if value else "Sin registros"
+
+
+def _export_value(value):
+    """Valor exportable: enums por su valor."""
+    return value.value if isinstance(value, enum.Enum) else value
@@ -1,10 +1,11 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.controllers.account_controller import AccountController
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.models.account import Account
 from app.schemas.account_schema import (
     ChangePasswordRequest,
@@ -32,12 +33,12 @@ account_controller = AccountController()
     summary="Iniciar sesión",
     description="Valida credenciales y devuelve un token JWT.",
 )
-def login(
-    payload: LoginRequest, db: Annotated[Session, Depends(get_db)]
+async def login(
+    payload: LoginRequest, db: Annotated[AsyncSession, Depends(get_async_db)]
 ) -> ResponseSchema:
     """Endpoint para iniciar sesión y obtener un token JWT."""
     try:
-        result = account_controller.login(db, payload)
+        result = await account_controller.login(db, payload)
         return ResponseSchema(
             status="success",
             message="Inicio de sesión exitoso",
@@ -81,13 +82,13 @@ def request_password_reset(
     summary="Confirmar restablecimiento de contraseña",
     description="Valida el token de reset y actualiza la contraseña.",
 )
-def confirm_password_reset(
+async def confirm_password_reset(
     payload: PasswordResetConfirm,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> ResponseSchema:
     """Confirma el restablecimiento de contraseña usando el token proporcionado."""
     try:
-        account_controller.confirm_password_reset(db, payload)
+        await account_controller.confirm_password_reset(db, payload)
         return ResponseSchema(
             status="success",
             message="Contraseña actualizada",
@@ -106,14 +107,14 @@ def confirm_password_reset(
     summary="Cambiar contraseña",
     description="Permite a un usuario autenticado cambiar su contraseña.",
 )
-def change_password(
+async def change_password(
     payload: ChangePasswordRequest,
-    db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> ResponseSchema:
     """Cambia la contraseña del usuario actual."""
     try:
-        account_controller.change_password(db, current_user.id, payload)
+        await account_controller.change_password(db, current_user.id, payload)
         return ResponseSchema(
             status="success",
             message="Contraseña actualizada correctamente",
@@ -3,10 +3,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.controllers.athlete_controller import AthleteController
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db, get_read_db
 from app.models.account import Account
 from app.schemas.athlete_schema import (
     AthleteDetailResponse,
@@ -47,7 +49,7 @@ athlete_controller = AthleteController()
 )
 async def register_minor_athlete(
     payload: MinorAthleteInscriptionDTO,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> ResponseSchema[MinorAthleteInscriptionResponseDTO]:
     """
     Registra un deportista menor de edad con su representante.
@@ -81,7 +83,7 @@ async def register_minor_athlete(
 )
 async def register_athlete_unl(
     payload: AthleteInscriptionDTO,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> ResponseSchema[AthleteInscriptionResponseDTO]:
     """Registra un deportista de la UNL en el sistema."""
     try:
@@ -116,14 +118,20 @@ async def register_athlete_unl(
         "con opción de búsqueda y filtrado. Requiere autenticación."
     ),
 )
-def get_all_athletes(
-    db: Annotated[Session, Depends(get_db)],
+async def get_all_athletes(
+    db: Annotated[Session, Depends(get_read_db)],
     filters: Annotated[AthleteFilter, Depends()],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene todos los atletas con filtros y paginación."""
     try:
-        result = athlete_controller.get_all_athletes(db=db, filters=filters)
+        # Consulta síncrona en el threadpool; el enriquecimiento con el MS
+        # de personas es asíncrono
+        result = await run_in_threadpool(
+            athlete_controller.get_all_athletes, db=db, filters=filters
+        )
+        if filters.include_person:
+            result = await athlete_controller.enrich_with_person_data(result)
         return ResponseSchema(
             status="success",
             message="Atletas obtenidos correctamente",
@@ -145,7 +153,7 @@ def get_all_athletes(
 )
 async def get_by_id(
     athlete_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene un atleta por su ID con toda la información disponible."""
@@ -190,7 +198,7 @@ async def get_by_id(
 async def update_athlete(
     athlete_id: int,
     payload: AthleteUpdateDTO,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Actualiza los datos básicos de un atleta."""
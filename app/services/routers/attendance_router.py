@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from app.controllers.attendance_controller import AttendanceController
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.attendance_schema import (
     AttendanceBulkCreate,
@@ -72,7 +72,7 @@ def create_bulk_attendance(
     "que tienen registros de asistencia.",
 )
 def get_attendance_dates(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene lista de fechas con asistencia."""
@@ -101,13 +101,13 @@ def get_attendance_dates(
     ),
 )
 def get_attendances_by_date(
-    db: Annotated[Session, Depends(get_db)],
-    filters: Annotated[AttendanceFilter, Depends()],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
+    filters: Annotated[AttendanceFilter, Depends()],
 ):
     """Obtiene asistencias por fecha con filtros."""
     try:
-        items, total = attendance_controller.get_attendances_by_date(
+        items, total, next_cursor = attendance_controller.get_attendances_by_date(
             db=db,
             filters=filters,
         )
@@ -120,6 +120,7 @@ def get_attendances_by_date(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ).model_dump(),
         )
     except AppException as exc:
@@ -136,9 +137,9 @@ def get_attendances_by_date(
     description="Obtiene un resumen estadístico de asistencia para una fecha.",
 )
 def get_attendance_summary(
-    db: Annotated[Session, Depends(get_db)],
-    filters: Annotated[AttendanceFilter, Depends()],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
+    filters: Annotated[AttendanceFilter, Depends()],
 ):
     """Obtiene resumen de asistencia por fecha."""
     try:
@@ -1,7 +1,8 @@
 """Constantes compartidas para routers."""
 
-from typing import TypeVar
+from typing import Annotated, TypeVar
 
+from fastapi import Query
 from fastapi.responses import JSONResponse
 
 from app.schemas.response import ResponseSchema
@@ -9,6 +10,15 @@ from app.utils.exceptions import AppException
 
 T = TypeVar("T")
 
+# ===========================================
+# PARÁMETROS COMUNES
+# ===========================================
+# Forzar el recálculo inmediato de estadísticas al escribir un test
+SyncStatsQuery = Annotated[
+    bool,
+    Query(description="Actualizar las estadísticas del atleta antes de responder"),
+]
+
 # ===========================================
 # MENSAJES DE ERROR COMUNES
 # ===========================================
@@ -42,7 +52,7 @@ def handle_app_exception(exc: AppException) -> JSONResponse:
             status="error",
             message=exc.message,
             data=None,
-            errors=None,
+            errors=getattr(exc, "errors", None),
         ).model_dump(),
     )
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.controllers.endurance_test_controller import EnduranceTestController
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.endurance_test_schema import (
     CreateEnduranceTestSchema,
@@ -15,7 +15,8 @@ from app.schemas.endurance_test_schema import (
     UpdateEnduranceTestSchema,
 )
 from app.schemas.response import PaginatedResponse, ResponseSchema
-from app.utils.exceptions import DatabaseException
+from app.services.routers.constants import SyncStatsQuery
+from app.utils.exceptions import DatabaseException, ValidationException
 from app.utils.security import get_current_account
 
 router = APIRouter(prefix="/endurance-tests", tags=["Endurance Tests"])
@@ -33,6 +34,7 @@ async def create_endurance_test(
     payload: CreateEnduranceTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Crear un nuevo Endurance Test."""
     try:
@@ -44,6 +46,7 @@ async def create_endurance_test(
             min_duration=payload.min_duration,
             total_distance_m=payload.total_distance_m,
             observations=payload.observations,
+            sync_stats=sync_stats,
         )
 
         return ResponseSchema(
@@ -65,13 +68,13 @@ async def create_endurance_test(
     description="Obtiene lista paginada de Endurance Tests con filtros.",
 )
 async def list_endurance_tests(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     filters: Annotated[EnduranceTestFilter, Depends()],
 ) -> ResponseSchema:
     """Listar todos los Endurance Tests con paginación."""
     try:
-        items, total = endurance_test_controller.list_tests(db, filters)
+        items, total, next_cursor = endurance_test_controller.list_tests(db, filters)
 
         return ResponseSchema(
             status="success",
@@ -81,8 +84,11 @@ async def list_endurance_tests(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ),
         )
+    except ValidationException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -132,6 +138,7 @@ async def update_endurance_test(
     payload: UpdateEnduranceTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Actualizar un Endurance Test."""
     data = payload.model_dump(exclude_none=True)
@@ -139,7 +146,9 @@ async def update_endurance_test(
         raise HTTPException(status_code=400, detail="No hay campos para actualizar")
 
     try:
-        updated = endurance_test_controller.update_test(db=db, test_id=test_id, **data)
+        updated = endurance_test_controller.update_test(
+            db=db, test_id=test_id, sync_stats=sync_stats, **data
+        )
 
         if not updated:
             raise HTTPException(status_code=404, detail="Endurance Test no encontrado")
@@ -168,10 +177,13 @@ async def delete_endurance_test(
     test_id: int,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Eliminar un Endurance Test."""
     try:
-        deleted = endurance_test_controller.delete_test(db, test_id)
+        deleted = endurance_test_controller.delete_test(
+            db, test_id, sync_stats=sync_stats
+        )
 
         if not deleted:
             raise HTTPException(status_code=404, detail="Endurance Test no encontrado")
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.controllers.evaluation_controller import EvaluationController
-from app.core.database import get_db
+from app.controllers.test_controller import TestController
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.evaluation_schema import (
     CreateEvaluationSchema,
@@ -15,11 +16,21 @@ from app.schemas.evaluation_schema import (
     UpdateEvaluationSchema,
 )
 from app.schemas.response import PaginatedResponse, ResponseSchema
-from app.utils.exceptions import DatabaseException
+from app.schemas.test_base_schema import (
+    BulkCreateTestsResponseSchema,
+    BulkCreateTestsSchema,
+)
+from app.services.routers.constants import (
+    SyncStatsQuery,
+    handle_app_exception,
+    handle_unexpected_exception,
+)
+from app.utils.exceptions import AppException, DatabaseException, ValidationException
 from app.utils.security import get_current_account
 
 router = APIRouter(prefix="/evaluations", tags=["Evaluations"])
 evaluation_controller = EvaluationController()
+test_controller = TestController()
 
 
 # ==================== EVALUATION ENDPOINTS ====================
@@ -63,13 +74,15 @@ async def create_evaluation(
     description="Obtiene lista paginada de evaluaciones con búsqueda y filtros.",
 )
 async def list_evaluations(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     filters: Annotated[EvaluationFilter, Depends()],
 ) -> ResponseSchema:
     """Listar todas las evaluaciones con paginación."""
     try:
-        items, total = evaluation_controller.list_evaluations_paginated(db, filters)
+        items, total, next_cursor = evaluation_controller.list_evaluations_paginated(
+            db, filters
+        )
 
         return ResponseSchema(
             status="success",
@@ -79,8 +92,11 @@ async def list_evaluations(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ),
         )
+    except ValidationException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -94,7 +110,7 @@ async def list_evaluations(
 )
 async def list_user_evaluations(
     user_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
@@ -223,3 +239,45 @@ async def delete_evaluation(
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+# ==================== TEST ENDPOINTS ====================
+
+
+@router.post(
+    "/{evaluation_id}/tests/bulk",
+    response_model=ResponseSchema[BulkCreateTestsResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+    summary="Registrar tests en lote",
+    description=(
+        "Registra en una sola transacción los resultados de una evaluación "
+        "(sprint, yoyo, resistencia y técnicos mezclados). Si alguna fila es "
+        "inválida no se registra ninguna y `errors` indica el campo de cada "
+        "fila (`tests.<índice>.<campo>`)."
+    ),
+)
+async def bulk_create_tests(
+    evaluation_id: int,
+    payload: BulkCreateTestsSchema,
+    db: Annotated[Session, Depends(get_db)],
+    current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
+) -> ResponseSchema:
+    """Registrar varios tests de una evaluación."""
+    try:
+        result = test_controller.bulk_create_tests(
+            db=db,
+            evaluation_id=evaluation_id,
+            payload=payload,
+            sync_stats=sync_stats,
+        )
+
+        return ResponseSchema(
+            status="success",
+            message=f"{result['created']} tests registrados correctamente",
+            data=BulkCreateTestsResponseSchema(**result),
+        )
+    except AppException as exc:
+        return handle_app_exception(exc)
+    except Exception as exc:
+        return handle_unexpected_exception(exc)
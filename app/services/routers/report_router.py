@@ -1,15 +1,19 @@
 """Router de reportes deportivos con endpoints específicos."""
 
-from typing import Annotated
+from io import BytesIO
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.controllers.report_controller import ReportController
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.models.account import Account
 from app.schemas.report_schema import ReportFilter, ReportType
+from app.schemas.response import ResponseSchema
+from app.services.report_jobs import ReportJob, StoredReportJob, report_jobs
+from app.services.routers.constants import handle_app_exception
 from app.utils.exceptions import AppException, ValidationException
 from app.utils.security import get_current_account
 
@@ -25,6 +29,82 @@ CONTENT_TYPES = {
 }
 
 
+def report_file_name(base_name: str, filters: ReportFilter) -> str:
+    """Nombre del archivo descargado; el modo raw agrega "_registros"."""
+    suffix = "_registros" if filters.mode == "raw" else ""
+    return f"{base_name}{suffix}.{filters.format}"
+
+
+def generate_report_response(
+    db: Session,
+    filters: ReportFilter,
+    current_user: Account,
+    base_name: str,
+    if_none_match: Optional[str] = None,
+):
+    """
+    Genera el reporte y arma la respuesta.
+
+    Los reportes cacheables llevan un ETag derivado de sus filtros y de la
+    versión de los datos; si el cliente envía el mismo en `If-None-Match`
+    se responde 304 sin generar nada.
+    """
+    user_name = current_user.user.full_name
+    cache_key = report_controller.report_cache_key(db, filters, user_name)
+    if cache_key and if_none_match in (cache_key, f'"{cache_key}"'):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(cache_key)
+        )
+
+    file_content = report_controller.generate_report(
+        db=db, filters=filters, user_name=user_name, cache_key=cache_key
+    )
+    return build_report_response(
+        file_content, report_file_name(base_name, filters), current_user, cache_key
+    )
+
+
+def etag_headers(cache_key: str) -> dict:
+    """Cabeceras de validación: ETag y revalidar antes de reutilizar."""
+    return {"ETag": f'"{cache_key}"', "Cache-Control": "private, no-cache"}
+
+
+def build_report_response(
+    file_content, file_name: str, current_user: Account, etag: Optional[str] = None
+):
+    """
+    Respuesta de un reporte generado.
+
+    Devuelve el archivo en streaming o, si el PDF quedó como trabajo
+    asíncrono, 202 con el ID del trabajo y las URLs para consultarlo.
+    """
+    if isinstance(file_content, ReportJob):
+        report_jobs.assign(file_content, owner_id=current_user.id, file_name=file_name)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=ResponseSchema(
+                status="success",
+                message="Reporte en proceso de generación",
+                data=job_payload(file_content),
+            ).model_dump(),
+        )
+
+    content_type = CONTENT_TYPES.get(file_name.rsplit(".", 1)[-1], DEFAULT_CONTENT_TYPE)
+    headers = {"Content-Disposition": f"attachment; filename={file_name}"}
+    if etag:
+        headers.update(etag_headers(etag))
+    return StreamingResponse(file_content, media_type=content_type, headers=headers)
+
+
+def job_payload(job: ReportJob | StoredReportJob) -> dict:
+    """Estado del trabajo con las URLs de consulta y descarga."""
+    return {
+        **job.to_dict(),
+        "status_url": f"{router.prefix}/jobs/{job.id}",
+        "download_url": f"{router.prefix}/jobs/{job.id}/download",
+    }
+
+
 def validate_report_permissions(
     current_user: Annotated[Account, Depends(get_current_account)],
 ) -> Account:
@@ -54,18 +134,21 @@ def validate_report_permissions(
     description=(
         "Genera un reporte formal de asistencia con datos de deportistas, "
         "porcentajes de asistencia y resúmenes. Soporta filtros por tipo de atleta, "
-        "sexo y rango de fechas."
+        "sexo y rango de fechas. Con `mode=raw` (xlsx/csv) exporta en streaming "
+        "cada registro de asistencia."
     ),
 )
 def generate_attendance_report(
     filters: ReportFilter,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(validate_report_permissions)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """
     Genera reporte de asistencia.
 
     - **format**: Formato del archivo: pdf, xlsx, csv
+    - **mode**: summary (resumen) o raw (registros individuales)
     - **start_date**: Fecha de inicio (YYYY-MM-DD)
     - **end_date**: Fecha de fin (YYYY-MM-DD)
     - **athlete_type**: Filtro por tipo de deportista
@@ -75,27 +158,14 @@ def generate_attendance_report(
         # Forzar tipo de reporte
         filters.report_type = ReportType.ATTENDANCE
 
-        # Generar reporte
-        file_content = report_controller.generate_report(
-            db=db,
-            filters=filters,
-            user_name=current_user.user.full_name,
-        )
-
-        # Determinar content type
-        content_type = CONTENT_TYPES.get(filters.format, DEFAULT_CONTENT_TYPE)
-
-        # Nombre del archivo
-        file_name = f"reporte_asistencia.{filters.format}"
-
-        return StreamingResponse(
-            file_content,
-            media_type=content_type,
-            headers={"Content-Disposition": f"attachment; filename={file_name}"},
+        return generate_report_response(
+            db, filters, current_user, "reporte_asistencia", if_none_match
         )
 
     except ValidationException as e:
         raise AppException(status_code=400, message=str(e)) from e
+    except AppException:
+        raise
     except Exception as e:
         raise AppException(
             status_code=500, message=f"Error al generar reporte: {str(e)}"
@@ -109,18 +179,21 @@ def generate_attendance_report(
     summary="Generar reporte de evaluaciones y tests",
     description=(
         "Genera un reporte formal con resultados de tests físicos (sprint, etc.."
-        "técnicos). Incluye promedios y resúmenes por tipo de test."
+        "técnicos). Incluye promedios y resúmenes por tipo de test. Con "
+        "`mode=raw` (xlsx/csv) exporta en streaming cada test registrado."
     ),
 )
 def generate_tests_report(
     filters: ReportFilter,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(validate_report_permissions)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """
     Genera reporte de evaluaciones y tests.
 
     - **format**: Formato del archivo: pdf, xlsx, csv
+    - **mode**: summary (resumen) o raw (registros individuales)
     - **start_date**: Fecha de inicio
     - **end_date**: Fecha de fin
     - **athlete_type**: Filtro por tipo de deportista
@@ -129,27 +202,14 @@ def generate_tests_report(
         # Forzar tipo de reporte
         filters.report_type = ReportType.TESTS
 
-        # Generar reporte
-        file_content = report_controller.generate_report(
-            db=db,
-            filters=filters,
-            user_name=current_user.user.full_name,
-        )
-
-        # Content type
-        content_type = CONTENT_TYPES.get(filters.format, DEFAULT_CONTENT_TYPE)
-
-        # Nombre del archivo
-        file_name = f"reporte_tests.{filters.format}"
-
-        return StreamingResponse(
-            file_content,
-            media_type=content_type,
-            headers={"Content-Disposition": f"attachment; filename={file_name}"},
+        return generate_report_response(
+            db, filters, current_user, "reporte_tests", if_none_match
         )
 
     except ValidationException as e:
         raise AppException(status_code=400, message=str(e)) from e
+    except AppException:
+        raise
     except Exception as e:
         raise AppException(
             status_code=500, message=f"Error al generar reporte: {str(e)}"
@@ -168,8 +228,9 @@ def generate_tests_report(
 )
 def generate_statistics_report(
     filters: ReportFilter,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(validate_report_permissions)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """
     Genera reporte de estadísticas generales.
@@ -182,28 +243,65 @@ def generate_statistics_report(
         # Forzar tipo de reporte
         filters.report_type = ReportType.STATISTICS
 
-        # Generar reporte
-        file_content = report_controller.generate_report(
-            db=db,
-            filters=filters,
-            user_name=current_user.user.full_name,
-        )
-
-        # Content type
-        content_type = CONTENT_TYPES.get(filters.format, DEFAULT_CONTENT_TYPE)
-
-        # Nombre del archivo
-        file_name = f"reporte_estadisticas.{filters.format}"
-
-        return StreamingResponse(
-            file_content,
-            media_type=content_type,
-            headers={"Content-Disposition": f"attachment; filename={file_name}"},
+        return generate_report_response(
+            db, filters, current_user, "reporte_estadisticas", if_none_match
         )
 
     except ValidationException as e:
         raise AppException(status_code=400, message=str(e)) from e
+    except AppException:
+        raise
     except Exception as e:
         raise AppException(
             status_code=500, message=f"Error al generar reporte: {str(e)}"
         ) from e
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ResponseSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Consultar trabajo de reporte",
+    description=(
+        "Estado de un reporte PDF generado en segundo plano: pending, running, "
+        "done o failed."
+    ),
+)
+def get_report_job(
+    job_id: str,
+    current_user: Annotated[Account, Depends(validate_report_permissions)],
+):
+    """Consulta el estado de un trabajo de reporte del usuario actual."""
+    try:
+        job = report_jobs.get(job_id, owner_id=current_user.id)
+        return ResponseSchema(
+            status="success",
+            message="Estado del reporte obtenido correctamente",
+            data=job_payload(job),
+        )
+    except AppException as exc:
+        return handle_app_exception(exc)
+
+
+@router.get(
+    "/jobs/{job_id}/download",
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    summary="Descargar reporte generado",
+    description=(
+        "Descarga el PDF de un trabajo terminado; responde 409 si aún se está "
+        "generando."
+    ),
+)
+def download_report_job(
+    job_id: str,
+    current_user: Annotated[Account, Depends(validate_report_permissions)],
+):
+    """Descarga el PDF de un trabajo de reporte terminado."""
+    try:
+        job = report_jobs.get(job_id, owner_id=current_user.id)
+        return build_report_response(
+            BytesIO(job.content()), job.file_name, current_user
+        )
+    except AppException as exc:
+        return handle_app_exception(exc)
@@ -5,10 +5,11 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.controllers.representative_controller import RepresentativeController
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db, get_read_db
 from app.models.account import Account
 from app.schemas.representative_schema import (
     RepresentativeDetailResponse,
@@ -44,7 +45,7 @@ representative_controller = RepresentativeController()
 )
 async def get_representative_by_dni(
     dni: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Busca un representante por DNI. Útil para el frontend."""
     try:
@@ -87,7 +88,7 @@ async def get_representative_by_dni(
 )
 async def create_representative(
     payload: RepresentativeInscriptionDTO,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_admin: Annotated[Account, Depends(get_current_admin)],
 ):
     """Solo el administrador puede crear representantes directamente."""
@@ -114,7 +115,7 @@ async def create_representative(
     description="Obtiene lista paginada de representantes. Requiere autenticación.",
 )
 def get_all_representatives(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     filters: Annotated[RepresentativeFilter, Depends()],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
@@ -143,7 +144,7 @@ def get_all_representatives(
 )
 async def get_representative_by_id(
     representative_id: Annotated[int, Field(ge=1)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene un representante por su ID con toda la información disponible."""
@@ -172,7 +173,7 @@ async def get_representative_by_id(
 async def update_representative(
     representative_id: Annotated[int, Field(ge=1)],
     payload: RepresentativeUpdateDTO,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_admin: Annotated[Account, Depends(get_current_admin)],
 ):
     """Actualiza un representante."""
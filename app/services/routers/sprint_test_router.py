@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.controllers.sprint_test_controller import SprintTestController
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.response import PaginatedResponse, ResponseSchema
 from app.schemas.sprint_test_schema import (
@@ -15,7 +15,8 @@ from app.schemas.sprint_test_schema import (
     SprintTestResponseSchema,
     UpdateSprintTestSchema,
 )
-from app.utils.exceptions import DatabaseException
+from app.services.routers.constants import SyncStatsQuery
+from app.utils.exceptions import DatabaseException, ValidationException
 from app.utils.security import get_current_account
 
 router = APIRouter(prefix="/sprint-tests", tags=["Sprint Tests"])
@@ -33,12 +34,14 @@ async def create_sprint_test(
     payload: CreateSprintTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Crear un nuevo Sprint Test."""
     try:
         test = sprint_test_controller.add_test(
             db=db,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         return ResponseSchema(
@@ -60,13 +63,13 @@ async def create_sprint_test(
     description="Obtiene lista paginada de Sprint Tests con filtros.",
 )
 async def list_sprint_tests(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     filters: Annotated[SprintTestFilter, Depends()],
 ) -> ResponseSchema:
     """Listar todos los Sprint Tests con paginación."""
     try:
-        items, total = sprint_test_controller.list_tests(db, filters)
+        items, total, next_cursor = sprint_test_controller.list_tests(db, filters)
 
         return ResponseSchema(
             status="success",
@@ -76,8 +79,11 @@ async def list_sprint_tests(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ),
         )
+    except ValidationException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -127,6 +133,7 @@ async def update_sprint_test(
     payload: UpdateSprintTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Actualizar un Sprint Test."""
     data = payload.model_dump(exclude_none=True)
@@ -138,6 +145,7 @@ async def update_sprint_test(
             db=db,
             test_id=test_id,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         if not updated:
@@ -167,10 +175,11 @@ async def delete_sprint_test(
     test_id: int,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Eliminar un Sprint Test."""
     try:
-        deleted = sprint_test_controller.delete_test(db, test_id)
+        deleted = sprint_test_controller.delete_test(db, test_id, sync_stats=sync_stats)
 
         if not deleted:
             raise HTTPException(status_code=404, detail="Sprint Test no encontrado")
@@ -8,7 +8,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.controllers.statistic_controller import StatisticController
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.response import ResponseSchema
 from app.schemas.statistic_schema import UpdateSportsStatsRequest
@@ -35,7 +35,7 @@ statistic_controller = StatisticController()
     ),
 )
 def get_club_overview(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
     type_athlete: Optional[str] = Query(None, description="Filtro por tipo de atleta"),
     sex: Optional[str] = Query(None, description="Filtro por sexo (MALE, FEMALE)"),
@@ -70,7 +70,7 @@ def get_club_overview(
     ),
 )
 def get_attendance_statistics(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
     start_date: Annotated[Optional[date], Query(description="Fecha de inicio")] = None,
     end_date: Annotated[Optional[date], Query(description="Fecha de fin")] = None,
@@ -111,7 +111,7 @@ def get_attendance_statistics(
     ),
 )
 def get_test_performance(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
     start_date: Annotated[Optional[date], Query(description="Fecha de inicio")] = None,
     end_date: Annotated[Optional[date], Query(description="Fecha de fin")] = None,
@@ -151,7 +151,7 @@ def get_test_performance(
 )
 def get_athlete_individual_stats(
     athlete_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene estadísticas individuales de un atleta."""
@@ -230,6 +230,34 @@ def update_sports_stats(
         return handle_unexpected_exception(e)
 
 
+@router.post(
+    "/refresh",
+    response_model=ResponseSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Aplicar estadísticas pendientes",
+    description=(
+        "Recalcula en el momento las estadísticas físicas de los atletas con "
+        "tests registrados que aún esperan el refresco diferido."
+    ),
+)
+def refresh_pending_stats(
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[Account, Depends(get_current_account)],
+):
+    """Fuerza la actualización de las estadísticas encoladas."""
+    try:
+        data = statistic_controller.refresh_pending_stats(db=db)
+        return ResponseSchema(
+            status="success",
+            message="Estadísticas pendientes actualizadas correctamente",
+            data=data,
+        )
+    except AppException as exc:
+        return handle_app_exception(exc)
+    except Exception as e:
+        return handle_unexpected_exception(e)
+
+
 @router.get(
     "/athlete/{athlete_id}/tests-history",
     response_model=ResponseSchema,
@@ -242,7 +270,7 @@ def update_sports_stats(
 )
 def get_athlete_tests_history(
     athlete_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene historial de tests de un atleta para gráficos de progreso."""
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from app.controllers.technical_assessment_controller import (
     TechnicalAssessmentController,
 )
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.response import PaginatedResponse, ResponseSchema
 from app.schemas.technical_assessment_schema import (
@@ -17,7 +17,8 @@ from app.schemas.technical_assessment_schema import (
     TechnicalAssessmentResponseSchema,
     UpdateTechnicalAssessmentSchema,
 )
-from app.utils.exceptions import DatabaseException
+from app.services.routers.constants import SyncStatsQuery
+from app.utils.exceptions import DatabaseException, ValidationException
 from app.utils.security import get_current_account
 
 router = APIRouter(prefix="/technical-assessments", tags=["Technical Assessments"])
@@ -35,12 +36,14 @@ async def create_technical_assessment(
     payload: CreateTechnicalAssessmentSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Crear una nueva Technical Assessment."""
     try:
         test = technical_assessment_controller.add_test(
             db=db,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         return ResponseSchema(
@@ -62,13 +65,15 @@ async def create_technical_assessment(
     description="Obtiene lista paginada de Technical Assessments con filtros.",
 )
 async def list_technical_assessments(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     filters: Annotated[TechnicalAssessmentFilter, Depends()],
 ) -> ResponseSchema:
     """Listar todos los Technical Assessments con paginación."""
     try:
-        items, total = technical_assessment_controller.list_tests(db, filters)
+        items, total, next_cursor = technical_assessment_controller.list_tests(
+            db, filters
+        )
 
         return ResponseSchema(
             status="success",
@@ -80,8 +85,11 @@ async def list_technical_assessments(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ),
         )
+    except ValidationException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -133,6 +141,7 @@ async def update_technical_assessment(
     payload: UpdateTechnicalAssessmentSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Actualizar un Technical Assessment."""
     data = payload.model_dump(exclude_none=True)
@@ -144,6 +153,7 @@ async def update_technical_assessment(
             db=db,
             test_id=test_id,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         if not updated:
@@ -175,10 +185,13 @@ async def delete_technical_assessment(
     test_id: int,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Eliminar un Technical Assessment."""
     try:
-        deleted = technical_assessment_controller.delete_test(db, test_id)
+        deleted = technical_assessment_controller.delete_test(
+            db, test_id, sync_stats=sync_stats
+        )
 
         if not deleted:
             raise HTTPException(
@@ -2,10 +2,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.controllers.user_controller import UserController
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db, get_read_db
 from app.models.account import Account
 from app.models.enums.rol import Role
 from app.schemas.response import PaginatedResponse, ResponseSchema
@@ -52,7 +53,7 @@ user_controller = UserController()
 )
 async def admin_create_user(
     payload: AdminCreateUserRequest,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_admin: Annotated[Account, Depends(get_current_admin)],
 ) -> ResponseSchema:
     """Solo el administrador puede crear usuarios administradores o entrenadores."""
@@ -94,7 +95,7 @@ async def admin_create_user(
 )
 async def admin_update_user(
     payload: AdminUpdateUserRequest,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     user_id: Annotated[int, Path(gt=0, description="ID del usuario a actualizar")],
     current_admin: Annotated[Account, Depends(get_current_admin)],
 ) -> ResponseSchema:
@@ -127,7 +128,7 @@ async def admin_update_user(
     ),
 )
 def get_all_users(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     filters: Annotated[UserFilter, Depends()],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
@@ -158,7 +159,7 @@ def get_all_users(
     description="Obtiene los detalles del usuario actualmente autenticado.",
 )
 async def get_me(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     """Obtiene los detalles del usuario logueado actualmente"""
@@ -196,7 +197,7 @@ async def get_me(
     description="Lista todos los pasantes con paginación y búsqueda.",
 )
 def get_all_interns(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     filters: Annotated[InternFilter, Depends()],
     current_user: Annotated[Account, Depends(get_current_coach_or_admin)],
 ):
@@ -229,7 +230,7 @@ def get_all_interns(
 )
 async def get_by_id(
     user_id: Annotated[int, Path(gt=0, description="ID del usuario")],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[Account, Depends(get_current_account)],
 ):
     try:
@@ -264,7 +265,7 @@ async def get_by_id(
     summary="Desactivar usuario",
     description="Desactiva un usuario. Solo Administradores.",
 )
-async def desactivate_user(
+def desactivate_user(
     user_id: Annotated[int, Path(gt=0, description="ID del usuario a desactivar")],
     db: Annotated[Session, Depends(get_db)],
     current_admin: Annotated[Account, Depends(get_current_admin)],
@@ -290,7 +291,7 @@ async def desactivate_user(
     summary="Activar usuario",
     description="Activa un usuario. Solo Administradores.",
 )
-async def activate_user(
+def activate_user(
     user_id: Annotated[int, Path(gt=0, description="ID del usuario a activar")],
     db: Annotated[Session, Depends(get_db)],
     current_admin: Annotated[Account, Depends(get_current_admin)],
@@ -321,7 +322,7 @@ async def activate_user(
     summary="Promover atleta a pasante",
     description="Crea una cuenta de pasante para un atleta existente.",
 )
-async def promote_athlete_to_intern(
+def promote_athlete_to_intern(
     athlete_id: Annotated[int, Path(gt=0, description="ID del atleta a promover")],
     payload: PromoteAthleteRequest,
     db: Annotated[Session, Depends(get_db)],
@@ -352,7 +353,7 @@ async def promote_athlete_to_intern(
     summary="Desactivar pasante",
     description="Desactiva un pasante. Solo Coach o Admin.",
 )
-async def deactivate_intern(
+def deactivate_intern(
     intern_id: Annotated[int, Path(gt=0, description="ID del pasante a desactivar")],
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[Account, Depends(get_current_coach_or_admin)],
@@ -378,7 +379,7 @@ async def deactivate_intern(
     summary="Activar pasante",
     description="Activa un pasante. Solo Coach o Admin.",
 )
-async def activate_intern(
+def activate_intern(
     intern_id: Annotated[int, Path(gt=0, description="ID del pasante a activar")],
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[Account, Depends(get_current_coach_or_admin)],
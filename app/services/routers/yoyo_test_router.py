@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.controllers.yoyo_test_controller import YoyoTestController
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.account import Account
 from app.schemas.response import PaginatedResponse, ResponseSchema
 from app.schemas.yoyo_test_schema import (
@@ -15,7 +15,8 @@ from app.schemas.yoyo_test_schema import (
     YoyoTestFilter,
     YoyoTestResponseSchema,
 )
-from app.utils.exceptions import DatabaseException
+from app.services.routers.constants import SyncStatsQuery
+from app.utils.exceptions import DatabaseException, ValidationException
 from app.utils.security import get_current_account
 
 router = APIRouter(prefix="/yoyo-tests", tags=["Yoyo Tests"])
@@ -33,12 +34,14 @@ async def create_yoyo_test(
     payload: CreateYoyoTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Crear un nuevo Yoyo Test."""
     try:
         test = yoyo_test_controller.add_test(
             db=db,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         return ResponseSchema(
@@ -60,13 +63,13 @@ async def create_yoyo_test(
     description="Obtiene lista paginada de Yoyo Tests con filtros.",
 )
 async def list_yoyo_tests(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
     filters: Annotated[YoyoTestFilter, Depends()],
 ) -> ResponseSchema:
     """Listar todos los Yoyo Tests con paginación."""
     try:
-        items, total = yoyo_test_controller.list_tests(db, filters)
+        items, total, next_cursor = yoyo_test_controller.list_tests(db, filters)
 
         return ResponseSchema(
             status="success",
@@ -76,8 +79,11 @@ async def list_yoyo_tests(
                 total=total,
                 page=filters.page,
                 limit=filters.limit,
+                next_cursor=next_cursor,
             ),
         )
+    except ValidationException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -127,6 +133,7 @@ async def update_yoyo_test(
     payload: UpdateYoyoTestSchema,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Actualizar un Yoyo Test."""
     data = payload.model_dump(exclude_none=True)
@@ -138,6 +145,7 @@ async def update_yoyo_test(
             db=db,
             test_id=test_id,
             payload=payload,
+            sync_stats=sync_stats,
         )
 
         if not updated:
@@ -167,10 +175,11 @@ async def delete_yoyo_test(
     test_id: int,
     db: Annotated[Session, Depends(get_db)],
     current_account: Annotated[Account, Depends(get_current_account)],
+    sync_stats: SyncStatsQuery = False,
 ) -> ResponseSchema:
     """Eliminar un Yoyo Test."""
     try:
-        deleted = yoyo_test_controller.delete_test(db, test_id)
+        deleted = yoyo_test_controller.delete_test(db, test_id, sync_stats=sync_stats)
 
         if not deleted:
             raise HTTPException(status_code=404, detail="Yoyo Test no encontrado")
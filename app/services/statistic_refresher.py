@@ -0,0 +1,160 @@
+"""Refresco diferido y por lotes de las estadísticas físicas de atletas."""
+
+import logging
+import threading
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.dao.statistic_dao import StatisticDAO
+
+logger = logging.getLogger(__name__)
+
+
+class StatisticRefresher:
+    """
+    Cola de atletas con estadísticas pendientes de recalcular.
+
+    Las escrituras de tests encolan los atletas afectados y responden sin
+    esperar; un hilo de fondo agrupa los IDs (sin duplicados) y los
+    recalcula por lotes con una única consulta agrupada por lote. Si el
+    refresco no está en marcha, `enqueue` devuelve False y el llamador
+    debe actualizar las estadísticas en línea.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.interval = (
+            settings.STATS_REFRESH_INTERVAL_SECONDS if interval is None else interval
+        )
+        self.batch_size = batch_size or settings.STATS_REFRESH_BATCH_SIZE
+        self.statistic_dao = StatisticDAO()
+        self._session_factory = session_factory
+        self._pending: dict[int, None] = {}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def pending(self) -> list[int]:
+        """IDs de atletas pendientes, en orden de llegada."""
+        with self._condition:
+            return list(self._pending)
+
+    def start(self) -> None:
+        """Inicia el hilo de refresco (idempotente)."""
+        if self.running:
+            return
+        if self._session_factory is None:
+            from app.core.database import SessionLocal
+
+            self._session_factory = SessionLocal
+        self._stopping = False
+        self._worker = threading.Thread(
+            target=self._run, name="statistic-refresher", daemon=True
+        )
+        self._worker.start()
+        logger.info("Statistic refresher started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Detiene el hilo tras procesar los atletas pendientes."""
+        if not self.running:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        self._worker = None
+        logger.info("Statistic refresher stopped")
+
+    def enqueue(self, athlete_ids: Iterable[int]) -> bool:
+        """
+        Marca atletas para recalcular.
+
+        Returns:
+            True si quedaron encolados; False si el refresco no está activo
+        """
+        with self._condition:
+            if self._stopping or not self.running:
+                return False
+            for athlete_id in athlete_ids:
+                self._pending[athlete_id] = None
+            self._condition.notify()
+        return True
+
+    def discard(self, athlete_ids: Iterable[int]) -> bool:
+        """Quita atletas de la cola; True si alguno estaba pendiente."""
+        found = False
+        with self._condition:
+            for athlete_id in athlete_ids:
+                if athlete_id in self._pending:
+                    del self._pending[athlete_id]
+                    found = True
+        return found
+
+    def flush(self, db: Session) -> int:
+        """
+        Recalcula en línea todos los atletas pendientes.
+
+        Returns:
+            Cantidad de atletas recalculados
+        """
+        total = 0
+        while batch := self._take_batch():
+            self._refresh(db, batch)
+            total += len(batch)
+        return total
+
+    # ========== INTERNOS ==========
+
+    def _take_batch(self) -> list[int]:
+        with self._condition:
+            batch = list(self._pending)[: self.batch_size]
+            for athlete_id in batch:
+                del self._pending[athlete_id]
+            return batch
+
+    def _refresh(self, db: Session, batch: list[int]) -> None:
+        try:
+            changed = self.statistic_dao.refresh_test_totals(db, batch)
+            logger.debug(f"Statistics refreshed: {len(batch)} athletes, {changed}")
+        except Exception as e:
+            # Reencolar para reintentar en el siguiente ciclo
+            logger.error(f"Error refreshing statistics batch: {e}")
+            with self._condition:
+                for athlete_id in batch:
+                    self._pending.setdefault(athlete_id, None)
+            raise
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                stopping = self._stopping
+            if not stopping:
+                # Ventana para acumular las escrituras de la misma sesión
+                with self._condition:
+                    self._condition.wait_for(lambda: self._stopping, self.interval)
+            db = self._session_factory()
+            try:
+                self.flush(db)
+            except Exception:  # nosec B110 - el lote se reintenta en el siguiente ciclo
+                pass
+            finally:
+                db.close()
+            if stopping:
+                return
+
+
+# Singleton compartido por los controladores de tests
+statistic_refresher = StatisticRefresher()
@@ -1,7 +1,18 @@
+"""Gráficos de reportes con la API orientada a objetos de matplotlib.
+
+Cada gráfico usa su propia `Figure` con lienzo Agg, sin el estado global
+de pyplot, por lo que se puede generar desde varios hilos a la vez.
+matplotlib se importa al dibujar el primer gráfico.
+"""
+
 import base64
 import io
+from functools import lru_cache
+from typing import Optional, Sequence
 
-import matplotlib.pyplot as plt
+from app.core.config import settings
+
+MIME_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
 
 
 class ChartGenerator:
@@ -12,32 +23,64 @@ class ChartGenerator:
         "black": "#211915",
         "blue": "#004C7B",
     }
+    PIE_COLORS = ("blue", "green", "red", "black")
 
-    @staticmethod
-    def _to_base64(fig):
-        img = io.BytesIO()
-        fig.savefig(img, format="png", bbox_inches="tight", dpi=150)
-        img.seek(0)
-        plt.close(fig)
-        return base64.b64encode(img.getvalue()).decode()
+    @classmethod
+    def generate_bar_chart(
+        cls,
+        labels: Optional[Sequence],
+        values: Sequence,
+        title: str,
+        y_label: str = "",
+        fmt: Optional[str] = None,
+    ) -> Optional[str]:
+        """Gráfico de barras como data URI (SVG o PNG), o None sin datos."""
+        if not labels:
+            return None
+        return _render_chart(
+            "bar", *_chart_key(labels, values), title, y_label, _format(fmt)
+        )
 
     @classmethod
-    def generate_bar_chart(cls, labels, values, title, y_label=""):
+    def generate_pie_chart(
+        cls,
+        labels: Optional[Sequence],
+        values: Sequence,
+        title: str,
+        fmt: Optional[str] = None,
+    ) -> Optional[str]:
+        """Gráfico circular como data URI (SVG o PNG), o None sin datos."""
         if not labels:
             return None
+        return _render_chart(
+            "pie", *_chart_key(labels, values), title, "", _format(fmt)
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Vacía la memoria de gráficos ya generados."""
+        _render_chart.cache_clear()
+
+    @staticmethod
+    def _to_data_uri(fig, fmt: str) -> str:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, bbox_inches="tight", dpi=150)
+        encoded = base64.b64encode(buffer.getvalue()).decode()
+        return f"data:{MIME_TYPES[fmt]};base64,{encoded}"
 
-        plt.figure(figsize=(8, 4))
-        bars = plt.bar(labels, values, color=cls.COLORS["green"], width=0.5)
+    @classmethod
+    def _draw_bar(cls, ax, labels, values, title, y_label) -> None:
+        bars = ax.bar(labels, values, color=cls.COLORS["green"], width=0.5)
 
-        plt.title(title, color=cls.COLORS["black"], pad=15, fontweight="bold")
-        plt.ylabel(y_label)
-        plt.grid(axis="y", linestyle="--", alpha=0.5)
-        plt.xticks(rotation=15 if len(labels) > 4 else 0)
+        ax.set_title(title, color=cls.COLORS["black"], pad=15, fontweight="bold")
+        ax.set_ylabel(y_label)
+        ax.grid(axis="y", linestyle="--", alpha=0.5)
+        ax.tick_params(axis="x", labelrotation=15 if len(labels) > 4 else 0)
 
         # Poner valores sobre las barras
         for bar in bars:
             height = bar.get_height()
-            plt.text(
+            ax.text(
                 bar.get_x() + bar.get_width() / 2.0,
                 height,
                 f"{height:.1f}",
@@ -46,37 +89,52 @@ class ChartGenerator:
                 fontsize=8,
             )
 
-        plt.tight_layout()
-        return cls._to_base64(plt.gcf())
-
     @classmethod
-    def generate_pie_chart(cls, labels, values, title):
-        if not labels:
-            return None
-
-        plt.figure(figsize=(6, 3.5))  # Slightly smaller height
+    def _draw_pie(cls, ax, labels, values, title) -> None:
+        # Repetir la paleta si hay más etiquetas que colores
         colors = [
-            cls.COLORS["blue"],
-            cls.COLORS["green"],
-            cls.COLORS["red"],
-            cls.COLORS["black"],
+            cls.COLORS[cls.PIE_COLORS[i % len(cls.PIE_COLORS)]]
+            for i in range(len(labels))
         ]
-
-        # Ensure colors cycle if more labels than colors
-        if len(labels) > len(colors):
-            colors = colors * (len(labels) // len(colors) + 1)
-
-        plt.pie(
+        ax.pie(
             values,
             labels=labels,
             autopct="%1.1f%%",
-            colors=colors[: len(labels)],
+            colors=colors,
             startangle=90,
             textprops={"fontsize": 8},
         )
-        plt.title(
+        ax.set_title(
             title, color=cls.COLORS["black"], fontweight="bold", fontsize=10, pad=10
         )
 
-        plt.tight_layout()
-        return cls._to_base64(plt.gcf())
+
+def _format(fmt: Optional[str]) -> str:
+    fmt = fmt or settings.REPORT_CHART_FORMAT
+    if fmt not in MIME_TYPES:
+        raise ValueError(f"Formato de gráfico no soportado: {fmt}")
+    return fmt
+
+
+def _chart_key(labels: Sequence, values: Sequence) -> tuple:
+    """Etiquetas y valores como tuplas hashables (admite listas y numpy)."""
+    return tuple(str(label) for label in labels), tuple(float(v) for v in values)
+
+
+@lru_cache(maxsize=128)
+def _render_chart(
+    kind: str, labels: tuple, values: tuple, title: str, y_label: str, fmt: str
+) -> str:
+    """Dibuja el gráfico en una Figure propia; memoizado por sus datos."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if kind == "bar":
+        fig = Figure(figsize=(8, 4), layout="tight")
+        FigureCanvasAgg(fig)
+        ChartGenerator._draw_bar(fig.add_subplot(), labels, values, title, y_label)
+    else:
+        fig = Figure(figsize=(6, 3.5), layout="tight")
+        FigureCanvasAgg(fig)
+        ChartGenerator._draw_pie(fig.add_subplot(), labels, values, title)
+    return ChartGenerator._to_data_uri(fig, fmt)
@@ -27,9 +27,15 @@ class AlreadyExistsException(AppException):
 class ValidationException(AppException):
     """Datos inválidos o reglas de negocio incumplidas."""
 
-    def __init__(self, message: str = "Error de validación", detail: str = None):
+    def __init__(
+        self,
+        message: str = "Error de validación",
+        detail: str = None,
+        errors: dict = None,
+    ):
         super().__init__(message, status_code=422)
         self.detail = detail
+        self.errors = errors
 
     def to_dict(self):
         return {"message": self.message, "detail": self.detail}
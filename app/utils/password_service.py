@@ -0,0 +1,74 @@
+"""Hash y verificación de contraseñas fuera del hilo de la petición.
+
+bcrypt es costoso a propósito; en ráfagas de login ocuparía el threadpool
+de FastAPI. Aquí corre en un executor propio y acotado, de modo que como
+máximo `PASSWORD_HASH_WORKERS` hashes se calculan a la vez y el resto espera
+sin bloquear el event loop ni los hilos de las demás rutas.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.utils.security import (
+    hash_password,
+    verify_and_update_password,
+    verify_password,
+)
+
+# Contraseña del hash ficticio con el que se igualan los tiempos de login
+DUMMY_PASSWORD = "DummyPass123!"  # nosec
+
+
+class PasswordService:
+    """Operaciones bcrypt asíncronas sobre un executor dedicado."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dummy_hash: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            return self._executor
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args))
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, password, password_hash)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verifica y devuelve un hash nuevo si cambió `BCRYPT_ROUNDS`."""
+        return await self._run(verify_and_update_password, password, password_hash)
+
+    async def dummy_hash(self) -> str:
+        """Hash ficticio, calculado la primera vez que se necesita."""
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(DUMMY_PASSWORD)
+        return self._dummy_hash
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_service = PasswordService()
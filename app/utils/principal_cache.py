@@ -0,0 +1,162 @@
+"""Caché en memoria de la cuenta autenticada (principal) por token."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.models.enums.rol import Role
+
+
+@dataclass(frozen=True)
+class PrincipalUser:
+    """Resumen del usuario dueño de la cuenta."""
+
+    id: int
+    external: Optional[str]
+    full_name: str
+    dni: str
+    role: Role
+    email: str
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Cuenta autenticada sin sesión de BD.
+
+    Expone los mismos atributos de `Account` que usan los routers
+    (`id`, `email`, `role`, `user_id`, `user.*`).
+    """
+
+    id: int
+    email: str
+    role: Role
+    is_active: bool
+    user_id: int
+    user: Optional[PrincipalUser]
+
+    @classmethod
+    def from_account(cls, account) -> "Principal":
+        user = account.user
+        return cls(
+            id=account.id,
+            email=account.email,
+            role=account.role,
+            is_active=account.is_active,
+            user_id=account.user_id,
+            user=PrincipalUser(
+                id=user.id,
+                external=user.external,
+                full_name=user.full_name,
+                dni=user.dni,
+                role=account.role,
+                email=account.email,
+            )
+            if user is not None
+            else None,
+        )
+
+
+class PrincipalCache:
+    """
+    Principales por (id de cuenta, `iat` del token) con TTL corto.
+
+    Cada cuenta tiene una versión: `invalidate` la incrementa y descarta sus
+    entradas, de modo que tras desactivar la cuenta, cambiar su rol o
+    contraseña o editar su usuario la siguiente petición vuelve a consultar
+    la BD.
+
+    La caché es por proceso: `invalidate` solo alcanza al worker que hizo el
+    cambio. Los demás pueden seguir sirviendo el principal anterior (incluso
+    de una cuenta desactivada o con otro rol) hasta
+    `PRINCIPAL_CACHE_TTL_SECONDS`.
+    """
+
+    def __init__(self, ttl: float = 30, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def version(self, account_id: int) -> int:
+        with self._lock:
+            return self._versions.get(account_id, 0)
+
+    def get(self, account_id: int, issued_at: Optional[int]) -> Optional[Principal]:
+        if not self.enabled:
+            return None
+        key = (account_id, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, version, principal = entry
+                if expires_at > time.monotonic() and version == self._versions.get(
+                    account_id, 0
+                ):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return principal
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        account_id: int,
+        issued_at: Optional[int],
+        principal: Principal,
+        version: int,
+    ) -> None:
+        """Guarda el principal leído con la versión vigente al consultarlo."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if version != self._versions.get(account_id, 0):
+                return  # se invalidó mientras se consultaba la BD
+            key = (account_id, issued_at)
+            self._entries[key] = (time.monotonic() + self.ttl, version, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, account_id: Optional[int]) -> None:
+        """Descarta los principales de una cuenta tras modificarla."""
+        if account_id is None:
+            return
+        with self._lock:
+            self._versions[account_id] = self._versions.get(account_id, 0) + 1
+            for key in [k for k in self._entries if k[0] == account_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
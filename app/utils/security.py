@@ -2,7 +2,7 @@
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
@@ -16,11 +16,12 @@ from app.dao.account_dao import AccountDAO
 from app.models.account import Account
 from app.models.enums.rol import Role
 from app.utils.exceptions import UnauthorizedException, ValidationException
+from app.utils.principal_cache import Principal, principal_cache
 
 _pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=10,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
 )
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/accounts/login")
 
@@ -127,6 +128,24 @@ def verify_password(password: str, password_hash: str) -> bool:
     return _pwd_context.verify(password, password_hash)
 
 
+def verify_and_update_password(
+    password: str, password_hash: str
+) -> Tuple[bool, Optional[str]]:
+    """Verifica la contraseña y, si el hash usa otro costo, genera uno nuevo.
+
+    Args:
+        password: Contraseña en texto plano a verificar.
+        password_hash: Hash de la contraseña almacenado.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Si coincide y el hash nuevo a guardar
+        (None si el almacenado sigue vigente).
+    """
+    if not password or not password_hash:
+        return False, None
+    return _pwd_context.verify_and_update(password, password_hash)
+
+
 def create_access_token(
     subject: str | int,
     expires_seconds: int | None = None,
@@ -273,9 +292,12 @@ def validate_refresh_token(token: str) -> dict:
 def get_current_account(
     token: str = _TOKEN_DEP,
     db: Session = _DB_DEP,
-) -> Account:
+) -> Principal:
     """Dependencia para obtener la cuenta autenticada desde el JWT.
 
+    La cuenta se guarda en ``principal_cache`` por (``sub``, ``iat``), así
+    que las peticiones siguientes con el mismo token no consultan la BD.
+
     Args:
         token: JWT extraído del encabezado ``Authorization`` mediante
             el esquema ``OAuth2PasswordBearer``.
@@ -283,8 +305,8 @@ def get_current_account(
             la cuenta asociada al token.
 
     Returns:
-        Account: Objeto de cuenta autenticada correspondiente al sujeto
-        (``sub``) contenido en el token.
+        Principal: Cuenta autenticada correspondiente al sujeto (``sub``)
+        contenido en el token, con los mismos atributos que ``Account``.
 
     Raises:
         UnauthorizedException: Si el token es inválido, no contiene ``sub``,
@@ -299,11 +321,20 @@ def get_current_account(
     if sub is None:
         raise UnauthorizedException("Token inválido: falta identificador")
 
-    account = AccountDAO().get_by_id(db, int(sub), only_active=True)
+    account_id = int(sub)
+    issued_at = payload.get("iat")
+    principal = principal_cache.get(account_id, issued_at)
+    if principal is not None:
+        return principal
+
+    version = principal_cache.version(account_id)
+    account = AccountDAO().get_by_id(db, account_id, only_active=True)
     if not account:
         raise UnauthorizedException("Cuenta no encontrada o inactiva")
 
-    return account
+    principal = Principal.from_account(account)
+    principal_cache.put(account_id, issued_at, principal, version)
+    return principal
 
 
 _CURRENT_ACCOUNT_DEP = Depends(get_current_account)
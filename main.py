@@ -2,18 +2,22 @@
 
 import logging
 import sys
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from sqlalchemy.exc import DatabaseError, InterfaceError, OperationalError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core import query_stats
 from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.database import Base, engine, mark_read_your_writes
 from app.core.docs import get_openapi_config, get_tags_metadata
+from app.core.http_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.http_metrics import route_metrics
 from app.core.scalar_docs import setup_scalar_docs
 from app.models import *  # noqa: F401, F403
 from app.schemas.constants import SERVICE_PROBLEMS_MSG
@@ -58,17 +62,29 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Eventos de ciclo de vida."""
-    from app.core.database import SessionLocal
+    from app.core.database import (
+        SessionLocal,
+        dispose_async_engine,
+        get_async_engine,
+    )
+    from app.core.migrations import upgrade_schema
     from app.core.seeder import seed_default_admin
+    from app.services.report_jobs import report_jobs
+    from app.services.statistic_refresher import statistic_refresher
+    from app.utils.password_service import password_service
 
     logger.info("🚀 Starting application...")
+    # Login y las rutas asíncronas usan este motor: sin el driver (asyncpg)
+    # el arranque falla aquí y no en la primera petición
+    get_async_engine()
     try:
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created")
 
-        # Crear usuario admin por defecto
+        # Columnas y backfills que create_all no aplica; admin por defecto
         db = SessionLocal()
         try:
+            upgrade_schema(db)
             seed_default_admin(db)
         finally:
             db.close()
@@ -76,6 +92,16 @@ async def lifespan(app: FastAPI):
     except Exception as exc:  # pragma: no cover - se registra el fallo
         logger.error(f"Error creating tables or seeding: {exc}")
 
+    if settings.STATS_REFRESH_DEFERRED:
+        statistic_refresher.start()
+    if settings.REPORT_PDF_WORKERS > 0:
+        report_jobs.start()
+    if settings.REPORT_WARM_UP:
+        from app.services.report_renderer import warm_up_worker
+
+        # Plantillas siempre; CSS y fuentes solo si el PDF se genera aquí
+        warm_up_worker(pdf=settings.REPORT_PDF_WORKERS == 0)
+
     logger.info(
         f"📊 Scalar Docs: http://{settings.APP_HOST}:{settings.APP_PORT}/scalar"
     )
@@ -84,6 +110,11 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("🛑 Shutting down...")
+    statistic_refresher.stop()
+    report_jobs.stop()
+    password_service.shutdown()
+    route_metrics.flush()
+    await dispose_async_engine()
 
 
 def _configure_middlewares(app: FastAPI) -> None:
@@ -96,6 +127,86 @@ def _configure_middlewares(app: FastAPI) -> None:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def read_your_writes(request: Request, call_next):
+        """Envía al primario las lecturas que siguen a una escritura."""
+        response = await call_next(request)
+        mark_read_your_writes(request, response)
+        return response
+
+    @app.middleware("http")
+    async def sql_timing(request: Request, call_next):
+        """Consultas y tiempo en BD de la petición en `Server-Timing` y en el log."""
+        token = query_stats.start_request()
+        try:
+            response = await call_next(request)
+        finally:
+            stats = query_stats.end_request(token)
+        # Las cabeceras salen antes del cuerpo: Server-Timing no incluye las
+        # consultas de un cuerpo en streaming. El cuerpo se genera en la
+        # tarea de la petición, que sigue sumando en `stats`, y el log se
+        # escribe al terminar de enviarlo.
+        response.headers["Server-Timing"] = stats.server_timing()
+
+        def log_queries(_sent: int) -> None:
+            if stats.count:
+                query_stats.logger.info(
+                    f"request method={request.method} path={request.url.path} "
+                    f"status={response.status_code} queries={stats.count} "
+                    f"db_ms={stats.total_seconds * 1000:.1f} "
+                    f"slowest_ms={stats.slowest_seconds * 1000:.1f}"
+                )
+
+        _on_body_complete(response, log_queries)
+        return response
+
+    @app.middleware("http")
+    async def http_metrics(request: Request, call_next):
+        """Latencia, códigos, tamaño y peticiones en curso por plantilla de ruta.
+
+        La petición termina con el último byte del cuerpo, no con las
+        cabeceras, para medir también las respuestas en streaming.
+        """
+        method = request.method
+        route = route_metrics.route_for(request.app, request.scope)
+        route_metrics.start(method, route)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except BaseException:
+            route_metrics.finish(method, route, 500, time.perf_counter() - start)
+            raise
+
+        def record(sent: int) -> None:
+            route_metrics.finish(
+                method, route, response.status_code, time.perf_counter() - start, sent
+            )
+
+        _on_body_complete(response, record)
+        return response
+
+
+def _on_body_complete(response, callback) -> None:
+    """
+    Llama a `callback(bytes_enviados)` al terminar de enviar el cuerpo.
+
+    Las respuestas de `call_next` se envían después de que el middleware
+    retorna; también se llama si el envío se interrumpe (cliente
+    desconectado).
+    """
+    body_iterator = response.body_iterator
+
+    async def iterate():
+        sent = 0
+        try:
+            async for chunk in body_iterator:
+                sent += len(chunk)
+                yield chunk
+        finally:
+            callback(sent)
+
+    response.body_iterator = iterate()
+
 
 def _register_exception_handlers(app: FastAPI) -> None:
     """Registra todos los manejadores de excepciones."""
@@ -212,6 +323,50 @@ def _register_health_endpoints(app: FastAPI) -> None:
                 content={"status": "not_ready", "reason": "database_unavailable"},
             )
 
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """Métricas por ruta de todos los workers, en formato Prometheus."""
+        return PlainTextResponse(
+            route_metrics.render(), media_type=METRICS_CONTENT_TYPE
+        )
+
+    @app.get("/metrics/db-pool", tags=["Health"], response_model=ResponseSchema)
+    async def db_pool_metrics():
+        """Uso de los pools de conexiones: en uso, overflow y esperas."""
+        from app.core.database import pool_limits, pool_share
+        from app.core.pool_metrics import pool_metrics
+
+        pools = pool_metrics.snapshot()
+        limits = {}
+        for name in pools:
+            pool_size, max_overflow = pool_limits(pool_share(name))
+            limits[name] = {"pool_size": pool_size, "max_overflow": max_overflow}
+        return ResponseSchema(
+            status="success",
+            message="Métricas del pool de conexiones",
+            data={
+                "workers": settings.WEB_WORKERS,
+                "limits": limits,
+                "pools": pools,
+            },
+        )
+
+    @app.get("/metrics/person-cache", tags=["Health"], response_model=ResponseSchema)
+    async def person_cache_metrics():
+        """Caché, circuito y concurrencia de las consultas al MS de personas."""
+        from app.client.person_cache import person_cache
+        from app.client.person_client import get_ms_breaker, get_ms_limiter
+
+        return ResponseSchema(
+            status="success",
+            message="Métricas de la caché de personas",
+            data={
+                **person_cache.stats(),
+                "breaker": get_ms_breaker().stats(),
+                "concurrency": get_ms_limiter().stats(),
+            },
+        )
+
     @app.get("/info", tags=["Health"], response_model=ResponseSchema)
     async def api_info():
         return ResponseSchema(
@@ -259,19 +414,18 @@ app = create_application()
 
 
 if __name__ == "__main__":
-    import os
-
     import uvicorn
 
-    # Fórmula (2 * CPU cores) + 1
-    workers = 1 if settings.DEBUG else int(os.getenv("UVICORN_WORKERS", 4))
+    # WEB_CONCURRENCY (o UVICORN_WORKERS), lo mismo con lo que se dimensiona
+    # el pool de BD
+    workers = settings.WEB_WORKERS
 
     uvicorn.run(
         "main:app",
         host=settings.APP_HOST,
         port=settings.APP_PORT,
         reload=settings.DEBUG,
-        workers=workers if not settings.DEBUG else 1,  # reload no soporta workers
+        workers=workers,  # reload no soporta workers: 1 en DEBUG
         log_level="debug" if settings.DEBUG else "info",
         limit_concurrency=200,  # Aumentado para soportar más carga
         limit_max_requests=50000,  # Más requests antes de reiniciar
@@ -0,0 +1,44 @@
+"""Script para reconstruir (backfill) el resumen diario de asistencia.
+
+Recalcula `attendance_daily_rollup` completo a partir de `attendances`.
+El primer poblado lo hace la aplicación al arrancar; usar este script tras
+cambiar el tipo o sexo de atletas con historial, o si se sospecha
+desalineación.
+
+Ejecutar con: uv run python scripts/rebuild_attendance_rollup.py
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO  # noqa: E402
+from app.models import *  # noqa: F401, F403, E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild_attendance_rollup():
+    """Crea la tabla si falta y la reconstruye desde las asistencias."""
+    db = SessionLocal()
+    try:
+        Base.metadata.create_all(bind=engine)
+        days = AttendanceRollupDAO().rebuild(db)
+        logger.info(f" Attendance rollup rebuilt: {days} days")
+        return True
+    except Exception as e:
+        logger.error(f" Error rebuilding attendance rollup: {e}")
+        return False
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    success = rebuild_attendance_rollup()
+    exit(0 if success else 1)
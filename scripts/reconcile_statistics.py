@@ -0,0 +1,51 @@
+"""Script para conciliar los acumulados de tests en `statistics`.
+
+Agrega las columnas de acumulados si la tabla existente no las tiene (lo
+mismo que hace la aplicación al arrancar), las recalcula desde los tests
+activos y reporta las diferencias.
+Con `--check` solo reporta, sin corregir.
+
+Ejecutar con: uv run python scripts/reconcile_statistics.py [--check]
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.migrations import ensure_statistic_accumulators  # noqa: E402
+from app.dao.statistic_dao import StatisticDAO  # noqa: E402
+from app.models import *  # noqa: F401, F403, E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def reconcile_statistics(check: bool = False):
+    """Concilia los acumulados; con `check=True` solo reporta derivas."""
+    db = SessionLocal()
+    try:
+        ensure_statistic_accumulators(db)
+        drift = StatisticDAO().reconcile_test_totals(db, repair=not check)
+        for item in drift:
+            logger.warning(
+                f" Drift athlete={item['athlete_id']} {item['field']}: "
+                f"stored={item['stored']} actual={item['actual']}"
+            )
+        action = "found" if check else "repaired"
+        logger.info(f" Statistics reconciled: {len(drift)} differences {action}")
+        return True
+    except Exception as e:
+        logger.error(f" Error reconciling statistics: {e}")
+        return False
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    success = reconcile_statistics(check="--check" in sys.argv[1:])
+    exit(0 if success else 1)
@@ -0,0 +1,173 @@
+"""Tests de la caché de consultas al MS de personas."""
+
+import asyncio
+import fnmatch
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.client.person_cache import MemoryBackend, PersonCache, RedisBackend
+from app.client.person_ms_service import PersonMSService
+
+PERSON = {"status": "success", "data": {"external": "ext-1", "firts_name": "Ana"}}
+
+
+class LocalRedis:
+    """Sustituto local de `redis.asyncio.Redis` compartido entre "workers"."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode()
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+def _slow_loader(calls: list, delay: float = 0.01):
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return PERSON
+
+    return load
+
+
+# ==============================================
+# TESTS: CACHÉ
+# ==============================================
+
+
+async def test_hit_after_miss():
+    """La segunda consulta se sirve de la caché."""
+    cache = PersonCache(MemoryBackend(), ttl=60)
+    calls = []
+
+    assert await cache.get_or_load("110", _slow_loader(calls)) == PERSON
+    assert await cache.get_or_load(" 110 ", _slow_loader(calls)) == PERSON
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_concurrent_misses_are_single_flight():
+    """Consultas simultáneas por la misma identificación hacen una sola llamada."""
+    cache = PersonCache(MemoryBackend(), ttl=60)
+    calls = []
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("110", _slow_loader(calls)) for _ in range(20))
+    )
+
+    assert len(calls) == 1
+    assert all(result == PERSON for result in results)
+    assert cache.stats()["coalesced"] == 19
+
+
+async def test_errors_are_not_cached():
+    """Un fallo se propaga y no queda en caché."""
+    cache = PersonCache(MemoryBackend(), ttl=60)
+    loader = AsyncMock(side_effect=[RuntimeError("MS caído"), PERSON])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("110", loader)
+
+    assert await cache.get_or_load("110", loader) == PERSON
+
+
+async def test_ttl_and_lru_eviction():
+    """Las entradas vencen por TTL y la menos usada sale al superar el límite."""
+    backend = MemoryBackend(max_entries=2)
+    await backend.set("a", 1, ttl=60)
+    await backend.set("b", 2, ttl=60)
+    await backend.get("a")
+    await backend.set("c", 3, ttl=60)
+
+    assert await backend.get("a") == 1
+    assert await backend.get("b") is None
+
+    await backend.set("expired", 4, ttl=-1)
+    assert await backend.get("expired") is None
+
+
+async def test_invalidate_during_load_keeps_stale_value_out():
+    """Si la persona se modifica durante una consulta, no se guarda lo viejo."""
+    cache = PersonCache(MemoryBackend(), ttl=60)
+    calls = []
+
+    load = asyncio.ensure_future(cache.get_or_load("110", _slow_loader(calls)))
+    await asyncio.sleep(0)
+    await cache.invalidate("110")
+    await load
+    await cache.get_or_load("110", _slow_loader(calls))
+
+    assert len(calls) == 2
+
+
+async def test_redis_backend_is_shared_between_workers():
+    """Dos procesos con el mismo Redis comparten entradas e invalidaciones."""
+    redis = LocalRedis()
+    worker_a = PersonCache(RedisBackend(client=redis), ttl=60)
+    worker_b = PersonCache(RedisBackend(client=redis), ttl=60)
+    calls = []
+
+    await worker_a.get_or_load("110", _slow_loader(calls))
+    assert await worker_b.get_or_load("110", _slow_loader(calls)) == PERSON
+    await worker_b.invalidate("110")
+    await worker_a.get_or_load("110", _slow_loader(calls))
+
+    assert len(calls) == 2
+    await worker_a.clear()
+    assert redis.data == {}
+
+
+async def test_backend_errors_fall_back_to_ms():
+    """Si el backend falla se consulta el MS igualmente."""
+    backend = AsyncMock()
+    backend.get.side_effect = ConnectionError("redis caído")
+    backend.set.side_effect = ConnectionError("redis caído")
+    cache = PersonCache(backend, ttl=60)
+
+    assert await cache.get_or_load("110", AsyncMock(return_value=PERSON)) == PERSON
+
+
+# ==============================================
+# TESTS: PersonMSService
+# ==============================================
+
+
+@pytest.fixture
+def service():
+    client = AsyncMock()
+    client.get_by_identification = AsyncMock(return_value=PERSON)
+    client.update_person = AsyncMock(return_value={"data": {"external": "ext-1"}})
+    return PersonMSService(person_client=client, cache=PersonCache(MemoryBackend()))
+
+
+async def test_service_caches_identification_lookups(service):
+    """Las vistas de detalle repetidas no vuelven a llamar al MS."""
+    for _ in range(3):
+        await service.get_user_by_identification("110")
+
+    service.person_client.get_by_identification.assert_awaited_once_with("110")
+
+
+async def test_update_person_invalidates(service):
+    """Actualizar una persona descarta su entrada en caché."""
+    await service.get_user_by_identification("110")
+    await service.update_person(
+        external="ext-1", first_name="Ana", last_name="Paz", dni="110"
+    )
+    await service.get_user_by_identification("110")
+
+    assert service.person_client.get_by_identification.await_count == 2
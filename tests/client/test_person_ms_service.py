@@ -1,14 +1,24 @@
 """Tests para PersonMSService."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.client.person_cache import person_cache
 from app.client.person_ms_service import PersonMSService
 from app.schemas.user_schema import CreatePersonInMSRequest
 from app.utils.exceptions import ExternalServiceException, ValidationException
 
 
+@pytest.fixture(autouse=True)
+def clear_person_cache():
+    """Cada test parte con la caché de personas vacía."""
+    asyncio.run(person_cache.clear())
+    yield
+    asyncio.run(person_cache.clear())
+
+
 class TestPersonMSServiceInit:
     """Tests para inicialización de PersonMSService."""
 
@@ -514,3 +524,85 @@ class TestHandleCreateResponse:
 
         with pytest.raises(ValidationException):
             await service._handle_create_response(response, person_data)
+
+
+class TestGetManyByIdentification:
+    """Tests para get_many_by_identification."""
+
+    @pytest.fixture
+    def service(self):
+        """Service con caché propia y un MS que tarda 20 ms por consulta."""
+        from app.client.person_cache import MemoryBackend, PersonCache
+
+        calls = []
+
+        async def get_by_identification(identification):
+            calls.append(identification)
+            await asyncio.sleep(0.02)
+            return {"status": "success", "data": {"identification": identification}}
+
+        client = AsyncMock()
+        client.get_by_identification = AsyncMock(side_effect=get_by_identification)
+        service = PersonMSService(
+            person_client=client, cache=PersonCache(MemoryBackend())
+        )
+        service.calls = calls
+        return service
+
+    @pytest.mark.asyncio
+    async def test_fans_out_concurrently(self, service):
+        """Diez personas tardan lo que una consulta, no diez."""
+        ids = [f"11000000{i:02d}" for i in range(10)]
+
+        start = asyncio.get_running_loop().time()
+        result = await service.get_many_by_identification(ids + ids[:2])
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert sorted(service.calls) == ids
+        assert list(result) == ids
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_merges_with_cache(self, service):
+        """Solo se consultan las identificaciones que no están en caché."""
+        await service.get_user_by_identification("110")
+
+        result = await service.get_many_by_identification(["110", "220"])
+
+        assert service.calls == ["110", "220"]
+        assert result["110"]["data"]["identification"] == "110"
+
+    @pytest.mark.asyncio
+    async def test_large_page_uses_snapshot(self, service, monkeypatch):
+        """Con muchas ausencias en caché se usa un único listado completo."""
+        monkeypatch.setattr(
+            "app.client.person_ms_service.settings.PERSON_MS_SNAPSHOT_THRESHOLD", 2
+        )
+        service.person_client.get_all_filter = AsyncMock(
+            return_value={"data": [{"identification": "110", "phono": "09"}]}
+        )
+
+        result = await service.get_many_by_identification(["110", "220"])
+
+        assert service.calls == []
+        assert result["110"]["data"]["phono"] == "09"
+        assert result["220"] is None
+        assert await service.cache.peek("110") == result["110"]
+
+    @pytest.mark.asyncio
+    async def test_slow_lookups_are_bounded(self, service):
+        """Lo que no llega a tiempo queda en None y luego entra en caché."""
+        result = await service.get_many_by_identification(["110"], timeout=0.001)
+
+        assert result == {"110": None}
+        await asyncio.sleep(0.05)
+        assert await service.cache.peek("110") is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_none(self, service):
+        """Un error del MS en una persona no afecta al resto."""
+        service.person_client.get_by_identification.side_effect = (
+            ExternalServiceException("caído")
+        )
+
+        assert await service.get_many_by_identification(["110"]) == {"110": None}
@@ -0,0 +1,236 @@
+"""Tests del circuito y la concurrencia adaptativa hacia el MS de personas."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.client import person_client
+from app.client.person_auth import PersonAuthService
+from app.client.person_client import PersonClient
+from app.client.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+)
+from app.utils.exceptions import ExternalServiceException, ValidationException
+
+PERSON = {"status": "success", "data": {"external": "ext-1", "firts_name": "Ana"}}
+
+
+class FakePersonMS:
+    """MS de personas local: responde, falla o deja de estar disponible."""
+
+    def __init__(self):
+        self.mode = "up"  # up, down (sin conexión), error (503) o busy (429)
+        self.delay = 0.0
+        self.logins = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.token = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "down":
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/api/person/login":
+            self.logins += 1
+            await asyncio.sleep(0.01)
+            self.token = f"Bearer token-{self.logins}"
+            return httpx.Response(200, json={"data": {"token": self.token}})
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.mode == "error":
+                return httpx.Response(503, json={"message": "Service Unavailable"})
+            if self.mode == "busy":
+                return httpx.Response(429, json={"message": "Too Many Requests"})
+            if request.headers.get("Authorization") != self.token:
+                return httpx.Response(401, json={"message": "Token expirado"})
+            if request.url.path.endswith("/invalid"):
+                return httpx.Response(400, json={"message": "Identificación inválida"})
+            return httpx.Response(200, json=PERSON)
+        finally:
+            self.in_flight -= 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_ms():
+    return FakePersonMS()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def client(fake_ms, clock, monkeypatch):
+    """PersonClient contra el MS local, con un circuito de dos fallos."""
+    shared = httpx.AsyncClient(
+        base_url="http://person-ms.local", transport=httpx.MockTransport(fake_ms.handle)
+    )
+    monkeypatch.setattr(PersonClient, "_shared_client", shared)
+    monkeypatch.setattr(person_client, "auth_service", PersonAuthService())
+    monkeypatch.setattr(
+        person_client,
+        "_ms_breaker",
+        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+    )
+    return PersonClient(base_url="http://person-ms.local")
+
+
+async def _fail_twice(client, fake_ms):
+    fake_ms.mode = "down"
+    for _ in range(2):
+        with pytest.raises(ExternalServiceException):
+            await client.get_by_identification("110")
+
+
+# ==============================================
+# TESTS: CIRCUITO
+# ==============================================
+
+
+async def test_closed_circuit_logs_in_on_shared_client(client, fake_ms):
+    """Con el MS sano se hace login una vez y se reutiliza el token."""
+    for _ in range(3):
+        assert await client.get_by_identification("110") == PERSON
+
+    assert fake_ms.logins == 1
+    assert person_client.get_ms_breaker().state == CLOSED
+
+
+async def test_concurrent_expired_tokens_refresh_once(client, fake_ms):
+    """Varias respuestas 401 simultáneas provocan un solo login."""
+    await client.get_by_identification("110")
+    fake_ms.token = "Bearer revocado"
+    fake_ms.delay = 0.01
+
+    results = await asyncio.gather(
+        *(client.get_by_identification("110") for _ in range(10))
+    )
+
+    assert all(result == PERSON for result in results)
+    assert fake_ms.logins == 2
+
+
+async def test_circuit_opens_and_fails_fast(client, fake_ms):
+    """Tras los fallos seguidos no se vuelve a llamar al MS."""
+    await client.get_by_identification("110")
+    fake_ms.mode = "error"
+    for _ in range(2):
+        with pytest.raises(ValidationException):
+            await client.get_by_identification("110")
+    requests = fake_ms.requests
+
+    with pytest.raises(ExternalServiceException) as exc_info:
+        await client.get_by_identification("110")
+
+    assert "no está disponible" in exc_info.value.message
+    assert fake_ms.requests == requests
+    assert person_client.get_ms_breaker().stats()["state"] == OPEN
+
+
+async def test_half_open_trial_closes_circuit(client, fake_ms, clock):
+    """Pasado el tiempo de espera, una llamada de prueba exitosa lo cierra."""
+    await _fail_twice(client, fake_ms)
+    breaker = person_client.get_ms_breaker()
+    clock.now = 30
+    assert breaker.state == HALF_OPEN
+
+    fake_ms.mode = "up"
+    fake_ms.delay = 0.01
+    trial = asyncio.ensure_future(client.get_by_identification("110"))
+    await asyncio.sleep(0)
+    with pytest.raises(ExternalServiceException):
+        await client.get_by_identification("110")  # solo una llamada de prueba
+
+    assert await trial == PERSON
+    assert breaker.state == CLOSED
+
+
+async def test_half_open_failure_reopens(client, fake_ms, clock):
+    """Si la llamada de prueba falla, el circuito vuelve a abrirse."""
+    await _fail_twice(client, fake_ms)
+    clock.now = 30
+
+    with pytest.raises(ExternalServiceException):
+        await client.get_by_identification("110")
+
+    breaker = person_client.get_ms_breaker()
+    assert breaker.state == OPEN
+    clock.now = 59
+    assert breaker.state == OPEN
+
+
+async def test_client_errors_do_not_trip_circuit(client, fake_ms):
+    """Los 4xx del MS son errores de datos, no caídas del servicio."""
+    for _ in range(5):
+        with pytest.raises(ValidationException):
+            await client.get_by_identification("invalid")
+
+    assert person_client.get_ms_breaker().state == CLOSED
+
+
+# ==============================================
+# TESTS: CONCURRENCIA ADAPTATIVA
+# ==============================================
+
+
+async def test_limiter_caps_requests_to_ms(client, fake_ms, monkeypatch):
+    """Nunca hay más peticiones en curso que el límite vigente."""
+    limiter = AdaptiveLimiter(initial=3, max_limit=3)
+    monkeypatch.setattr(person_client, "_ms_limiter", limiter)
+    await client.get_by_identification("110")
+    fake_ms.delay = 0.01
+
+    await asyncio.gather(*(client.get_by_identification("110") for _ in range(12)))
+
+    assert fake_ms.max_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_backs_off_on_overload(client, fake_ms, monkeypatch):
+    """Un 429 reduce el límite a la mitad; los éxitos lo recuperan de a poco."""
+    limiter = AdaptiveLimiter(initial=8, max_limit=10)
+    monkeypatch.setattr(person_client, "_ms_limiter", limiter)
+    await client.get_by_identification("110")
+
+    fake_ms.mode = "busy"
+    with pytest.raises(ValidationException):
+        await client.get_by_identification("110")
+    assert limiter.limit == 4
+    assert person_client.get_ms_breaker().state == CLOSED
+
+    fake_ms.mode = "up"
+    for _ in range(5):
+        await client.get_by_identification("110")
+    assert limiter.limit == 5
+
+
+async def test_limiter_waiters_resume_in_order():
+    """Con el límite ocupado se espera a que se libere un lugar."""
+    limiter = AdaptiveLimiter(initial=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limiter.stats()["waiting"] == 1
+
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
@@ -3,8 +3,29 @@ from unittest.mock import MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.client.person_client import reset_ms_resilience
 from app.models.enums.rol import Role
+from app.utils.principal_cache import principal_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_ms_resilience():
+    """Cada test empieza con el circuito del MS cerrado y el límite inicial."""
+    reset_ms_resilience()
+    yield
+    reset_ms_resilience()
+
+
+@pytest.fixture(autouse=True)
+def fresh_principal_cache():
+    """Los tokens creados en un test no se resuelven desde la caché de otro."""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
 
 
 @pytest.fixture
@@ -14,6 +35,85 @@ def mock_db_session():
     yield session
 
 
+@pytest.fixture
+def mock_async_db_session(mock_db_session):
+    """AsyncSession simulada: `run_sync` ejecuta la función con `mock_db_session`."""
+    session = MagicMock()
+
+    async def run_sync(fn, *args, **kwargs):
+        return fn(mock_db_session, *args, **kwargs)
+
+    session.run_sync = run_sync
+    yield session
+
+
+@pytest.fixture
+def sqlite_engine():
+    """Motor SQLite en memoria con todas las tablas, para benchmarks de consultas."""
+    from app.core.database import Base
+    from app.models import Account  # noqa: F401 - registra todos los modelos
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_db(sqlite_engine):
+    """Sesión real sobre SQLite en memoria."""
+    session = sessionmaker(bind=sqlite_engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+async def async_sqlite_db():
+    """AsyncSession real sobre SQLite en memoria (aiosqlite)."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.core.database import Base
+    from app.models import Account  # noqa: F401 - registra todos los modelos
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def query_counter(sqlite_engine):
+    """Cuenta las sentencias SQL emitidas contra `sqlite_engine`.
+
+    Uso: ``with query_counter() as counter: ...`` y luego ``counter.count``.
+    """
+    from contextlib import contextmanager
+
+    class _Counter:
+        count = 0
+
+    @contextmanager
+    def _count():
+        counter = _Counter()
+
+        def _before_execute(conn, cursor, statement, params, context, executemany):
+            counter.count += 1
+
+        event.listen(sqlite_engine, "before_cursor_execute", _before_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", _before_execute)
+
+    return _count
+
+
 @pytest.fixture
 def mock_admin_account():
     """Mock de una cuenta de administrador para autenticación."""
@@ -50,15 +150,24 @@ def mock_intern_account():
 
 
 @pytest.fixture
-async def client(mock_db_session):
+async def client(mock_db_session, mock_async_db_session):
     """Cliente HTTP asíncrono sin autenticación (para tests públicos)."""
-    from app.core.database import get_db
+    from app.core.database import (
+        get_async_db,
+        get_db,
+        get_read_db,
+    )
     from main import app
 
     async def override_get_db():
         yield mock_db_session
 
+    async def override_get_async_db():
+        yield mock_async_db_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -69,15 +178,22 @@ async def client(mock_db_session):
 
 
 @pytest.fixture
-async def admin_client(mock_db_session, mock_admin_account):
+async def admin_client(mock_db_session, mock_async_db_session, mock_admin_account):
     """Cliente HTTP autenticado como administrador."""
-    from app.core.database import get_db
+    from app.core.database import (
+        get_async_db,
+        get_db,
+        get_read_db,
+    )
     from app.utils.security import get_current_account, get_current_admin
     from main import app
 
     async def override_get_db():
         yield mock_db_session
 
+    async def override_get_async_db():
+        yield mock_async_db_session
+
     def override_get_current_account():
         return mock_admin_account
 
@@ -85,6 +201,8 @@ async def admin_client(mock_db_session, mock_admin_account):
         return mock_admin_account
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_account] = override_get_current_account
     app.dependency_overrides[get_current_admin] = override_get_current_admin
 
@@ -96,15 +214,22 @@ async def admin_client(mock_db_session, mock_admin_account):
 
 
 @pytest.fixture
-async def coach_client(mock_db_session, mock_coach_account):
+async def coach_client(mock_db_session, mock_async_db_session, mock_coach_account):
     """Cliente HTTP autenticado como entrenador."""
-    from app.core.database import get_db
+    from app.core.database import (
+        get_async_db,
+        get_db,
+        get_read_db,
+    )
     from app.utils.security import get_current_account, get_current_coach
     from main import app
 
     async def override_get_db():
         yield mock_db_session
 
+    async def override_get_async_db():
+        yield mock_async_db_session
+
     def override_get_current_account():
         return mock_coach_account
 
@@ -112,6 +237,8 @@ async def coach_client(mock_db_session, mock_coach_account):
         return mock_coach_account
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_account] = override_get_current_account
     app.dependency_overrides[get_current_coach] = override_get_current_coach
 
@@ -123,15 +250,22 @@ async def coach_client(mock_db_session, mock_coach_account):
 
 
 @pytest.fixture
-async def intern_client(mock_db_session, mock_intern_account):
+async def intern_client(mock_db_session, mock_async_db_session, mock_intern_account):
     """Cliente HTTP autenticado como pasante."""
-    from app.core.database import get_db
+    from app.core.database import (
+        get_async_db,
+        get_db,
+        get_read_db,
+    )
     from app.utils.security import get_current_account, get_current_staff
     from main import app
 
     async def override_get_db():
         yield mock_db_session
 
+    async def override_get_async_db():
+        yield mock_async_db_session
+
     def override_get_current_account():
         return mock_intern_account
 
@@ -139,6 +273,8 @@ async def intern_client(mock_db_session, mock_intern_account):
         return mock_intern_account
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_account] = override_get_current_account
     app.dependency_overrides[get_current_staff] = override_get_current_staff
 
@@ -1,9 +1,10 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.controllers.account_controller import AccountController
 from app.utils.exceptions import UnauthorizedException
+from app.utils.password_service import password_service
 
 
 @pytest.fixture
@@ -22,9 +23,8 @@ def _mock_account():
     return acc
 
 
-def test_login_success(monkeypatch, controller):
+async def test_login_success(monkeypatch, controller, mock_async_db_session):
     """Prueba de login exitoso."""
-    db = MagicMock()
     account = _mock_account()
 
     monkeypatch.setattr(
@@ -33,37 +33,72 @@ def test_login_success(monkeypatch, controller):
         lambda db, email, only_active=True: account,
     )
     monkeypatch.setattr(
-        "app.controllers.account_controller.verify_password", lambda password, ph: True
+        password_service, "verify_and_update", AsyncMock(return_value=(True, None))
     )
     monkeypatch.setattr(
         "app.controllers.account_controller.create_access_token",
         lambda **kwargs: "token123",
     )
 
-    resp = controller.login(
-        db, MagicMock(email="USER@test.com", password="Password123!")
+    resp = await controller.login(
+        mock_async_db_session,
+        MagicMock(email="USER@test.com", password="Password123!"),
     )
 
     assert resp.access_token == "token123"
     assert resp.token_type == "bearer"
+    assert account.password_hash == "hashed"
 
 
-def test_login_not_found(monkeypatch, controller):
+async def test_login_rehashes_on_cost_change(
+    monkeypatch, controller, mock_async_db_session, mock_db_session
+):
+    """Si el costo de bcrypt cambió, el login guarda el hash nuevo."""
+    account = _mock_account()
+    monkeypatch.setattr(
+        controller.account_dao,
+        "get_by_email",
+        lambda db, email, only_active=True: account,
+    )
+    monkeypatch.setattr(
+        password_service,
+        "verify_and_update",
+        AsyncMock(return_value=(True, "rehashed")),
+    )
+    monkeypatch.setattr(
+        "app.controllers.account_controller.create_access_token",
+        lambda **kwargs: "token123",
+    )
+
+    await controller.login(
+        mock_async_db_session,
+        MagicMock(email="user@test.com", password="Password123!"),
+    )
+
+    assert account.password_hash == "rehashed"
+    mock_db_session.commit.assert_called_once()
+
+
+async def test_login_not_found(monkeypatch, controller, mock_async_db_session):
     """Prueba de login con cuenta no encontrada."""
-    db = MagicMock()
     monkeypatch.setattr(
         controller.account_dao,
         "get_by_email",
         lambda db, email, only_active=True: None,
     )
+    verify = AsyncMock(return_value=False)
+    monkeypatch.setattr(password_service, "verify", verify)
+    monkeypatch.setattr(password_service, "_dummy_hash", "dummy")
 
     with pytest.raises(UnauthorizedException):
-        controller.login(db, MagicMock(email="user@test.com", password="pass"))
+        await controller.login(
+            mock_async_db_session, MagicMock(email="user@test.com", password="pass")
+        )
+    verify.assert_awaited_once_with("pass", "dummy")
 
 
-def test_login_bad_password(monkeypatch, controller):
+async def test_login_bad_password(monkeypatch, controller, mock_async_db_session):
     """Prueba de login con contraseña incorrecta."""
-    db = MagicMock()
     account = _mock_account()
     monkeypatch.setattr(
         controller.account_dao,
@@ -71,11 +106,13 @@ def test_login_bad_password(monkeypatch, controller):
         lambda db, email, only_active=True: account,
     )
     monkeypatch.setattr(
-        "app.controllers.account_controller.verify_password", lambda password, ph: False
+        password_service, "verify_and_update", AsyncMock(return_value=(False, None))
     )
 
     with pytest.raises(UnauthorizedException):
-        controller.login(db, MagicMock(email="user@test.com", password="wrong"))
+        await controller.login(
+            mock_async_db_session, MagicMock(email="user@test.com", password="wrong")
+        )
 
 
 def test_request_password_reset_success(monkeypatch, controller):
@@ -126,9 +163,10 @@ def test_request_password_reset_not_found(monkeypatch, controller):
     assert sent["called"] is False
 
 
-def test_confirm_password_reset_success(monkeypatch, controller):
+async def test_confirm_password_reset_success(
+    monkeypatch, controller, mock_async_db_session, mock_db_session
+):
     """Prueba de confirmación de reseteo de contraseña exitoso."""
-    db = MagicMock()
     account = _mock_account()
     monkeypatch.setattr(
         "app.controllers.account_controller.validate_reset_token",
@@ -139,13 +177,11 @@ def test_confirm_password_reset_success(monkeypatch, controller):
         "get_by_id",
         lambda db, id, only_active=True: account,
     )
-    monkeypatch.setattr(
-        "app.controllers.account_controller.hash_password", lambda pwd: "new_hashed"
-    )
+    monkeypatch.setattr(password_service, "hash", AsyncMock(return_value="new_hashed"))
 
-    controller.confirm_password_reset(
-        db, MagicMock(token="reset123", new_password="NewPass123!")
+    await controller.confirm_password_reset(
+        mock_async_db_session, MagicMock(token="reset123", new_password="NewPass123!")
     )
 
     assert account.password_hash == "new_hashed"
-    db.commit.assert_called_once()
+    mock_db_session.commit.assert_called_once()
@@ -46,7 +46,9 @@ def valid_data():
 
 
 @pytest.mark.asyncio
-async def test_register_athlete_unl_success(controller, mock_db_session, valid_data):
+async def test_register_athlete_unl_success(
+    controller, mock_db_session, valid_data, mock_async_db_session
+):
     """Test exitoso de registro de atleta."""
     controller.athlete_dao.exists.return_value = False
     controller.athlete_dao.create.return_value = MagicMock(
@@ -57,7 +59,9 @@ async def test_register_athlete_unl_success(controller, mock_db_session, valid_d
     controller.statistic_dao.create.return_value = MagicMock(id=10)
 
     with patch("app.controllers.athlete_controller.validate_dni_not_exists_locally"):
-        result = await controller.register_athlete_unl(mock_db_session, valid_data)
+        result = await controller.register_athlete_unl(
+            mock_async_db_session, valid_data
+        )
 
     assert result.athlete_id == 1
     assert result.statistic_id == 10
@@ -71,7 +75,7 @@ async def test_register_athlete_unl_success(controller, mock_db_session, valid_d
 
 @pytest.mark.asyncio
 async def test_register_athlete_unl_duplicate_dni(
-    controller, mock_db_session, valid_data
+    controller, mock_db_session, valid_data, mock_async_db_session
 ):
     """Test con DNI duplicado."""
     with patch(
@@ -81,7 +85,7 @@ async def test_register_athlete_unl_duplicate_dni(
         ),
     ):
         with pytest.raises(AlreadyExistsException) as exc:
-            await controller.register_athlete_unl(mock_db_session, valid_data)
+            await controller.register_athlete_unl(mock_async_db_session, valid_data)
 
     assert "DNI" in str(exc.value)
     controller.athlete_dao.create.assert_not_called()
@@ -463,3 +467,55 @@ async def test_minor_athlete_height_weight_none_valid():
     assert minor.height is None
     assert minor.weight is None
     print("\nAltura y peso opcionales (None) aceptados correctamente")
+
+
+@pytest.mark.asyncio
+async def test_enrich_with_person_data_uses_one_batch(controller):
+    """El listado se enriquece con una sola consulta por lote al MS."""
+    from app.schemas.response import PaginatedResponse
+
+    page = PaginatedResponse(
+        items=[{"dni": "110"}, {"dni": "220"}], total=2, page=1, limit=10
+    )
+    controller.person_ms_service.get_many_by_identification = AsyncMock(
+        return_value={
+            "110": {"data": {"phono": "0999999999", "direction": "Loja"}},
+            "220": None,
+        }
+    )
+
+    result = await controller.enrich_with_person_data(page)
+
+    controller.person_ms_service.get_many_by_identification.assert_awaited_once()
+    assert result.items[0] == {
+        "dni": "110",
+        "phone": "0999999999",
+        "direction": "Loja",
+    }
+    assert result.items[1] == {"dni": "220"}
+
+
+@pytest.mark.asyncio
+async def test_athlete_flow_on_real_async_session(async_sqlite_db, valid_data):
+    """Registro, consulta y edición sobre una AsyncSession real (aiosqlite)."""
+    controller = AthleteController()
+    controller.person_ms_service.create_or_get_person = AsyncMock(return_value="ext-1")
+    controller.person_ms_service.get_user_by_identification = AsyncMock(
+        return_value={"data": {"firts_name": "Juan", "phono": "0987654321"}}
+    )
+    controller.person_ms_service.update_person = AsyncMock(return_value="ext-2")
+
+    created = await controller.register_athlete_unl(async_sqlite_db, valid_data)
+    assert created.statistic_id is not None
+
+    detail = await controller.get_athlete_with_ms_info(
+        async_sqlite_db, created.athlete_id
+    )
+    assert detail.dni == "1710034065"
+    assert detail.external_person_id == "ext-1"
+
+    updated = await controller.update_athlete(
+        async_sqlite_db, created.athlete_id, {"weight": 80.0}
+    )
+    assert updated.weight == 80.0
+    controller.person_ms_service.update_person.assert_awaited_once()
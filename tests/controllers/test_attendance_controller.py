@@ -22,9 +22,7 @@ def attendance_controller():
     controller.attendance_dao = MagicMock()
     controller.athlete_dao = MagicMock()
     # Por defecto, simular que los atletas existen
-    mock_athlete = MagicMock()
-    mock_athlete.id = 1
-    controller.athlete_dao.get_by_id.return_value = mock_athlete
+    controller.athlete_dao.get_existing_ids.side_effect = lambda db, ids: set(ids)
     return controller
 
 
@@ -236,8 +234,9 @@ def test_create_bulk_attendance_nonexistent_athlete(attendance_controller, mock_
     """Atleta inexistente lanza NotFoundException."""
     from app.utils.exceptions import NotFoundException
 
-    # Mock para que get_by_id retorne None (atleta no existe)
-    attendance_controller.athlete_dao.get_by_id.return_value = None
+    # Mock para que ningún atleta exista
+    attendance_controller.athlete_dao.get_existing_ids.side_effect = None
+    attendance_controller.athlete_dao.get_existing_ids.return_value = set()
 
     data = AttendanceBulkCreate(
         date=date(2025, 12, 30),
@@ -265,11 +264,12 @@ def test_get_attendances_by_date_success(
     attendance_controller.attendance_dao.get_by_date.return_value = (
         [mock_attendance],
         1,
+        None,
     )
 
     filters = AttendanceFilter(date=date(2025, 12, 30))
 
-    items, total = attendance_controller.get_attendances_by_date(
+    items, total, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
@@ -282,11 +282,11 @@ def test_get_attendances_by_date_success(
 
 def test_get_attendances_by_date_empty(attendance_controller, mock_db):
     """Obtener asistencias cuando no hay registros."""
-    attendance_controller.attendance_dao.get_by_date.return_value = ([], 0)
+    attendance_controller.attendance_dao.get_by_date.return_value = ([], 0, None)
 
     filters = AttendanceFilter(date=date(2025, 12, 30))
 
-    items, total = attendance_controller.get_attendances_by_date(
+    items, total, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
@@ -301,11 +301,12 @@ def test_get_attendances_by_date_with_type_filter(
     attendance_controller.attendance_dao.get_by_date.return_value = (
         [mock_attendance],
         1,
+        None,
     )
 
     filters = AttendanceFilter(date=date(2025, 12, 30), type_athlete="DOCENTES")
 
-    items, total = attendance_controller.get_attendances_by_date(
+    items, total, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
@@ -321,11 +322,12 @@ def test_get_attendances_by_date_with_search(
     attendance_controller.attendance_dao.get_by_date.return_value = (
         [mock_attendance],
         1,
+        None,
     )
 
     filters = AttendanceFilter(date=date(2025, 12, 30), search="Juan")
 
-    items, total = attendance_controller.get_attendances_by_date(
+    items, total, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
@@ -336,7 +338,7 @@ def test_get_attendances_by_date_with_search(
 
 def test_get_attendances_by_date_pagination(attendance_controller, mock_db):
     """Verificar que la paginación se aplica correctamente."""
-    attendance_controller.attendance_dao.get_by_date.return_value = ([], 0)
+    attendance_controller.attendance_dao.get_by_date.return_value = ([], 0, None)
 
     filters = AttendanceFilter(date=date(2025, 12, 30), page=2, limit=10)
 
@@ -398,10 +400,11 @@ def test_format_attendance_response_present(
     attendance_controller.attendance_dao.get_by_date.return_value = (
         [mock_attendance],
         1,
+        None,
     )
 
     filters = AttendanceFilter(date=date(2025, 12, 30))
-    items, _ = attendance_controller.get_attendances_by_date(
+    items, _, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
@@ -419,10 +422,11 @@ def test_format_attendance_response_absent(
     attendance_controller.attendance_dao.get_by_date.return_value = (
         [mock_attendance_absent],
         1,
+        None,
     )
 
     filters = AttendanceFilter(date=date(2025, 12, 30))
-    items, _ = attendance_controller.get_attendances_by_date(
+    items, _, _ = attendance_controller.get_attendances_by_date(
         db=mock_db, filters=filters
     )
 
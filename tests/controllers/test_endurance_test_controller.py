@@ -1,7 +1,7 @@
 """Tests unitarios para `EnduranceTestController`."""
 
 from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import ANY, MagicMock, Mock
 
 import pytest
 
@@ -31,6 +31,17 @@ def mock_db():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def record_test_change(monkeypatch):
+    """Aísla las estadísticas: registra las llamadas a `record_test_change`."""
+    recorder = MagicMock()
+    monkeypatch.setattr(
+        "app.controllers.endurance_test_controller.statistic_controller.record_test_change",
+        recorder,
+    )
+    return recorder
+
+
 @pytest.fixture
 def mock_evaluation():
     """Fixture de una evaluación mock."""
@@ -135,7 +146,7 @@ def test_update_endurance_test_success(
 
 
 def test_delete_endurance_test_success(
-    monkeypatch, endurance_test_controller, mock_db, mock_endurance_test
+    endurance_test_controller, mock_db, mock_endurance_test, record_test_change
 ):
     """Elimina y actualiza estadísticas cuando existe."""
     endurance_test_controller.endurance_test_dao.get_by_id.return_value = (
@@ -143,21 +154,14 @@ def test_delete_endurance_test_success(
     )
     endurance_test_controller.endurance_test_dao.delete.return_value = None
 
-    called = {"stats": False}
-
-    def _update_stats(db, athlete_id):
-        called["stats"] = True
-        assert athlete_id == mock_endurance_test.athlete_id
-
-    monkeypatch.setattr(
-        "app.controllers.endurance_test_controller.statistic_controller.update_athlete_stats",
-        _update_stats,
-    )
-
     result = endurance_test_controller.delete_test(mock_db, test_id=3)
 
     assert result is True
     endurance_test_controller.endurance_test_dao.delete.assert_called_once_with(
         mock_db, 3
     )
-    assert called["stats"] is True
+    record_test_change.assert_called_once_with(
+        mock_db,
+        before=(mock_endurance_test.athlete_id, mock_endurance_test.type, ANY),
+        sync=False,
+    )
@@ -8,6 +8,7 @@ import pytest
 
 from app.controllers.report_controller import ReportController
 from app.schemas.report_schema import ReportFilter, ReportType
+from app.services.report_cache import ReportCache
 from app.utils.exceptions import ValidationException
 
 
@@ -17,6 +18,8 @@ class TestReportController:
     def setup_method(self):
         """Configuración para cada test."""
         self.controller = ReportController()
+        # Sin caché: cada llamada debe llegar al servicio
+        self.controller.report_cache = ReportCache(max_bytes=0)
         self.mock_db = Mock()
 
     def test_generate_report_attendance_pdf(self):
@@ -65,7 +65,7 @@ def valid_representative_data():
 
 @pytest.mark.asyncio
 async def test_create_representative_success(
-    controller, mock_db_session, valid_representative_data
+    controller, mock_db_session, valid_representative_data, mock_async_db_session
 ):
     """Test exitoso de creación de representante."""
     controller.representative_dao.exists.return_value = False
@@ -80,7 +80,7 @@ async def test_create_representative_success(
         "app.controllers.representative_controller.validate_dni_not_exists_locally"
     ):
         result = await controller.create_representative(
-            mock_db_session, valid_representative_data
+            mock_async_db_session, valid_representative_data
         )
 
     assert result.representative_id == 1
@@ -94,7 +94,7 @@ async def test_create_representative_success(
 
 @pytest.mark.asyncio
 async def test_create_representative_duplicate_dni(
-    controller, mock_db_session, valid_representative_data
+    controller, mock_db_session, valid_representative_data, mock_async_db_session
 ):
     """Test con DNI duplicado."""
     with patch(
@@ -105,7 +105,7 @@ async def test_create_representative_duplicate_dni(
     ):
         with pytest.raises(AlreadyExistsException) as exc:
             await controller.create_representative(
-                mock_db_session, valid_representative_data
+                mock_async_db_session, valid_representative_data
             )
 
     assert "representante" in str(exc.value).lower() or "dni" in str(exc.value).lower()
@@ -113,7 +113,9 @@ async def test_create_representative_duplicate_dni(
 
 
 @pytest.mark.asyncio
-async def test_get_representative_by_dni_found(controller, mock_db_session):
+async def test_get_representative_by_dni_found(
+    controller, mock_db_session, mock_async_db_session
+):
     """Test de búsqueda por DNI encontrado."""
     mock_rep = MagicMock(
         id=1,
@@ -127,7 +129,9 @@ async def test_get_representative_by_dni_found(controller, mock_db_session):
     )
     controller.representative_dao.get_by_field.return_value = mock_rep
 
-    result = await controller.get_representative_by_dni(mock_db_session, "1710034065")
+    result = await controller.get_representative_by_dni(
+        mock_async_db_session, "1710034065"
+    )
 
     assert result is not None
     assert result.id == 1
@@ -136,17 +140,23 @@ async def test_get_representative_by_dni_found(controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_representative_by_dni_not_found(controller, mock_db_session):
+async def test_get_representative_by_dni_not_found(
+    controller, mock_db_session, mock_async_db_session
+):
     """Test de búsqueda por DNI no encontrado."""
     controller.representative_dao.get_by_field.return_value = None
 
-    result = await controller.get_representative_by_dni(mock_db_session, "9999999999")
+    result = await controller.get_representative_by_dni(
+        mock_async_db_session, "9999999999"
+    )
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_get_representative_by_id_success(controller, mock_db_session):
+async def test_get_representative_by_id_success(
+    controller, mock_db_session, mock_async_db_session
+):
     """Test de obtener representante por ID."""
     mock_rep = MagicMock(
         id=1,
@@ -162,7 +172,7 @@ async def test_get_representative_by_id_success(controller, mock_db_session):
     )
     controller.representative_dao.get_by_id.return_value = mock_rep
 
-    result = await controller.get_representative_by_id(mock_db_session, 1)
+    result = await controller.get_representative_by_id(mock_async_db_session, 1)
 
     assert result.id == 1
     assert result.full_name == "Juan Pérez"
@@ -170,12 +180,14 @@ async def test_get_representative_by_id_success(controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_representative_by_id_not_found(controller, mock_db_session):
+async def test_get_representative_by_id_not_found(
+    controller, mock_db_session, mock_async_db_session
+):
     """Test de obtener representante por ID no encontrado."""
     controller.representative_dao.get_by_id.return_value = None
 
     with pytest.raises(ValidationException) as exc:
-        await controller.get_representative_by_id(mock_db_session, 999)
+        await controller.get_representative_by_id(mock_async_db_session, 999)
 
     assert "no encontrado" in str(exc.value).lower()
 
@@ -1,7 +1,7 @@
 """Tests unitarios para `SprintTestController`."""
 
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, Mock
+from unittest.mock import ANY, MagicMock, Mock
 
 import pytest
 from pydantic import ValidationError
@@ -36,6 +36,17 @@ def mock_db():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def record_test_change(monkeypatch):
+    """Aísla las estadísticas: registra las llamadas a `record_test_change`."""
+    recorder = MagicMock()
+    monkeypatch.setattr(
+        "app.controllers.sprint_test_controller.statistic_controller.record_test_change",
+        recorder,
+    )
+    return recorder
+
+
 @pytest.fixture
 def mock_evaluation():
     """Fixture de una evaluación mock."""
@@ -160,28 +171,21 @@ def test_update_sprint_test_no_fields_returns_existing(
 
 
 def test_delete_sprint_test_success(
-    monkeypatch, sprint_test_controller, mock_db, mock_sprint_test
+    sprint_test_controller, mock_db, mock_sprint_test, record_test_change
 ):
     """Elimina y actualiza estadísticas cuando existe."""
     sprint_test_controller.sprint_test_dao.get_by_id.return_value = mock_sprint_test
     sprint_test_controller.sprint_test_dao.delete.return_value = None
 
-    called = {"stats": False}
-
-    def _update_stats(db, athlete_id):
-        called["stats"] = True
-        assert athlete_id == mock_sprint_test.athlete_id
-
-    monkeypatch.setattr(
-        "app.controllers.sprint_test_controller.statistic_controller.update_athlete_stats",
-        _update_stats,
-    )
-
     result = sprint_test_controller.delete_test(mock_db, test_id=1)
 
     assert result is True
     sprint_test_controller.sprint_test_dao.delete.assert_called_once_with(mock_db, 1)
-    assert called["stats"] is True
+    record_test_change.assert_called_once_with(
+        mock_db,
+        before=(mock_sprint_test.athlete_id, mock_sprint_test.type, ANY),
+        sync=False,
+    )
 
 
 def test_delete_sprint_test_not_found(sprint_test_controller, mock_db):
@@ -220,7 +224,7 @@ def test_list_tests_success(sprint_test_controller, mock_db, mock_sprint_test):
     mock_limit.all.return_value = [mock_sprint_test]
 
     filters = SprintTestFilter(page=1, limit=10)
-    items, total = sprint_test_controller.list_tests(mock_db, filters)
+    items, total, _ = sprint_test_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 3
@@ -249,7 +253,7 @@ def test_list_tests_with_filters(sprint_test_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = SprintTestFilter(page=1, limit=10, evaluation_id=1, athlete_id=5)
-    items, total = sprint_test_controller.list_tests(mock_db, filters)
+    items, total, _ = sprint_test_controller.list_tests(mock_db, filters)
 
     assert items == []
     assert total == 1
@@ -279,7 +283,7 @@ def test_list_tests_with_search(sprint_test_controller, mock_db, mock_sprint_tes
     mock_limit.all.return_value = [mock_sprint_test]
 
     filters = SprintTestFilter(page=1, limit=10, search="Carlos")
-    items, total = sprint_test_controller.list_tests(mock_db, filters)
+    items, total, _ = sprint_test_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 1
@@ -309,7 +313,7 @@ def test_list_tests_with_search_no_match(sprint_test_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = SprintTestFilter(page=1, limit=10, search="NoExiste")
-    items, total = sprint_test_controller.list_tests(mock_db, filters)
+    items, total, _ = sprint_test_controller.list_tests(mock_db, filters)
 
     assert items == []
 
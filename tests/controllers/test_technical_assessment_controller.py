@@ -1,7 +1,7 @@
 """Tests unitarios para `TechnicalAssessmentController`."""
 
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, Mock
+from unittest.mock import ANY, MagicMock, Mock
 
 import pytest
 from pydantic import ValidationError
@@ -39,6 +39,17 @@ def mock_db():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def record_test_change(monkeypatch):
+    """Aísla las estadísticas: registra las llamadas a `record_test_change`."""
+    recorder = MagicMock()
+    monkeypatch.setattr(
+        "app.controllers.technical_assessment_controller.statistic_controller.record_test_change",
+        recorder,
+    )
+    return recorder
+
+
 @pytest.fixture
 def mock_evaluation():
     """Fixture de una evaluación mock."""
@@ -167,9 +178,12 @@ def test_update_technical_assessment_success(
 
 
 def test_delete_technical_assessment_success(
-    technical_assessment_controller, mock_db, mock_technical_assessment
+    technical_assessment_controller,
+    mock_db,
+    mock_technical_assessment,
+    record_test_change,
 ):
-    """Elimina cuando existe."""
+    """Elimina y actualiza estadísticas cuando existe."""
     technical_assessment_controller.technical_assessment_dao.get_by_id.return_value = (
         mock_technical_assessment
     )
@@ -181,6 +195,15 @@ def test_delete_technical_assessment_success(
     technical_assessment_controller.technical_assessment_dao.delete.assert_called_once_with(
         mock_db, 4
     )
+    record_test_change.assert_called_once_with(
+        mock_db,
+        before=(
+            mock_technical_assessment.athlete_id,
+            mock_technical_assessment.type,
+            ANY,
+        ),
+        sync=False,
+    )
 
 
 def test_update_technical_assessment_no_fields_returns_existing(
@@ -360,7 +383,7 @@ def test_list_tests_success(
     mock_limit.all.return_value = [mock_technical_assessment]
 
     filters = TechnicalAssessmentFilter(page=1, limit=10)
-    items, total = technical_assessment_controller.list_tests(mock_db, filters)
+    items, total, _ = technical_assessment_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 4
@@ -391,7 +414,7 @@ def test_list_tests_with_evaluation_filter(
     mock_limit.all.return_value = [mock_technical_assessment]
 
     filters = TechnicalAssessmentFilter(page=1, limit=10, evaluation_id=1)
-    items, total = technical_assessment_controller.list_tests(mock_db, filters)
+    items, total, _ = technical_assessment_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 2
@@ -421,7 +444,7 @@ def test_list_tests_with_athlete_filter(
     mock_limit.all.return_value = [mock_technical_assessment]
 
     filters = TechnicalAssessmentFilter(page=1, limit=10, athlete_id=5)
-    items, total = technical_assessment_controller.list_tests(mock_db, filters)
+    items, total, _ = technical_assessment_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 1
@@ -453,7 +476,7 @@ def test_list_tests_with_search(
     mock_limit.all.return_value = [mock_technical_assessment]
 
     filters = TechnicalAssessmentFilter(page=1, limit=10, search="Juan")
-    items, total = technical_assessment_controller.list_tests(mock_db, filters)
+    items, total, _ = technical_assessment_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 1
@@ -480,7 +503,7 @@ def test_list_tests_empty_result(technical_assessment_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = TechnicalAssessmentFilter(page=1, limit=10)
-    items, total = technical_assessment_controller.list_tests(mock_db, filters)
+    items, total, _ = technical_assessment_controller.list_tests(mock_db, filters)
 
     assert items == []
     assert total == 0
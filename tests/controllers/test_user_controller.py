@@ -94,7 +94,7 @@ def mock_user():
 
 @pytest.mark.asyncio
 async def test_create_user_admin_success(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Usuario creado correctamente."""
     user_controller.account_dao.exists.return_value = False
@@ -110,7 +110,7 @@ async def test_create_user_admin_success(
 
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         result = await user_controller.admin_create_user(
-            db=mock_db_session, payload=valid_create_payload
+            db=mock_async_db_session, payload=valid_create_payload
         )
 
     assert result.id == 1
@@ -123,7 +123,7 @@ async def test_create_user_admin_success(
 
 @pytest.mark.asyncio
 async def test_create_user_coach_success(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Usuario creado correctamente."""
     valid_create_payload.role = Role.COACH
@@ -136,7 +136,7 @@ async def test_create_user_coach_success(
 
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         result = await user_controller.admin_create_user(
-            db=mock_db_session, payload=valid_create_payload
+            db=mock_async_db_session, payload=valid_create_payload
         )
 
     assert result.role in ["COACH", "Coach"]
@@ -144,7 +144,7 @@ async def test_create_user_coach_success(
 
 @pytest.mark.asyncio
 async def test_create_user_duplicate_dni(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Ya existe un usuario con el DNI ingresado."""
     with patch(
@@ -157,7 +157,7 @@ async def test_create_user_duplicate_dni(
             AlreadyExistsException, match="Ya existe un usuario con el DNI"
         ):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
     user_controller.person_ms_service.create_or_get_person.assert_not_called()
@@ -165,7 +165,7 @@ async def test_create_user_duplicate_dni(
 
 @pytest.mark.asyncio
 async def test_create_user_duplicate_email(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Ya existe una cuenta registrada con ese correo electrónico."""
     # Email ya existe
@@ -176,7 +176,7 @@ async def test_create_user_duplicate_email(
             AlreadyExistsException, match="Ya existe una cuenta con ese email"
         ):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
     user_controller.person_ms_service.create_or_get_person.assert_not_called()
@@ -184,7 +184,7 @@ async def test_create_user_duplicate_email(
 
 @pytest.mark.asyncio
 async def test_create_user_person_ms_error(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """No se pudo registrar la información personal del usuario."""
     user_controller.account_dao.exists.return_value = False
@@ -195,13 +195,13 @@ async def test_create_user_person_ms_error(
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         with pytest.raises(Exception, match="No se pudo registrar la persona"):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
 
 @pytest.mark.asyncio
 async def test_create_user_unexpected_error(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Ocurrió un error inesperado al crear el usuario."""
     user_controller.account_dao.exists.return_value = False
@@ -213,7 +213,7 @@ async def test_create_user_unexpected_error(
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         with pytest.raises(Exception, match="error inesperado"):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
 
@@ -275,7 +275,11 @@ def test_create_user_invalid_role():
 
 @pytest.mark.asyncio
 async def test_update_user_success(
-    user_controller, mock_db_session, valid_update_payload, mock_user
+    user_controller,
+    mock_db_session,
+    valid_update_payload,
+    mock_user,
+    mock_async_db_session,
 ):
     """Usuario actualizado correctamente."""
     user_controller.user_dao.get_by_id.return_value = mock_user
@@ -293,33 +297,40 @@ async def test_update_user_success(
 
     user_controller.user_dao.update.return_value = updated_user
 
-    result = await user_controller.admin_update_user(
-        db=mock_db_session, payload=valid_update_payload, user_id=1
-    )
+    with patch("app.controllers.user_controller.principal_cache") as cache:
+        result = await user_controller.admin_update_user(
+            db=mock_async_db_session, payload=valid_update_payload, user_id=1
+        )
 
     # Mensaje esperado: "Usuario actualizado correctamente"
     assert result.id == 1
     assert result.full_name == "Juan Carlos Pérez López"
     assert result.is_active is True
     user_controller.user_dao.update.assert_called_once()
+    # El principal en caché lleva nombre y external del usuario
+    cache.invalidate.assert_called_once_with(mock_user.account.id)
 
 
 @pytest.mark.asyncio
 async def test_update_user_not_found(
-    user_controller, mock_db_session, valid_update_payload
+    user_controller, mock_db_session, valid_update_payload, mock_async_db_session
 ):
     """El usuario a actualizar no existe."""
     user_controller.user_dao.get_by_id.return_value = None
 
     with pytest.raises(ValidationException, match="El usuario a actualizar no existe"):
         await user_controller.admin_update_user(
-            db=mock_db_session, payload=valid_update_payload, user_id=999
+            db=mock_async_db_session, payload=valid_update_payload, user_id=999
         )
 
 
 @pytest.mark.asyncio
 async def test_update_user_unexpected_error(
-    user_controller, mock_db_session, valid_update_payload, mock_user
+    user_controller,
+    mock_db_session,
+    valid_update_payload,
+    mock_user,
+    mock_async_db_session,
 ):
     """Ocurrió un error inesperado al actualizar el usuario."""
     user_controller.user_dao.get_by_id.return_value = mock_user
@@ -330,7 +341,7 @@ async def test_update_user_unexpected_error(
 
     with pytest.raises(Exception, match="error inesperado"):
         await user_controller.admin_update_user(
-            db=mock_db_session, payload=valid_update_payload, user_id=1
+            db=mock_async_db_session, payload=valid_update_payload, user_id=1
         )
 
 
@@ -384,7 +395,9 @@ def test_get_all_users_with_filters(user_controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id_success(user_controller, mock_db_session, mock_user):
+async def test_get_user_by_id_success(
+    user_controller, mock_db_session, mock_user, mock_async_db_session
+):
     """Usuario obtenido correctamente."""
     user_controller.user_dao.get_by_id.return_value = mock_user
     user_controller.person_ms_service.get_user_by_identification.return_value = {
@@ -401,7 +414,7 @@ async def test_get_user_by_id_success(user_controller, mock_db_session, mock_use
         },
     }
 
-    result = await user_controller.get_user_by_id(db=mock_db_session, user_id=1)
+    result = await user_controller.get_user_by_id(db=mock_async_db_session, user_id=1)
 
     # Mensaje esperado: "Usuario obtenido correctamente"
     assert result is not None
@@ -411,11 +424,13 @@ async def test_get_user_by_id_success(user_controller, mock_db_session, mock_use
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id_not_found(user_controller, mock_db_session):
+async def test_get_user_by_id_not_found(
+    user_controller, mock_db_session, mock_async_db_session
+):
     """Usuario no encontrado."""
     user_controller.user_dao.get_by_id.return_value = None
 
-    result = await user_controller.get_user_by_id(db=mock_db_session, user_id=999)
+    result = await user_controller.get_user_by_id(db=mock_async_db_session, user_id=999)
 
     # Mensaje esperado: "Usuario no encontrado"
     assert result is None
@@ -423,7 +438,7 @@ async def test_get_user_by_id_not_found(user_controller, mock_db_session):
 
 @pytest.mark.asyncio
 async def test_get_user_by_id_person_not_found(
-    user_controller, mock_db_session, mock_user
+    user_controller, mock_db_session, mock_user, mock_async_db_session
 ):
     """No se encontró la información personal del usuario."""
     user_controller.user_dao.get_by_id.return_value = mock_user
@@ -432,7 +447,7 @@ async def test_get_user_by_id_person_not_found(
     with pytest.raises(
         ValidationException, match="No se encontró la información de la persona"
     ):
-        await user_controller.get_user_by_id(db=mock_db_session, user_id=1)
+        await user_controller.get_user_by_id(db=mock_async_db_session, user_id=1)
 
 
 #  Desactivar usuario
@@ -464,7 +479,9 @@ def test_deactivate_user_not_found(user_controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_dni_invalid_check_digit(user_controller, mock_db_session):
+async def test_dni_invalid_check_digit(
+    user_controller, mock_db_session, mock_async_db_session
+):
     """Debe rechazar DNI con dígito verificador incorrecto."""
     payload = AdminCreateUserRequest(
         first_name="Test",
@@ -480,7 +497,9 @@ async def test_dni_invalid_check_digit(user_controller, mock_db_session):
     user_controller.account_dao.exists.return_value = False
 
     with pytest.raises(ValidationException, match="Dni invalido"):
-        await user_controller.admin_create_user(db=mock_db_session, payload=payload)
+        await user_controller.admin_create_user(
+            db=mock_async_db_session, payload=payload
+        )
 
 
 @pytest.mark.asyncio
@@ -501,7 +520,9 @@ async def test_dni_invalid_province(user_controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_dni_invalid_third_digit(user_controller, mock_db_session):
+async def test_dni_invalid_third_digit(
+    user_controller, mock_db_session, mock_async_db_session
+):
     """Debe rechazar DNI con tercer dígito > 5 (formato inválido)."""
     payload = AdminCreateUserRequest(
         first_name="Test",
@@ -517,7 +538,9 @@ async def test_dni_invalid_third_digit(user_controller, mock_db_session):
     user_controller.account_dao.exists.return_value = False
 
     with pytest.raises(ValidationException, match="Formato de DNI invalido"):
-        await user_controller.admin_create_user(db=mock_db_session, payload=payload)
+        await user_controller.admin_create_user(
+            db=mock_async_db_session, payload=payload
+        )
 
 
 @pytest.mark.asyncio
@@ -539,7 +562,9 @@ async def test_dni_with_letters(user_controller, mock_db_session):
 
 
 @pytest.mark.asyncio
-async def test_dni_province_30_valid(user_controller, mock_db_session):
+async def test_dni_province_30_valid(
+    user_controller, mock_db_session, mock_async_db_session
+):
     """Debe aceptar DNI con provincia 30 (ecuatorianos en el exterior)."""
     payload = AdminCreateUserRequest(
         first_name="Test",
@@ -560,7 +585,9 @@ async def test_dni_province_30_valid(user_controller, mock_db_session):
     )
 
     try:
-        await user_controller.admin_create_user(db=mock_db_session, payload=payload)
+        await user_controller.admin_create_user(
+            db=mock_async_db_session, payload=payload
+        )
     except ValidationException as e:
         # Si falla, debe ser por dígito verificador, no por provincia
         assert "Provincia" not in str(e)
@@ -836,7 +863,7 @@ def test_normalize_role_variations_coach():
 
 @pytest.mark.asyncio
 async def test_normalize_names_whitespace(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Debe normalizar espacios en first_name y last_name."""
     valid_create_payload.first_name = "  Juan  "
@@ -853,7 +880,7 @@ async def test_normalize_names_whitespace(
 
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         _ = await user_controller.admin_create_user(
-            db=mock_db_session, payload=valid_create_payload
+            db=mock_async_db_session, payload=valid_create_payload
         )
 
     call_args = user_controller.person_ms_service.create_or_get_person.call_args
@@ -864,7 +891,7 @@ async def test_normalize_names_whitespace(
 
 @pytest.mark.asyncio
 async def test_normalize_email_to_lowercase(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Debe normalizar email a minúsculas."""
     valid_create_payload.email = "JUAN.PEREZ@EXAMPLE.COM"
@@ -878,7 +905,7 @@ async def test_normalize_email_to_lowercase(
 
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         result = await user_controller.admin_create_user(
-            db=mock_db_session, payload=valid_create_payload
+            db=mock_async_db_session, payload=valid_create_payload
         )
 
     assert result.email == "juan.perez@example.com"
@@ -891,7 +918,11 @@ async def test_normalize_email_to_lowercase(
 
 @pytest.mark.asyncio
 async def test_sync_external_on_update(
-    user_controller, mock_db_session, valid_update_payload, mock_user
+    user_controller,
+    mock_db_session,
+    valid_update_payload,
+    mock_user,
+    mock_async_db_session,
 ):
     """Debe sincronizar el external si el MS lo cambia."""
     new_external = "NEW-EXTERNAL-123456789012345678901234567890"
@@ -910,7 +941,7 @@ async def test_sync_external_on_update(
     user_controller.user_dao.update.return_value = updated_user
 
     await user_controller.admin_update_user(
-        db=mock_db_session, payload=valid_update_payload, user_id=1
+        db=mock_async_db_session, payload=valid_update_payload, user_id=1
     )
 
     call_args = user_controller.user_dao.update.call_args
@@ -920,7 +951,7 @@ async def test_sync_external_on_update(
 
 @pytest.mark.asyncio
 async def test_ms_returns_empty_external(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Debe manejar cuando MS retorna external vacío."""
     user_controller.account_dao.exists.return_value = False
@@ -933,14 +964,14 @@ async def test_ms_returns_empty_external(
 
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         result = await user_controller.admin_create_user(
-            db=mock_db_session, payload=valid_create_payload
+            db=mock_async_db_session, payload=valid_create_payload
         )
     assert result.external == ""
 
 
 @pytest.mark.asyncio
 async def test_ms_identity_validation_failed(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Debe propagar error cuando MS detecta conflicto de identidad."""
     user_controller.account_dao.exists.return_value = False
@@ -953,13 +984,13 @@ async def test_ms_identity_validation_failed(
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         with pytest.raises(ValidationException, match="no coinciden"):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
 
 @pytest.mark.asyncio
 async def test_ms_connection_error(
-    user_controller, mock_db_session, valid_create_payload
+    user_controller, mock_db_session, valid_create_payload, mock_async_db_session
 ):
     """Debe propagar error de conexión con MS."""
     user_controller.account_dao.exists.return_value = False
@@ -970,7 +1001,7 @@ async def test_ms_connection_error(
     with patch("app.controllers.user_controller.validate_dni_not_exists_locally"):
         with pytest.raises(ValidationException, match="comunicación"):
             await user_controller.admin_create_user(
-                db=mock_db_session, payload=valid_create_payload
+                db=mock_async_db_session, payload=valid_create_payload
             )
 
 
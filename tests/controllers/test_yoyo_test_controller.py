@@ -1,7 +1,7 @@
 """Tests unitarios para `YoyoTestController`."""
 
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, Mock
+from unittest.mock import ANY, MagicMock, Mock
 
 import pytest
 from pydantic import ValidationError
@@ -33,6 +33,17 @@ def mock_db():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def record_test_change(monkeypatch):
+    """Aísla las estadísticas: registra las llamadas a `record_test_change`."""
+    recorder = MagicMock()
+    monkeypatch.setattr(
+        "app.controllers.yoyo_test_controller.statistic_controller.record_test_change",
+        recorder,
+    )
+    return recorder
+
+
 @pytest.fixture
 def mock_evaluation():
     """Fixture de una evaluación mock."""
@@ -157,28 +168,21 @@ def test_update_yoyo_test_no_fields_returns_existing(
 
 
 def test_delete_yoyo_test_success(
-    monkeypatch, yoyo_test_controller, mock_db, mock_yoyo_test
+    yoyo_test_controller, mock_db, mock_yoyo_test, record_test_change
 ):
     """Elimina y actualiza estadísticas cuando existe."""
     yoyo_test_controller.yoyo_test_dao.get_by_id.return_value = mock_yoyo_test
     yoyo_test_controller.yoyo_test_dao.delete.return_value = None
 
-    called = {"stats": False}
-
-    def _update_stats(db, athlete_id):
-        called["stats"] = True
-        assert athlete_id == mock_yoyo_test.athlete_id
-
-    monkeypatch.setattr(
-        "app.controllers.yoyo_test_controller.statistic_controller.update_athlete_stats",
-        _update_stats,
-    )
-
     result = yoyo_test_controller.delete_test(mock_db, test_id=2)
 
     assert result is True
     yoyo_test_controller.yoyo_test_dao.delete.assert_called_once_with(mock_db, 2)
-    assert called["stats"] is True
+    record_test_change.assert_called_once_with(
+        mock_db,
+        before=(mock_yoyo_test.athlete_id, mock_yoyo_test.type, ANY),
+        sync=False,
+    )
 
 
 def test_delete_yoyo_test_not_found(yoyo_test_controller, mock_db):
@@ -218,7 +222,7 @@ def test_list_tests_success(yoyo_test_controller, mock_db, mock_yoyo_test):
     mock_limit.all.return_value = [mock_yoyo_test]
 
     filters = YoyoTestFilter(page=1, limit=10)
-    items, total = yoyo_test_controller.list_tests(mock_db, filters)
+    items, total, _ = yoyo_test_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 5
@@ -247,7 +251,7 @@ def test_list_tests_with_filters(yoyo_test_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = YoyoTestFilter(page=1, limit=10, evaluation_id=1, athlete_id=5)
-    items, total = yoyo_test_controller.list_tests(mock_db, filters)
+    items, total, _ = yoyo_test_controller.list_tests(mock_db, filters)
 
     assert items == []
     assert total == 2
@@ -277,7 +281,7 @@ def test_list_tests_with_search(yoyo_test_controller, mock_db, mock_yoyo_test):
     mock_limit.all.return_value = [mock_yoyo_test]
 
     filters = YoyoTestFilter(page=1, limit=10, search="Juan")
-    items, total = yoyo_test_controller.list_tests(mock_db, filters)
+    items, total, _ = yoyo_test_controller.list_tests(mock_db, filters)
 
     assert len(items) == 1
     assert total == 1
@@ -304,7 +308,7 @@ def test_list_tests_with_empty_search(yoyo_test_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = YoyoTestFilter(page=1, limit=10, search="")
-    items, total = yoyo_test_controller.list_tests(mock_db, filters)
+    items, total, _ = yoyo_test_controller.list_tests(mock_db, filters)
 
     assert items == []
     assert total == 5
@@ -334,7 +338,7 @@ def test_list_tests_with_search_no_match(yoyo_test_controller, mock_db):
     mock_limit.all.return_value = []
 
     filters = YoyoTestFilter(page=1, limit=10, search="NoExiste")
-    items, total = yoyo_test_controller.list_tests(mock_db, filters)
+    items, total, _ = yoyo_test_controller.list_tests(mock_db, filters)
 
     assert items == []
 
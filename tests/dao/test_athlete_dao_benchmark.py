@@ -0,0 +1,50 @@
+"""Benchmark de consultas para el listado de atletas (SQLite)."""
+
+import pytest
+
+from app.controllers.athlete_controller import AthleteController
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.user import User
+from app.schemas.athlete_schema import AthleteFilter
+
+
+@pytest.fixture
+def seeded_db(sqlite_db):
+    """60 atletas; los de índice par también son usuarios del sistema."""
+    for i in range(60):
+        dni = f"{1100000000 + i}"
+        sqlite_db.add(
+            Athlete(
+                external_person_id=f"ext-{i}",
+                full_name=f"Atleta {i}",
+                dni=dni,
+                type_athlete="UNL",
+                sex=Sex.FEMALE,
+            )
+        )
+        if i % 2 == 0:
+            sqlite_db.add(User(external=f"user-{i}", full_name=f"U {i}", dni=dni))
+    sqlite_db.commit()
+    return sqlite_db
+
+
+def test_get_all_athletes_has_account_flag(seeded_db):
+    """has_account refleja si existe un usuario con el mismo DNI."""
+    page = AthleteController().get_all_athletes(seeded_db, AthleteFilter(limit=20))
+
+    assert page.total == 60
+    assert len(page.items) == 20
+    for item in page.items:
+        assert item["has_account"] == (int(item["dni"]) % 2 == 0)
+
+
+@pytest.mark.parametrize("limit", [5, 100])
+def test_get_all_athletes_two_queries_per_page(seeded_db, query_counter, limit):
+    """Benchmark: una página cuesta dos consultas (conteo y filas)."""
+    controller = AthleteController()
+
+    with query_counter() as counter:
+        controller.get_all_athletes(seeded_db, AthleteFilter(limit=limit))
+
+    assert counter.count == 2
@@ -0,0 +1,87 @@
+"""Benchmark de consultas para el registro de asistencia en lote (SQLite)."""
+
+from datetime import date
+
+import pytest
+
+from app.controllers.attendance_controller import AttendanceController
+from app.dao.attendance_dao import AttendanceDAO
+from app.models.athlete import Athlete
+from app.models.attendance import Attendance
+from app.models.enums.sex import Sex
+from app.schemas.attendance_schema import AttendanceBulkCreate
+
+
+def _create_squad(db, size: int, offset: int = 0) -> list:
+    """Crea `size` atletas (DNIs a partir de `offset`) y devuelve sus IDs."""
+    squad = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=Sex.MALE,
+        )
+        for i in range(offset, offset + size)
+    ]
+    db.add_all(squad)
+    db.commit()
+    return [a.id for a in squad]
+
+
+def _bulk_payload(athlete_ids: list, present: bool) -> AttendanceBulkCreate:
+    return AttendanceBulkCreate(
+        date=date(2025, 3, 1),
+        time="08:00",
+        records=[{"athlete_id": i, "is_present": present} for i in athlete_ids],
+    )
+
+
+def test_bulk_upsert_returns_created_and_updated(sqlite_db):
+    """El upsert devuelve (creados, actualizados) y deja un registro por atleta."""
+    dao = AttendanceDAO()
+    ids = _create_squad(sqlite_db, 5)
+    day = date(2025, 3, 1)
+
+    first = dao.create_or_update_bulk(
+        sqlite_db, day, "08:00", "1150696977", [{"athlete_id": i} for i in ids[:3]]
+    )
+    second = dao.create_or_update_bulk(
+        sqlite_db,
+        day,
+        "09:00",
+        "1150696977",
+        [{"athlete_id": i, "is_present": False} for i in ids],
+    )
+
+    assert first == (3, 0)
+    assert second == (2, 3)
+    rows = sqlite_db.query(Attendance).all()
+    assert len(rows) == 5
+    assert {r.time for r in rows} == {"09:00"}
+    assert not any(r.is_present for r in rows)
+
+
+@pytest.mark.parametrize("present", [True, False])
+def test_bulk_query_count_constant_in_squad_size(sqlite_db, query_counter, present):
+    """Benchmark: registrar 10 o 200 atletas emite el mismo número de consultas."""
+    controller = AttendanceController()
+    small_squad = _create_squad(sqlite_db, 10)
+    large_squad = _create_squad(sqlite_db, 200, offset=10)
+
+    counts = {}
+    for label, ids in (("small", small_squad), ("large", large_squad)):
+        # Primera pasada crea, segunda actualiza
+        sqlite_db.query(Attendance).delete()
+        sqlite_db.commit()
+        with query_counter() as create_counter:
+            controller.create_bulk_attendance(
+                sqlite_db, _bulk_payload(ids, present), "1150696977"
+            )
+        with query_counter() as update_counter:
+            controller.create_bulk_attendance(
+                sqlite_db, _bulk_payload(ids, not present), "1150696977"
+            )
+        counts[label] = (create_counter.count, update_counter.count)
+
+    assert counts["small"] == counts["large"]
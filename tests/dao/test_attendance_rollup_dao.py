@@ -0,0 +1,293 @@
+"""Tests de `attendance_daily_rollup` sobre SQLite en memoria."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.dao.attendance_dao import AttendanceDAO
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.attendance_daily_rollup import AttendanceDailyRollup
+from app.models.enums.sex import Sex
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def athletes(sqlite_db):
+    """Plantel de atletas de dos tipos y ambos sexos."""
+    squad = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL" if i % 2 else "EXTERNOS",
+            sex=Sex.MALE if i % 3 else Sex.FEMALE,
+        )
+        for i in range(12)
+    ]
+    sqlite_db.add_all(squad)
+    sqlite_db.commit()
+    return squad
+
+
+def _mark_days(db, athletes, days: int, start: date = date(2025, 1, 1)):
+    """Registra asistencia diaria del plantel durante `days` días."""
+    dao = AttendanceDAO()
+    for offset in range(days):
+        dao.create_or_update_bulk(
+            db,
+            target_date=start + timedelta(days=offset),
+            time_str="08:00",
+            user_dni="1150696977",
+            records=[
+                {"athlete_id": a.id, "is_present": (a.id + offset) % 4 != 0}
+                for a in athletes
+            ],
+        )
+
+
+# ==============================================
+# TESTS: MANTENIMIENTO INCREMENTAL
+# ==============================================
+
+
+def test_bulk_write_maintains_rollup(sqlite_db, athletes):
+    """Cada registro en lote deja el resumen del día alineado."""
+    dao = AttendanceDAO()
+    day = date(2025, 3, 1)
+
+    dao.create_or_update_bulk(
+        sqlite_db,
+        target_date=day,
+        time_str="08:00",
+        user_dni="1150696977",
+        records=[{"athlete_id": a.id, "is_present": True} for a in athletes],
+    )
+    assert dao.get_attendance_summary_by_date(sqlite_db, day) == {
+        "total": 12,
+        "present": 12,
+        "absent": 0,
+    }
+
+    # Re-registrar el día con menos atletas y algunos ausentes
+    dao.create_or_update_bulk(
+        sqlite_db,
+        target_date=day,
+        time_str="09:00",
+        user_dni="1150696977",
+        records=[
+            {"athlete_id": a.id, "is_present": i % 2 == 0}
+            for i, a in enumerate(athletes[:6])
+        ],
+    )
+    assert dao.get_attendance_summary_by_date(sqlite_db, day) == {
+        "total": 6,
+        "present": 3,
+        "absent": 3,
+    }
+    assert dao.get_existing_dates(sqlite_db) == [day]
+
+
+def test_rebuild_matches_incremental(sqlite_db, athletes):
+    """La reconstrucción completa produce los mismos conteos."""
+    _mark_days(sqlite_db, athletes, days=5)
+
+    def snapshot():
+        return sorted(
+            (r.day, r.type_athlete, r.sex.value, r.total, r.present, r.absent)
+            for r in sqlite_db.query(AttendanceDailyRollup).all()
+        )
+
+    incremental = snapshot()
+    days = AttendanceRollupDAO().rebuild(sqlite_db)
+
+    assert days == 5
+    assert snapshot() == incremental
+
+
+def test_refresh_day_from_two_sessions(sqlite_engine, sqlite_db, athletes):
+    """Dos transacciones que recalculan el mismo día no chocan en la clave única.
+
+    Ninguna ve las filas de la otra antes de escribir, como dos registros en
+    lote concurrentes del mismo día.
+    """
+    day = date(2025, 1, 2)
+    _mark_days(sqlite_db, athletes, days=2)
+    rollup_dao = AttendanceRollupDAO()
+    make_session = sessionmaker(bind=sqlite_engine, autoflush=False)
+    first, second = make_session(), make_session()
+
+    sqlite_db.query(AttendanceDailyRollup).filter(
+        AttendanceDailyRollup.day == day
+    ).delete(synchronize_session=False)
+    sqlite_db.commit()
+
+    rollup_dao.refresh_day(first, day)
+    rollup_dao.refresh_day(second, day)
+    first.flush()
+    second.flush()
+    first.commit()
+    second.commit()
+    first.close()
+    second.close()
+
+    rows = (
+        sqlite_db.query(AttendanceDailyRollup)
+        .filter(AttendanceDailyRollup.day == day)
+        .all()
+    )
+    assert len(rows) == len({(r.type_athlete, r.sex) for r in rows})
+    assert sum(r.total for r in rows) == len(athletes)
+    assert AttendanceDAO().get_attendance_summary_by_date(sqlite_db, day) == {
+        "total": 12,
+        "present": sum((a.id + 1) % 4 != 0 for a in athletes),
+        "absent": sum((a.id + 1) % 4 == 0 for a in athletes),
+    }
+
+
+def test_refresh_day_drops_groups_without_attendance(sqlite_db, athletes):
+    """Un grupo que ya no tiene asistencias ese día sale del resumen."""
+    dao = AttendanceDAO()
+    day = date(2025, 3, 1)
+    records = [{"athlete_id": a.id, "is_present": True} for a in athletes]
+    dao.create_or_update_bulk(
+        sqlite_db,
+        target_date=day,
+        time_str="08:00",
+        user_dni="1150696977",
+        records=records,
+    )
+    unl_only = [
+        r for r, a in zip(records, athletes, strict=True) if a.type_athlete == "UNL"
+    ]
+    dao.create_or_update_bulk(
+        sqlite_db,
+        target_date=day,
+        time_str="09:00",
+        user_dni="1150696977",
+        records=unl_only,
+    )
+
+    types = {
+        r.type_athlete
+        for r in sqlite_db.query(AttendanceDailyRollup)
+        .filter(AttendanceDailyRollup.day == day)
+        .all()
+    }
+    assert types == {"UNL"}
+
+
+# ==============================================
+# TESTS: LECTURAS DESDE EL RESUMEN
+# ==============================================
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"type_athlete": "UNL"},
+        {"sex": "FEMALE"},
+        {"start_date": date(2025, 1, 3), "end_date": date(2025, 1, 6)},
+    ],
+)
+def test_attendance_stats_rollup_matches_records(sqlite_db, athletes, filters):
+    """Las estadísticas desde el resumen coinciden con las calculadas en crudo."""
+    _mark_days(sqlite_db, athletes, days=8)
+    dao = StatisticDAO()
+
+    from_rollup = dao.get_attendance_stats(sqlite_db, use_rollup=True, **filters)
+    from_records = dao.get_attendance_stats(sqlite_db, use_rollup=False, **filters)
+
+    from_rollup["attendance_by_type"].sort(key=lambda r: r["type_athlete"])
+    from_records["attendance_by_type"].sort(key=lambda r: r["type_athlete"])
+    assert from_rollup == from_records
+
+
+def test_attendance_stats_query_count_independent_of_history(
+    sqlite_db, athletes, query_counter
+):
+    """Benchmark: las lecturas cuestan igual con 3 o 30 días de historial."""
+    dao = StatisticDAO()
+    attendance_dao = AttendanceDAO()
+
+    _mark_days(sqlite_db, athletes, days=3)
+    with query_counter() as short_history:
+        dao.get_attendance_stats(sqlite_db)
+        attendance_dao.get_attendance_summary_by_date(sqlite_db, date(2025, 1, 2))
+        attendance_dao.get_existing_dates(sqlite_db)
+
+    _mark_days(sqlite_db, athletes, days=30, start=date(2025, 2, 1))
+    with query_counter() as long_history:
+        dao.get_attendance_stats(sqlite_db)
+        attendance_dao.get_attendance_summary_by_date(sqlite_db, date(2025, 1, 2))
+        attendance_dao.get_existing_dates(sqlite_db)
+
+    assert short_history.count == long_history.count
+
+
+# ==============================================
+# TESTS: TABLA SIN POBLAR
+# ==============================================
+
+
+def _clear_rollup(db):
+    """Simula asistencias registradas antes de existir el resumen."""
+    db.query(AttendanceDailyRollup).delete()
+    db.commit()
+
+
+def test_reads_fall_back_to_records_until_populated(sqlite_db, athletes):
+    """Sin resumen, las lecturas coinciden con las calculadas en crudo."""
+    _mark_days(sqlite_db, athletes, days=4)
+    expected_stats = StatisticDAO().get_attendance_stats(sqlite_db)
+    attendance_dao = AttendanceDAO()
+    expected_summary = attendance_dao.get_attendance_summary_by_date(
+        sqlite_db, date(2025, 1, 2)
+    )
+    _clear_rollup(sqlite_db)
+
+    assert not AttendanceRollupDAO().is_populated(sqlite_db)
+    assert StatisticDAO().get_attendance_stats(sqlite_db) == expected_stats
+    assert (
+        attendance_dao.get_attendance_summary_by_date(sqlite_db, date(2025, 1, 2))
+        == expected_summary
+    )
+    assert attendance_dao.get_existing_dates(sqlite_db) == [
+        date(2025, 1, 4),
+        date(2025, 1, 3),
+        date(2025, 1, 2),
+        date(2025, 1, 1),
+    ]
+
+
+def test_first_write_rebuilds_empty_rollup(sqlite_db, athletes):
+    """La primera escritura sobre un resumen vacío incluye el historial."""
+    _mark_days(sqlite_db, athletes, days=3)
+    _clear_rollup(sqlite_db)
+
+    _mark_days(sqlite_db, athletes, days=1, start=date(2025, 2, 1))
+
+    assert AttendanceRollupDAO().get_dates(sqlite_db) == [
+        date(2025, 2, 1),
+        date(2025, 1, 3),
+        date(2025, 1, 2),
+        date(2025, 1, 1),
+    ]
+
+
+def test_backfill_if_empty(sqlite_db, athletes):
+    """El backfill de arranque solo reconstruye un resumen vacío."""
+    dao = AttendanceRollupDAO()
+    _mark_days(sqlite_db, athletes, days=3)
+
+    assert dao.backfill_if_empty(sqlite_db) == 0
+
+    _clear_rollup(sqlite_db)
+    assert dao.backfill_if_empty(sqlite_db) == 3
+    assert dao.is_populated(sqlite_db)
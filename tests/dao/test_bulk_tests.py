@@ -0,0 +1,188 @@
+"""Tests del registro en lote de tests de una evaluación (SQLite)."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.controllers.sprint_test_controller import SprintTestController
+from app.controllers.test_controller import TestController
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.statistic import Statistic
+from app.models.technical_assessment import TechnicalAssessment
+from app.models.test import Test
+from app.models.user import User
+from app.schemas.sprint_test_schema import CreateSprintTestSchema
+from app.schemas.test_base_schema import BulkCreateTestsSchema
+from app.utils.exceptions import NotFoundException, ValidationException
+
+TEST_DATE = "2025-01-10T10:00:00"
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def squad(sqlite_db):
+    """40 atletas con su registro Statistic y una evaluación."""
+    athletes = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=Sex.MALE,
+        )
+        for i in range(40)
+    ]
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add_all([*athletes, user])
+    sqlite_db.flush()
+    sqlite_db.add_all([Statistic(athlete_id=a.id) for a in athletes])
+    evaluation = Evaluation(
+        date=datetime(2025, 1, 10), time="10:00", name="Eval", user_id=user.id
+    )
+    sqlite_db.add(evaluation)
+    sqlite_db.commit()
+    return sqlite_db, [a.id for a in athletes], evaluation.id
+
+
+def _results(athlete_id: int) -> list[dict]:
+    """Los cuatro resultados de un atleta en la evaluación."""
+    common = {"athlete_id": athlete_id, "date": TEST_DATE}
+    return [
+        {
+            "test_type": "sprint_test",
+            "distance_meters": 30,
+            "time_0_10_s": 1.8,
+            "time_0_30_s": 5.0,
+            **common,
+        },
+        {
+            "test_type": "yoyo_test",
+            "shuttle_count": 48,
+            "final_level": "16.3",
+            "failures": 2,
+            **common,
+        },
+        {
+            "test_type": "endurance_test",
+            "min_duration": 12,
+            "total_distance_m": 2400.0,
+            **common,
+        },
+        {"test_type": "technical_assessment", "ball_control": "Good", **common},
+    ]
+
+
+# ==============================================
+# TESTS: ALTA EN LOTE
+# ==============================================
+
+
+def test_bulk_create_mixed_types(squad):
+    """Crea todos los tipos, devuelve los IDs en orden y actualiza estadísticas."""
+    db, athlete_ids, evaluation_id = squad
+    rows = _results(athlete_ids[0]) + _results(athlete_ids[1])
+
+    result = TestController().bulk_create_tests(
+        db, evaluation_id, BulkCreateTestsSchema(tests=rows)
+    )
+
+    assert result["created"] == 8
+    assert result["by_type"] == {
+        "sprint_test": 2,
+        "yoyo_test": 2,
+        "endurance_test": 2,
+        "technical_assessment": 2,
+    }
+    tests = {t.id: t for t in db.query(Test).all()}
+    assert [tests[i].type for i in result["test_ids"]] == [
+        row["test_type"] for row in rows
+    ]
+    assert [tests[i].athlete_id for i in result["test_ids"]] == [
+        row["athlete_id"] for row in rows
+    ]
+    technical = db.get(TechnicalAssessment, result["test_ids"][3])
+    assert technical.evaluation_id == evaluation_id
+    assert technical.ball_control.value == "Good"
+    assert StatisticDAO().reconcile_test_totals(db, repair=False) == []
+    assert StatisticDAO().get_athlete_statistic(db, athlete_ids[0]).speed == 75.0
+
+
+def test_bulk_create_reports_row_errors_and_writes_nothing(squad):
+    """Las filas inválidas se informan por índice y campo; no se inserta nada."""
+    db, athlete_ids, evaluation_id = squad
+    rows = _results(athlete_ids[0])
+    rows[0]["time_0_30_s"] = 1.0  # menor que 0-10m
+    rows[1]["shuttle_count"] = "muchos"
+    rows[2]["athlete_id"] = 999
+    rows[3]["test_type"] = "penalty_test"
+
+    with pytest.raises(ValidationException) as exc_info:
+        TestController().bulk_create_tests(
+            db, evaluation_id, BulkCreateTestsSchema(tests=rows)
+        )
+
+    errors = exc_info.value.errors
+    assert set(errors) == {
+        "tests.0",
+        "tests.1.shuttle_count",
+        "tests.2.athlete_id",
+        "tests.3.test_type",
+    }
+    assert errors["tests.2.athlete_id"] == ["El atleta con ID 999 no existe"]
+    assert exc_info.value.message.startswith("4 de 4 tests")
+    assert db.query(Test).count() == 0
+
+
+def test_bulk_create_unknown_evaluation(squad):
+    db, athlete_ids, _ = squad
+
+    with pytest.raises(NotFoundException):
+        TestController().bulk_create_tests(
+            db, 999, BulkCreateTestsSchema(tests=_results(athlete_ids[0]))
+        )
+
+
+# ==============================================
+# BENCHMARK: 40 ATLETAS X 4 TESTS
+# ==============================================
+
+
+def test_bulk_evaluation_upload_one_commit(squad, sqlite_engine, query_counter):
+    """Benchmark: la carga de 160 tests hace un commit de tests (más uno de
+    estadísticas) frente a dos por test con el alta individual."""
+    db, athlete_ids, evaluation_id = squad
+    commits = []
+    event.listen(sqlite_engine, "commit", lambda conn: commits.append(1))
+    rows = [row for athlete_id in athlete_ids for row in _results(athlete_id)]
+
+    with query_counter() as bulk:
+        TestController().bulk_create_tests(
+            db, evaluation_id, BulkCreateTestsSchema(tests=rows)
+        )
+    bulk_commits = len(commits)
+
+    commits.clear()
+    with query_counter() as single:
+        for athlete_id in athlete_ids[:10]:
+            SprintTestController().add_test(
+                db,
+                CreateSprintTestSchema(
+                    date=TEST_DATE,
+                    athlete_id=athlete_id,
+                    evaluation_id=evaluation_id,
+                    distance_meters=30,
+                    time_0_10_s=1.8,
+                    time_0_30_s=5.0,
+                ),
+            )
+    per_test = single.count / 10
+
+    assert bulk_commits == 2
+    assert bulk.count < per_test * 160 / 3
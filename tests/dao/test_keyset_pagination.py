@@ -0,0 +1,209 @@
+"""Tests de paginación por cursor (keyset) sobre SQLite en memoria."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.controllers.athlete_controller import AthleteController
+from app.controllers.evaluation_controller import EvaluationController
+from app.dao.athlete_dao import AthleteDAO
+from app.dao.attendance_dao import AttendanceDAO
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.user import User
+from app.schemas.athlete_schema import AthleteFilter
+from app.schemas.evaluation_schema import EvaluationFilter
+from app.utils.exceptions import ValidationException
+
+DAY = date(2025, 3, 1)
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def seeded_db(sqlite_db):
+    """45 atletas con nombres repetidos, su asistencia de un día y 25
+    evaluaciones que comparten fecha de a cinco."""
+    athletes = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i % 9}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=Sex.MALE,
+        )
+        for i in range(45)
+    ]
+    sqlite_db.add_all(athletes)
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add(user)
+    sqlite_db.commit()
+
+    for i in range(25):
+        sqlite_db.add(
+            Evaluation(
+                date=datetime(2025, 1, 1) + timedelta(days=i // 5),
+                time="10:00",
+                name=f"Eval {i}",
+                user_id=user.id,
+            )
+        )
+    sqlite_db.commit()
+
+    AttendanceDAO().create_or_update_bulk(
+        sqlite_db, DAY, "08:00", "1150696977", [{"athlete_id": a.id} for a in athletes]
+    )
+    return sqlite_db
+
+
+def _walk(fetch_page):
+    """Recorre todas las páginas siguiendo `next_cursor`."""
+    pages, cursor = [], None
+    while True:
+        items, total, cursor = fetch_page(cursor)
+        pages.append((items, total))
+        if cursor is None:
+            return pages
+
+
+# ==============================================
+# TESTS: RECORRIDO COMPLETO
+# ==============================================
+
+
+def test_athlete_cursor_walk_matches_offset_order(seeded_db):
+    """El recorrido por cursor devuelve los mismos atletas y orden que OFFSET."""
+    dao = AthleteDAO()
+
+    pages = _walk(
+        lambda cursor: dao.get_all_with_account_flag(
+            seeded_db, AthleteFilter(pagination="cursor", cursor=cursor, limit=10)
+        )
+    )
+    by_cursor = [athlete.id for items, _ in pages for athlete, _ in items]
+    by_offset, _, _ = dao.get_all_with_account_flag(seeded_db, AthleteFilter(limit=100))
+
+    assert len(pages) == 5
+    assert {total for _, total in pages} == {45}
+    assert by_cursor == [athlete.id for athlete, _ in by_offset]
+
+
+def test_attendance_cursor_breaks_ties_by_id(seeded_db):
+    """Con nombres repetidos, el desempate por ID no pierde ni repite filas."""
+    dao = AttendanceDAO()
+
+    pages = _walk(
+        lambda cursor: dao.get_by_date(
+            seeded_db, DAY, keyset=True, cursor=cursor, limit=7, count="none"
+        )
+    )
+    rows = [(a.athlete.full_name, a.id) for items, _ in pages for a in items]
+
+    assert len(rows) == 45
+    assert rows == sorted(rows)
+    assert {total for _, total in pages} == {None}
+
+
+def test_evaluation_cursor_on_shared_dates(seeded_db):
+    """Evaluaciones con la misma fecha se recorren completas (orden descendente)."""
+    controller = EvaluationController()
+
+    pages = _walk(
+        lambda cursor: controller.list_evaluations_paginated(
+            seeded_db, EvaluationFilter(pagination="cursor", cursor=cursor, limit=4)
+        )
+    )
+    rows = [(e.date, e.id) for items, _ in pages for e in items]
+
+    assert len(rows) == 25
+    assert rows == sorted(rows, reverse=True)
+
+
+# ==============================================
+# TESTS: CONTEO Y CURSORES INVÁLIDOS
+# ==============================================
+
+
+def test_count_modes(seeded_db, query_counter):
+    """ "none" omite la consulta de conteo; "estimate" en SQLite usa el exacto."""
+    dao = AthleteDAO()
+
+    with query_counter() as counter:
+        _, total, _ = dao.get_all_with_account_flag(
+            seeded_db, AthleteFilter(pagination="cursor", count="none")
+        )
+    assert total is None
+    assert counter.count == 1
+
+    _, total, _ = dao.get_all_with_account_flag(
+        seeded_db, AthleteFilter(pagination="cursor", count="estimate")
+    )
+    assert total == 45
+
+
+@pytest.mark.parametrize("cursor", ["basura", "eyJrIjogImlkIn0"])
+def test_invalid_cursor_raises_validation(seeded_db, cursor):
+    """Un cursor corrupto o de otro listado se rechaza como error de validación."""
+    with pytest.raises(ValidationException):
+        AttendanceDAO().get_by_date(seeded_db, DAY, cursor=cursor)
+
+
+def test_cursor_from_other_listing_is_rejected(seeded_db):
+    """Un cursor de atletas (orden por ID) no sirve para asistencias (por nombre)."""
+    _, _, cursor = AthleteDAO().get_all_with_account_flag(
+        seeded_db, AthleteFilter(pagination="cursor", limit=5)
+    )
+
+    with pytest.raises(ValidationException):
+        AttendanceDAO().get_by_date(seeded_db, DAY, cursor=cursor)
+
+
+def test_search_page_walks_all_rows(seeded_db):
+    """`BaseDAO.search_page` recorre todos los registros filtrados."""
+    dao = AthleteDAO()
+
+    pages = _walk(
+        lambda cursor: dao.search_page(
+            seeded_db,
+            filters={"full_name": "Atleta 3"},
+            order_by="dni",
+            limit=2,
+            cursor=cursor,
+        )
+    )
+    dnis = [a.dni for items, _ in pages for a in items]
+
+    assert len(dnis) == 5
+    assert dnis == sorted(dnis)
+
+
+# ==============================================
+# BENCHMARK: PÁGINA PROFUNDA VS PRIMERA PÁGINA
+# ==============================================
+
+
+def test_deep_page_costs_same_as_first(seeded_db, query_counter):
+    """Benchmark: la última página por cursor cuesta lo mismo que la primera."""
+    controller = AthleteController()
+
+    with query_counter() as first:
+        page = controller.get_all_athletes(
+            seeded_db, AthleteFilter(pagination="cursor", limit=5)
+        )
+    cursor = page.next_cursor
+    for _ in range(7):
+        page = controller.get_all_athletes(
+            seeded_db, AthleteFilter(cursor=cursor, limit=5)
+        )
+        cursor = page.next_cursor
+    with query_counter() as deep:
+        last = controller.get_all_athletes(
+            seeded_db, AthleteFilter(cursor=cursor, limit=5)
+        )
+
+    assert len(last.items) == 5
+    assert last.next_cursor is None
+    assert first.count == deep.count == 2
@@ -0,0 +1,228 @@
+"""Tests de la exportación de registros crudos (modo raw) sobre SQLite."""
+
+import csv
+import tracemalloc
+from datetime import date, datetime, timedelta
+from io import BytesIO, StringIO
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy import insert
+
+from app.controllers.report_controller import ReportController
+from app.dao.attendance_dao import AttendanceDAO
+from app.models.athlete import Athlete
+from app.models.attendance import Attendance
+from app.models.enums.scale import Scale
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.sprint_test import SprintTest
+from app.models.technical_assessment import TechnicalAssessment
+from app.models.user import User
+from app.schemas.report_schema import ReportFilter
+from app.services.report_service import ReportService
+from app.utils.exceptions import ValidationException
+
+FIRST_DAY = date(2025, 3, 1)
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+def _seed(db, days: int) -> list:
+    """Dos atletas (hombre y mujer) con asistencia diaria y un sprint por día;
+    el primero además tiene una evaluación técnica."""
+    athletes = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=sex,
+        )
+        for i, sex in enumerate((Sex.MALE, Sex.FEMALE))
+    ]
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    db.add_all([*athletes, user])
+    db.flush()
+    evaluation = Evaluation(
+        date=datetime(2025, 3, 1), time="10:00", name="Eval marzo", user_id=user.id
+    )
+    db.add(evaluation)
+    db.flush()
+
+    attendance_dao = AttendanceDAO()
+    for day in range(days):
+        current = FIRST_DAY + timedelta(days=day)
+        attendance_dao.create_or_update_bulk(
+            db, current, "08:00", "1150696977", [{"athlete_id": a.id} for a in athletes]
+        )
+        db.add_all(
+            SprintTest(
+                date=datetime.combine(current, datetime.min.time()),
+                distance_meters=30,
+                time_0_10_s=1.8,
+                time_0_30_s=4.0 + day % 10 / 10,
+                evaluation_id=evaluation.id,
+                athlete_id=athlete.id,
+            )
+            for athlete in athletes
+        )
+    db.add(
+        TechnicalAssessment(
+            date=datetime(2025, 3, 1),
+            ball_control=Scale.GOOD,
+            evaluation_id=evaluation.id,
+            athlete_id=athletes[0].id,
+        )
+    )
+    db.commit()
+    return [a.id for a in athletes]
+
+
+@pytest.fixture
+def seeded_db(sqlite_db):
+    _seed(sqlite_db, 3)
+    return sqlite_db
+
+
+def _export(db, **filters) -> bytes:
+    chunks = ReportService().stream_raw_report(db, ReportFilter(mode="raw", **filters))
+    return b"".join(chunks)
+
+
+def _csv_rows(content: bytes) -> list:
+    return list(csv.DictReader(StringIO(content.decode("utf-8-sig"))))
+
+
+# ==============================================
+# TESTS: CONTENIDO
+# ==============================================
+
+
+def test_attendance_csv_has_one_row_per_record(seeded_db):
+    """El CSV de asistencia trae un registro por atleta y día."""
+    rows = _csv_rows(_export(seeded_db, report_type="attendance", format="csv"))
+
+    assert len(rows) == 6
+    assert {row["Tipo"] for row in rows} == {"Asistencia"}
+    assert {row["Athlete Dni"] for row in rows} == {"1100000000", "1100000001"}
+    assert {row["Is Present"] for row in rows} == {"True"}
+
+
+def test_tests_csv_merges_test_types(seeded_db):
+    """Los tests comparten un CSV con la unión de columnas y la evaluación."""
+    rows = _csv_rows(_export(seeded_db, report_type="tests", format="csv"))
+
+    by_type = {}
+    for row in rows:
+        by_type.setdefault(row["Tipo"], []).append(row)
+    assert {name: len(items) for name, items in by_type.items()} == {
+        "Sprint": 6,
+        "Técnica": 1,
+    }
+    assert by_type["Técnica"][0]["Ball Control"] == "Good"
+    assert by_type["Técnica"][0]["Time 0 30 S"] == ""
+    assert {row["Evaluation"] for row in rows} == {"Eval marzo"}
+
+
+def test_tests_xlsx_has_one_sheet_per_type(seeded_db):
+    """El XLSX tiene una hoja por tipo de test con su encabezado."""
+    content = _export(seeded_db, report_type="tests", format="xlsx")
+
+    workbook = load_workbook(BytesIO(content), read_only=True)
+    assert workbook.sheetnames == ["Sprint", "Yoyo", "Resistencia", "Técnica"]
+    sprint = list(workbook["Sprint"].values)
+    assert sprint[0][:3] == ("Date", "Athlete Name", "Athlete Dni")
+    assert len(sprint) == 7
+    assert len(list(workbook["Yoyo"].values)) == 1
+
+
+def test_filters_by_scope_and_inclusive_dates(seeded_db):
+    """Sexo y rango de fechas (fin inclusivo) se aplican en la consulta."""
+    rows = _csv_rows(
+        _export(
+            seeded_db,
+            report_type="attendance",
+            format="csv",
+            sex="FEMALE",
+            start_date=FIRST_DAY + timedelta(days=1),
+            end_date=FIRST_DAY + timedelta(days=2),
+        )
+    )
+
+    assert len(rows) == 2
+    assert {row["Athlete Name"] for row in rows} == {"Atleta 1"}
+
+
+def test_statistics_raw_is_rejected(seeded_db):
+    """Las estadísticas no tienen registros crudos que exportar."""
+    with pytest.raises(ValidationException):
+        ReportController().generate_report(
+            seeded_db,
+            ReportFilter(report_type="statistics", format="csv", mode="raw"),
+            user_name="Coach",
+        )
+
+
+def test_raw_pdf_is_invalid():
+    """El modo raw solo admite xlsx y csv."""
+    with pytest.raises(ValueError):
+        ReportFilter(report_type="tests", format="pdf", mode="raw")
+
+
+# ==============================================
+# BENCHMARK: MEMORIA CONSTANTE
+# ==============================================
+
+
+def _add_attendance(db, athlete_ids: list, days: int) -> None:
+    """Inserta en bloque `days` días de asistencia para los atletas dados."""
+    db.execute(
+        insert(Attendance),
+        [
+            {
+                "date": datetime.combine(FIRST_DAY, datetime.min.time())
+                + timedelta(days=day),
+                "time": "08:00",
+                "is_present": day % 3 != 0,
+                "justification": None if day % 3 else "Lesión",
+                "user_dni": "1150696977",
+                "athlete_id": athlete_id,
+            }
+            for athlete_id in athlete_ids
+            for day in range(days)
+        ],
+    )
+    db.commit()
+
+
+def _peak_memory(db, fmt: str) -> tuple:
+    """Bytes exportados y pico de memoria durante la exportación."""
+    tracemalloc.start()
+    size = 0
+    for chunk in ReportService().stream_raw_report(
+        db, ReportFilter(report_type="attendance", format=fmt, mode="raw")
+    ):
+        size += len(chunk)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, peak
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_export_memory_does_not_grow_with_rows(sqlite_db, fmt):
+    """Benchmark: exportar 5x más filas no multiplica el pico de memoria."""
+    athlete_ids = _seed(sqlite_db, 0)
+    _peak_memory(sqlite_db, fmt)  # calentamiento (imports y cachés)
+
+    results = {}
+    for label, days in (("small", 1000), ("large", 4000)):
+        _add_attendance(sqlite_db, athlete_ids, days)
+        results[label] = _peak_memory(sqlite_db, fmt)
+        sqlite_db.query(Attendance).delete()
+        sqlite_db.commit()
+
+    assert results["large"][0] > 3 * results["small"][0]
+    assert results["large"][1] < 1.5 * results["small"][1]
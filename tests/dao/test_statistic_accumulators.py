@@ -0,0 +1,210 @@
+"""Tests de los acumulados incrementales de `statistics` (SQLite)."""
+
+from datetime import datetime
+
+import pytest
+
+from app.controllers.endurance_test_controller import EnduranceTestController
+from app.controllers.sprint_test_controller import SprintTestController
+from app.controllers.statistic_controller import statistic_controller
+from app.controllers.technical_assessment_controller import (
+    TechnicalAssessmentController,
+)
+from app.controllers.yoyo_test_controller import YoyoTestController
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.enums.scale import Scale
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.statistic import Statistic
+from app.models.user import User
+from app.schemas.sprint_test_schema import (
+    CreateSprintTestSchema,
+    UpdateSprintTestSchema,
+)
+from app.schemas.technical_assessment_schema import CreateTechnicalAssessmentSchema
+from app.schemas.yoyo_test_schema import CreateYoyoTestSchema
+
+TEST_DATE = datetime(2025, 1, 10, 10, 0)
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def club(sqlite_db):
+    """Dos atletas con su registro Statistic y una evaluación."""
+    athletes = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=Sex.MALE,
+        )
+        for i in range(2)
+    ]
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add_all([*athletes, user])
+    sqlite_db.flush()
+    sqlite_db.add_all([Statistic(athlete_id=a.id) for a in athletes])
+    evaluation = Evaluation(date=TEST_DATE, time="10:00", name="Eval", user_id=user.id)
+    sqlite_db.add(evaluation)
+    sqlite_db.commit()
+    return sqlite_db, [a.id for a in athletes], evaluation.id
+
+
+def _add_sprint(db, athlete_id, evaluation_id, time_0_30_s):
+    return SprintTestController().add_test(
+        db,
+        CreateSprintTestSchema(
+            date=TEST_DATE,
+            athlete_id=athlete_id,
+            evaluation_id=evaluation_id,
+            distance_meters=30,
+            time_0_10_s=1.8,
+            time_0_30_s=time_0_30_s,
+        ),
+    )
+
+
+def _aggregate_stats(db, athlete_id) -> dict:
+    """Estadísticas físicas con la agregación completa (AVG/COUNT)."""
+    dao = StatisticDAO()
+    sprint = dao.get_sprint_avg_time(db, athlete_id)
+    yoyo = dao.get_yoyo_avg_shuttles(db, athlete_id)
+    endurance = dao.get_endurance_avg_distance(db, athlete_id)
+    technical = dao.get_technical_count(db, athlete_id)
+    stamina = []
+    if yoyo is not None:
+        stamina.append(min(100, max(0, 30 + (yoyo - 20) * 1.17)))
+    if endurance is not None:
+        stamina.append(min(100, max(0, 30 + (endurance - 1000) * 0.035)))
+    return {
+        "speed": (
+            round(max(0, min(100, 100 - ((sprint - 4) * 25))), 1)
+            if sprint is not None
+            else None
+        ),
+        "stamina": round(sum(stamina) / len(stamina), 1) if stamina else None,
+        "agility": min(100, technical * 10) if technical else None,
+    }
+
+
+def _stored_stats(db, athlete_id) -> dict:
+    statistic = StatisticDAO().get_athlete_statistic(db, athlete_id)
+    db.refresh(statistic)
+    return {
+        "speed": statistic.speed,
+        "stamina": statistic.stamina,
+        "agility": statistic.agility,
+    }
+
+
+# ==============================================
+# TESTS: MANTENIMIENTO INCREMENTAL
+# ==============================================
+
+
+def test_create_update_delete_keep_stats_exact(club):
+    """Altas, ediciones (incluido cambio de atleta) y bajas dejan los mismos
+    valores que la agregación completa, sin derivas."""
+    db, (first, second), evaluation_id = club
+    sprint = SprintTestController()
+
+    tests = [_add_sprint(db, first, evaluation_id, t) for t in (4.2, 5.0, 6.1)]
+    YoyoTestController().add_test(
+        db,
+        CreateYoyoTestSchema(
+            date=TEST_DATE,
+            athlete_id=first,
+            evaluation_id=evaluation_id,
+            shuttle_count=48,
+            final_level="16.3",
+            failures=2,
+        ),
+    )
+    EnduranceTestController().add_test(
+        db,
+        evaluation_id=evaluation_id,
+        athlete_id=first,
+        date=TEST_DATE,
+        min_duration=12,
+        total_distance_m=2400.0,
+    )
+    TechnicalAssessmentController().add_test(
+        db,
+        CreateTechnicalAssessmentSchema(
+            date=TEST_DATE,
+            athlete_id=first,
+            evaluation_id=evaluation_id,
+            ball_control=Scale.GOOD,
+        ),
+    )
+
+    sprint.update_test(db, tests[0].id, UpdateSprintTestSchema(time_0_30_s=3.9))
+    sprint.update_test(db, tests[1].id, UpdateSprintTestSchema(athlete_id=second))
+    sprint.delete_test(db, tests[2].id)
+
+    for athlete_id in (first, second):
+        assert _stored_stats(db, athlete_id) == _aggregate_stats(db, athlete_id)
+    assert StatisticDAO().reconcile_test_totals(db, repair=False) == []
+
+
+def test_reconcile_detects_and_repairs_drift(club):
+    """La conciliación reporta acumulados desalineados y los corrige."""
+    db, (first, _), evaluation_id = club
+    for t in (4.5, 5.5):
+        _add_sprint(db, first, evaluation_id, t)
+
+    statistic = StatisticDAO().get_athlete_statistic(db, first)
+    statistic.sprint_count = 7
+    statistic.speed = 1.0
+    db.commit()
+
+    dao = StatisticDAO()
+    drift = dao.reconcile_test_totals(db, repair=False)
+    assert drift == [
+        {"athlete_id": first, "field": "sprint_count", "stored": 7, "actual": 2}
+    ]
+
+    dao.reconcile_test_totals(db)
+
+    assert dao.reconcile_test_totals(db, repair=False) == []
+    assert _stored_stats(db, first) == _aggregate_stats(db, first)
+
+
+def test_update_athlete_stats_full_recompute(club):
+    """`update_athlete_stats` sigue recalculando desde cero."""
+    db, (first, _), evaluation_id = club
+    _add_sprint(db, first, evaluation_id, 5.0)
+    statistic = StatisticDAO().get_athlete_statistic(db, first)
+    statistic.sprint_time_sum = 0
+    db.commit()
+
+    result = statistic_controller.update_athlete_stats(db, first)
+
+    assert result == _aggregate_stats(db, first)
+
+
+# ==============================================
+# BENCHMARK: COSTO CONSTANTE POR ESCRITURA
+# ==============================================
+
+
+def test_stat_update_cost_independent_of_history(club, query_counter):
+    """Benchmark: registrar un test cuesta lo mismo con 1 o 60 tests previos."""
+    db, (first, _), evaluation_id = club
+    _add_sprint(db, first, evaluation_id, 5.0)
+
+    with query_counter() as short_history:
+        _add_sprint(db, first, evaluation_id, 5.0)
+
+    for _ in range(60):
+        _add_sprint(db, first, evaluation_id, 5.0)
+
+    with query_counter() as long_history:
+        _add_sprint(db, first, evaluation_id, 5.0)
+
+    assert short_history.count == long_history.count
@@ -0,0 +1,117 @@
+"""Benchmark de consultas para `StatisticDAO.get_club_overview` sobre SQLite."""
+
+from datetime import datetime
+
+import pytest
+
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.sprint_test import SprintTest
+from app.models.user import User
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def seeded_db(sqlite_db):
+    """Club con atletas de varios tipos/sexos, una evaluación y tests."""
+    athletes = []
+    types = ["UNL", "EXTERNOS", "DOCENTES"]
+    sexes = [Sex.MALE, Sex.FEMALE]
+    for i in range(30):
+        athletes.append(
+            Athlete(
+                external_person_id=f"ext-{i}",
+                full_name=f"Atleta {i}",
+                dni=f"{1100000000 + i}",
+                type_athlete=types[i % len(types)],
+                sex=sexes[i % len(sexes)],
+                is_active=i % 5 != 0,
+            )
+        )
+    sqlite_db.add_all(athletes)
+
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add(user)
+    sqlite_db.flush()
+
+    evaluation = Evaluation(
+        date=datetime(2025, 1, 10), time="10:00", name="Eval", user_id=user.id
+    )
+    sqlite_db.add(evaluation)
+    sqlite_db.flush()
+
+    for athlete in athletes[:12]:
+        sqlite_db.add(
+            SprintTest(
+                date=datetime(2025, 1, 10),
+                evaluation_id=evaluation.id,
+                athlete_id=athlete.id,
+                distance_meters=30,
+                time_0_10_s=1.8,
+                time_0_30_s=4.5,
+            )
+        )
+    sqlite_db.commit()
+    return sqlite_db
+
+
+def _normalize(overview: dict) -> dict:
+    """Ordena las distribuciones para comparar resultados de ambos modos."""
+    result = dict(overview)
+    result["athletes_by_type"] = sorted(
+        overview["athletes_by_type"], key=lambda r: r["type_athlete"]
+    )
+    result["athletes_by_gender"] = sorted(
+        overview["athletes_by_gender"], key=lambda r: str(r["sex"])
+    )
+    return result
+
+
+# ==============================================
+# TESTS: EQUIVALENCIA Y NÚMERO DE CONSULTAS
+# ==============================================
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"type_athlete": "UNL"}, {"sex": "MALE"}, {"type_athlete": "X"}],
+)
+def test_single_pass_matches_multi_query(seeded_db, filters):
+    """Ambos modos devuelven exactamente el mismo resumen."""
+    dao = StatisticDAO()
+
+    single = dao.get_club_overview(seeded_db, single_pass=True, **filters)
+    multi = dao.get_club_overview(seeded_db, single_pass=False, **filters)
+
+    assert _normalize(single) == _normalize(multi)
+
+
+def test_distributions_honour_filters(seeded_db):
+    """Las distribuciones solo cuentan atletas que cumplen los filtros."""
+    dao = StatisticDAO()
+
+    result = dao.get_club_overview(seeded_db, type_athlete="UNL", sex="MALE")
+
+    assert [r["type_athlete"] for r in result["athletes_by_type"]] == ["UNL"]
+    assert [r["sex"] for r in result["athletes_by_gender"]] == [Sex.MALE]
+    assert result["athletes_by_type"][0]["count"] == result["active_athletes"]
+    assert result["total_evaluations"] == 1
+    assert result["total_tests"] == 12
+
+
+def test_query_count_single_pass_vs_multi_query(seeded_db, query_counter):
+    """Benchmark: el modo de una pasada emite 1 consulta frente a 6."""
+    dao = StatisticDAO()
+
+    with query_counter() as before:
+        dao.get_club_overview(seeded_db, single_pass=False)
+    with query_counter() as after:
+        dao.get_club_overview(seeded_db, single_pass=True)
+
+    assert before.count >= 6
+    assert after.count == 1
@@ -0,0 +1,176 @@
+"""Benchmark del historial de tests de un atleta (SQLite)."""
+
+from datetime import datetime, timedelta
+
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.endurance_test import EnduranceTest
+from app.models.enums.scale import Scale
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.sprint_test import SprintTest
+from app.models.technical_assessment import TechnicalAssessment
+from app.models.user import User
+from app.models.yoyo_test import YoyoTest
+
+SCALES = [None, Scale.POOR, Scale.AVERAGE, Scale.GOOD, Scale.EXCELLENT]
+
+
+def _seed_history(db, per_type: int) -> int:
+    """Crea un atleta con `per_type` tests de cada tipo y devuelve su ID.
+
+    Cada semana hay un test de cada tipo en la misma fecha, para cubrir el
+    orden entre tipos a igual fecha; los valores cubren recortes a 0 y 100.
+    """
+    athlete = Athlete(
+        external_person_id="ext-1",
+        full_name="Atleta",
+        dni="1100000000",
+        type_athlete="UNL",
+        sex=Sex.MALE,
+    )
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    db.add_all([athlete, user])
+    db.flush()
+    evaluation = Evaluation(
+        date=datetime(2024, 1, 1), time="10:00", name="Eval", user_id=user.id
+    )
+    db.add(evaluation)
+    db.flush()
+
+    common = {"evaluation_id": evaluation.id, "athlete_id": athlete.id}
+    for i in range(per_type):
+        day = datetime(2024, 1, 1) + timedelta(weeks=i)
+        db.add_all(
+            [
+                TechnicalAssessment(
+                    date=day,
+                    ball_control=SCALES[i % 5],
+                    short_pass=SCALES[(i + 2) % 5],
+                    shooting=SCALES[(i * 3) % 5],
+                    **common,
+                ),
+                EnduranceTest(
+                    date=day,
+                    min_duration=12,
+                    total_distance_m=600.0 + (i * 97) % 2400,
+                    **common,
+                ),
+                SprintTest(
+                    date=day,
+                    distance_meters=30,
+                    time_0_10_s=1.8,
+                    time_0_30_s=3.0 + (i * 7 % 60) / 10,
+                    **common,
+                ),
+                YoyoTest(
+                    date=day,
+                    shuttle_count=(i * 13) % 90,
+                    final_level="16.3",
+                    failures=2,
+                    is_active=i % 11 != 5,
+                    **common,
+                ),
+            ]
+        )
+    db.commit()
+    return athlete.id
+
+
+def _history_entry(test_id, test_type, day, raw_value, raw_unit, score) -> dict:
+    return {
+        "id": test_id,
+        "test_type": test_type,
+        "date": f"2024-01-{day:02d}T00:00:00",
+        "raw_value": raw_value,
+        "raw_unit": raw_unit,
+        "score": score,
+    }
+
+
+# Resultado esperado de `_seed_history(db, 3)`: sprints por debajo de 4s
+# (100), un YoYo sin shuttles (0) y distancias bajo 1000m
+EXPECTED_HISTORY_3 = [
+    _history_entry(3, "Sprint Test", 1, 3.0, "segundos", 100.0),
+    _history_entry(4, "YoYo Test", 1, 0, "shuttles", 0.0),
+    _history_entry(2, "Endurance Test", 1, 600.0, "metros", 16.0),
+    _history_entry(1, "Technical Assessment", 1, 50.0, "puntos", 50.0),
+    _history_entry(7, "Sprint Test", 8, 3.7, "segundos", 100.0),
+    _history_entry(8, "YoYo Test", 8, 13, "shuttles", 21.8),
+    _history_entry(6, "Endurance Test", 8, 697.0, "metros", 19.4),
+    _history_entry(5, "Technical Assessment", 8, 175 / 3, "puntos", 58.3),
+    _history_entry(11, "Sprint Test", 15, 4.4, "segundos", 90.0),
+    _history_entry(12, "YoYo Test", 15, 26, "shuttles", 37.0),
+    _history_entry(10, "Endurance Test", 15, 794.0, "metros", 22.8),
+    _history_entry(9, "Technical Assessment", 15, 175 / 3, "puntos", 58.3),
+]
+
+
+def _summary(count, avg, best, last, trend) -> dict:
+    return {
+        "count": count,
+        "avg_score": avg,
+        "best_score": best,
+        "last_score": last,
+        "trend": trend,
+    }
+
+
+EXPECTED_SUMMARY = {
+    3: {
+        "Sprint Test": _summary(3, 96.7, 100.0, 90.0, "stable"),
+        "YoYo Test": _summary(3, 19.6, 37.0, 37.0, "improving"),
+        "Endurance Test": _summary(3, 19.4, 22.8, 22.8, "stable"),
+        "Technical Assessment": _summary(3, 55.6, 58.3, 58.3, "stable"),
+    },
+    # Con YoYo inactivos (i % 11 == 5) y recortes a 0 y 100
+    40: {
+        "Sprint Test": _summary(40, 53.3, 100.0, 42.5, "declining"),
+        "YoYo Test": _summary(36, 50.9, 100.0, 73.3, "improving"),
+        "Endurance Test": _summary(40, 50.7, 97.5, 64.4, "improving"),
+        "Technical Assessment": _summary(40, 62.5, 87.5, 58.3, "improving"),
+    },
+}
+
+
+def test_history_matches_expected_scores(sqlite_db):
+    """Historial, scores y resumen coinciden con los valores esperados."""
+    athlete_id = _seed_history(sqlite_db, 3)
+
+    result = StatisticDAO().get_athlete_tests_history(sqlite_db, athlete_id)
+
+    assert result["tests_history"] == EXPECTED_HISTORY_3
+    assert result["summary_by_type"] == EXPECTED_SUMMARY[3]
+    assert list(result["summary_by_type"]) == list(EXPECTED_SUMMARY[3])
+
+
+def test_history_summary_with_long_history(sqlite_db):
+    """El resumen por tipo de un historial largo coincide con el esperado."""
+    athlete_id = _seed_history(sqlite_db, 40)
+
+    result = StatisticDAO().get_athlete_tests_history(sqlite_db, athlete_id)
+
+    assert len(result["tests_history"]) == 156
+    assert result["summary_by_type"] == EXPECTED_SUMMARY[40]
+
+
+def test_history_without_tests(sqlite_db):
+    """Un atleta sin tests devuelve historial y resumen vacíos."""
+    athlete_id = _seed_history(sqlite_db, 0)
+
+    result = StatisticDAO().get_athlete_tests_history(sqlite_db, athlete_id)
+
+    assert result["tests_history"] == []
+    assert result["summary_by_type"] == {}
+
+
+def test_history_query_count(sqlite_db, query_counter):
+    """Benchmark: 2 consultas (atleta y tests) aun con cientos de tests."""
+    athlete_id = _seed_history(sqlite_db, 150)
+    dao = StatisticDAO()
+
+    with query_counter() as counter:
+        result = dao.get_athlete_tests_history(sqlite_db, athlete_id)
+
+    assert len(result["tests_history"]) > 500
+    assert counter.count == 2
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,7 +15,7 @@ async def test_login_success(client):
             "token_type": "bearer",
             "expires_in": 3600,
         }
-        mock_ctrl.login.return_value = mock_resp
+        mock_ctrl.login = AsyncMock(return_value=mock_resp)
 
         response = await client.post(
             "/api/v1/accounts/login",
@@ -32,7 +32,9 @@ async def test_login_success(client):
 async def test_login_invalid_credentials(client):
     """Prueba de login con credenciales inválidas."""
     with patch("app.services.routers.account_router.account_controller") as mock_ctrl:
-        mock_ctrl.login.side_effect = UnauthorizedException("Credenciales inválidas")
+        mock_ctrl.login = AsyncMock(
+            side_effect=UnauthorizedException("Credenciales inválidas")
+        )
 
         response = await client.post(
             "/api/v1/accounts/login",
@@ -83,7 +85,7 @@ async def test_password_reset_request_always_generic_success(client):
 async def test_password_reset_confirm_success(client):
     """Prueba de confirmación de restablecimiento de contraseña exitoso."""
     with patch("app.services.routers.account_router.account_controller") as mock_ctrl:
-        mock_ctrl.confirm_password_reset.return_value = None
+        mock_ctrl.confirm_password_reset = AsyncMock(return_value=None)
 
         response = await client.post(
             "/api/v1/accounts/password-reset/confirm",
@@ -100,8 +102,8 @@ async def test_password_reset_confirm_success(client):
 async def test_password_reset_confirm_invalid_token(client):
     """Prueba de confirmación de restablecimiento de contraseña con token inválido."""
     with patch("app.services.routers.account_router.account_controller") as mock_ctrl:
-        mock_ctrl.confirm_password_reset.side_effect = UnauthorizedException(
-            "Token inválido o expirado"
+        mock_ctrl.confirm_password_reset = AsyncMock(
+            side_effect=UnauthorizedException("Token inválido o expirado")
         )
 
         response = await client.post(
@@ -132,7 +134,7 @@ async def test_password_reset_confirm_unexpected_error(client):
     """Debe responder 500 ante error inesperado del controlador."""
 
     with patch("app.services.routers.account_router.account_controller") as mock_ctrl:
-        mock_ctrl.confirm_password_reset.side_effect = Exception("boom")
+        mock_ctrl.confirm_password_reset = AsyncMock(side_effect=Exception("boom"))
 
         response = await client.post(
             "/api/v1/accounts/password-reset/confirm",
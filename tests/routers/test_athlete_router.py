@@ -307,6 +307,30 @@ async def test_get_all_athletes_with_filters(admin_client):
     assert response.status_code in [200, 500]
 
 
+@pytest.mark.asyncio
+async def test_get_all_athletes_include_person(admin_client):
+    """Con include_person el listado se enriquece con datos del MS."""
+    from app.schemas.response import PaginatedResponse
+
+    page = PaginatedResponse(items=[{"dni": "110"}], total=1, page=1, limit=10)
+    enriched = PaginatedResponse(
+        items=[{"dni": "110", "phone": "09"}], total=1, page=1, limit=10
+    )
+    with patch(
+        "app.services.routers.athlete_router.athlete_controller"
+    ) as mock_controller:
+        mock_controller.get_all_athletes.return_value = page
+        mock_controller.enrich_with_person_data = AsyncMock(return_value=enriched)
+
+        response = await admin_client.get(
+            "/api/v1/athletes/all", params={"include_person": True}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["items"] == [{"dni": "110", "phone": "09"}]
+    mock_controller.enrich_with_person_data.assert_awaited_once_with(page)
+
+
 @pytest.mark.asyncio
 async def test_get_all_athletes_without_auth(client):
     """Lista de atletas sin autenticación debe fallar."""
@@ -133,7 +133,7 @@ async def test_list_endurance_tests_success(admin_client, mock_db_session):
         mock_test.updated_at = None
         mock_test.is_active = True
 
-        mock_controller.list_tests.return_value = ([mock_test], 1)
+        mock_controller.list_tests.return_value = ([mock_test], 1, None)
 
         response = await admin_client.get("/api/v1/endurance-tests/")
 
@@ -150,7 +150,7 @@ async def test_list_endurance_tests_empty(admin_client, mock_db_session):
     with patch(
         "app.services.routers.endurance_test_router.endurance_test_controller"
     ) as mock_controller:
-        mock_controller.list_tests.return_value = ([], 0)
+        mock_controller.list_tests.return_value = ([], 0, None)
 
         response = await admin_client.get("/api/v1/endurance-tests/")
 
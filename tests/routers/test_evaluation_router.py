@@ -7,6 +7,7 @@ Cubre únicamente los endpoints propios del recurso Evaluations:
 - GET /evaluations/{evaluation_id}: Obtener evaluación
 - PUT /evaluations/{evaluation_id}: Actualizar evaluación
 - DELETE /evaluations/{evaluation_id}: Eliminar evaluación
+- POST /evaluations/{evaluation_id}/tests/bulk: Registrar tests en lote
 """
 
 from datetime import datetime, timedelta
@@ -14,6 +15,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.utils.exceptions import ValidationException
+
 # ==============================================
 # FIXTURES
 # ==============================================
@@ -119,7 +122,7 @@ async def test_list_evaluations_success(admin_client):
         mock_eval.created_at = datetime.now()
         mock_eval.updated_at = None
         mock_eval.is_active = True
-        mock_controller.list_evaluations_paginated.return_value = ([mock_eval], 1)
+        mock_controller.list_evaluations_paginated.return_value = ([mock_eval], 1, None)
 
         response = await admin_client.get("/api/v1/evaluations/")
 
@@ -138,7 +141,7 @@ async def test_list_evaluations_with_pagination(admin_client):
     with patch(
         "app.services.routers.evaluation_router.evaluation_controller"
     ) as mock_controller:
-        mock_controller.list_evaluations_paginated.return_value = ([], 0)
+        mock_controller.list_evaluations_paginated.return_value = ([], 0, None)
 
         response = await admin_client.get("/api/v1/evaluations/?page=1&limit=10")
 
@@ -317,3 +320,56 @@ async def test_list_user_evaluations_success(admin_client):
         data = response.json()
         assert data["status"] == "success"
         assert len(data["data"]) == 1
+
+
+# ==============================================
+# TESTS: POST /evaluations/{evaluation_id}/tests/bulk
+# ==============================================
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tests_success(admin_client):
+    """POST /evaluations/{id}/tests/bulk debe registrar el lote."""
+    with patch(
+        "app.services.routers.evaluation_router.test_controller"
+    ) as mock_controller:
+        mock_controller.bulk_create_tests.return_value = {
+            "created": 2,
+            "by_type": {"sprint_test": 1, "yoyo_test": 1},
+            "test_ids": [10, 11],
+        }
+
+        response = await admin_client.post(
+            "/api/v1/evaluations/1/tests/bulk?sync_stats=true",
+            json={"tests": [{"test_type": "sprint_test"}, {"test_type": "yoyo_test"}]},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["data"]["test_ids"] == [10, 11]
+        kwargs = mock_controller.bulk_create_tests.call_args.kwargs
+        assert kwargs["evaluation_id"] == 1
+        assert kwargs["sync_stats"] is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tests_row_errors(admin_client):
+    """POST /evaluations/{id}/tests/bulk devuelve los errores por fila."""
+    with patch(
+        "app.services.routers.evaluation_router.test_controller"
+    ) as mock_controller:
+        mock_controller.bulk_create_tests.side_effect = ValidationException(
+            "1 de 1 tests tienen errores; no se registró ninguno",
+            errors={"tests.0.athlete_id": ["El atleta con ID 9 no existe"]},
+        )
+
+        response = await admin_client.post(
+            "/api/v1/evaluations/1/tests/bulk",
+            json={"tests": [{"test_type": "sprint_test", "athlete_id": 9}]},
+        )
+
+        assert response.status_code == 422
+        data = response.json()
+        assert data["errors"] == {
+            "tests.0.athlete_id": ["El atleta con ID 9 no existe"]
+        }
@@ -1,5 +1,6 @@
 """Tests para report_router."""
 
+from concurrent.futures import Future
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +8,14 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.services.routers.report_router import router, validate_report_permissions
+from app.core.database import get_read_db
+from app.schemas.report_schema import ReportFilter
+from app.services.report_jobs import ReportJob, ReportJobManager, report_jobs
+from app.services.routers.report_router import (
+    report_file_name,
+    router,
+    validate_report_permissions,
+)
 from app.utils.exceptions import ValidationException
 
 # Crear app de prueba
@@ -63,6 +71,25 @@ class TestValidateReportPermissions:
         assert result == mock_account
 
 
+class TestReportFileName:
+    """Tests para report_file_name."""
+
+    def test_summary_file_name(self):
+        """El resumen conserva el nombre base."""
+        filters = ReportFilter(format="xlsx")
+
+        assert report_file_name("reporte_tests", filters) == "reporte_tests.xlsx"
+
+    def test_raw_file_name(self):
+        """La exportación de registros agrega el sufijo _registros."""
+        filters = ReportFilter(format="csv", mode="raw")
+
+        assert (
+            report_file_name("reporte_asistencia", filters)
+            == "reporte_asistencia_registros.csv"
+        )
+
+
 class TestGenerateAttendanceReport:
     """Tests para endpoint generate_attendance_report."""
 
@@ -80,7 +107,7 @@ class TestGenerateAttendanceReport:
         mock_user.user.role.value = "Administrator"
         return mock_db, mock_user
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_attendance_report_pdf(
@@ -108,7 +135,7 @@ class TestGenerateAttendanceReport:
         # El test puede fallar por auth, pero verifica estructura
         assert response.status_code in [200, 401, 403, 422]
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_attendance_report_csv(
@@ -144,7 +171,7 @@ class TestGenerateTestsReport:
         """Cliente de prueba."""
         return TestClient(app)
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_tests_report_pdf(self, mock_ctrl, mock_auth, mock_db, client):
@@ -169,7 +196,7 @@ class TestGenerateTestsReport:
 
         assert response.status_code in [200, 401, 403, 422]
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_tests_report_xlsx(self, mock_ctrl, mock_auth, mock_db, client):
@@ -203,7 +230,7 @@ class TestGenerateStatisticsReport:
         """Cliente de prueba."""
         return TestClient(app)
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_statistics_report_pdf(
@@ -230,7 +257,7 @@ class TestGenerateStatisticsReport:
 
         assert response.status_code in [200, 401, 403, 422]
 
-    @patch("app.services.routers.report_router.get_db")
+    @patch("app.services.routers.report_router.get_read_db")
     @patch("app.services.routers.report_router.get_current_account")
     @patch("app.services.routers.report_router.report_controller")
     def test_generate_statistics_report_with_filters(
@@ -305,3 +332,130 @@ class TestErrorHandling:
 
         # Debería fallar por validación o auth
         assert response.status_code in [401, 422]
+
+
+class TestReportJobs:
+    """Tests para los trabajos de reportes PDF en segundo plano."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Cliente con un usuario Coach (ID 7) autenticado."""
+        monkeypatch.setattr(report_jobs, "directory", tmp_path)
+        account = MagicMock()
+        account.id = 7
+        account.user.full_name = "Coach"
+        account.user.role.value = "Coach"
+        app.dependency_overrides[validate_report_permissions] = lambda: account
+        app.dependency_overrides[get_read_db] = lambda: MagicMock()
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+        report_jobs._jobs.clear()
+
+    @staticmethod
+    def _job(job_id: str, owner_id: int = 7, done: bool = True) -> ReportJob:
+        future = Future()
+        if done:
+            future.set_result(b"%PDF-job")
+        job = ReportJob(id=job_id, future=future, file_name="reporte_tests.pdf")
+        job.owner_id = owner_id
+        report_jobs._jobs[job_id] = job
+        return job
+
+    @patch("app.services.routers.report_router.report_controller")
+    def test_large_report_returns_202_with_job(self, mock_ctrl, client):
+        """Un reporte convertido en trabajo responde 202 con sus URLs."""
+        future = Future()
+        mock_ctrl.generate_report.return_value = ReportJob(id="abc", future=future)
+
+        response = client.post("/reports/tests", json={"format": "pdf"})
+
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert data["job_id"] == "abc"
+        assert data["status"] == "pending"
+        assert data["file_name"] == "reporte_tests.pdf"
+        assert data["download_url"] == "/reports/jobs/abc/download"
+
+    def test_job_status_and_download(self, client):
+        """El creador consulta el estado y descarga el PDF terminado."""
+        self._job("done")
+
+        status_response = client.get("/reports/jobs/done")
+        download = client.get("/reports/jobs/done/download")
+
+        assert status_response.json()["data"]["status"] == "done"
+        assert download.status_code == 200
+        assert download.content == b"%PDF-job"
+        assert "reporte_tests.pdf" in download.headers["content-disposition"]
+
+    def test_download_pending_job_returns_409(self, client):
+        """Descargar un trabajo en curso responde 409."""
+        self._job("pending", done=False)
+
+        response = client.get("/reports/jobs/pending/download")
+
+        assert response.status_code == 409
+
+    def test_job_of_other_user_returns_404(self, client):
+        """Los trabajos de otro usuario no son visibles."""
+        self._job("other", owner_id=99)
+
+        response = client.get("/reports/jobs/other")
+
+        assert response.status_code == 404
+
+    def test_job_created_by_another_worker(self, client, tmp_path):
+        """Un trabajo de otro worker se consulta y descarga desde el disco."""
+        other_worker = ReportJobManager(directory=str(tmp_path))
+        job = ReportJob(id="shared", future=Future())
+        other_worker.assign(job, owner_id=7, file_name="reporte_tests.pdf")
+
+        pending = client.get("/reports/jobs/shared")
+        job.future.set_result(b"%PDF-shared")
+        other_worker._finish(job)
+        download = client.get("/reports/jobs/shared/download")
+
+        assert pending.json()["data"]["status"] == "pending"
+        assert download.status_code == 200
+        assert download.content == b"%PDF-shared"
+
+
+class TestReportETag:
+    """Tests para la revalidación de reportes con ETag."""
+
+    @pytest.fixture
+    def client(self):
+        """Cliente con un usuario Coach autenticado."""
+        account = MagicMock()
+        account.user.full_name = "Coach"
+        app.dependency_overrides[validate_report_permissions] = lambda: account
+        app.dependency_overrides[get_read_db] = lambda: MagicMock()
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    @patch("app.services.routers.report_router.report_controller")
+    def test_report_carries_etag(self, mock_ctrl, client):
+        """El reporte generado incluye su ETag."""
+        mock_ctrl.report_cache_key.return_value = "abc123"
+        mock_ctrl.generate_report.return_value = BytesIO(b"xlsx content")
+
+        response = client.post("/reports/tests", json={"format": "xlsx"})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc123"'
+        assert mock_ctrl.generate_report.call_args.kwargs["cache_key"] == "abc123"
+
+    @patch("app.services.routers.report_router.report_controller")
+    def test_matching_etag_returns_304(self, mock_ctrl, client):
+        """Con el mismo ETag responde 304 sin generar el reporte."""
+        mock_ctrl.report_cache_key.return_value = "abc123"
+
+        response = client.post(
+            "/reports/tests",
+            json={"format": "xlsx"},
+            headers={"If-None-Match": '"abc123"'},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"abc123"'
+        mock_ctrl.generate_report.assert_not_called()
@@ -141,7 +141,7 @@ async def test_list_sprint_tests_success(admin_client, mock_db_session):
         mock_test.updated_at = None
         mock_test.is_active = True
 
-        mock_controller.list_tests.return_value = ([mock_test], 1)
+        mock_controller.list_tests.return_value = ([mock_test], 1, None)
 
         response = await admin_client.get("/api/v1/sprint-tests/")
 
@@ -158,7 +158,7 @@ async def test_list_sprint_tests_empty(admin_client, mock_db_session):
     with patch(
         "app.services.routers.sprint_test_router.sprint_test_controller"
     ) as mock_controller:
-        mock_controller.list_tests.return_value = ([], 0)
+        mock_controller.list_tests.return_value = ([], 0, None)
 
         response = await admin_client.get("/api/v1/sprint-tests/")
 
@@ -134,7 +134,7 @@ async def test_list_technical_assessments_success(admin_client, mock_db_session)
         mock_test.updated_at = None
         mock_test.is_active = True
 
-        mock_controller.list_tests.return_value = ([mock_test], 1)
+        mock_controller.list_tests.return_value = ([mock_test], 1, None)
 
         response = await admin_client.get("/api/v1/technical-assessments/")
 
@@ -151,7 +151,7 @@ async def test_list_technical_assessments_empty(admin_client, mock_db_session):
     with patch(
         "app.services.routers.technical_assessment_router.technical_assessment_controller"
     ) as mock_controller:
-        mock_controller.list_tests.return_value = ([], 0)
+        mock_controller.list_tests.return_value = ([], 0, None)
 
         response = await admin_client.get("/api/v1/technical-assessments/")
 
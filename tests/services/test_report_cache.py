@@ -0,0 +1,202 @@
+"""Tests de la caché de reportes en disco y su uso desde el controlador."""
+
+import os
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from io import BytesIO
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from app.controllers.report_controller import ReportController
+from app.controllers.sprint_test_controller import SprintTestController
+from app.dao.report_dao import ReportDAO
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.user import User
+from app.schemas.report_schema import ReportFilter, ReportMetadata
+from app.schemas.sprint_test_schema import (
+    CreateSprintTestSchema,
+    UpdateSprintTestSchema,
+)
+from app.services.report_cache import ReportCache
+from app.services.report_jobs import ReportJob
+
+TEST_DATE = datetime(2025, 1, 10, 10, 0)
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReportCache(directory=str(tmp_path), max_bytes=1024)
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controlador con una caché propia en un directorio temporal."""
+    controller = ReportController()
+    controller.report_cache = ReportCache(directory=str(tmp_path / "reports"))
+    return controller
+
+
+@pytest.fixture
+def club(sqlite_db):
+    """Un atleta, una evaluación y un sprint registrado."""
+    athlete = Athlete(
+        external_person_id="ext-1",
+        full_name="Atleta",
+        dni="1100000000",
+        type_athlete="UNL",
+        sex=Sex.MALE,
+    )
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add_all([athlete, user])
+    sqlite_db.flush()
+    evaluation = Evaluation(date=TEST_DATE, time="10:00", name="Eval", user_id=user.id)
+    sqlite_db.add(evaluation)
+    sqlite_db.commit()
+    sprint = SprintTestController().add_test(
+        sqlite_db,
+        CreateSprintTestSchema(
+            date=TEST_DATE,
+            athlete_id=athlete.id,
+            evaluation_id=evaluation.id,
+            distance_meters=30,
+            time_0_10_s=1.8,
+            time_0_30_s=4.5,
+        ),
+    )
+    return sqlite_db, sprint
+
+
+def _age(path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+# ==============================================
+# TESTS: CACHÉ EN DISCO
+# ==============================================
+
+
+def test_put_and_get_round_trip(cache):
+    """Lo guardado se recupera por su clave; una clave ausente da None."""
+    key = cache.key({"format": "pdf"}, "Coach", "v1")
+    cache.put(key, b"%PDF-1")
+
+    assert cache.get(key) == b"%PDF-1"
+    assert cache.get(cache.key({"format": "pdf"}, "Coach", "v2")) is None
+
+
+def test_key_is_stable_and_order_independent():
+    """La clave no depende del orden de los filtros."""
+    assert ReportCache.key({"a": 1, "b": 2}) == ReportCache.key({"b": 2, "a": 1})
+    assert ReportCache.key({"a": 1}) != ReportCache.key({"a": 2})
+
+
+def test_evicts_least_recently_used(cache, tmp_path):
+    """Al superar el límite se expulsa la entrada usada hace más tiempo."""
+    cache.put("old", b"x" * 400)
+    cache.put("used", b"y" * 400)
+    _age(tmp_path / "old.bin", 60)
+    _age(tmp_path / "used.bin", 120)
+    cache.get("used")  # lectura reciente: pasa a ser la más nueva
+
+    cache.put("new", b"z" * 400)
+
+    assert cache.get("old") is None
+    assert cache.get("used") == b"y" * 400
+    assert cache.get("new") == b"z" * 400
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    """Con tamaño 0 la caché queda deshabilitada."""
+    cache = ReportCache(directory=str(tmp_path), max_bytes=0)
+    cache.put("key", b"data")
+
+    assert not cache.enabled
+    assert cache.get("key") is None
+
+
+# ==============================================
+# TESTS: CONTROLADOR
+# ==============================================
+
+
+def test_cache_key_changes_with_data(club, controller):
+    """Editar un test cambia la versión de datos y, con ella, la clave."""
+    db, sprint = club
+    filters = ReportFilter(report_type="tests", format="xlsx")
+    before = controller.report_cache_key(db, filters, "Coach")
+
+    assert controller.report_cache_key(db, filters, "Coach") == before
+    assert controller.report_cache_key(db, filters, "Otro") != before
+
+    SprintTestController().update_test(
+        db, sprint.id, UpdateSprintTestSchema(time_0_30_s=4.1)
+    )
+
+    assert controller.report_cache_key(db, filters, "Coach") != before
+
+
+def test_report_date_is_the_data_cutoff(club, controller):
+    """El reporte muestra la fecha de corte de los datos, no la de generación."""
+    db, _ = club
+    as_of = ReportDAO().data_as_of(db, "tests")
+    filters = ReportFilter(report_type="tests", format="xlsx")
+
+    report = controller.generate_report(db, filters, "Coach")
+    info = pd.read_excel(report, sheet_name="Información")
+
+    assert as_of is not None
+    assert ReportDAO().data_as_of(db, "tests") == as_of
+    assert dict(zip(info["Campo"], info["Valor"], strict=True))["Datos al"] == (
+        as_of.strftime("%d/%m/%Y %H:%M")
+    )
+    assert "generated_at" not in ReportMetadata.model_fields
+
+
+def test_raw_reports_are_not_cached(club, controller):
+    """Las exportaciones en streaming no usan la caché."""
+    db, _ = club
+    filters = ReportFilter(report_type="tests", format="csv", mode="raw")
+
+    assert controller.report_cache_key(db, filters, "Coach") is None
+
+
+def test_repeat_report_served_from_cache(club, controller):
+    """Benchmark: la segunda descarga no vuelve a generar el reporte."""
+    db, _ = club
+    filters = ReportFilter(report_type="tests", format="xlsx")
+    service = controller.report_service
+
+    with patch.object(
+        service, "generate_tests_report", wraps=service.generate_tests_report
+    ) as generate:
+        first = controller.generate_report(db, filters, "Coach").getvalue()
+        second = controller.generate_report(db, filters, "Coach").getvalue()
+
+    assert generate.call_count == 1
+    assert second == first
+
+
+def test_job_result_is_cached_when_done(club, controller):
+    """El PDF de un trabajo asíncrono se guarda al terminar."""
+    db, _ = club
+    filters = ReportFilter(report_type="tests", format="pdf")
+    job = ReportJob(id="job", future=Future())
+    key = controller.report_cache_key(db, filters, "Coach")
+
+    with patch.object(controller, "_build_report", return_value=job):
+        assert controller.generate_report(db, filters, "Coach") is job
+    job.future.set_result(b"%PDF-job")
+
+    result = controller.generate_report(db, filters, "Coach", cache_key=key)
+    assert isinstance(result, BytesIO)
+    assert result.getvalue() == b"%PDF-job"
@@ -0,0 +1,178 @@
+"""Tests del pool de procesos para reportes PDF."""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from app.services.report_jobs import ReportJob, ReportJobManager
+from app.utils.exceptions import AppException, NotFoundException
+
+HTML = "<html><body><h1>Reporte</h1></body></html>"
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Pool de un proceso; los reportes de más de 10 filas son trabajos."""
+    jobs = ReportJobManager(
+        max_workers=1,
+        max_pending=2,
+        sync_max_rows=10,
+        ttl=60,
+        directory=str(tmp_path),
+    )
+    jobs.start()
+    yield jobs
+    jobs.stop()
+
+
+def _wait(job: ReportJob, timeout: float = 30.0) -> ReportJob:
+    job.future.result(timeout)
+    deadline = time.monotonic() + timeout
+    while job.finished_at is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+def _finished_job(job_id: str, result=None, error=None) -> ReportJob:
+    future = Future()
+    if error:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return ReportJob(id=job_id, future=future, finished_at=time.monotonic())
+
+
+# ==============================================
+# TESTS: CAMINO SÍNCRONO
+# ==============================================
+
+
+def test_renders_inline_when_pool_not_started():
+    """Sin pool (tests, scripts) el PDF se genera en el mismo proceso."""
+    with patch(
+        "app.services.report_jobs.render_pdf_bytes", return_value=b"%PDF-inline"
+    ):
+        result = ReportJobManager().render(HTML, rows=10_000)
+
+    assert isinstance(result, BytesIO)
+    assert result.getvalue() == b"%PDF-inline"
+
+
+def test_small_report_returns_pdf(manager):
+    """Un reporte pequeño se renderiza en el pool y se devuelve directamente."""
+    result = manager.render(HTML, rows=10)
+
+    assert isinstance(result, BytesIO)
+    assert result.getvalue().startswith(b"%PDF")
+
+
+def test_concurrent_small_reports(manager):
+    """Varias peticiones simultáneas comparten el pool sin errores."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: manager.render(HTML), range(8)))
+
+    assert all(r.getvalue().startswith(b"%PDF") for r in results)
+
+
+# ==============================================
+# TESTS: TRABAJOS ASÍNCRONOS
+# ==============================================
+
+
+@pytest.mark.parametrize("rows, background", [(11, False), (1, True)])
+def test_large_or_background_report_creates_job(manager, rows, background):
+    """Los reportes grandes o en segundo plano devuelven un trabajo."""
+    job = manager.render(HTML, rows=rows, background=background)
+
+    assert isinstance(job, ReportJob)
+    assert manager.get(job.id) is job
+    _wait(job)
+    assert job.status == "done"
+    assert job.content().startswith(b"%PDF")
+    assert job.to_dict()["status"] == "done"
+
+
+def test_job_pending_and_failed_content(manager):
+    """Un trabajo sin terminar responde 409 y uno fallido 500."""
+    pending = ReportJob(id="pending", future=Future())
+    failed = _finished_job("failed", error=RuntimeError("sin fuentes"))
+
+    with pytest.raises(AppException) as pending_exc:
+        pending.content()
+    with pytest.raises(AppException) as failed_exc:
+        failed.content()
+
+    assert pending.status == "pending"
+    assert pending_exc.value.status_code == 409
+    assert failed.status == "failed"
+    assert failed_exc.value.status_code == 500
+    assert "sin fuentes" in failed_exc.value.message
+
+
+def test_queue_full_rejects_new_jobs(manager):
+    """Con la cola llena se rechaza el trabajo con 503."""
+    for job_id in ("a", "b"):
+        manager._jobs[job_id] = ReportJob(id=job_id, future=Future())
+
+    with pytest.raises(AppException) as exc_info:
+        manager.render(HTML, background=True)
+
+    assert exc_info.value.status_code == 503
+
+
+def test_job_only_visible_to_owner(manager):
+    """Otro usuario no puede consultar el trabajo."""
+    job = _finished_job("own", result=b"%PDF")
+    job.owner_id = 1
+    manager._jobs[job.id] = job
+
+    assert manager.get("own", owner_id=1) is job
+    with pytest.raises(NotFoundException):
+        manager.get("own", owner_id=2)
+
+
+def test_finished_jobs_expire(tmp_path):
+    """Los trabajos terminados se descartan tras el TTL."""
+    manager = ReportJobManager(ttl=0, directory=str(tmp_path))
+    manager._jobs["old"] = _finished_job("old", result=b"%PDF")
+
+    with pytest.raises(NotFoundException):
+        manager.get("old")
+
+
+def test_jobs_are_shared_between_workers(manager, tmp_path):
+    """Otro worker con el mismo directorio ve el estado y el PDF del trabajo."""
+    job = manager.render(HTML, background=True)
+    manager.assign(job, owner_id=3, file_name="asistencia.pdf")
+    _wait(job)
+    other_worker = ReportJobManager(directory=str(tmp_path))
+
+    stored = other_worker.get(job.id, owner_id=3)
+
+    assert stored.status == "done"
+    assert stored.file_name == "asistencia.pdf"
+    assert stored.content() == job.content()
+    with pytest.raises(NotFoundException):
+        other_worker.get(job.id, owner_id=4)
+
+
+def test_stored_jobs_expire(tmp_path):
+    """Los archivos de trabajos viejos se borran del directorio compartido."""
+    creator = ReportJobManager(directory=str(tmp_path))
+    creator._finish(_finished_job("old", result=b"%PDF"))
+
+    with pytest.raises(NotFoundException):
+        ReportJobManager(ttl=0, directory=str(tmp_path)).get("old")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pool_uses_spawn(manager):
+    """Los procesos del pool no se crean con fork (el servidor tiene hilos)."""
+    assert manager._executor._mp_context.get_start_method() == "spawn"
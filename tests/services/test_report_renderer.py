@@ -0,0 +1,87 @@
+"""Tests del renderizador de reportes compartido por proceso."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.report_schema import ReportMetadata
+from app.services.report_renderer import (
+    BASE_TEMPLATE,
+    ReportRenderer,
+    warm_up_worker,
+)
+from app.services.report_service import ReportService
+
+CONTEXT = {
+    "title": "Reporte de Tests",
+    "metadata": ReportMetadata(title="Reporte de Tests", generated_by="Coach"),
+    "kpi_cards": [{"label": "Total", "value": "12", "color": "#211915"}],
+    "main_chart": None,
+    "tables": [
+        {
+            "title": "Resumen",
+            "headers": ["Test", "Promedio"],
+            "rows": [[f"Test {i}", i * 1.5] for i in range(30)],
+        }
+    ],
+    "athlete_info": None,
+}
+
+
+# ==============================================
+# TESTS
+# ==============================================
+
+
+def test_render_html_uses_shared_environment():
+    """La plantilla se compila una vez y no incluye estilos en línea."""
+    renderer = ReportRenderer()
+
+    html_string = renderer.render_html(BASE_TEMPLATE, **CONTEXT)
+
+    assert "Reporte de Tests" in html_string
+    assert "<style>" not in html_string
+    assert renderer.env.get_template(BASE_TEMPLATE) is renderer.env.get_template(
+        BASE_TEMPLATE
+    )
+
+
+def test_stylesheet_and_fonts_loaded_once():
+    """CSS y fuentes se crean con el primer PDF y luego se reutilizan."""
+    weasyprint = pytest.importorskip("weasyprint")
+    renderer = ReportRenderer()
+
+    with patch("weasyprint.CSS", wraps=weasyprint.CSS) as css:
+        first = renderer.write_pdf(renderer.render_html(BASE_TEMPLATE, **CONTEXT))
+        second = renderer.write_pdf(renderer.render_html(BASE_TEMPLATE, **CONTEXT))
+
+    assert first.startswith(b"%PDF")
+    assert second.startswith(b"%PDF")
+    assert css.call_count == 1
+
+
+def test_services_share_process_renderer():
+    """Cada ReportService reutiliza el mismo entorno de plantillas."""
+    assert ReportService().env is ReportService().env
+
+
+def test_warm_up_worker_never_raises():
+    """Un fallo al calentar se registra y no impide arrancar el worker."""
+    with patch(
+        "app.services.report_renderer.report_renderer.warm_up",
+        side_effect=OSError("sin fuentes"),
+    ):
+        assert warm_up_worker() is None
+
+
+def test_first_report_after_warm_up_reuses_resources():
+    """Tras el calentamiento, el primer reporte ya no carga CSS ni fuentes."""
+    weasyprint = pytest.importorskip("weasyprint")
+    renderer = ReportRenderer()
+    renderer.warm_up()
+
+    with patch("weasyprint.CSS", wraps=weasyprint.CSS) as css:
+        pdf = renderer.write_pdf(renderer.render_html(BASE_TEMPLATE, **CONTEXT))
+
+    assert pdf.startswith(b"%PDF")
+    assert css.call_count == 0
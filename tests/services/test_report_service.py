@@ -11,8 +11,7 @@ class TestReportServiceInit:
     """Tests para inicialización de ReportService."""
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_init(self, mock_env, mock_stat_ctrl):
+    def test_init(self, mock_stat_ctrl):
         """Verifica inicialización correcta."""
         from app.services.report_service import ReportService
 
@@ -26,8 +25,7 @@ class TestGenerateAttendanceReport:
     """Tests para generate_attendance_report."""
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_attendance_report_csv(self, mock_env, mock_ctrl):
+    def test_generate_attendance_report_csv(self, mock_ctrl):
         """Genera reporte de asistencia en CSV."""
         from app.services.report_service import ReportService
 
@@ -54,8 +52,7 @@ class TestGenerateAttendanceReport:
         assert isinstance(result, BytesIO)
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_attendance_report_xlsx(self, mock_env, mock_ctrl):
+    def test_generate_attendance_report_xlsx(self, mock_ctrl):
         """Genera reporte de asistencia en Excel."""
         from app.services.report_service import ReportService
 
@@ -82,8 +79,7 @@ class TestGenerateAttendanceReport:
         assert isinstance(result, BytesIO)
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_attendance_report_pdf(self, mock_env, mock_ctrl):
+    def test_generate_attendance_report_pdf(self, mock_ctrl):
         """Genera reporte de asistencia en PDF."""
         from app.services.report_service import ReportService
 
@@ -114,8 +110,7 @@ class TestGenerateTestsReport:
     """Tests para generate_tests_report."""
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_tests_report_csv(self, mock_env, mock_ctrl):
+    def test_generate_tests_report_csv(self, mock_ctrl):
         """Genera reporte de tests en CSV."""
         from app.services.report_service import ReportService
 
@@ -147,8 +142,7 @@ class TestGenerateTestsReport:
         assert isinstance(result, BytesIO)
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_tests_report_pdf(self, mock_env, mock_ctrl):
+    def test_generate_tests_report_pdf(self, mock_ctrl):
         """Genera reporte de tests en PDF."""
         from app.services.report_service import ReportService
 
@@ -184,8 +178,7 @@ class TestGenerateStatisticsReport:
     """Tests para generate_statistics_report."""
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_statistics_report_xlsx(self, mock_env, mock_ctrl):
+    def test_generate_statistics_report_xlsx(self, mock_ctrl):
         """Genera reporte de estadísticas en Excel."""
         from app.services.report_service import ReportService
 
@@ -211,8 +204,7 @@ class TestGenerateStatisticsReport:
         assert isinstance(result, BytesIO)
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_statistics_report_csv(self, mock_env, mock_ctrl):
+    def test_generate_statistics_report_csv(self, mock_ctrl):
         """Genera reporte de estadísticas en CSV."""
         from app.services.report_service import ReportService
 
@@ -242,8 +234,7 @@ class TestPrivateMethods:
     """Tests para métodos privados."""
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_build_metadata_exists(self, mock_env, mock_ctrl):
+    def test_build_metadata_exists(self, mock_ctrl):
         """Verifica que _build_metadata existe."""
         from app.services.report_service import ReportService
 
@@ -252,10 +243,9 @@ class TestPrivateMethods:
         assert hasattr(service, "_build_metadata")
         assert callable(service._build_metadata)
 
-    @patch("app.services.report_service.HTML")
+    @patch("app.services.report_jobs.render_pdf_bytes")
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_render_pdf_exists(self, mock_env, mock_ctrl, mock_html):
+    def test_render_pdf_exists(self, mock_ctrl, mock_html):
         """Verifica que _render_pdf existe."""
         from app.services.report_service import ReportService
 
@@ -265,8 +255,7 @@ class TestPrivateMethods:
         assert callable(service._render_pdf)
 
     @patch("app.services.report_service.StatisticController")
-    @patch("app.services.report_service.Environment")
-    def test_generate_tabular_report_exists(self, mock_env, mock_ctrl):
+    def test_generate_tabular_report_exists(self, mock_ctrl):
         """Verifica que _generate_tabular_report existe."""
         from app.services.report_service import ReportService
 
@@ -0,0 +1,173 @@
+"""Tests del refresco diferido de estadísticas (SQLite)."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.sprint_test_controller import SprintTestController
+from app.controllers.statistic_controller import statistic_controller
+from app.dao.statistic_dao import StatisticDAO
+from app.models.athlete import Athlete
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.statistic import Statistic
+from app.models.user import User
+from app.schemas.sprint_test_schema import CreateSprintTestSchema
+from app.services.statistic_refresher import StatisticRefresher
+from app.utils.exceptions import DatabaseException
+
+TEST_DATE = datetime(2025, 1, 10, 10, 0)
+
+# ==============================================
+# FIXTURES
+# ==============================================
+
+
+@pytest.fixture
+def club(sqlite_db):
+    """Dos atletas con su registro Statistic y una evaluación."""
+    athletes = [
+        Athlete(
+            external_person_id=f"ext-{i}",
+            full_name=f"Atleta {i}",
+            dni=f"{1100000000 + i}",
+            type_athlete="UNL",
+            sex=Sex.MALE,
+        )
+        for i in range(2)
+    ]
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    sqlite_db.add_all([*athletes, user])
+    sqlite_db.flush()
+    sqlite_db.add_all([Statistic(athlete_id=a.id) for a in athletes])
+    evaluation = Evaluation(date=TEST_DATE, time="10:00", name="Eval", user_id=user.id)
+    sqlite_db.add(evaluation)
+    sqlite_db.commit()
+    return sqlite_db, [a.id for a in athletes], evaluation.id
+
+
+@pytest.fixture
+def refresher(sqlite_engine, monkeypatch):
+    """Refresco en marcha con una ventana larga: solo procesa al detenerlo."""
+    refresher = StatisticRefresher(
+        interval=60, session_factory=sessionmaker(bind=sqlite_engine)
+    )
+    monkeypatch.setattr(
+        "app.controllers.statistic_controller.statistic_refresher", refresher
+    )
+    refresher.start()
+    yield refresher
+    refresher.stop()
+
+
+def _add_sprint(db, athlete_id, evaluation_id, time_0_30_s, sync_stats=False):
+    return SprintTestController().add_test(
+        db,
+        CreateSprintTestSchema(
+            date=TEST_DATE,
+            athlete_id=athlete_id,
+            evaluation_id=evaluation_id,
+            distance_meters=30,
+            time_0_10_s=1.8,
+            time_0_30_s=time_0_30_s,
+        ),
+        sync_stats=sync_stats,
+    )
+
+
+def _speed(db, athlete_id):
+    statistic = StatisticDAO().get_athlete_statistic(db, athlete_id)
+    db.refresh(statistic)
+    return statistic.speed
+
+
+# ==============================================
+# TESTS: COLA Y LOTES
+# ==============================================
+
+
+def test_writes_are_coalesced_and_refreshed_in_one_batch(club, refresher):
+    """Varias escrituras por atleta dejan un único ID pendiente por atleta."""
+    db, (first, second), evaluation_id = club
+    for athlete_id in (first, second, first, second, first):
+        _add_sprint(db, athlete_id, evaluation_id, 5.0)
+
+    assert refresher.pending == [first, second]
+    assert _speed(db, first) is None
+
+    result = statistic_controller.refresh_pending_stats(db)
+
+    assert result == {"refreshed_athletes": 2}
+    assert refresher.pending == []
+    assert _speed(db, first) == _speed(db, second) == 75.0
+
+
+def test_sync_stats_refreshes_immediately(club, refresher):
+    """`sync_stats=True` incluye los cambios encolados del mismo atleta."""
+    db, (first, _), evaluation_id = club
+    _add_sprint(db, first, evaluation_id, 6.0)
+
+    _add_sprint(db, first, evaluation_id, 4.0, sync_stats=True)
+
+    assert refresher.pending == []
+    assert _speed(db, first) == 75.0
+
+
+def test_stop_drains_pending_athletes(club, sqlite_engine):
+    """Al detener el refresco se procesan los atletas pendientes."""
+    db, (first, _), evaluation_id = club
+    _add_sprint(db, first, evaluation_id, 5.0)
+    statistic = StatisticDAO().get_athlete_statistic(db, first)
+    statistic.sprint_count, statistic.speed = 0, None
+    db.commit()
+    refresher = StatisticRefresher(
+        interval=0, session_factory=sessionmaker(bind=sqlite_engine)
+    )
+    refresher.start()
+    refresher.enqueue([first])
+    refresher.stop()
+
+    assert not refresher.running
+    assert refresher.pending == []
+    assert _speed(db, first) == 75.0
+    assert refresher.enqueue([first]) is False
+
+
+def test_failed_batch_is_requeued():
+    """Si el recálculo falla, los atletas vuelven a la cola."""
+    refresher = StatisticRefresher(interval=60)
+    refresher.statistic_dao = MagicMock()
+    refresher.statistic_dao.refresh_test_totals.side_effect = DatabaseException("fallo")
+    refresher._pending = {3: None, 5: None}
+
+    with pytest.raises(DatabaseException):
+        refresher.flush(MagicMock())
+
+    assert refresher.pending == [3, 5]
+
+
+def test_inline_update_without_refresher(club):
+    """Sin refresco activo, la escritura actualiza las estadísticas en línea."""
+    db, (first, _), evaluation_id = club
+    _add_sprint(db, first, evaluation_id, 5.0)
+
+    assert _speed(db, first) == 75.0
+
+
+# ==============================================
+# BENCHMARK: COSTO DE LA ESCRITURA
+# ==============================================
+
+
+def test_deferred_write_skips_statistic_queries(club, refresher, query_counter):
+    """Benchmark: una escritura diferida emite menos consultas que una síncrona."""
+    db, (first, _), evaluation_id = club
+
+    with query_counter() as deferred:
+        _add_sprint(db, first, evaluation_id, 5.0)
+    with query_counter() as synchronous:
+        _add_sprint(db, first, evaluation_id, 5.0, sync_stats=True)
+
+    assert deferred.count < synchronous.count
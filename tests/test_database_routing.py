@@ -0,0 +1,116 @@
+"""Tests del enrutado de lecturas a la réplica (dos archivos SQLite)."""
+
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.database import (
+    READ_CONSISTENCY_HEADER,
+    READ_PRIMARY_COOKIE,
+    get_db,
+    get_read_db,
+)
+from main import _configure_middlewares
+
+
+def _sqlite_file(path, name: str):
+    """Base SQLite en archivo con una tabla que identifica al servidor."""
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE server (name TEXT)"))
+        conn.execute(text("INSERT INTO server VALUES (:name)"), {"name": name})
+    return engine
+
+
+def _server(db) -> str:
+    return db.execute(text("SELECT name FROM server")).scalar()
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """Primario y réplica en archivos distintos; devuelve la URL de la réplica."""
+    primary = _sqlite_file(tmp_path / "primary.db", "primary")
+    read = _sqlite_file(tmp_path / "replica.db", "replica")
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=primary))
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=read))
+    yield f"sqlite:///{tmp_path / 'replica.db'}"
+    primary.dispose()
+    read.dispose()
+
+
+@pytest.fixture
+def api(replica):
+    """App mínima con el middleware real y endpoints de lectura y escritura."""
+    app = FastAPI()
+    _configure_middlewares(app)
+
+    @app.get("/read")
+    def read(db: Annotated[object, Depends(get_read_db)]):
+        return {"server": _server(db)}
+
+    @app.post("/write")
+    def write(db: Annotated[object, Depends(get_db)]):
+        return {"server": _server(db)}
+
+    @app.post("/report")
+    def report(db: Annotated[object, Depends(get_read_db)]):
+        return {"server": _server(db)}
+
+    return TestClient(app)
+
+
+def test_reads_go_to_replica(api):
+    """Sin escrituras previas se lee de la réplica."""
+    assert api.get("/read").json() == {"server": "replica"}
+    assert api.post("/write").json() == {"server": "primary"}
+
+
+def test_read_your_writes_after_mutation(api, monkeypatch):
+    """Tras escribir, el cliente lee del primario hasta que vence la ventana."""
+    response = api.post("/write")
+
+    assert READ_PRIMARY_COOKIE in response.cookies
+    assert api.get("/read").json() == {"server": "primary"}
+
+    api.cookies.set(READ_PRIMARY_COOKIE, "0")
+    assert api.get("/read").json() == {"server": "replica"}
+
+
+def test_read_only_post_does_not_pin_primary(api):
+    """Un POST que solo lee (p. ej. reportes) no fuerza el primario."""
+    response = api.post("/report")
+
+    assert response.json() == {"server": "replica"}
+    assert READ_PRIMARY_COOKIE not in response.cookies
+
+
+def test_consistency_header_forces_primary(api):
+    """Un cliente sin cookies puede pedir el primario por cabecera."""
+    response = api.get("/read", headers={READ_CONSISTENCY_HEADER: "primary"})
+
+    assert response.json() == {"server": "primary"}
+
+
+def test_without_replica_no_cookie(tmp_path, monkeypatch):
+    """Sin réplica configurada todo va al primario y no se marca al cliente."""
+    primary = sessionmaker(bind=_sqlite_file(tmp_path / "only.db", "primary"))
+    monkeypatch.setattr(database, "SessionLocal", primary)
+    monkeypatch.setattr(database, "ReadSessionLocal", primary)
+    app = FastAPI()
+    _configure_middlewares(app)
+
+    @app.post("/write")
+    def write(db: Annotated[object, Depends(get_db)]):
+        return {"server": _server(db)}
+
+    response = TestClient(app).post("/write")
+
+    assert response.json() == {"server": "primary"}
+    assert READ_PRIMARY_COOKIE not in response.cookies
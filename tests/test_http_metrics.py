@@ -0,0 +1,150 @@
+"""Tests de las métricas HTTP por ruta y su exposición en /metrics."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+import main
+from app.core.http_metrics import UNMATCHED_ROUTE, RouteMetrics
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Métricas propias del test en lugar de las del proceso."""
+    metrics = RouteMetrics()
+    monkeypatch.setattr(main, "route_metrics", metrics)
+    return metrics
+
+
+@pytest.fixture
+def api(metrics):
+    app = FastAPI()
+    main._configure_middlewares(app)
+
+    @app.get("/athletes/{athlete_id}")
+    def athlete(athlete_id: int):
+        return {"id": athlete_id}
+
+    @app.post("/athletes")
+    def create_athlete():
+        return Response(status_code=201, content=b"x" * 2048)
+
+    @app.get("/export")
+    def export():
+        def chunks():
+            for _ in range(3):
+                time.sleep(0.02)
+                yield b"x" * 100
+
+        return StreamingResponse(chunks())
+
+    return TestClient(app)
+
+
+def test_requests_are_grouped_by_route_template(api, metrics):
+    """Cada ID cae en la misma serie: la plantilla, no la URL real."""
+    for athlete_id in (1, 2, 3):
+        api.get(f"/athletes/{athlete_id}")
+    api.post("/athletes")
+    api.get("/no-existe")
+
+    assert metrics.requests[("GET", "/athletes/{athlete_id}", "200")] == 3
+    assert metrics.requests[("POST", "/athletes", "201")] == 1
+    assert metrics.requests[("GET", UNMATCHED_ROUTE, "404")] == 1
+    assert metrics.latency[("GET", "/athletes/{athlete_id}")].count == 3
+    assert metrics.size[("POST", "/athletes")].sum == 2048
+    assert all(value == 0 for value in metrics.in_flight.values())
+
+
+def test_streaming_response_is_measured_until_last_byte(api, metrics):
+    """Latencia y tamaño incluyen el envío del cuerpo en streaming."""
+    response = api.get("/export")
+
+    assert len(response.content) == 300
+    assert metrics.latency[("GET", "/export")].sum >= 0.06
+    assert metrics.size[("GET", "/export")].sum == 300
+    assert metrics.in_flight[("GET", "/export")] == 0
+
+
+def test_prometheus_exposition(api, metrics):
+    """El texto sigue el formato de Prometheus con buckets acumulados."""
+    api.get("/athletes/7")
+
+    text = metrics.render()
+
+    assert "# TYPE http_requests_total counter" in text
+    assert (
+        'http_requests_total{method="GET",route="/athletes/{athlete_id}",'
+        'status="200"} 1'
+    ) in text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert (
+        'http_request_duration_seconds_bucket{method="GET",'
+        'route="/athletes/{athlete_id}",le="+Inf"} 1'
+    ) in text
+    assert 'http_request_duration_seconds_count{method="GET"' in text
+
+
+def test_metrics_endpoint(metrics):
+    """/metrics responde texto plano de Prometheus."""
+    client = TestClient(main.app)
+    client.get("/health/live")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'route="/health/live"' in response.text
+
+
+def test_counters_are_summed_across_workers(tmp_path):
+    """Los contadores de otros workers (vivos o terminados) se suman."""
+    script = (
+        "from app.core.http_metrics import RouteMetrics\n"
+        f"m = RouteMetrics({str(tmp_path)!r})\n"
+        "m.start('GET', '/athletes')\n"
+        "m.finish('GET', '/athletes', 200, 0.02, 100)\n"
+        "m.start('GET', '/athletes')\n"
+        "m.flush()\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+    # Un worker vivo con una petición en curso
+    alive = {
+        "pid": os.getppid(),
+        "requests": [["GET", "/athletes", "200", 2]],
+        "in_flight": [["GET", "/athletes", 1]],
+        "latency": [],
+        "size": [],
+    }
+    (tmp_path / "http-alive.json").write_text(json.dumps(alive))
+
+    metrics = RouteMetrics(str(tmp_path))
+    metrics.start("GET", "/athletes")
+    metrics.finish("GET", "/athletes", 200, 0.2)
+    text = metrics.render()
+
+    assert 'http_requests_total{method="GET",route="/athletes",status="200"} 4' in text
+    # La petición del worker terminado ya no cuenta como en curso
+    assert 'http_requests_in_progress{method="GET",route="/athletes"} 1' in text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/athletes"} 2'
+    ) in text
+
+
+def test_label_values_are_escaped():
+    """Comillas y barras en las etiquetas no rompen el formato."""
+    metrics = RouteMetrics()
+    metrics.start("GET", '/a"b\\c')
+    metrics.finish("GET", '/a"b\\c', 200, 0.01)
+
+    assert 'route="/a\\"b\\\\c"' in metrics.render()
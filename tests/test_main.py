@@ -187,6 +187,18 @@ class TestLifespan:
             pass
         # Después del ciclo de vida la app se cierra correctamente
 
+    @pytest.mark.asyncio
+    async def test_lifespan_creates_async_engine(self):
+        """El motor asíncrono se crea al arrancar (falla pronto sin driver)."""
+        from fastapi import FastAPI
+
+        from app.core import database
+        from main import lifespan
+
+        async with lifespan(FastAPI()):
+            assert database._async_engine is not None
+        assert database._async_engine is None
+
 
 class TestModuleImports:
     """Tests para verificar importaciones del módulo."""
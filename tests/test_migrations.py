@@ -0,0 +1,99 @@
+"""Tests de los ajustes de esquema que se aplican al arrancar."""
+
+from datetime import date, datetime
+
+from sqlalchemy import inspect, text
+
+from app.core.migrations import ensure_attendance_rollup, ensure_statistic_accumulators
+from app.dao.attendance_rollup_dao import AttendanceRollupDAO
+from app.dao.statistic_dao import ACCUMULATOR_FIELDS
+from app.models.athlete import Athlete
+from app.models.attendance import Attendance
+from app.models.enums.sex import Sex
+from app.models.evaluation import Evaluation
+from app.models.sprint_test import SprintTest
+from app.models.statistic import Statistic
+from app.models.user import User
+
+
+def _seed_athlete_with_sprint(db) -> int:
+    athlete = Athlete(
+        external_person_id="ext-1",
+        full_name="Atleta",
+        dni="1100000001",
+        type_athlete="UNL",
+        sex=Sex.MALE,
+    )
+    user = User(external="ext-user", full_name="Coach", dni="0999999999")
+    db.add_all([athlete, user])
+    db.flush()
+    evaluation = Evaluation(
+        date=datetime(2025, 1, 10), time="10:00", name="Eval", user_id=user.id
+    )
+    db.add(evaluation)
+    db.flush()
+    db.add_all(
+        [
+            Statistic(athlete_id=athlete.id),
+            SprintTest(
+                date=datetime(2025, 1, 10),
+                evaluation_id=evaluation.id,
+                athlete_id=athlete.id,
+                distance_meters=30,
+                time_0_10_s=1.8,
+                time_0_30_s=5.0,
+            ),
+        ]
+    )
+    db.commit()
+    return athlete.id
+
+
+def test_missing_accumulators_are_added_and_backfilled(sqlite_db):
+    """Una tabla `statistics` anterior recibe las columnas ya calculadas."""
+    athlete_id = _seed_athlete_with_sprint(sqlite_db)
+    # Simular la tabla desplegada antes de los acumulados
+    for field in ACCUMULATOR_FIELDS:
+        sqlite_db.execute(text(f"ALTER TABLE statistics DROP COLUMN {field}"))
+    sqlite_db.commit()
+
+    added = ensure_statistic_accumulators(sqlite_db)
+
+    assert added == list(ACCUMULATOR_FIELDS)
+    columns = {
+        c["name"] for c in inspect(sqlite_db.get_bind()).get_columns("statistics")
+    }
+    assert set(ACCUMULATOR_FIELDS) <= columns
+    sqlite_db.expire_all()
+    statistic = sqlite_db.query(Statistic).filter_by(athlete_id=athlete_id).one()
+    assert statistic.sprint_count == 1
+    assert statistic.sprint_time_sum == 5.0
+    assert statistic.speed == 75.0
+
+
+def test_up_to_date_schema_is_left_alone(sqlite_db):
+    """Con el esquema al día no se altera ni se recalcula nada."""
+    athlete_id = _seed_athlete_with_sprint(sqlite_db)
+
+    assert ensure_statistic_accumulators(sqlite_db) == []
+    statistic = sqlite_db.query(Statistic).filter_by(athlete_id=athlete_id).one()
+    assert statistic.sprint_count == 0
+
+
+def test_empty_attendance_rollup_is_backfilled(sqlite_db):
+    """Las asistencias previas al resumen diario se vuelcan al arrancar."""
+    athlete_id = _seed_athlete_with_sprint(sqlite_db)
+    sqlite_db.add(
+        Attendance(
+            date=datetime(2025, 1, 10, 8),
+            time="08:00",
+            is_present=True,
+            user_dni="0999999999",
+            athlete_id=athlete_id,
+        )
+    )
+    sqlite_db.commit()
+
+    assert ensure_attendance_rollup(sqlite_db) == 1
+    assert ensure_attendance_rollup(sqlite_db) == 0
+    assert AttendanceRollupDAO().get_dates(sqlite_db) == [date(2025, 1, 10)]
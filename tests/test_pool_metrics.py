@@ -0,0 +1,177 @@
+"""Tests del dimensionamiento y las métricas del pool de conexiones."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core import database
+from app.core.pool_metrics import Histogram, InstrumentedQueuePool, PoolMetrics
+
+
+@pytest.fixture
+def pool_engine(tmp_path):
+    """Motor SQLite en archivo con una sola conexión y métricas propias."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        connect_args={"check_same_thread": False},
+    )
+    metrics = PoolMetrics()
+    metrics.track("test", engine)
+    yield engine, metrics
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("workers", "expected"),
+    [(1, (70, 30)), (4, (18, 7)), (8, (9, 3)), (200, (1, 0))],
+)
+def test_pool_limits_split_budget_across_workers(monkeypatch, workers, expected):
+    """El presupuesto del host se reparte entre workers, con parte de overflow."""
+    monkeypatch.setattr(database.settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(database.settings, "DB_POOL_OVERFLOW_RATIO", 0.3)
+
+    pool_size, max_overflow = database.pool_limits(workers=workers)
+
+    assert (pool_size, max_overflow) == expected
+    if workers <= 100:
+        assert (pool_size + max_overflow) * workers <= 100
+
+
+@pytest.mark.parametrize("workers", [1, 4, 9])
+def test_primary_engines_share_one_budget(monkeypatch, workers):
+    """Los motores síncrono y asíncrono del primario no suman más que el host."""
+    monkeypatch.setattr(database.settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(database.settings, "DB_ASYNC_POOL_RATIO", 0.2)
+
+    sync_size, sync_overflow = database.pool_limits(
+        database.pool_share("primary"), workers
+    )
+    async_size, async_overflow = database.pool_limits(
+        database.pool_share("primary_async"), workers
+    )
+
+    assert (sync_size + sync_overflow + async_size + async_overflow) * workers <= 100
+    assert sync_size > async_size
+    assert database.pool_share("replica") == 1.0
+
+
+def test_workers_follow_web_concurrency(monkeypatch):
+    """El pool se dimensiona con WEB_CONCURRENCY, la variable que lee uvicorn."""
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    monkeypatch.setenv("DEBUG", "false")
+
+    assert database.settings.__class__().WEB_WORKERS == 3
+
+
+def test_workers_fall_back_to_uvicorn_workers(monkeypatch):
+    """Sin WEB_CONCURRENCY se respeta UVICORN_WORKERS y su valor por defecto."""
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.delenv("UVICORN_WORKERS", raising=False)
+    monkeypatch.setenv("DEBUG", "false")
+
+    assert database.settings.__class__().WEB_WORKERS == 4
+
+    monkeypatch.setenv("UVICORN_WORKERS", "2")
+    assert database.settings.__class__().WEB_WORKERS == 2
+
+
+def test_primary_engine_sets_statement_timeout_on_connect():
+    """El statement_timeout viaja en `options`, sin consulta extra al conectar."""
+    captured = {}
+
+    def capture(dialect, conn_rec, cargs, cparams):
+        captured.update(cparams)
+        raise ConnectionAbortedError("solo inspección")
+
+    engine = database.engine
+    event.listen(engine, "do_connect", capture)
+    try:
+        with pytest.raises(ConnectionAbortedError):
+            engine.connect()
+    finally:
+        event.remove(engine, "do_connect", capture)
+
+    timeout = database.settings.DB_STATEMENT_TIMEOUT_MS
+    assert captured["options"] == f"-c statement_timeout={timeout}"
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == database.pool_limits(database.pool_share("primary"))[0]
+
+
+def test_checkout_and_wait_are_recorded(pool_engine):
+    """Cada checkout registra conexiones en uso, overflow y espera."""
+    engine, metrics = pool_engine
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        snapshot = metrics.snapshot()["test"]
+        assert snapshot["checked_out"] == 1
+
+    snapshot = metrics.snapshot()["test"]
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["wait_seconds_histogram"]["count"] == 1
+    assert snapshot["checked_out_histogram"]["buckets"][1] == {"le": 1, "count": 1}
+
+
+def test_exhausted_pool_records_timeout(pool_engine):
+    """Sin conexiones libres la espera termina en timeout y se cuenta."""
+    engine, metrics = pool_engine
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot()["test"]
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_seconds_histogram"]["sum"] >= 0.05
+
+
+def test_metrics_survive_dispose(pool_engine):
+    """dispose() recrea el pool sin perder las métricas acumuladas."""
+    engine, metrics = pool_engine
+    with engine.connect():
+        pass
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert metrics.get("test").wait_seconds.count == 2
+
+
+def test_histogram_buckets_are_cumulative():
+    """Los conteos exportados son acumulados, con +Inf al final."""
+    histogram = Histogram((1, 5))
+    for value in (0.5, 3, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {
+        "buckets": [
+            {"le": 1, "count": 1},
+            {"le": 5, "count": 3},
+            {"le": "+Inf", "count": 4},
+        ],
+        "sum": 16.5,
+        "count": 4,
+    }
+
+
+def test_db_pool_endpoint():
+    """/metrics/db-pool expone el tamaño configurado y cada pool registrado."""
+    from main import app
+
+    response = TestClient(app).get("/metrics/db-pool")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert "primary" in data["pools"]
+    pool_size, max_overflow = database.pool_limits(database.pool_share("primary"))
+    assert data["limits"]["primary"] == {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+    }
@@ -0,0 +1,126 @@
+"""Tests de las métricas de SQL por petición (Server-Timing y consultas lentas)."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core import query_stats
+from main import _configure_middlewares
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite en archivo con los eventos de conteo registrados."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'stats.db'}", connect_args={"check_same_thread": False}
+    )
+    query_stats.instrument(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE athlete (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_queries_are_counted_per_request(engine):
+    """Cada sentencia suma al conteo y al tiempo de la petición actual."""
+    token = query_stats.start_request()
+    with engine.connect() as conn:
+        for _ in range(3):
+            conn.execute(text("SELECT * FROM athlete"))
+    stats = query_stats.end_request(token)
+
+    assert stats.count == 3
+    assert stats.slowest_statement == "SELECT * FROM athlete"
+    assert 0 < stats.slowest_seconds <= stats.total_seconds
+    assert 'desc="3 queries"' in stats.server_timing()
+    assert query_stats.current_stats() is None
+
+
+def test_queries_outside_requests_are_ignored(engine):
+    """Sin petición en curso (p. ej. tareas de fondo) no se acumula nada."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert query_stats.current_stats() is None
+
+
+def test_failed_statement_does_not_leak_timer(engine):
+    """Una sentencia fallida no deja su marca de inicio en la conexión."""
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+
+        assert conn.info["query_start"] == []
+
+
+def test_slow_query_is_logged_with_plan(engine, monkeypatch, caplog):
+    """Sobre el umbral se registra la sentencia y su EXPLAIN."""
+    monkeypatch.setattr(query_stats.settings, "SQL_SLOW_QUERY_MS", 1e-6)
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT name FROM athlete WHERE name = :n"), {"n": "x"})
+
+    record = next(r for r in caplog.records if "slow_query" in r.message)
+    assert "SELECT name FROM athlete" in record.message
+    assert "SCAN athlete" in record.message
+
+
+def test_middleware_emits_server_timing_and_log(engine, caplog):
+    """La respuesta lleva Server-Timing y se registra una línea por petición."""
+    app = FastAPI()
+    _configure_middlewares(app)
+
+    @app.get("/athletes")
+    def athletes():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT * FROM athlete"))
+            conn.execute(text("SELECT count(*) FROM athlete"))
+        return {}
+
+    @app.get("/ping")
+    def ping():
+        return {}
+
+    with caplog.at_level(logging.INFO, logger="app.sql"):
+        response = TestClient(app).get("/athletes")
+        idle = TestClient(app).get("/ping")
+
+    assert "db;dur=" in response.headers["Server-Timing"]
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+    assert 'desc="0 queries"' in idle.headers["Server-Timing"]
+    lines = [r.message for r in caplog.records if r.message.startswith("request ")]
+    assert len(lines) == 1
+    assert "path=/athletes" in lines[0] and "queries=2" in lines[0]
+
+
+def test_streaming_body_queries_are_logged(engine, caplog):
+    """Las consultas al generar un cuerpo en streaming cuentan en el log."""
+    app = FastAPI()
+    _configure_middlewares(app)
+
+    @app.get("/export")
+    def export():
+        def rows():
+            for _ in range(3):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT * FROM athlete"))
+                yield b"row\n"
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    with caplog.at_level(logging.INFO, logger="app.sql"):
+        response = TestClient(app).get("/export")
+
+    assert response.text == "row\n" * 3
+    # Las cabeceras se envían antes que el cuerpo
+    assert 'desc="0 queries"' in response.headers["Server-Timing"]
+    lines = [r.message for r in caplog.records if r.message.startswith("request ")]
+    assert len(lines) == 1
+    assert "path=/export" in lines[0] and "queries=3" in lines[0]
@@ -0,0 +1,52 @@
+"""Benchmark de arranque: costo de importar `main` con `-X importtime`."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Presupuesto del import de `main` (hoy ~0.8s; pandas y WeasyPrint suman >1s)
+IMPORT_BUDGET_SECONDS = 2.0
+# Módulos que solo deben cargarse al generar el primer reporte
+REPORTING_MODULES = ("pandas", "numpy", "jinja2", "weasyprint", "matplotlib")
+
+
+def _import_main(code: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import main{code}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_seconds(importtime_log: str, module: str) -> float:
+    """Tiempo acumulado (µs -> s) de un módulo en la salida de importtime."""
+    for line in importtime_log.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1_000_000
+    raise AssertionError(f"{module} no aparece en la salida de -X importtime")
+
+
+def test_import_main_within_budget():
+    """Importar `main` (lo que paga cada worker de uvicorn) cabe en el presupuesto."""
+    result = _import_main()
+
+    seconds = _cumulative_seconds(result.stderr, "main")
+
+    assert seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_import_main_does_not_load_reporting_stack():
+    """El stack de reportes se importa con el primer reporte, no al arrancar."""
+    code = (
+        "; import sys; "
+        f"print(','.join(m for m in {REPORTING_MODULES!r} if m in sys.modules))"
+    )
+
+    result = _import_main(code)
+
+    assert result.stdout.strip() == ""
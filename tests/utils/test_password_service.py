@@ -0,0 +1,87 @@
+"""Tests y benchmark del servicio asíncrono de contraseñas."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from passlib.hash import bcrypt
+
+from app.utils import password_service as password_module
+from app.utils.password_service import PasswordService
+from app.utils.security import verify_password
+
+PASSWORD = "Password123!"
+
+
+@pytest.fixture
+def service():
+    service = PasswordService(max_workers=4)
+    yield service
+    service.shutdown()
+
+
+async def test_verify_and_update_rehashes_on_cost_change(service):
+    """Un hash con otro costo se reemplaza al verificar la contraseña."""
+    old_hash = bcrypt.using(rounds=4).hash(PASSWORD)
+
+    valid, new_hash = await service.verify_and_update(PASSWORD, old_hash)
+
+    assert valid is True
+    assert new_hash is not None and new_hash != old_hash
+    assert await service.verify(PASSWORD, new_hash)
+    assert await service.verify_and_update(PASSWORD, new_hash) == (True, None)
+    assert await service.verify_and_update("otra", old_hash) == (False, None)
+
+
+async def test_dummy_hash_is_lazy(service):
+    """El hash ficticio no se calcula al importar sino en el primer uso."""
+    assert service._dummy_hash is None
+
+    first = await service.dummy_hash()
+
+    assert await service.dummy_hash() is first
+    assert await service.verify(password_module.DUMMY_PASSWORD, first)
+
+
+async def test_login_burst_throughput(service, monkeypatch):
+    """Benchmark: 50 logins simultáneos sin bloquear el event loop."""
+    stored_hash = bcrypt.using(rounds=8).hash(PASSWORD)
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def counted_verify(password, password_hash):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            return verify_password(password, password_hash)
+        finally:
+            with lock:
+                running["now"] -= 1
+
+    monkeypatch.setattr(password_module, "verify_password", counted_verify)
+
+    gaps = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.ensure_future(heartbeat())
+    results = await asyncio.gather(
+        *(service.verify(PASSWORD, stored_hash) for _ in range(50))
+    )
+    done.set()
+    await ticker
+
+    assert all(results)
+    assert running["max"] <= service.max_workers
+    # El loop siguió atendiendo otras tareas mientras bcrypt trabajaba
+    assert len(gaps) > 1
+    assert max(gaps) < 0.25
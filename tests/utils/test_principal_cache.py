@@ -0,0 +1,116 @@
+"""Tests de la caché de la cuenta autenticada en get_current_account."""
+
+import time
+
+import pytest
+
+from app.controllers.account_controller import AccountController
+from app.controllers.user_controller import UserController
+from app.models.account import Account
+from app.models.enums.rol import Role
+from app.models.user import User
+from app.utils.exceptions import UnauthorizedException
+from app.utils.principal_cache import Principal, PrincipalCache, principal_cache
+from app.utils.security import create_access_token, get_current_account, hash_password
+
+PASSWORD = "Secreta123!"
+
+
+@pytest.fixture
+def account(sqlite_db):
+    user = User(external="ext-1", full_name="Ana Paz", dni="1104680135")
+    sqlite_db.add(user)
+    sqlite_db.flush()
+    account = Account(
+        email="coach@unl.edu.ec",
+        password_hash=hash_password(PASSWORD),
+        role=Role.COACH,
+        user_id=user.id,
+    )
+    sqlite_db.add(account)
+    sqlite_db.commit()
+    return account
+
+
+def test_warm_cache_skips_database(sqlite_db, account, query_counter):
+    """Con el mismo token, la segunda petición no consulta la BD."""
+    token = create_access_token(subject=account.id)
+    sqlite_db.expire_all()
+
+    with query_counter() as cold:
+        first = get_current_account(token=token, db=sqlite_db)
+    with query_counter() as warm:
+        second = get_current_account(token=token, db=sqlite_db)
+
+    assert cold.count >= 1
+    assert warm.count == 0
+    assert second is first
+    assert isinstance(second, Principal)
+    assert (second.role, second.user.full_name, second.user.role) == (
+        Role.COACH,
+        "Ana Paz",
+        Role.COACH,
+    )
+
+
+def test_password_change_invalidates(sqlite_db, account, query_counter):
+    """Cambiar la contraseña obliga a releer la cuenta."""
+    token = create_access_token(subject=account.id)
+    get_current_account(token=token, db=sqlite_db)
+
+    AccountController().set_password_hash(
+        sqlite_db, account, hash_password("Nueva1234!")
+    )
+
+    with query_counter() as after:
+        get_current_account(token=token, db=sqlite_db)
+    assert after.count >= 1
+
+
+def test_deactivated_account_is_rejected(sqlite_db, account):
+    """Tras desactivar la cuenta el token deja de autenticar."""
+    token = create_access_token(subject=account.id)
+    get_current_account(token=token, db=sqlite_db)
+
+    account.is_active = False
+    sqlite_db.commit()
+    principal_cache.invalidate(account.id)
+
+    with pytest.raises(UnauthorizedException):
+        get_current_account(token=token, db=sqlite_db)
+
+
+def test_user_deactivation_bumps_version(sqlite_db, account):
+    """Desactivar al usuario descarta el principal de su cuenta."""
+    version = principal_cache.version(account.id)
+
+    UserController().desactivate_user(sqlite_db, account.user_id)
+
+    assert principal_cache.version(account.id) == version + 1
+
+
+def test_stale_read_is_not_stored():
+    """Si se invalida mientras se lee la BD, no se guarda el dato viejo."""
+    cache = PrincipalCache(ttl=60)
+    principal = Principal(1, "a@unl.edu.ec", Role.INTERN, True, 1, None)
+    version = cache.version(1)
+
+    cache.invalidate(1)
+    cache.put(1, 100, principal, version)
+
+    assert cache.get(1, 100) is None
+
+
+def test_entries_expire_and_are_bounded():
+    """Las entradas vencen por TTL y el tamaño está acotado."""
+    principal = Principal(1, "a@unl.edu.ec", Role.INTERN, True, 1, None)
+    expired = PrincipalCache(ttl=0.001)
+    expired.put(1, 100, principal, 0)
+    time.sleep(0.01)
+    assert expired.get(1, 100) is None
+
+    bounded = PrincipalCache(ttl=60, max_entries=2)
+    for iat in (1, 2, 3):
+        bounded.put(1, iat, principal, 0)
+    assert bounded.get(1, 1) is None
+    assert bounded.get(1, 3) is principal
@@ -325,7 +325,8 @@ class TestGetCurrentAccount:
 
         result = get_current_account(token=token, db=mock_db)
 
-        assert result == mock_account
+        assert result.id == mock_account.id
+        assert result.user.dni == mock_account.user.dni
         mock_dao.get_by_id.assert_called_once()
 
     @patch("app.utils.security.AccountDAO")